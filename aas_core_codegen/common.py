@@ -1,5 +1,6 @@
 """Provide common functions and types for the code generation."""
 import ast
+import contextlib
 import inspect
 import io
 import re
@@ -238,6 +239,150 @@ def indent_but_first_line(text: str, indention: str) -> str:
     return "\n".join(indented_lines)
 
 
+class CodeWriter:
+    r"""
+    Write the code to a single buffer while keeping track of the indention.
+
+    The indention is applied to all the lines which contain non-whitespace
+    characters, equivalent to :py:func:`textwrap.indent`. Instead of indenting
+    a nested block and then copying it again at each nesting level, the nested
+    blocks are written directly to the buffer within :py:meth:`indent`.
+
+    A line is indented with the indention in effect when its first character
+    has been written.
+
+    >>> writer = CodeWriter()
+    >>> writer.write("parent\n{\n")
+    >>> with writer.indent("    "):
+    ...     writer.write_line("child")
+    ...     writer.write("\n")
+    ...     with writer.indent("    "):
+    ...         writer.write("grandchild")
+    >>> writer.write("\n}")
+    >>> print(writer.getvalue())
+    parent
+    {
+        child
+    <BLANKLINE>
+            grandchild
+    }
+    """
+
+    def __init__(self) -> None:
+        """Initialize with an empty buffer and no indention."""
+        self._parts = []  # type: List[str]
+        self._indentions = []  # type: List[str]
+        self._indention = ""
+
+        # The indention of the current line, or None if the line is empty
+        self._line_indention = None  # type: Optional[str]
+
+        # The indented line is kept until it is finished so that we know whether
+        # it needs to be indented.
+        self._line_parts = []  # type: List[str]
+
+    @contextlib.contextmanager
+    def indent(self, indention: str) -> Iterator[None]:
+        """Indent everything written within the context by ``indention``."""
+        self._indentions.append(self._indention)
+        self._indention = self._indention + indention
+        try:
+            yield
+        finally:
+            self._indention = self._indentions.pop()
+
+    def _pending_line(self) -> str:
+        """Indent the pending line, if necessary."""
+        line = "".join(self._line_parts)
+        if len(line.strip()) > 0:
+            assert self._line_indention is not None
+            return self._line_indention + line
+
+        return line
+
+    def _continue_line(self, text: str) -> None:
+        """Write ``text`` without new lines to the current line."""
+        if self._line_indention is None:
+            self._line_indention = self._indention
+
+        if len(self._line_indention) == 0:
+            self._parts.append(text)
+        else:
+            self._line_parts.append(text)
+
+    def write(self, text: str) -> None:
+        """Write ``text`` at the current indention."""
+        if len(text) == 0:
+            return
+
+        if len(self._indention) == 0 and not self._line_indention:
+            # Nothing needs to be indented, so we write the text as-is.
+            self._parts.append(text)
+            self._line_indention = None if text.endswith("\n") else ""
+            return
+
+        first_newline = text.find("\n")
+        if first_newline == -1:
+            self._continue_line(text)
+            return
+
+        if first_newline > 0:
+            self._continue_line(text[:first_newline])
+
+        if len(self._line_parts) > 0:
+            self._parts.append(self._pending_line())
+            self._line_parts = []
+
+        self._parts.append("\n")
+        self._line_indention = None
+
+        # The lines in-between are complete, so we can indent them in one go.
+        last_newline = text.rfind("\n")
+        if last_newline > first_newline:
+            indention = self._indention
+            self._parts.append(
+                "\n".join(
+                    [
+                        indention + line if len(line.strip()) > 0 else line
+                        for line in text[first_newline + 1 : last_newline].split("\n")
+                    ]
+                )
+            )
+            self._parts.append("\n")
+
+        if last_newline < len(text) - 1:
+            self._continue_line(text[last_newline + 1 :])
+
+    def write_line(self, line: str = "") -> None:
+        """Write ``line`` at the current indention and end it with a new line."""
+        self.write(line)
+        self.write("\n")
+
+    def chunks(self) -> Iterator[str]:
+        """
+        Iterate over the code written so far in chunks.
+
+        Use the chunks instead of :py:meth:`getvalue` if you stream the code,
+        *e.g.*, to a file, so that the chunks do not need to be joined.
+        """
+        yield from self._parts
+
+        if len(self._line_parts) > 0:
+            yield self._pending_line()
+
+    def getvalue(self) -> str:
+        """Retrieve the code written so far."""
+        value = "".join(self._parts)
+
+        # We keep the joined parts so that we do not join them again.
+        self._parts = [value]
+
+        if len(self._line_parts) > 0:
+            return value + self._pending_line()
+
+        return value
+
+
 def assert_union_of_descendants_exhaustive(union: Any, base_class: Any) -> None:
     """
     Check that the ``union`` covers all the concrete subclasses of ``base_class``.
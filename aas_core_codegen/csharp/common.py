@@ -78,9 +78,6 @@ def _assert_all_primitive_types_are_mapped() -> None:
         raise AssertionError("\n\n".join(messages))
 
 
-_assert_all_primitive_types_are_mapped()
-
-
 def generate_type(type_annotation: intermediate.TypeAnnotationUnion) -> Stripped:
     """Generate the C# type for the given type annotation."""
     # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
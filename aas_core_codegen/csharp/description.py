@@ -1,6 +1,7 @@
 """Render descriptions to C# documentation comments."""
 import textwrap
 from typing import Tuple, Optional, List
+import weakref
 import xml.sax.saxutils
 
 from icontract import ensure
@@ -393,6 +394,17 @@ class _ElementRenderer(intermediate_rendering.DocutilsElementTransformer[str]):
         return text, None
 
 
+#: Rendered comments, or the rendering errors, by the document of the description.
+#:
+#: The intermediate layer shares the document between the descriptions of
+#: an inherited member in the ancestor and in all the descendants, so that each
+#: document needs to be rendered only once. We cache only the error messages, since
+#: the errors need to point to the node of the given description.
+_COMMENT_CACHE = (
+    weakref.WeakKeyDictionary()
+)  # type: weakref.WeakKeyDictionary[docutils.nodes.document, Tuple[Optional[Stripped], Optional[str]]]
+
+
 @ensure(lambda result: (result[0] is None) ^ (result[1] is None))
 def generate_comment(
     description: intermediate.Description,
@@ -401,10 +413,20 @@ def generate_comment(
     if len(description.document.children) == 0:
         return Stripped(""), None
 
-    renderer = _ElementRenderer()
-    text, error = renderer.transform(description.document)
-    if error:
-        return None, Error(description.node, error)
+    cached = _COMMENT_CACHE.get(description.document, None)
+    if cached is None:
+        renderer = _ElementRenderer()
+        text, error = renderer.transform(description.document)
+        if error:
+            cached = None, error
+        else:
+            assert text is not None
+            cached = Stripped(text), None
+
+        _COMMENT_CACHE[description.document] = cached
+
+    comment, error_message = cached
+    if error_message is not None:
+        return None, Error(description.node, error_message)
 
-    assert text is not None
-    return Stripped(text), None
+    return comment, None
@@ -1,4 +1,6 @@
 """Generate C# code for de/serialization of AAS classes from and to JSON."""
 from aas_core_codegen.csharp.jsonization import _generate
 
+generate_chunks = _generate.generate_chunks
+generate_shards = _generate.generate_shards
 generate = _generate.generate
@@ -2,7 +2,17 @@
 
 import io
 import textwrap
-from typing import Tuple, Optional, List
+from typing import (
+    Tuple,
+    Optional,
+    List,
+    Iterator,
+    Sequence,
+    Mapping,
+    Dict,
+    Union,
+    Set,
+)
 
 from icontract import ensure
 
@@ -13,6 +23,7 @@ from aas_core_codegen.common import (
     Identifier,
     assert_never,
     indent_but_first_line,
+    CodeWriter,
 )
 from aas_core_codegen.csharp import common as csharp_common, naming as csharp_naming
 from aas_core_codegen.csharp.common import (
@@ -45,16 +56,27 @@ def _generate_json_converter_for_enumeration(
         {III}throw new Json.JsonException();
         {II}}}
 
-        {II}string? text = reader.GetString();
-        {II}if (text == null)
+        {II}// Parse the UTF-8 bytes in place unless they need to be unescaped.
+        {II}Aas.{enum_name}? value;
+        {II}if (!reader.HasValueSequence
+        {III}&& System.MemoryExtensions.IndexOf(
+        {IIII}reader.ValueSpan, (byte)'\\\\') == -1)
         {II}{{
-        {III}throw new Json.JsonException();
+        {III}value = Stringification.{enum_name}FromUtf8(reader.ValueSpan);
+        {II}}}
+        {II}else
+        {II}{{
+        {III}string? text = reader.GetString();
+        {III}if (text == null)
+        {III}{{
+        {IIII}throw new Json.JsonException();
+        {III}}}
+
+        {III}value = Stringification.{enum_name}FromString(text);
         {II}}}
 
-        {II}Aas.{enum_name}? value = Stringification.{enum_name}FromString(
-        {III}text);
         {II}return value ?? throw new Json.JsonException(
-        {III}$"Invalid {enum_name}: {{text}}");
+        {III}$"Invalid {enum_name}: {{reader.GetString()}}");
         {I}}}
 
         {I}public override void Write(
@@ -76,118 +98,212 @@ def _generate_json_converter_for_enumeration(
     )
 
 
-def _generate_read_for_interface(interface: intermediate.Interface) -> Stripped:
-    """Generate the ``Read`` method for de-serializing the ``interface``."""
-    # NOTE (mristin, 2022-02-05):
-    # We have to perform a two-pass de-serialization.
-    #
-    # First, we have to read all the properties and pick "modelType". While we are
-    # looking for the "modelType", we have to buffer the JSON representation of the
-    # object in a separate buffer as string.
-    #
-    # Second, we dispatch to the appropriate class deserialization method once we know
-    # the model type.
-
-    # NOTE (mristin, 2022-02-05):
-    # The order how we generate the blocks does not correspond to the order of
-    # the blocks in the file as we have to nest them. Hence read this code bottom-up
-    # if you want to properly understand it.
-
-    dispatch_writer = io.StringIO()
-    dispatch_writer.write(
+#: Names of the helper methods which read a primitive value of the given type
+_PRIMITIVE_READ_METHODS = {
+    intermediate.PrimitiveType.BOOL: "ReadBool",
+    intermediate.PrimitiveType.INT: "ReadInt",
+    intermediate.PrimitiveType.FLOAT: "ReadFloat",
+    intermediate.PrimitiveType.STR: "ReadString",
+    intermediate.PrimitiveType.BYTEARRAY: "ReadBytes",
+}
+assert all(literal in _PRIMITIVE_READ_METHODS for literal in intermediate.PrimitiveType)
+
+#: Methods of ``Utf8JsonWriter`` which write a primitive value of the given type
+_PRIMITIVE_WRITE_METHODS = {
+    intermediate.PrimitiveType.BOOL: "WriteBooleanValue",
+    intermediate.PrimitiveType.INT: "WriteNumberValue",
+    intermediate.PrimitiveType.FLOAT: "WriteNumberValue",
+    intermediate.PrimitiveType.STR: "WriteStringValue",
+    intermediate.PrimitiveType.BYTEARRAY: "WriteBase64StringValue",
+}
+assert all(
+    literal in _PRIMITIVE_WRITE_METHODS for literal in intermediate.PrimitiveType
+)
+
+
+def _converter_name(
+    symbol: Union[intermediate.Enumeration, intermediate.Class]
+) -> Identifier:
+    """
+    Determine the name of the converter which de/serializes the ``symbol``.
+
+    A class with an interface is de/serialized through the interface converter
+    so that the descendants are dispatched on the model type.
+    """
+    if isinstance(symbol, intermediate.Enumeration):
+        return Identifier(f"{csharp_naming.enum_name(symbol.name)}JsonConverter")
+
+    if symbol.interface is not None:
+        return Identifier(f"{csharp_naming.interface_name(symbol.name)}JsonConverter")
+
+    return Identifier(f"{csharp_naming.class_name(symbol.name)}JsonConverter")
+
+
+def _converter_instance(converter: Identifier) -> Stripped:
+    """Generate the C# expression referring to the shared instance of ``converter``."""
+    assert converter.endswith("JsonConverter")
+    return Stripped(f"Converters.{converter[:-len('JsonConverter')]}")
+
+
+def _primitive_type_of(
+    type_annotation: intermediate.TypeAnnotationUnion,
+) -> Optional[intermediate.PrimitiveType]:
+    """Determine the primitive type of the value, if it is a primitive."""
+    if isinstance(type_annotation, intermediate.PrimitiveTypeAnnotation):
+        return type_annotation.a_type
+
+    if isinstance(type_annotation, intermediate.OurTypeAnnotation) and isinstance(
+        type_annotation.symbol, intermediate.ConstrainedPrimitive
+    ):
+        return type_annotation.symbol.constrainee
+
+    return None
+
+
+def _generate_item_converter(
+    type_annotation: intermediate.TypeAnnotationUnion,
+) -> Stripped:
+    """Generate the C# expression for the converter of the list items."""
+    if isinstance(type_annotation, intermediate.OurTypeAnnotation) and isinstance(
+        type_annotation.symbol, (intermediate.Enumeration, intermediate.Class)
+    ):
+        return _converter_instance(_converter_name(type_annotation.symbol))
+
+    # We do not generate converters for primitives and nested lists, so we have
+    # to look them up in the options. They are rare in the meta-model.
+    item_type = csharp_common.generate_type(type_annotation=type_annotation)
+    return Stripped(
+        f"(Json.Serialization.JsonConverter<{item_type}>)"
+        f"options.GetConverter(typeof({item_type}))"
+    )
+
+
+def _generate_read_value(type_annotation: intermediate.TypeAnnotationUnion) -> Stripped:
+    """Generate the C# expression reading the value at the current token."""
+    if isinstance(type_annotation, intermediate.OptionalTypeAnnotation):
+        return _generate_read_value(type_annotation=type_annotation.value)
+
+    primitive_type = _primitive_type_of(type_annotation)
+    if primitive_type is not None:
+        return Stripped(f"{_PRIMITIVE_READ_METHODS[primitive_type]}(ref reader)")
+
+    if isinstance(type_annotation, intermediate.ListTypeAnnotation):
+        item_converter = _generate_item_converter(type_annotation.items)
+        return Stripped(
+            textwrap.dedent(
+                f"""\
+                ReadList(
+                {I}ref reader,
+                {I}{item_converter},
+                {I}options)"""
+            )
+        )
+
+    assert isinstance(type_annotation, intermediate.OurTypeAnnotation)
+    symbol = type_annotation.symbol
+    assert isinstance(symbol, (intermediate.Enumeration, intermediate.Class))
+
+    a_type = csharp_common.generate_type(type_annotation=type_annotation)
+    return Stripped(
         textwrap.dedent(
             f"""\
-            var secondPassReader = new Json.Utf8JsonReader(
-            {I}buffer.GetBuffer(),
-            {I}new Json.JsonReaderOptions
-            {I}{{
-            {II}AllowTrailingCommas = options.AllowTrailingCommas,
-            {II}CommentHandling = options.ReadCommentHandling,
-            {II}MaxDepth = options.MaxDepth
-            {I}}});
-            switch (modelType)
-            {{
-            """
+            {_converter_instance(_converter_name(symbol))}.Read(
+            {I}ref reader, typeof(Aas.{a_type}), options)"""
         )
     )
 
-    for implementer in interface.implementers:
-        cls_name = csharp_naming.class_name(implementer.name)
-        json_model_type = naming.json_model_type(implementer.name)
 
-        dispatch_writer.write(
-            textwrap.indent(
-                textwrap.dedent(
-                    f"""\
-                    case {csharp_common.string_literal(json_model_type)}:
-                    {{
-                    {I}var deserialized = Json.JsonSerializer.Deserialize<Aas.{cls_name}>(
-                    {II}ref secondPassReader);
-                    {I}if (deserialized == null)
-                    {I}{{
-                    {II}throw new System.InvalidOperationException(
-                    {III}"Unexpected null {cls_name} from Deserialize call");
-                    {I}}}
-                    {I}return deserialized;
-                    }}
-                    """
-                ),
-                I,
-            )
-        )
+def _generate_write_value(
+    type_annotation: intermediate.TypeAnnotationUnion, value: str
+) -> Stripped:
+    """Generate the C# statement writing the ``value`` of the given type."""
+    if isinstance(type_annotation, intermediate.OptionalTypeAnnotation):
+        return _generate_write_value(type_annotation=type_annotation.value, value=value)
 
-    dispatch_writer.write(
-        textwrap.indent(
+    primitive_type = _primitive_type_of(type_annotation)
+    if primitive_type is not None:
+        return Stripped(f"writer.{_PRIMITIVE_WRITE_METHODS[primitive_type]}({value});")
+
+    if isinstance(type_annotation, intermediate.ListTypeAnnotation):
+        item_converter = _generate_item_converter(type_annotation.items)
+        return Stripped(
             textwrap.dedent(
                 f"""\
-                default:
-                {I}throw new Json.JsonException(
-                {II}$"Unknown model type: {{modelType}}");
-                """
-            ),
-            I,
+                WriteList(
+                {I}writer,
+                {I}{value},
+                {I}{item_converter},
+                {I}options);"""
+            )
         )
+
+    assert isinstance(type_annotation, intermediate.OurTypeAnnotation)
+    symbol = type_annotation.symbol
+    assert isinstance(symbol, (intermediate.Enumeration, intermediate.Class))
+
+    return Stripped(
+        f"{_converter_instance(_converter_name(symbol))}.Write("
+        f"writer, {value}, options);"
     )
 
-    dispatch_writer.write("}  // switch on modelType")
 
-    while_reader_body = textwrap.dedent(
-        f"""\
-// See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-if (reader.HasValueSequence)
-{{
-{II}foreach (var item in reader.ValueSequence)
-{II}{{
-{III}buffer.Write(item.Span);
-{II}}}
-}}
-else
-{{
-{I}buffer.Write(reader.ValueSpan);
-}}
+def _is_value_type(type_annotation: intermediate.TypeAnnotationUnion) -> bool:
+    """Check whether the type annotation corresponds to a C# value type."""
+    primitive_type = _primitive_type_of(type_annotation)
+    if primitive_type is not None:
+        return primitive_type not in (
+            intermediate.PrimitiveType.STR,
+            intermediate.PrimitiveType.BYTEARRAY,
+        )
 
-switch (reader.TokenType)
-{{
-{I}case Json.JsonTokenType.EndObject:
-{I}{{
-{II}{indent_but_first_line(dispatch_writer.getvalue(), II)}
-{I}}}
-{I}case Json.JsonTokenType.PropertyName:
-{I}{{
-{II}string propertyName = reader.GetString()
-{III}?? throw new System.InvalidOperationException(
-{IIII}"Unexpected null property name");
+    return isinstance(type_annotation, intermediate.OurTypeAnnotation) and isinstance(
+        type_annotation.symbol, intermediate.Enumeration
+    )
 
-{II}if (propertyName == "modelType")
-{II}{{
-{III}modelType = Json.JsonSerializer.Deserialize<string>(
-{IIII}ref reader);
-{II}}}
-{III}break;
-{I}}}
-{I}default:
-{II}throw new Json.JsonException();
-}}  // switch on token type"""
+
+def _property_name_field(json_name: Identifier) -> Stripped:
+    """Generate the C# expression of the pre-encoded JSON property name."""
+    return Stripped(f"PropertyNames.{json_name[0].upper()}{json_name[1:]}")
+
+
+def _model_type_field(json_model_type: Identifier) -> Stripped:
+    """Generate the C# expression of the pre-encoded model type."""
+    return Stripped(f"ModelTypes.{json_model_type}")
+
+
+def _generate_read_for_interface(interface: intermediate.Interface) -> Stripped:
+    """Generate the ``Read`` method for de-serializing the ``interface``."""
+    # We peek the "modelType" on a copy of the reader. The reader is a struct, so
+    # the copy is a checkpoint which costs neither a buffer nor a second parse of
+    # the object. Once we know the model type, we de-serialize the object with
+    # the original reader which still points to the start of the object.
+
+    dispatch_writer = CodeWriter()
+    for implementer in interface.implementers:
+        cls_name = csharp_naming.class_name(implementer.name)
+        model_type = _model_type_field(naming.json_model_type(implementer.name))
+        converter = _converter_instance(Identifier(f"{cls_name}JsonConverter"))
+
+        dispatch_writer.write(
+            textwrap.dedent(
+                f"""\
+                if (peekReader.ValueTextEquals(
+                {I}{model_type}.EncodedUtf8Bytes))
+                {{
+                {I}return {converter}.Read(
+                {II}ref reader, typeof(Aas.{cls_name}), options);
+                }}
+
+                """
+            )
+        )
+
+    dispatch_writer.write(
+        textwrap.dedent(
+            f"""\
+            throw new Json.JsonException(
+            {I}$"Unknown model type: {{peekReader.GetString()}}");"""
+        )
     )
 
     blocks = [
@@ -200,24 +316,47 @@ switch (reader.TokenType)
                 }}"""
             )
         ),
-        Stripped("string? modelType = null;"),
         Stripped(
-            textwrap.dedent(
-                """\
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);"""
-            )
+            f"""\
+// The reader is a struct, so the copy acts as a checkpoint.
+Json.Utf8JsonReader peekReader = reader;
+while (peekReader.Read()
+{I}&& peekReader.TokenType != Json.JsonTokenType.EndObject)
+{{
+{I}if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
+{I}{{
+{II}throw new Json.JsonException();
+{I}}}
+
+{I}bool isModelType = peekReader.ValueTextEquals(
+{II}PropertyNames.ModelType.EncodedUtf8Bytes);
+
+{I}MoveToValue(ref peekReader);
+
+{I}if (isModelType)
+{I}{{
+{II}if (peekReader.TokenType != Json.JsonTokenType.String)
+{II}{{
+{III}throw new Json.JsonException(
+{IIII}"Expected modelType to be a string");
+{II}}}
+
+{II}{indent_but_first_line(dispatch_writer.getvalue(), II)}
+{I}}}
+
+{I}if (!peekReader.TrySkip())
+{I}{{
+{II}throw new Json.JsonException();
+{I}}}
+}}  // while peekReader.Read"""
         ),
         Stripped(
             textwrap.dedent(
                 f"""\
-while (reader.Read())
-{{
-{I}{indent_but_first_line(while_reader_body, I)}
-}}  // while reader.Reader"""
+                throw new Json.JsonException(
+                {I}"Expected a modelType, but got none");"""
             )
         ),
-        Stripped("throw new Json.JsonException();"),
     ]
 
     interface_name = csharp_naming.interface_name(interface.name)
@@ -246,7 +385,7 @@ def _generate_write_for_interface(interface: intermediate.Interface) -> Stripped
 
     # region Switch on implementer type
 
-    switch_writer = io.StringIO()
+    switch_writer = CodeWriter()
     switch_writer.write(
         textwrap.dedent(
             """\
@@ -259,33 +398,30 @@ def _generate_write_for_interface(interface: intermediate.Interface) -> Stripped
     for implementer in interface.implementers:
         cls_name = csharp_naming.class_name(implementer.name)
         var_name = csharp_naming.variable_name(Identifier(f"the_{implementer.name}"))
+        converter = _converter_instance(Identifier(f"{cls_name}JsonConverter"))
 
-        switch_writer.write(
-            textwrap.indent(
+        with switch_writer.indent(I):
+            switch_writer.write(
                 textwrap.dedent(
                     f"""\
                     case {cls_name} {var_name}:
-                    {I}Json.JsonSerializer.Serialize(
-                    {II}writer, {var_name});
+                    {I}{converter}.Write(
+                    {II}writer, {var_name}, options);
                     {I}break;
                     """
-                ),
-                I,
+                )
             )
-        )
 
-    switch_writer.write(
-        textwrap.indent(
+    with switch_writer.indent(I):
+        switch_writer.write(
             textwrap.dedent(
                 f"""\
                 default:
                 {I}throw new System.ArgumentException(
                     $"Instance `that` of type {{that.GetType()}} is " +
                     $"not an implementer class of {interface_name}: {{that}}");"""
-            ),
-            I,
+            )
         )
-    )
 
     switch_writer.write("\n}")
 
@@ -326,7 +462,7 @@ def _generate_json_converter_for_interface(
 
     interface_name = csharp_naming.interface_name(interface.name)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -342,11 +478,13 @@ def _generate_json_converter_for_interface(
 
     writer.write("\n\n")
 
-    writer.write(textwrap.indent(read_code, I))
+    with writer.indent(I):
+        writer.write(read_code)
 
     writer.write("\n\n")
 
-    writer.write(textwrap.indent(write_code, I))
+    with writer.indent(I):
+        writer.write(write_code)
 
     writer.write(f"\n}}  // {interface_name}JsonConverter")
 
@@ -391,7 +529,7 @@ def _generate_read_for_class(cls: intermediate.ConcreteClass) -> Stripped:
 
     # region Final successful case
 
-    return_writer = io.StringIO()
+    return_writer = CodeWriter()
     if len(cls.constructor.arguments) > 0:
         return_writer.write(f"return new Aas.{cls_name}(\n")
 
@@ -405,16 +543,14 @@ def _generate_read_for_class(cls: intermediate.ConcreteClass) -> Stripped:
                     f"Required property is missing: {json_prop_name}"
                 )
 
-                return_writer.write(
-                    textwrap.indent(
+                with return_writer.indent(I):
+                    return_writer.write(
                         textwrap.dedent(
                             f"""\
                     {var_name} ?? throw new Json.JsonException(
                     {I}{error_msg})"""
-                        ),
-                        I,
+                        )
                     )
-                )
             else:
                 return_writer.write(f"{I}{var_name}")
 
@@ -439,83 +575,50 @@ case Json.JsonTokenType.EndObject:
     ]
 
     if len(cls.properties) > 0 or cls.serialization.with_model_type:
-        property_switch_writer = io.StringIO()
-        property_switch_writer.write(
-            textwrap.dedent(
-                f"""\
-                string propertyName = reader.GetString()
-                {I}?? throw new System.InvalidOperationException(
-                {II}"Unexpected property name null");
-
-                switch (propertyName)
-                {{
-                """
-            )
-        )
+        property_switch_writer = CodeWriter()
 
-        for prop in cls.properties:
+        # We match the property names against the pre-encoded UTF-8 bytes so that
+        # no string needs to be allocated for a property name.
+        for i, prop in enumerate(cls.properties):
             var_name = csharp_naming.variable_name(Identifier(f"the_{prop.name}"))
 
-            if isinstance(prop.type_annotation, intermediate.OptionalTypeAnnotation):
-                arg_type = csharp_common.generate_type(
-                    type_annotation=prop.type_annotation.value
-                )
-            else:
-                arg_type = csharp_common.generate_type(
-                    type_annotation=prop.type_annotation
-                )
+            property_name = _property_name_field(naming.json_property(prop.name))
+
+            read_value = _generate_read_value(type_annotation=prop.type_annotation)
 
-            json_prop_name = naming.json_property(prop.name)
+            if_keyword = "if" if i == 0 else "else if"
 
             property_switch_writer.write(
-                textwrap.indent(
-                    textwrap.dedent(
-                        f"""\
-                        case {csharp_common.string_literal(json_prop_name)}:
-                        {I}{var_name} =  (
-                        {II}Json.JsonSerializer.Deserialize<{arg_type}>(
-                        {III}ref reader));
-                        {I}break;
-                        """
-                    ),
-                    I,
-                )
+                f"""\
+{if_keyword} (reader.ValueTextEquals(
+{I}{property_name}.EncodedUtf8Bytes))
+{{
+{I}MoveToValue(ref reader);
+{I}{var_name} = {indent_but_first_line(read_value, I)};
+}}
+"""
             )
 
-        if cls.serialization.with_model_type:
+        skip_comment = (
+            "// Ignore the property modelType as we already know the exact type,\n"
+            "// and ignore an unknown property"
+            if cls.serialization.with_model_type
+            else "// Ignore an unknown property"
+        )
+
+        if len(cls.properties) == 0:
             property_switch_writer.write(
-                textwrap.indent(
-                    textwrap.dedent(
-                        f"""\
-                case "modelType":
-                {I}// Ignore the property modelType as we already know the exact type
-                {I}break;
-                """
-                    ),
-                    I,
-                )
+                f"{skip_comment}\n" f"SkipProperty(ref reader);"
             )
-
-        property_switch_writer.write(
-            textwrap.dedent(
+        else:
+            property_switch_writer.write(
                 f"""\
-            {I}default:
-            {II}// Ignore an unknown property
-            {II}if (!reader.Read())
-            {II}{{
-            {III}throw new Json.JsonException(
-            {IIII}$"Unexpected end-of-stream after the property: {{propertyName}}");
-            {II}}}
-            {II}if (!reader.TrySkip())
-            {II}{{
-            {III}throw new Json.JsonException(
-            {IIII}"Unexpected end-of-stream when skipping " +
-            {IIII}$"the value of the unknown property: {{propertyName}}");
-            {II}}}
-            {II}break;
-            }}  // switch on propertyName"""
+else
+{{
+{I}{indent_but_first_line(skip_comment, I)}
+{I}SkipProperty(ref reader);
+}}"""
             )
-        )
 
         token_case_blocks.append(
             Stripped(
@@ -536,7 +639,7 @@ case Json.JsonTokenType.PropertyName:
         )
     )
 
-    while_writer = io.StringIO()
+    while_writer = CodeWriter()
     while_writer.write(
         textwrap.dedent(
             f"""\
@@ -548,11 +651,12 @@ case Json.JsonTokenType.PropertyName:
         )
     )
 
-    for i, token_case_block in enumerate(token_case_blocks):
-        if i > 0:
-            while_writer.write("\n\n")
+    with while_writer.indent(II):
+        for i, token_case_block in enumerate(token_case_blocks):
+            if i > 0:
+                while_writer.write("\n\n")
 
-        while_writer.write(textwrap.indent(token_case_block, II))
+            while_writer.write(token_case_block)
 
     while_writer.write(
         f"\n" f"{I}}}  // switch on token type\n" f"}}  // while reader.Read"
@@ -566,7 +670,7 @@ case Json.JsonTokenType.PropertyName:
 
     # region Bundle it all together
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -579,10 +683,12 @@ case Json.JsonTokenType.PropertyName:
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
+
+            writer.write(block)
 
     writer.write("\n}")
 
@@ -596,45 +702,46 @@ def _generate_write_for_class(cls: intermediate.ConcreteClass) -> Stripped:
     blocks = [Stripped("writer.WriteStartObject();")]
 
     if cls.serialization.with_model_type:
-        json_model_type = naming.json_model_type(cls.name)
+        model_type = _model_type_field(naming.json_model_type(cls.name))
         blocks.append(
-            Stripped(
-                textwrap.dedent(
-                    f"""\
-            writer.WritePropertyName("modelType");
-            Json.JsonSerializer.Serialize(
-            {I}writer, {csharp_common.string_literal(json_model_type)});"""
-                )
-            )
+            Stripped(f"writer.WriteString(PropertyNames.ModelType, {model_type});")
         )
 
     for prop in cls.properties:
         prop_name = csharp_naming.property_name(prop.name)
-        json_prop_name = naming.json_property(prop.name)
+        property_name = _property_name_field(naming.json_property(prop.name))
 
         if not isinstance(prop.type_annotation, intermediate.OptionalTypeAnnotation):
+            write_value = _generate_write_value(
+                type_annotation=prop.type_annotation, value=f"that.{prop_name}"
+            )
+
             blocks.append(
                 Stripped(
-                    textwrap.dedent(
-                        f"""\
-                writer.WritePropertyName({csharp_common.string_literal(json_prop_name)});
-                Json.JsonSerializer.Serialize(
-                {I}writer, that.{prop_name});"""
-                    )
+                    f"""\
+writer.WritePropertyName({property_name});
+{write_value}"""
                 )
             )
         else:
+            value = (
+                f"that.{prop_name}.Value"
+                if _is_value_type(prop.type_annotation.value)
+                else f"that.{prop_name}"
+            )
+
+            write_value = _generate_write_value(
+                type_annotation=prop.type_annotation, value=value
+            )
+
             blocks.append(
                 Stripped(
-                    textwrap.dedent(
-                        f"""\
-                if (that.{prop_name} != null)
-                {{
-                {I}writer.WritePropertyName({csharp_common.string_literal(json_prop_name)});
-                {I}Json.JsonSerializer.Serialize(
-                {II}writer, that.{prop_name});
-                }}"""
-                    )
+                    f"""\
+if (that.{prop_name} != null)
+{{
+{I}writer.WritePropertyName({property_name});
+{I}{indent_but_first_line(write_value, I)}
+}}"""
                 )
             )
 
@@ -644,7 +751,7 @@ def _generate_write_for_class(cls: intermediate.ConcreteClass) -> Stripped:
 
     cls_name = csharp_naming.class_name(cls.name)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -657,10 +764,12 @@ def _generate_write_for_class(cls: intermediate.ConcreteClass) -> Stripped:
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
+
+            writer.write(block)
 
     writer.write("\n}")
 
@@ -674,7 +783,7 @@ def _generate_json_converter_for_class(cls: intermediate.ConcreteClass) -> Strip
 
     cls_name = csharp_naming.class_name(cls.name)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -685,37 +794,381 @@ def _generate_json_converter_for_class(cls: intermediate.ConcreteClass) -> Strip
         )
     )
 
-    writer.write(textwrap.indent(_generate_read_for_class(cls=cls), I))
+    with writer.indent(I):
+        writer.write(_generate_read_for_class(cls=cls))
 
     writer.write("\n\n")
 
-    writer.write(textwrap.indent(_generate_write_for_class(cls=cls), I))
+    with writer.indent(I):
+        writer.write(_generate_write_for_class(cls=cls))
 
     writer.write(f"\n}}  // {cls_name}JsonConverter")
 
     return Stripped(writer.getvalue())
 
 
-# fmt: off
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-@ensure(
-    lambda result:
-    not (result[0] is not None) or result[0].endswith('\n'),
-    "Trailing newline mandatory for valid end-of-files"
-)
-# fmt: on
-def generate(
-    symbol_table: intermediate.SymbolTable,
-    namespace: csharp_common.NamespaceIdentifier,
+def _generate_json_converters_of_symbol(
+    symbol: intermediate.Symbol,
     spec_impls: specific_implementations.SpecificImplementations,
-) -> Tuple[Optional[str], Optional[List[Error]]]:
+) -> Tuple[Optional[List[Tuple[Identifier, Stripped]]], Optional[Error]]:
     """
-    Generate the C# code for the general serialization.
+    Generate the JSON converters of the ``symbol`` together with their names.
 
-    The ``namespace`` defines the AAS C# namespace.
+    If the ``symbol`` needs no converters, return an empty list.
     """
-    errors = []  # type: List[Error]
+    if isinstance(symbol, intermediate.Enumeration):
+        return [
+            (
+                Identifier(f"{csharp_naming.enum_name(symbol.name)}JsonConverter"),
+                _generate_json_converter_for_enumeration(enumeration=symbol),
+            )
+        ], None
+
+    elif isinstance(symbol, intermediate.ConstrainedPrimitive):
+        # We do not de/serialize constrained primitives in any special way.
+        return [], None
+
+    elif isinstance(symbol, intermediate.Class):
+        result = []  # type: List[Tuple[Identifier, Stripped]]
+
+        # If it is an abstract class or a concrete class with descendants, provide
+        # a de/serialization of the corresponding interface first.
+
+        if symbol.interface is not None:
+            interface_block, error = _generate_json_converter_for_interface(
+                interface=symbol.interface
+            )
+
+            if error is not None:
+                return None, error
+
+            assert interface_block is not None
+
+            result.append(
+                (
+                    Identifier(
+                        f"{csharp_naming.interface_name(symbol.name)}JsonConverter"
+                    ),
+                    interface_block,
+                )
+            )
+
+        if isinstance(symbol, intermediate.ConcreteClass):
+            if symbol.is_implementation_specific:
+                jsonization_key = specific_implementations.ImplementationKey(
+                    f"Jsonization/{symbol.name}_json_converter.cs"
+                )
+
+                implementation = spec_impls.get(jsonization_key, None)
+                if implementation is None:
+                    return None, Error(
+                        symbol.parsed.node,
+                        f"The jsonization snippet is missing "
+                        f"for the implementation-specific "
+                        f"class {symbol.name}: {jsonization_key}",
+                    )
+
+                class_block = implementation
+            else:
+                class_block = _generate_json_converter_for_class(cls=symbol)
+
+            result.append(
+                (
+                    Identifier(f"{csharp_naming.class_name(symbol.name)}JsonConverter"),
+                    class_block,
+                )
+            )
+
+        return result, None
+
+    else:
+        assert_never(symbol)
+
+    raise AssertionError("Should not have gotten here")
+
+
+def _generate_create_json_converters(converters: Sequence[Identifier]) -> Stripped:
+    """Generate the function which lists all the ``converters``."""
+    if len(converters) == 0:
+        return Stripped(
+            textwrap.dedent(
+                f"""\
+            public static List<Json.JsonConverter> JsonConverters()
+            {{
+            {I}return new List<Json.JsonConverter>();
+            }}"""
+            )
+        )
+
+    converters_writer = io.StringIO()
+    converters_writer.write(
+        textwrap.dedent(
+            f"""\
+        /// <summary>
+        /// Create and populate a list of our custom-tailored JSON converters.
+        /// </summary>
+        public static List<Json.Serialization.JsonConverter> CreateJsonConverters()
+        {{
+        {I}return new List<Json.Serialization.JsonConverter>()
+        {I}{{
+        """
+        )
+    )
+
+    for i, converter in enumerate(converters):
+        converters_writer.write(f"{II}new {converter}()")
 
+        if i < len(converters) - 1:
+            converters_writer.write(",")
+
+        converters_writer.write("\n")
+
+    converters_writer.write(f"{I}}};\n}}")
+    return Stripped(converters_writer.getvalue())
+
+
+def _generate_converter_instances(converters: Sequence[Identifier]) -> Stripped:
+    """Generate the class which holds a shared instance of each converter."""
+    writer = CodeWriter()
+    writer.write(
+        textwrap.dedent(
+            """\
+            /// <summary>
+            /// Hold a shared instance of each converter so that the converters
+            /// call each other directly instead of looking each other up
+            /// in the serializer options.
+            /// </summary>
+            private static class Converters
+            {
+            """
+        )
+    )
+
+    for converter in converters:
+        instance = _converter_instance(converter)
+        field = instance[len("Converters.") :]
+        writer.write(
+            f"{I}internal static readonly {converter} {field} =\n"
+            f"{II}new {converter}();\n"
+        )
+
+    writer.write("}  // private static class Converters")
+
+    return Stripped(writer.getvalue())
+
+
+def _generate_encoded_names(symbol_table: intermediate.SymbolTable) -> Stripped:
+    """Generate the classes which hold the pre-encoded property names and model types."""
+    property_names = {Identifier("modelType")}  # type: Set[Identifier]
+    model_types = set()  # type: Set[Identifier]
+
+    for symbol in symbol_table.symbols:
+        if isinstance(symbol, intermediate.Class) and symbol.interface is not None:
+            for implementer in symbol.interface.implementers:
+                model_types.add(naming.json_model_type(implementer.name))
+
+        if not isinstance(symbol, intermediate.ConcreteClass):
+            continue
+
+        if symbol.serialization.with_model_type:
+            model_types.add(naming.json_model_type(symbol.name))
+
+        if not symbol.is_implementation_specific:
+            for prop in symbol.properties:
+                property_names.add(naming.json_property(prop.name))
+
+    writer = CodeWriter()
+    writer.write(
+        textwrap.dedent(
+            """\
+            /// <summary>
+            /// Hold the property names encoded in UTF-8 so that the readers match
+            /// them without allocating strings and the writers do not re-encode them.
+            /// </summary>
+            private static class PropertyNames
+            {
+            """
+        )
+    )
+
+    fields = set()  # type: Set[str]
+    for json_name in sorted(property_names):
+        field = _property_name_field(json_name)
+        assert field not in fields, f"Unexpected collision of {field!r}"
+        fields.add(field)
+
+        writer.write(
+            f"{I}internal static readonly Json.JsonEncodedText "
+            f"{field[len('PropertyNames.'):]} =\n"
+            f"{II}Json.JsonEncodedText.Encode("
+            f"{csharp_common.string_literal(json_name)});\n"
+        )
+
+    writer.write(
+        textwrap.dedent(
+            """\
+            }  // private static class PropertyNames
+
+            /// <summary>
+            /// Hold the model types encoded in UTF-8.
+            /// </summary>
+            private static class ModelTypes
+            {
+            """
+        )
+    )
+
+    for model_type in sorted(model_types):
+        writer.write(
+            f"{I}internal static readonly Json.JsonEncodedText {model_type} =\n"
+            f"{II}Json.JsonEncodedText.Encode("
+            f"{csharp_common.string_literal(model_type)});\n"
+        )
+
+    writer.write("}  // private static class ModelTypes")
+
+    return Stripped(writer.getvalue())
+
+
+# pylint: disable=line-too-long
+_HELPERS = Stripped(
+    f"""\
+private static void MoveToValue(ref Json.Utf8JsonReader reader)
+{{
+{I}if (!reader.Read())
+{I}{{
+{II}throw new Json.JsonException(
+{III}"Unexpected end-of-stream after a property name");
+{I}}}
+}}
+
+private static void SkipProperty(ref Json.Utf8JsonReader reader)
+{{
+{I}// The reader stays on the property name if the skip fails.
+{I}if (!reader.TrySkip())
+{I}{{
+{II}throw new Json.JsonException(
+{III}"Unexpected end-of-stream when skipping " +
+{III}$"the value of the property: {{reader.GetString()}}");
+{I}}}
+}}
+
+private static bool ReadBool(ref Json.Utf8JsonReader reader)
+{{
+{I}switch (reader.TokenType)
+{I}{{
+{II}case Json.JsonTokenType.True:
+{III}return true;
+{II}case Json.JsonTokenType.False:
+{III}return false;
+{II}default:
+{III}throw new Json.JsonException(
+{IIII}$"Expected a boolean, but got: {{reader.TokenType}}");
+{I}}}
+}}
+
+private static int ReadInt(ref Json.Utf8JsonReader reader)
+{{
+{I}if (reader.TokenType != Json.JsonTokenType.Number
+{II}|| !reader.TryGetInt32(out int value))
+{I}{{
+{II}throw new Json.JsonException(
+{III}$"Expected a 32-bit integer, but got: {{reader.TokenType}}");
+{I}}}
+
+{I}return value;
+}}
+
+private static float ReadFloat(ref Json.Utf8JsonReader reader)
+{{
+{I}if (reader.TokenType != Json.JsonTokenType.Number
+{II}|| !reader.TryGetSingle(out float value))
+{I}{{
+{II}throw new Json.JsonException(
+{III}$"Expected a single-precision number, but got: {{reader.TokenType}}");
+{I}}}
+
+{I}return value;
+}}
+
+private static string ReadString(ref Json.Utf8JsonReader reader)
+{{
+{I}if (reader.TokenType != Json.JsonTokenType.String)
+{I}{{
+{II}throw new Json.JsonException(
+{III}$"Expected a string, but got: {{reader.TokenType}}");
+{I}}}
+
+{I}return reader.GetString()
+{II}?? throw new System.InvalidOperationException(
+{III}"Unexpected null string");
+}}
+
+private static byte[] ReadBytes(ref Json.Utf8JsonReader reader)
+{{
+{I}if (reader.TokenType != Json.JsonTokenType.String
+{II}|| !reader.TryGetBytesFromBase64(out byte[]? value))
+{I}{{
+{II}throw new Json.JsonException(
+{III}$"Expected a base64-encoded string, but got: {{reader.TokenType}}");
+{I}}}
+
+{I}return value;
+}}
+
+private static List<T> ReadList<T>(
+{I}ref Json.Utf8JsonReader reader,
+{I}Json.Serialization.JsonConverter<T> converter,
+{I}Json.JsonSerializerOptions options)
+{{
+{I}if (reader.TokenType != Json.JsonTokenType.StartArray)
+{I}{{
+{II}throw new Json.JsonException(
+{III}$"Expected an array, but got: {{reader.TokenType}}");
+{I}}}
+
+{I}var result = new List<T>();
+{I}while (reader.Read())
+{I}{{
+{II}if (reader.TokenType == Json.JsonTokenType.EndArray)
+{II}{{
+{III}return result;
+{II}}}
+
+{II}result.Add(
+{III}converter.Read(ref reader, typeof(T), options)
+{III}?? throw new Json.JsonException("Unexpected null item"));
+{I}}}
+
+{I}throw new Json.JsonException("Unexpected end-of-stream in an array");
+}}
+
+private static void WriteList<T>(
+{I}Json.Utf8JsonWriter writer,
+{I}List<T> items,
+{I}Json.Serialization.JsonConverter<T> converter,
+{I}Json.JsonSerializerOptions options)
+{{
+{I}writer.WriteStartArray();
+{I}foreach (var item in items)
+{I}{{
+{II}converter.Write(writer, item, options);
+{I}}}
+{I}writer.WriteEndArray();
+}}"""
+)
+# pylint: enable=line-too-long
+
+
+def _write_start_of_file(
+    out: CodeWriter, namespace: csharp_common.NamespaceIdentifier, partial: bool
+) -> None:
+    """
+    Write the header of a jsonization file and open the ``Jsonization`` class.
+
+    If ``partial`` is set, the class ``Jsonization`` is declared as partial.
+    """
     # pylint: disable=line-too-long
     blocks = [
         csharp_common.WARNING,
@@ -742,153 +1195,203 @@ def generate(
         ),
     ]
 
+    for block in blocks:
+        assert not block.startswith("\n")
+        assert not block.endswith("\n")
+        out.write(block)
+        out.write("\n\n")
+
+    keyword = "partial class" if partial else "class"
+
+    # BEFORE-RELEASE (mristin, 2021-11-06): add a good docstring 🠒 add examples!
+    out.write(
+        textwrap.dedent(
+            f"""\
+        namespace {namespace}
+        {{
+        {I}public static {keyword} Jsonization
+        {I}{{
+        """
+        )
+    )
+
+
+def _write_end_of_file(
+    out: CodeWriter, namespace: csharp_common.NamespaceIdentifier, partial: bool
+) -> None:
+    """Close the ``Jsonization`` class and write the footer of a jsonization file."""
+    keyword = "partial class" if partial else "class"
+    out.write(f"\n{I}}}  // public static {keyword} Jsonization")
+    out.write(f"\n}}  // namespace {namespace}")
+
+    out.write("\n\n")
+    out.write(csharp_common.WARNING)
+    out.write("\n")
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def generate_chunks(
+    symbol_table: intermediate.SymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Iterator[str]], Optional[List[Error]]]:
+    """
+    Generate the C# code for the general serialization in chunks.
+
+    The ``namespace`` defines the AAS C# namespace.
+
+    The chunks are meant to be streamed, *e.g.*, to a file, without joining them.
+    """
+    errors = []  # type: List[Error]
+
     jsonization_blocks = []  # type: List[Stripped]
     converters = []  # type: List[Identifier]
 
     for symbol in symbol_table.symbols:
-        jsonization_block = None  # type: Optional[Stripped]
+        converters_of_symbol, error = _generate_json_converters_of_symbol(
+            symbol=symbol, spec_impls=spec_impls
+        )
+        if error is not None:
+            errors.append(error)
+            continue
 
-        if isinstance(symbol, intermediate.Enumeration):
-            jsonization_block = _generate_json_converter_for_enumeration(
-                enumeration=symbol
-            )
+        assert converters_of_symbol is not None
 
-            converters.append(
-                Identifier(f"{csharp_naming.enum_name(symbol.name)}JsonConverter")
-            )
+        for converter, jsonization_block in converters_of_symbol:
+            converters.append(converter)
+            jsonization_blocks.append(jsonization_block)
 
-        elif isinstance(symbol, intermediate.ConstrainedPrimitive):
-            # We do not de/serialize constrained primitives in any special way.
-            continue
+    jsonization_blocks.append(_generate_create_json_converters(converters=converters))
+    jsonization_blocks.append(_generate_converter_instances(converters=converters))
+    jsonization_blocks.append(_generate_encoded_names(symbol_table=symbol_table))
+    jsonization_blocks.append(_HELPERS)
 
-        elif isinstance(symbol, intermediate.Class):
-            # If it is an abstract class or a concrete class with descendants, provide
-            # a de/serialization of the corresponding interface first.
+    if len(errors) > 0:
+        return None, errors
 
-            if symbol.interface is not None:
-                jsonization_block, error = _generate_json_converter_for_interface(
-                    interface=symbol.interface
-                )
+    out = CodeWriter()
+    _write_start_of_file(out=out, namespace=namespace, partial=False)
 
-                if error is not None:
-                    errors.append(error)
-                    continue
+    with out.indent(II):
+        for i, jsonization_block in enumerate(jsonization_blocks):
+            if i > 0:
+                out.write("\n\n")
 
-                converters.append(
-                    Identifier(
-                        f"{csharp_naming.interface_name(symbol.name)}JsonConverter"
-                    )
-                )
+            out.write(jsonization_block)
 
-            if isinstance(symbol, intermediate.ConcreteClass):
-                if symbol.is_implementation_specific:
-                    jsonization_key = specific_implementations.ImplementationKey(
-                        f"Jsonization/{symbol.name}_json_converter.cs"
-                    )
+    _write_end_of_file(out=out, namespace=namespace, partial=False)
 
-                    implementation = spec_impls.get(jsonization_key, None)
-                    if implementation is None:
-                        errors.append(
-                            Error(
-                                symbol.parsed.node,
-                                f"The jsonization snippet is missing "
-                                f"for the implementation-specific "
-                                f"class {symbol.name}: {jsonization_key}",
-                            )
-                        )
-                        continue
+    return out.chunks(), None
 
-                    jsonization_block = spec_impls[jsonization_key]
-                else:
-                    jsonization_block = _generate_json_converter_for_class(cls=symbol)
 
-                converters.append(
-                    Identifier(f"{csharp_naming.class_name(symbol.name)}JsonConverter")
-                )
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@ensure(
+    lambda result: not (result[0] is not None)
+    or all(code.endswith("\n") for code in result[0].values()),
+    "Trailing newline mandatory for valid end-of-files",
+)
+def generate_shards(
+    symbol_table: intermediate.SymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Mapping[str, str]], Optional[List[Error]]]:
+    """
+    Generate the C# code for the general serialization in one file per symbol.
 
-        else:
-            assert_never(symbol)
+    The ``namespace`` defines the AAS C# namespace.
 
-        assert jsonization_block is not None
-        jsonization_blocks.append(jsonization_block)
+    The class ``Jsonization`` is split as a partial class. The list of all
+    the converters is generated in ``"Jsonization.cs"``.
 
-    if len(converters) == 0:
-        jsonization_blocks.append(
-            Stripped(
-                textwrap.dedent(
-                    f"""\
-            public static List<Json.JsonConverter> JsonConverters()
-            {{
-            {I}return new List<Json.JsonConverter>();
-            }}"""
-                )
-            )
-        )
-    else:
-        converters_writer = io.StringIO()
-        converters_writer.write(
-            textwrap.dedent(
-                f"""\
-            /// <summary>
-            /// Create and populate a list of our custom-tailored JSON converters.
-            /// </summary>
-            public static List<Json.Serialization.JsonConverter> CreateJsonConverters()
-            {{
-            {I}return new List<Json.Serialization.JsonConverter>()
-            {I}{{
-            """
-            )
+    Return the code mapped by the file names, *e.g.*, ``"Submodel.cs"``.
+    """
+    errors = []  # type: List[Error]
+
+    blocks_by_name = dict()  # type: Dict[str, List[Stripped]]
+    converters = []  # type: List[Identifier]
+
+    for symbol in symbol_table.symbols:
+        converters_of_symbol, error = _generate_json_converters_of_symbol(
+            symbol=symbol, spec_impls=spec_impls
         )
+        if error is not None:
+            errors.append(error)
+            continue
 
-        for i, converter in enumerate(converters):
-            converters_writer.write(f"{II}new {converter}()")
+        assert converters_of_symbol is not None
 
-            if i < len(converters) - 1:
-                converters_writer.write(",")
+        if len(converters_of_symbol) == 0:
+            continue
 
-            converters_writer.write("\n")
+        name = None  # type: Optional[str]
+        if isinstance(symbol, intermediate.Enumeration):
+            name = csharp_naming.enum_name(symbol.name)
+        elif isinstance(symbol, intermediate.ConstrainedPrimitive):
+            name = csharp_naming.class_name(symbol.name)
+        elif isinstance(symbol, intermediate.AbstractClass):
+            name = csharp_naming.interface_name(symbol.name)
+        elif isinstance(symbol, intermediate.ConcreteClass):
+            name = csharp_naming.class_name(symbol.name)
+        else:
+            assert_never(symbol)
 
-        converters_writer.write(f"{I}}};\n}}")
-        jsonization_blocks.append(Stripped(converters_writer.getvalue()))
+        assert name is not None
+
+        converters.extend(converter for converter, _ in converters_of_symbol)
+        blocks_by_name[name] = [block for _, block in converters_of_symbol]
 
     if len(errors) > 0:
         return None, errors
 
-    writer = io.StringIO()
-    # BEFORE-RELEASE (mristin, 2021-11-06): add a good docstring 🠒 add examples!
-    writer.write(
-        textwrap.dedent(
-            f"""\
-        namespace {namespace}
-        {{
-        {I}public static class Jsonization
-        {I}{{
-        """
-        )
-    )
+    blocks_by_name["Jsonization"] = [
+        _generate_create_json_converters(converters=converters),
+        _generate_converter_instances(converters=converters),
+        _generate_encoded_names(symbol_table=symbol_table),
+        _HELPERS,
+    ]
 
-    for i, jsonization_block in enumerate(jsonization_blocks):
-        if i > 0:
-            writer.write("\n\n")
+    shards = dict()  # type: Dict[str, str]
+    for name, blocks in blocks_by_name.items():
+        out = CodeWriter()
+        _write_start_of_file(out=out, namespace=namespace, partial=True)
 
-        writer.write(textwrap.indent(jsonization_block, II))
+        with out.indent(II):
+            for i, block in enumerate(blocks):
+                if i > 0:
+                    out.write("\n\n")
 
-    writer.write(f"\n{I}}}  // public static class Jsonization")
-    writer.write(f"\n}}  // namespace {namespace}")
+                out.write(block)
 
-    blocks.append(Stripped(writer.getvalue()))
+        _write_end_of_file(out=out, namespace=namespace, partial=True)
 
-    blocks.append(csharp_common.WARNING)
+        shards[f"{name}.cs"] = out.getvalue()
 
-    out = io.StringIO()
-    for i, block in enumerate(blocks):
-        if i > 0:
-            out.write("\n\n")
+    return shards, None
 
-        assert not block.startswith("\n")
-        assert not block.endswith("\n")
-        out.write(block)
 
-    out.write("\n")
+# fmt: off
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@ensure(
+    lambda result:
+    not (result[0] is not None) or result[0].endswith('\n'),
+    "Trailing newline mandatory for valid end-of-files"
+)
+# fmt: on
+def generate(
+    symbol_table: intermediate.SymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[str], Optional[List[Error]]]:
+    """
+    Generate the C# code for the general serialization.
+
+    The ``namespace`` defines the AAS C# namespace.
+    """
+    chunks, errors = generate_chunks(
+        symbol_table=symbol_table, namespace=namespace, spec_impls=spec_impls
+    )
+    if errors is not None:
+        return None, errors
 
-    return out.getvalue(), None
+    assert chunks is not None
+    return "".join(chunks), None
@@ -0,0 +1,19 @@
+"""
+Define the layouts of the generated C# files.
+
+This module is kept free of heavy imports so that the command-line interface can
+list the layouts without loading the C# generators.
+"""
+import enum
+
+
+class Layout(enum.Enum):
+    """List the layouts of the generated C# files."""
+
+    #: Generate the structures, verification and jsonization each in a single file
+    SINGLE_FILE = "single_file"
+
+    #: Generate the structures, verification and jsonization in one file per
+    #: symbol in the directories ``Types/``, ``Verification/`` and ``Jsonization/``,
+    #: respectively, so that a change to a symbol touches only a couple of files
+    SHARDED = "sharded"
@@ -1,5 +1,14 @@
 """Generate C# code to handle asset administration shells based on the meta-model."""
-from typing import TextIO
+import functools
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.process
+import os
+import pathlib
+import sys
+import threading
+import traceback
+from typing import TextIO, Optional, List, Callable, Sequence, Mapping, Tuple, Dict
 
 from aas_core_codegen import specific_implementations, run, intermediate
 from aas_core_codegen.csharp import (
@@ -9,202 +18,222 @@ from aas_core_codegen.csharp import (
     verification as csharp_verification,
     stringification as csharp_stringification,
     jsonization as csharp_jsonization,
+    layout as csharp_layout,
+    regex_mode as csharp_regex_mode,
 )
 
 
-def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
-    """Generate the code."""
-    verified_ir_table, errors = csharp_structure.verify(
-        symbol_table=context.symbol_table
-    )
+Layout = csharp_layout.Layout
+RegexMode = csharp_regex_mode.RegexMode
 
-    if errors is not None:
-        run.write_error_report(
-            message=f"Failed to verify the intermediate symbol table "
-            f"for generation of C# code"
-            f"based on {context.model_path}",
-            errors=[context.lineno_columner.error_message(error) for error in errors],
-            stderr=stderr,
-        )
-        return 1
 
-    assert verified_ir_table is not None
+class _ErrorReport:
+    """Represent an error report from the generation of a single file."""
 
-    unsupported_contracts_errors = (
-        intermediate.errors_if_contracts_for_functions_or_methods_defined(
-            verified_ir_table
-        )
-    )
-    if unsupported_contracts_errors is not None:
-        run.write_error_report(
-            message=f"We do not support pre and post-conditions and snapshots "
-            f"at the moment. Please notify the developers if you need this "
-            f"feature (based on meta-model {context.model_path})",
-            errors=[
-                context.lineno_columner.error_message(error)
-                for error in unsupported_contracts_errors
-            ],
-            stderr=stderr,
-        )
-        return 1
+    def __init__(self, message: str, errors: List[str]) -> None:
+        """Initialize with the given values."""
+        self.message = message
+        self.errors = errors
 
-    unsupported_methods_errors = (
-        intermediate.errors_if_non_implementation_specific_methods(verified_ir_table)
-    )
-    if unsupported_methods_errors is not None:
-        run.write_error_report(
-            message=f"We added some support for understood methods already and keep "
-            f"maintaining it as it is only a matter of time when we will "
-            f"introduce their transpilation. Introducing them after the fact "
-            f"would have been much more difficult.\n"
-            f"\n"
-            f"At the given moment, however, we deliberately focus only on "
-            f"implementation-specific methods. "
-            f"(based on meta-model {context.model_path})",
-            errors=[
-                context.lineno_columner.error_message(error)
-                for error in unsupported_methods_errors
-            ],
-            stderr=stderr,
-        )
-        return 1
 
-    namespace_key = specific_implementations.ImplementationKey("namespace.txt")
-    namespace_text = context.spec_impls.get(namespace_key, None)
-    if namespace_text is None:
-        stderr.write(f"The namespace snippet is missing: {namespace_key}\n")
-        return 1
+def _write_shards(
+    shards: Mapping[str, str], directory: pathlib.Path, what: str
+) -> Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]:
+    """
+    Write the ``shards`` of the C# code for ``what`` to the ``directory``.
 
-    if not csharp_common.NAMESPACE_IDENTIFIER_RE.fullmatch(namespace_text):
-        stderr.write(
-            f"The text from the snippet {namespace_key} "
-            f"is not a valid namespace identifier: {namespace_text!r}\n"
+    Return the hashes of the written files relative to the ``directory``'s parent.
+    """
+    directory.mkdir(exist_ok=True)
+
+    hashes = dict()  # type: Dict[str, str]
+    for name, code in shards.items():
+        pth = directory / name
+        try:
+            hashes[f"{directory.name}/{name}"] = run.write_text(path=pth, text=code)
+        except Exception as exception:
+            return None, _ErrorReport(
+                message=f"Failed to write the {what} to {pth}",
+                errors=[str(exception)],
+            )
+
+    return hashes, None
+
+
+def _generate_structure(
+    context: run.Context,
+    verified_ir_table: csharp_structure.VerifiedIntermediateSymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    layout: Layout,
+) -> Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]:
+    """Generate the C# structures and write them to the output directory."""
+    if layout is Layout.SHARDED:
+        shards, errors = csharp_structure.generate_shards(
+            symbol_table=verified_ir_table,
+            namespace=namespace,
+            spec_impls=context.spec_impls,
         )
-        return 1
 
-    namespace = csharp_common.NamespaceIdentifier(namespace_text)
+        if errors is not None:
+            return None, _ErrorReport(
+                message=f"Failed to generate the structures in the C# code "
+                f"based on {context.model_path}",
+                errors=[
+                    context.lineno_columner.error_message(error) for error in errors
+                ],
+            )
 
-    # region Structure
+        assert shards is not None
 
-    code, errors = csharp_structure.generate(
+        return _write_shards(
+            shards=shards, directory=context.output_dir / "Types", what="C# structures"
+        )
+
+    chunks, errors = csharp_structure.generate_chunks(
         symbol_table=verified_ir_table,
         namespace=namespace,
         spec_impls=context.spec_impls,
     )
 
     if errors is not None:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to generate the structures in the C# code "
             f"based on {context.model_path}",
             errors=[context.lineno_columner.error_message(error) for error in errors],
-            stderr=stderr,
         )
-        return 1
 
-    assert code is not None
+    assert chunks is not None
 
     pth = context.output_dir / "types.cs"
     try:
-        pth.write_text(code, encoding="utf-8")
+        digest = run.write_chunks(path=pth, chunks=chunks)
     except Exception as exception:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to write the C# structures to {pth}",
             errors=[str(exception)],
-            stderr=stderr,
         )
-        return 1
 
-    # endregion
+    return {pth.name: digest}, None
 
-    # region Visitation
 
+def _generate_visitation(
+    context: run.Context, namespace: csharp_common.NamespaceIdentifier
+) -> Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]:
+    """Generate the C# code for visitation and write it to the output directory."""
     code, errors = csharp_visitation.generate(
         symbol_table=context.symbol_table, namespace=namespace
     )
 
     if errors is not None:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to generate the C# code for visitation "
             f"based on {context.model_path}",
             errors=[context.lineno_columner.error_message(error) for error in errors],
-            stderr=stderr,
         )
-        return 1
 
     assert code is not None
 
     pth = context.output_dir / "visitation.cs"
     try:
-        pth.write_text(code, encoding="utf-8")
+        digest = run.write_text(path=pth, text=code)
     except Exception as exception:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to write the visitation C# code to {pth}",
             errors=[str(exception)],
-            stderr=stderr,
         )
-        return 1
 
-    # endregion
+    return {pth.name: digest}, None
 
-    # region Verification
 
+def _generate_verification(
+    context: run.Context,
+    verified_ir_table: csharp_structure.VerifiedIntermediateSymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    layout: Layout,
+    regex_mode: RegexMode,
+    regex_timeout_ms: Optional[int],
+) -> Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]:
+    """Generate the C# code for verification and write it to the output directory."""
     verify_errors = csharp_verification.verify(
         spec_impls=context.spec_impls,
         verification_functions=verified_ir_table.verification_functions,
     )
 
-    if errors is not None:
-        run.write_error_report(
+    if verify_errors is not None:
+        return None, _ErrorReport(
             message="Failed to verify the C#-specific structures",
             errors=verify_errors,
-            stderr=stderr,
         )
-        return 1
 
-    code, errors = csharp_verification.generate(
+    if layout is Layout.SHARDED:
+        shards, errors = csharp_verification.generate_shards(
+            symbol_table=verified_ir_table,
+            namespace=namespace,
+            spec_impls=context.spec_impls,
+            regex_mode=regex_mode,
+            regex_timeout_ms=regex_timeout_ms,
+        )
+
+        if errors is not None:
+            return None, _ErrorReport(
+                message=f"Failed to generate the verification C# code "
+                f"based on {context.model_path}",
+                errors=[
+                    context.lineno_columner.error_message(error) for error in errors
+                ],
+            )
+
+        assert shards is not None
+
+        return _write_shards(
+            shards=shards,
+            directory=context.output_dir / "Verification",
+            what="verification C# code",
+        )
+
+    chunks, errors = csharp_verification.generate_chunks(
         symbol_table=verified_ir_table,
         namespace=namespace,
         spec_impls=context.spec_impls,
+        regex_mode=regex_mode,
+        regex_timeout_ms=regex_timeout_ms,
     )
 
     if errors is not None:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to generate the verification C# code "
             f"based on {context.model_path}",
             errors=[context.lineno_columner.error_message(error) for error in errors],
-            stderr=stderr,
         )
-        return 1
 
-    assert code is not None
+    assert chunks is not None
 
     pth = context.output_dir / "verification.cs"
     try:
-        pth.write_text(code, encoding="utf-8")
+        digest = run.write_chunks(path=pth, chunks=chunks)
     except Exception as exception:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to write the verification C# code to {pth}",
             errors=[str(exception)],
-            stderr=stderr,
         )
-        return 1
 
-    # endregion
+    return {pth.name: digest}, None
 
-    # region Stringification
 
+def _generate_stringification(
+    context: run.Context, namespace: csharp_common.NamespaceIdentifier
+) -> Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]:
+    """Generate the C# code for stringification and write it to the output directory."""
     code, errors = csharp_stringification.generate(
         symbol_table=context.symbol_table, namespace=namespace
     )
 
     if errors is not None:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to generate the stringification C# code "
             f"based on {context.model_path}",
             errors=[context.lineno_columner.error_message(error) for error in errors],
-            stderr=stderr,
         )
-        return 1
 
     assert code is not None
 
@@ -212,50 +241,321 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
     pth.parent.mkdir(exist_ok=True)
 
     try:
-        pth.write_text(code, encoding="utf-8")
+        digest = run.write_text(path=pth, text=code)
     except Exception as exception:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to write the stringification C# code to {pth}",
             errors=[str(exception)],
-            stderr=stderr,
         )
-        return 1
 
-    # endregion
+    return {pth.name: digest}, None
+
 
-    # region Jsonization
+def _generate_jsonization(
+    context: run.Context, namespace: csharp_common.NamespaceIdentifier, layout: Layout
+) -> Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]:
+    """Generate the C# code for jsonization and write it to the output directory."""
+    if layout is Layout.SHARDED:
+        shards, errors = csharp_jsonization.generate_shards(
+            symbol_table=context.symbol_table,
+            namespace=namespace,
+            spec_impls=context.spec_impls,
+        )
+
+        if errors is not None:
+            return None, _ErrorReport(
+                message=f"Failed to generate the jsonization C# code "
+                f"based on {context.model_path}",
+                errors=[
+                    context.lineno_columner.error_message(error) for error in errors
+                ],
+            )
+
+        assert shards is not None
+
+        return _write_shards(
+            shards=shards,
+            directory=context.output_dir / "Jsonization",
+            what="jsonization C# code",
+        )
 
-    code, errors = csharp_jsonization.generate(
+    chunks, errors = csharp_jsonization.generate_chunks(
         symbol_table=context.symbol_table,
         namespace=namespace,
         spec_impls=context.spec_impls,
     )
 
     if errors is not None:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to generate the jsonization C# code "
             f"based on {context.model_path}",
             errors=[context.lineno_columner.error_message(error) for error in errors],
-            stderr=stderr,
         )
-        return 1
 
-    assert code is not None
+    assert chunks is not None
 
     pth = context.output_dir / "jsonization.cs"
     pth.parent.mkdir(exist_ok=True)
 
     try:
-        pth.write_text(code, encoding="utf-8")
+        digest = run.write_chunks(path=pth, chunks=chunks)
     except Exception as exception:
-        run.write_error_report(
+        return None, _ErrorReport(
             message=f"Failed to write the jsonization C# code to {pth}",
             errors=[str(exception)],
+        )
+
+    return {pth.name: digest}, None
+
+
+_Job = Callable[[], Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]]
+
+
+def _execute_job(
+    job: _Job,
+    spec_impls: specific_implementations.SnippetStore,
+    connection: multiprocessing.connection.Connection,
+) -> None:
+    """
+    Execute the ``job`` in a worker process and send its outcome over ``connection``.
+
+    The outcome is paired with the keys of the snippets accessed by the job.
+    """
+    try:
+        result = job()
+    except Exception:  # pylint: disable=broad-except
+        result = (
+            None,
+            _ErrorReport(
+                message="Failed to execute a job of the C# code generation",
+                errors=[traceback.format_exc()],
+            ),
+        )
+
+    connection.send((result, spec_impls.accessed_keys()))
+    connection.close()
+
+
+def _can_fork() -> bool:
+    """
+    Check whether we can safely fork the worker processes.
+
+    We fork only on Linux, since forking is unsafe on macOS, and only if this
+    process runs a single thread, since the other threads are not forked and
+    might hold the locks which the workers need.
+    """
+    return sys.platform.startswith("linux") and threading.active_count() == 1
+
+
+def _execute_jobs(
+    jobs: Sequence[_Job],
+    spec_impls: specific_implementations.SnippetStore,
+) -> List[Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]]:
+    """
+    Execute the ``jobs`` in parallel, if possible, and collect the results in order.
+
+    Each job results either in the hashes of the written files, or in an error report.
+    The snippets accessed by the jobs are recorded in ``spec_impls``.
+
+    The jobs are executed in the forked processes so that the workers inherit
+    the symbol table instead of un-pickling it. We execute the jobs sequentially
+    if there is only a single CPU, or if we can not safely fork.
+    """
+    cpu_count = os.cpu_count() or 1
+
+    if cpu_count == 1 or len(jobs) == 1 or not _can_fork():
+        return [job() for job in jobs]
+
+    fork_context = multiprocessing.get_context("fork")
+
+    results = (
+        []
+    )  # type: List[Tuple[Optional[Mapping[str, str]], Optional[_ErrorReport]]]
+
+    for start in range(0, len(jobs), cpu_count):
+        processes = []  # type: List[multiprocessing.process.BaseProcess]
+        receivers = []  # type: List[multiprocessing.connection.Connection]
+
+        for job in jobs[start : start + cpu_count]:
+            receiver, sender = fork_context.Pipe(duplex=False)
+            worker = fork_context.Process(
+                target=_execute_job, args=(job, spec_impls, sender)
+            )
+            worker.start()
+            sender.close()
+
+            processes.append(worker)
+            receivers.append(receiver)
+
+        for process, receiver in zip(processes, receivers):
+            try:
+                result, accessed_keys = receiver.recv()
+            except EOFError:
+                result = (
+                    None,
+                    _ErrorReport(
+                        message="A worker process of the C# code generation "
+                        "exited unexpectedly",
+                        errors=[],
+                    ),
+                )
+                accessed_keys = []
+            finally:
+                receiver.close()
+                process.join()
+
+            spec_impls.record_accessed(accessed_keys)
+            results.append(result)
+
+    return results
+
+
+def execute(
+    context: run.Context,
+    stdout: TextIO,
+    stderr: TextIO,
+    layout: Layout = Layout.SINGLE_FILE,
+    regex_mode: RegexMode = RegexMode.INTERPRETED,
+    regex_timeout_ms: Optional[int] = None,
+) -> int:
+    """
+    Generate the code in the given ``layout``.
+
+    The regular expressions are constructed according to the ``regex_mode``.
+    If ``regex_timeout_ms`` is given, the matching is limited to that many
+    milliseconds.
+    """
+    verified_ir_table, errors = csharp_structure.verify(
+        symbol_table=context.symbol_table
+    )
+
+    if errors is not None:
+        run.write_error_report(
+            message=f"Failed to verify the intermediate symbol table "
+            f"for generation of C# code"
+            f"based on {context.model_path}",
+            errors=[context.lineno_columner.error_message(error) for error in errors],
+            stderr=stderr,
+        )
+        return 1
+
+    assert verified_ir_table is not None
+
+    unsupported_contracts_errors = (
+        intermediate.errors_if_contracts_for_functions_or_methods_defined(
+            verified_ir_table
+        )
+    )
+    if unsupported_contracts_errors is not None:
+        run.write_error_report(
+            message=f"We do not support pre and post-conditions and snapshots "
+            f"at the moment. Please notify the developers if you need this "
+            f"feature (based on meta-model {context.model_path})",
+            errors=[
+                context.lineno_columner.error_message(error)
+                for error in unsupported_contracts_errors
+            ],
             stderr=stderr,
         )
         return 1
 
-    # endregion
+    unsupported_methods_errors = (
+        intermediate.errors_if_non_implementation_specific_methods(verified_ir_table)
+    )
+    if unsupported_methods_errors is not None:
+        run.write_error_report(
+            message=f"We added some support for understood methods already and keep "
+            f"maintaining it as it is only a matter of time when we will "
+            f"introduce their transpilation. Introducing them after the fact "
+            f"would have been much more difficult.\n"
+            f"\n"
+            f"At the given moment, however, we deliberately focus only on "
+            f"implementation-specific methods. "
+            f"(based on meta-model {context.model_path})",
+            errors=[
+                context.lineno_columner.error_message(error)
+                for error in unsupported_methods_errors
+            ],
+            stderr=stderr,
+        )
+        return 1
+
+    namespace_key = specific_implementations.ImplementationKey("namespace.txt")
+    namespace_text = context.spec_impls.get(namespace_key, None)
+    if namespace_text is None:
+        stderr.write(f"The namespace snippet is missing: {namespace_key}\n")
+        return 1
+
+    if not csharp_common.NAMESPACE_IDENTIFIER_RE.fullmatch(namespace_text):
+        stderr.write(
+            f"The text from the snippet {namespace_key} "
+            f"is not a valid namespace identifier: {namespace_text!r}\n"
+        )
+        return 1
+
+    namespace = csharp_common.NamespaceIdentifier(namespace_text)
+
+    # The files are generated independently of each other from the same symbol
+    # table, so that we can generate them in parallel. The reports are written
+    # in the order of the jobs so that the output is deterministic.
+    jobs = [
+        functools.partial(
+            _generate_structure,
+            context=context,
+            verified_ir_table=verified_ir_table,
+            namespace=namespace,
+            layout=layout,
+        ),
+        functools.partial(_generate_visitation, context=context, namespace=namespace),
+        functools.partial(
+            _generate_verification,
+            context=context,
+            verified_ir_table=verified_ir_table,
+            namespace=namespace,
+            layout=layout,
+            regex_mode=regex_mode,
+            regex_timeout_ms=regex_timeout_ms,
+        ),
+        functools.partial(
+            _generate_stringification, context=context, namespace=namespace
+        ),
+        functools.partial(
+            _generate_jsonization, context=context, namespace=namespace, layout=layout
+        ),
+    ]  # type: List[_Job]
+
+    hashes = dict()  # type: Dict[str, str]
+    failed = False
+
+    for hashes_of_job, report in _execute_jobs(
+        jobs=jobs, spec_impls=context.spec_impls
+    ):
+        if report is not None:
+            run.write_error_report(
+                message=report.message, errors=report.errors, stderr=stderr
+            )
+            failed = True
+        else:
+            assert hashes_of_job is not None
+            hashes.update(hashes_of_job)
+
+    if failed:
+        return 1
+
+    try:
+        run.write_manifest(
+            context=context,
+            target="csharp",
+            hashes=hashes,
+            options={"layout": layout.value},
+        )
+    except Exception as exception:
+        run.write_error_report(
+            message=f"Failed to write the manifest to {context.output_dir}",
+            errors=[str(exception)],
+            stderr=stderr,
+        )
+        return 1
 
     stdout.write(f"Code generated to: {context.output_dir}\n")
     return 0
@@ -1,10 +1,12 @@
 """Generate C# identifiers based on the identifiers from the meta-model."""
+import functools
 from typing import Union
 
 from aas_core_codegen import intermediate
 from aas_core_codegen.common import Identifier, assert_never
 
 
+@functools.lru_cache(maxsize=None)
 def interface_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# interface name based on its meta-model ``identifier``.
@@ -20,6 +22,7 @@ def interface_name(identifier: Identifier) -> Identifier:
     return Identifier("I{}".format("".join(part.capitalize() for part in parts)))
 
 
+@functools.lru_cache(maxsize=None)
 def enum_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for an enum based on its meta-model ``identifier``.
@@ -35,6 +38,7 @@ def enum_name(identifier: Identifier) -> Identifier:
     return Identifier("{}".format("".join(part.capitalize() for part in parts)))
 
 
+@functools.lru_cache(maxsize=None)
 def enum_literal_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for an enum literal based on its meta-model ``identifier``.
@@ -50,6 +54,7 @@ def enum_literal_name(identifier: Identifier) -> Identifier:
     return Identifier("{}".format("".join(part.capitalize() for part in parts)))
 
 
+@functools.lru_cache(maxsize=None)
 def class_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for a class based on its meta-model ``identifier``.
@@ -86,6 +91,7 @@ def name_of(
     raise AssertionError("Should not have gotten here")
 
 
+@functools.lru_cache(maxsize=None)
 def property_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for a public property based on its meta-model ``identifier``.
@@ -108,6 +114,7 @@ def property_name(identifier: Identifier) -> Identifier:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def private_property_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for a private property based on the ``identifier``.
@@ -130,6 +137,7 @@ def private_property_name(identifier: Identifier) -> Identifier:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def private_method_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for a private method based on the ``identifier``.
@@ -152,6 +160,7 @@ def private_method_name(identifier: Identifier) -> Identifier:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def method_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for a member method based on its meta-model ``identifier``.
@@ -174,6 +183,7 @@ def method_name(identifier: Identifier) -> Identifier:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def argument_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for an argument based on its meta-model ``identifier``.
@@ -196,6 +206,7 @@ def argument_name(identifier: Identifier) -> Identifier:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def variable_name(identifier: Identifier) -> Identifier:
     """
     Generate a C# name for a variable based on its meta-model ``identifier``.
@@ -0,0 +1,24 @@
+"""
+Define how the generated C# code constructs the regular expressions.
+
+This module is kept free of heavy imports so that the command-line interface can
+list the modes without loading the C# generators.
+"""
+import enum
+
+
+class RegexMode(enum.Enum):
+    """List the ways how the generated C# code constructs the regular expressions."""
+
+    #: Construct the regular expressions with the default options so that they are
+    #: interpreted on every match
+    INTERPRETED = "interpreted"
+
+    #: Construct the regular expressions with ``RegexOptions.Compiled`` and
+    #: ``RegexOptions.CultureInvariant`` so that they are compiled to IL on
+    #: the first use
+    COMPILED = "compiled"
+
+    #: Generate the regular expressions at build time with ``[GeneratedRegex]``
+    #: partial methods, which requires .NET 7 or later and C# 11
+    GENERATED = "generated"
@@ -3,157 +3,353 @@
 import io
 import textwrap
 import xml.sax.saxutils
-from typing import Tuple, Optional, List
+from typing import (
+    Tuple,
+    Optional,
+    List,
+    Sequence,
+    Callable,
+    Dict,
+)
 
-from icontract import ensure
+from icontract import ensure, require
 
 from aas_core_codegen import intermediate
-from aas_core_codegen.common import Error, Stripped, Identifier
+from aas_core_codegen.common import (
+    Error,
+    Stripped,
+    Identifier,
+    CodeWriter,
+    indent_but_first_line,
+)
 from aas_core_codegen.csharp import common as csharp_common, naming as csharp_naming
-from aas_core_codegen.csharp.common import INDENT as I, INDENT2 as II
+from aas_core_codegen.csharp.common import (
+    INDENT as I,
+    INDENT2 as II,
+    INDENT3 as III,
+)
 
 
-def _generate_enum_to_and_from_string(
-    enumeration: intermediate.Enumeration,
-) -> Stripped:
-    """Generate the methods for de/serializing enumeration from/to a string."""
-    blocks = []  # type: List[Stripped]
+def _char_literal(code_unit: int) -> str:
+    """Generate a C# character literal of the UTF-16 ``code_unit``."""
+    if code_unit == ord("'"):
+        return "'\\''"
+    elif code_unit == ord("\\"):
+        return "'\\\\'"
+    elif 0x20 <= code_unit < 0x7F:
+        return f"'{chr(code_unit)}'"
+    else:
+        return f"'\\u{code_unit:04X}'"
 
-    name = csharp_naming.enum_name(enumeration.name)
 
-    # region To-string-map
+def _byte_literal(code_unit: int) -> str:
+    """Generate a C# byte literal of the UTF-8 ``code_unit``."""
+    if 0x20 <= code_unit < 0x7F:
+        return f"(byte){_char_literal(code_unit)}"
+    else:
+        return f"0x{code_unit:02X}"
 
-    to_str_map_name = csharp_naming.private_property_name(
-        Identifier(f"{enumeration.name}_to_string")
-    )
 
-    to_str_map_writer = io.StringIO()
-    to_str_map_writer.write(
-        f"private static readonly Dictionary<Aas.{name}, string> {to_str_map_name} = (\n"
-        f"{I}new Dictionary<Aas.{name}, string>()\n"
-        f"{I}{{\n"
-    )
+def _utf16_code_units(text: str) -> List[int]:
+    """Encode ``text`` as UTF-16 code units as C# sees them in a string."""
+    encoded = text.encode("utf-16-le")
+    return [
+        int.from_bytes(encoded[i : i + 2], "little") for i in range(0, len(encoded), 2)
+    ]
 
-    for i, literal in enumerate(enumeration.literals):
-        literal_name = csharp_naming.enum_literal_name(literal.name)
-        to_str_map_writer.write(
-            f"{II}{{ Aas.{name}.{literal_name}, "
-            f"{csharp_common.string_literal(literal.value)} }}"
-        )
 
-        if i < len(enumeration.literals) - 1:
-            to_str_map_writer.write(",")
+def _utf8_code_units(text: str) -> List[int]:
+    """Encode ``text`` as UTF-8 code units."""
+    return list(text.encode("utf-8"))
 
-        to_str_map_writer.write("\n")
 
-    to_str_map_writer.write(f"{I}}});")
+def _utf8_equality(literal: intermediate.EnumerationLiteral) -> str:
+    """Generate the condition that the UTF-8 ``text`` equals the ``literal``."""
+    if literal.value.isascii():
+        return f"EqualsAscii(text, {csharp_common.string_literal(literal.value)})"
 
-    blocks.append(Stripped(to_str_map_writer.getvalue()))
+    comparisons = [
+        f"text[{i}] == {_byte_literal(code_unit)}"
+        for i, code_unit in enumerate(literal.value.encode("utf-8"))
+    ]
+    return "\n&& ".join(comparisons)
 
-    # endregion
 
-    # region To-string-method
+#: Literal of an enumeration with its value encoded as code units
+_Candidate = Tuple[Sequence[int], intermediate.EnumerationLiteral]
 
-    to_str_name = csharp_naming.method_name(Identifier("to_string"))
 
-    to_str_writer = io.StringIO()
-    to_str_writer.write(
-        textwrap.dedent(
+@require(lambda candidates: len(candidates) > 0)
+@require(
+    lambda candidates: len(set(len(code_units) for code_units, _ in candidates)) == 1,
+    "All the candidates of equal length",
+)
+def _generate_switch_on_code_units(
+    candidates: Sequence[_Candidate],
+    enum_name: Identifier,
+    code_unit_literal: Callable[[int], str],
+    equality: Callable[[intermediate.EnumerationLiteral], str],
+) -> Stripped:
+    """
+    Generate the code which matches ``text`` against the ``candidates``.
+
+    The candidates are discriminated by the code unit at the position which
+    splits them the most. The only remaining candidate is compared in full.
+    """
+    if len(candidates) == 1:
+        _, literal = candidates[0]
+        literal_name = csharp_naming.enum_literal_name(literal.name)
+        return Stripped(
             f"""\
-        /// <summary>
-        /// Retrieve the string representation of <paramref name="that" />.
-        /// </summary>
-        /// <remarks>
-        /// If <paramref name="that" /> is not a valid literal, return <c>null</c>.
-        /// </remarks>
-        public static string? {to_str_name}(Aas.{name} that)
-        {{
-        {I}if ({to_str_map_name}.TryGetValue(that, out string? value))
-        {I}{{
-        {II}return value;
-        {I}}}
-        {I}else
-        {I}{{
-        {II}return null;
-        {I}}}
-        }}"""
+if ({indent_but_first_line(equality(literal), I)})
+{{
+{I}return Aas.{enum_name}.{literal_name};
+}}"""
         )
+
+    length = len(candidates[0][0])
+    position = max(
+        range(length),
+        key=lambda a_position: len(
+            set(code_units[a_position] for code_units, _ in candidates)
+        ),
     )
 
-    blocks.append(Stripped(to_str_writer.getvalue()))
+    groups = dict()  # type: Dict[int, List[_Candidate]]
+    for code_units, literal in candidates:
+        groups.setdefault(code_units[position], []).append((code_units, literal))
 
-    # endregion
+    assert len(groups) > 1, (
+        f"Expected distinct values of the literals of {enum_name}, "
+        f"but got: {[literal.value for _, literal in candidates]}"
+    )
 
-    # region From-string-map
+    writer = io.StringIO()
+    writer.write(f"switch (text[{position}])\n{{\n")
+    for code_unit, group in groups.items():
+        body = _generate_switch_on_code_units(
+            candidates=group,
+            enum_name=enum_name,
+            code_unit_literal=code_unit_literal,
+            equality=equality,
+        )
+        writer.write(
+            f"{I}case {code_unit_literal(code_unit)}:\n"
+            f"{II}{indent_but_first_line(body, II)}\n"
+            f"{II}break;\n"
+        )
+    writer.write("}")
 
-    from_str_map_name = csharp_naming.private_property_name(
-        Identifier(f"{enumeration.name}_from_string")
-    )
+    return Stripped(writer.getvalue())
 
-    from_str_map_writer = io.StringIO()
-    from_str_map_writer.write(
-        f"private static readonly Dictionary<string, Aas.{name}> {from_str_map_name} = (\n"
-        f"{I}new Dictionary<string, Aas.{name}>()\n"
-        f"{I}{{\n"
-    )
 
-    for i, literal in enumerate(enumeration.literals):
-        literal_name = csharp_naming.enum_literal_name(literal.name)
-        from_str_map_writer.write(
-            f"{II}{{ {csharp_common.string_literal(literal.value)}, "
-            f"Aas.{name}.{literal_name} }}"
+def _generate_switch_on_length(
+    enumeration: intermediate.Enumeration,
+    encode: Callable[[str], Sequence[int]],
+    code_unit_literal: Callable[[int], str],
+    equality: Callable[[intermediate.EnumerationLiteral], str],
+) -> Stripped:
+    """
+    Generate the code which matches ``text`` against the literals of ``enumeration``.
+
+    The literals are encoded in code units with ``encode`` and first discriminated
+    by their length.
+    """
+    enum_name = csharp_naming.enum_name(enumeration.name)
+
+    if len(enumeration.literals) == 0:
+        return Stripped("return null;")
+
+    by_length = dict()  # type: Dict[int, List[_Candidate]]
+    for literal in enumeration.literals:
+        code_units = encode(literal.value)
+        by_length.setdefault(len(code_units), []).append((code_units, literal))
+
+    writer = io.StringIO()
+    writer.write("switch (text.Length)\n{\n")
+    for length in sorted(by_length):
+        body = _generate_switch_on_code_units(
+            candidates=by_length[length],
+            enum_name=enum_name,
+            code_unit_literal=code_unit_literal,
+            equality=equality,
         )
+        writer.write(
+            f"{I}case {length}:\n"
+            f"{II}{indent_but_first_line(body, II)}\n"
+            f"{II}break;\n"
+        )
+    writer.write("}\n\nreturn null;")
+
+    return Stripped(writer.getvalue())
+
+
+def _generate_enum_to_and_from_string(
+    enumeration: intermediate.Enumeration,
+) -> Stripped:
+    """Generate the methods for de/serializing enumeration from/to a string."""
+    blocks = []  # type: List[Stripped]
+
+    name = csharp_naming.enum_name(enumeration.name)
+
+    # region To-string-method
 
-        if i < len(enumeration.literals) - 1:
-            from_str_map_writer.write(",")
+    to_str_name = csharp_naming.method_name(Identifier("to_string"))
 
-        from_str_map_writer.write("\n")
+    if len(enumeration.literals) == 0:
+        to_str_body = "return null;"
+    else:
+        arms_writer = io.StringIO()
+        for literal in enumeration.literals:
+            literal_name = csharp_naming.enum_literal_name(literal.name)
+            arms_writer.write(
+                f"{I}Aas.{name}.{literal_name} => "
+                f"{csharp_common.string_literal(literal.value)},\n"
+            )
+        arms_writer.write(f"{I}_ => null")
 
-    from_str_map_writer.write(f"{I}}});")
+        to_str_body = f"""\
+return that switch
+{{
+{arms_writer.getvalue()}
+}};"""
 
-    blocks.append(Stripped(from_str_map_writer.getvalue()))
+    blocks.append(
+        Stripped(
+            f"""\
+/// <summary>
+/// Retrieve the string representation of <paramref name="that" />.
+/// </summary>
+/// <remarks>
+/// If <paramref name="that" /> is not a valid literal, return <c>null</c>.
+/// </remarks>
+public static string? {to_str_name}(Aas.{name} that)
+{{
+{I}{indent_but_first_line(to_str_body, I)}
+}}"""
+        )
+    )
 
     # endregion
 
-    # region From-string-method
+    # region From-string-methods
 
     from_str_name = csharp_naming.method_name(
         Identifier(f"{enumeration.name}_from_string")
     )
 
-    from_str_writer = io.StringIO()
-    from_str_writer.write(
-        textwrap.dedent(
+    remarks = f"""\
+/// <remarks>
+/// If <paramref name="text" /> is not a valid string representation
+/// of a literal of <see cref={xml.sax.saxutils.quoteattr(name)} />,
+/// return <c>null</c>.
+/// </remarks>"""
+
+    blocks.append(
+        Stripped(
             f"""\
-        /// <summary>
-        /// Parse the string representation of <see cref={xml.sax.saxutils.quoteattr(name)} />.
-        /// </summary>
-        /// <remarks>
-        /// If <paramref name="text" /> is not a valid string representation
-        /// of a literal of <see cref={xml.sax.saxutils.quoteattr(name)} />,
-        /// return <c>null</c>.
-        /// </remarks>
-        public static Aas.{name}? {from_str_name}(string text)
-        {{
-        {I}if ({from_str_map_name}.TryGetValue(text, out {name} value))
-        {I}{{
-        {II}return value;
-        {I}}}
-        {I}else
-        {I}{{
-        {II}return null;
-        {I}}}
-        }}"""
+/// <summary>
+/// Parse the string representation of <see cref={xml.sax.saxutils.quoteattr(name)} />.
+/// </summary>
+{remarks}
+public static Aas.{name}? {from_str_name}(string text)
+{{
+{I}return {from_str_name}((System.ReadOnlySpan<char>)text);
+}}"""
+        )
+    )
+
+    from_chars_body = _generate_switch_on_length(
+        enumeration=enumeration,
+        encode=_utf16_code_units,
+        code_unit_literal=_char_literal,
+        equality=lambda literal: (
+            f"EqualsOrdinal(text, {csharp_common.string_literal(literal.value)})"
+        ),
+    )
+
+    blocks.append(
+        Stripped(
+            f"""\
+/// <summary>
+/// Parse the string representation of <see cref={xml.sax.saxutils.quoteattr(name)} />
+/// given as characters.
+/// </summary>
+{remarks}
+public static Aas.{name}? {from_str_name}(System.ReadOnlySpan<char> text)
+{{
+{I}{indent_but_first_line(from_chars_body, I)}
+}}"""
         )
     )
 
-    blocks.append(Stripped(from_str_writer.getvalue()))
+    from_utf8_name = csharp_naming.method_name(
+        Identifier(f"{enumeration.name}_from_utf8")
+    )
+
+    from_utf8_body = _generate_switch_on_length(
+        enumeration=enumeration,
+        encode=_utf8_code_units,
+        code_unit_literal=_byte_literal,
+        equality=_utf8_equality,
+    )
+
+    blocks.append(
+        Stripped(
+            f"""\
+/// <summary>
+/// Parse the string representation of <see cref={xml.sax.saxutils.quoteattr(name)} />
+/// given as UTF-8 bytes.
+/// </summary>
+{remarks}
+public static Aas.{name}? {from_utf8_name}(System.ReadOnlySpan<byte> text)
+{{
+{I}{indent_but_first_line(from_utf8_body, I)}
+}}"""
+        )
+    )
 
     # endregion
 
     return Stripped("\n\n".join(blocks))
 
 
+_EQUALITY_HELPERS = Stripped(
+    f"""\
+/// <summary>
+/// Compare the characters of <paramref name="text" /> ordinally
+/// with <paramref name="literal" />.
+/// </summary>
+private static bool EqualsOrdinal(System.ReadOnlySpan<char> text, string literal)
+{{
+{I}return System.MemoryExtensions.SequenceEqual(
+{II}text, (System.ReadOnlySpan<char>)literal);
+}}
+
+/// <summary>
+/// Compare the UTF-8 bytes of <paramref name="text" /> with
+/// the ASCII <paramref name="literal" />.
+/// </summary>
+private static bool EqualsAscii(System.ReadOnlySpan<byte> text, string literal)
+{{
+{I}if (text.Length != literal.Length)
+{I}{{
+{II}return false;
+{I}}}
+
+{I}for (int i = 0; i < literal.Length; i++)
+{I}{{
+{II}if (text[i] != literal[i])
+{II}{{
+{III}return false;
+{II}}}
+{I}}}
+
+{I}return true;
+}}"""
+)
+
+
 # fmt: off
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
 @ensure(
@@ -175,14 +371,12 @@ def generate(
         Stripped(
             textwrap.dedent(
                 f"""\
-            using System.Collections.Generic;  // can't alias
-
             using Aas = {namespace};"""
             )
         ),
     ]
 
-    stringification_blocks = []  # type: List[Stripped]
+    stringification_blocks = [_EQUALITY_HELPERS]  # type: List[Stripped]
 
     for symbol in symbol_table.symbols:
         if not isinstance(symbol, intermediate.Enumeration):
@@ -192,7 +386,7 @@ def generate(
             _generate_enum_to_and_from_string(enumeration=symbol)
         )
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -204,11 +398,12 @@ def generate(
         )
     )
 
-    for i, stringification_block in enumerate(stringification_blocks):
-        if i > 0:
-            writer.write("\n\n")
+    with writer.indent(II):
+        for i, stringification_block in enumerate(stringification_blocks):
+            if i > 0:
+                writer.write("\n\n")
 
-        writer.write(textwrap.indent(stringification_block, II))
+            writer.write(stringification_block)
 
     writer.write(f"\n{I}}}  // public static class Stringification")
     writer.write(f"\n}}  // namespace {namespace}")
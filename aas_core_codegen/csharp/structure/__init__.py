@@ -2,5 +2,8 @@
 
 from aas_core_codegen.csharp.structure import _generate
 
+VerifiedIntermediateSymbolTable = _generate.VerifiedIntermediateSymbolTable
 verify = _generate.verify
+generate_chunks = _generate.generate_chunks
+generate_shards = _generate.generate_shards
 generate = _generate.generate
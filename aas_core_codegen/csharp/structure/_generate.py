@@ -1,5 +1,4 @@
 """Generate the C# data structures from the intermediate representation."""
-import io
 import textwrap
 from typing import (
     Optional,
@@ -10,13 +9,20 @@ from typing import (
     Union,
     Mapping,
     Final,
+    Iterator,
 )
 
 from icontract import ensure, require
 
 from aas_core_codegen import intermediate
 from aas_core_codegen import specific_implementations
-from aas_core_codegen.common import Error, Identifier, assert_never, Stripped, Rstripped
+from aas_core_codegen.common import (
+    Error,
+    Identifier,
+    assert_never,
+    Stripped,
+    CodeWriter,
+)
 from aas_core_codegen.csharp import (
     common as csharp_common,
     naming as csharp_naming,
@@ -125,7 +131,6 @@ def _verify_intra_structure_collisions(
         for prop in intermediate_symbol.properties:
             prop_name = csharp_naming.property_name(prop.name)
             if prop_name in observed_member_names:
-                # BEFORE-RELEASE (mristin, 2021-12-13): test
                 errors.append(
                     Error(
                         prop.parsed.node,
@@ -144,7 +149,6 @@ def _verify_intra_structure_collisions(
             method_name = csharp_naming.method_name(method.name)
 
             if method_name in observed_member_names:
-                # BEFORE-RELEASE (mristin, 2021-12-13): test
                 errors.append(
                     Error(
                         method.parsed.node,
@@ -163,13 +167,11 @@ def _verify_intra_structure_collisions(
         assert_never(intermediate_symbol)
 
     if len(errors) > 0:
-        errors.append(
-            Error(
-                intermediate_symbol.parsed.node,
-                f"Naming collision(s) in C# code "
-                f"for the symbol {intermediate_symbol.name!r}",
-                underlying=errors,
-            )
+        return Error(
+            intermediate_symbol.parsed.node,
+            f"Naming collision(s) in C# code "
+            f"for the symbol {intermediate_symbol.name!r}",
+            underlying=errors,
         )
 
     return None
@@ -214,7 +216,7 @@ def _generate_enum(
     enum: intermediate.Enumeration,
 ) -> Tuple[Optional[Stripped], Optional[Error]]:
     """Generate the C# code for the enum."""
-    writer = io.StringIO()
+    writer = CodeWriter()
 
     if enum.description is not None:
         comment, error = csharp_description.generate_comment(enum.description)
@@ -246,16 +248,15 @@ def _generate_enum(
 
             assert literal_comment is not None
 
-            writer.write(textwrap.indent(literal_comment, I))
+            with writer.indent(I):
+                writer.write(literal_comment)
             writer.write("\n")
 
-        writer.write(
-            textwrap.indent(
+        with writer.indent(I):
+            writer.write(
                 f"[EnumMember(Value = {csharp_common.string_literal(literal.value)})]\n"
-                f"{csharp_naming.enum_literal_name(literal.name)}",
-                I,
+                f"{csharp_naming.enum_literal_name(literal.name)}"
             )
-        )
 
     writer.write("\n}")
 
@@ -267,7 +268,7 @@ def _generate_interface(
     interface: intermediate.Interface,
 ) -> Tuple[Optional[Stripped], Optional[Error]]:
     """Generate C# code for the given interface."""
-    writer = io.StringIO()
+    writer = CodeWriter()
 
     if interface.description is not None:
         comment, error = csharp_description.generate_comment(interface.description)
@@ -296,7 +297,8 @@ def _generate_interface(
             if i > 0:
                 writer.write(",\n")
 
-            writer.write(textwrap.indent(inheritance_name, II))
+            with writer.indent(II):
+                writer.write(inheritance_name)
 
         writer.write("\n{\n")
 
@@ -382,11 +384,12 @@ def _generate_interface(
 
     # endregion
 
-    for i, code in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
+    with writer.indent(I):
+        for i, code in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
 
-        writer.write(textwrap.indent(code, I))
+            writer.write(code)
 
     writer.write("\n}")
 
@@ -400,6 +403,10 @@ class _DescendBodyUnroller(csharp_unrolling.Unroller):
     #: Otherwise, we do not unroll recursively.
     _recurse: Final[bool]
 
+    #: If set, generates the code which passes the instances to the ``action``
+    #: instead of yielding them.
+    _callback: Final[bool]
+
     #: Pre-computed descendability map. A type is descendable if we should unroll it
     #: further.
     _descendability: Final[Mapping[intermediate.TypeAnnotationUnion, bool]]
@@ -407,10 +414,12 @@ class _DescendBodyUnroller(csharp_unrolling.Unroller):
     def __init__(
         self,
         recurse: bool,
+        callback: bool,
         descendability: Mapping[intermediate.TypeAnnotationUnion, bool],
     ) -> None:
         """Initialize with the given values."""
         self._recurse = recurse
+        self._callback = callback
         self._descendability = descendability
 
     def _unroll_primitive_type_annotation(
@@ -445,10 +454,30 @@ class _DescendBodyUnroller(csharp_unrolling.Unroller):
 
         assert isinstance(symbol, intermediate.Class)  # Exhaustively match
 
-        result = [csharp_unrolling.Node(f"yield return {unrollee_expr};", children=[])]
+        if self._callback:
+            result = [csharp_unrolling.Node(f"action({unrollee_expr});", children=[])]
+        else:
+            result = [
+                csharp_unrolling.Node(f"yield return {unrollee_expr};", children=[])
+            ]
 
         if self._recurse:
-            if self._descendability[type_annotation]:
+            if self._descendability[type_annotation] and self._callback:
+                # The implementation-specific classes might rely on the default
+                # implementation, which is only accessible through the interface.
+                target_expr = (
+                    f"((IClass){unrollee_expr})"
+                    if symbol.is_implementation_specific
+                    else unrollee_expr
+                )
+
+                result.append(
+                    csharp_unrolling.Node(
+                        text=f"// Recurse\n{target_expr}.Descend(action);",
+                        children=[],
+                    )
+                )
+            elif self._descendability[type_annotation]:
                 recurse_var = csharp_unrolling.Unroller._loop_var_name(
                     level=item_level, suffix="Item"
                 )
@@ -533,12 +562,17 @@ class _DescendBodyUnroller(csharp_unrolling.Unroller):
         ]
 
 
-def _generate_descend_body(cls: intermediate.ConcreteClass, recurse: bool) -> Stripped:
+def _generate_descend_body(
+    cls: intermediate.ConcreteClass, recurse: bool, callback: bool
+) -> Stripped:
     """
     Generate the body of the ``Descend`` and ``DescendOnce`` methods.
 
     With this function, we can unroll the recursion as a simple optimization
     in the recursive case.
+
+    If ``callback`` is set, generate the body of the overload which passes
+    the instances to an ``action`` instead of yielding them.
     """
     blocks = []  # type: List[Stripped]
 
@@ -552,7 +586,9 @@ def _generate_descend_body(cls: intermediate.ConcreteClass, recurse: bool) -> St
 
         # region Unroll
 
-        unroller = _DescendBodyUnroller(recurse=recurse, descendability=descendability)
+        unroller = _DescendBodyUnroller(
+            recurse=recurse, callback=callback, descendability=descendability
+        )
 
         roots = unroller.unroll(
             unrollee_expr=csharp_naming.property_name(prop.name),
@@ -572,7 +608,10 @@ def _generate_descend_body(cls: intermediate.ConcreteClass, recurse: bool) -> St
         # endregion
 
     if len(blocks) == 0:
-        blocks.append(Stripped("// No descendable properties\nyield break;"))
+        if callback:
+            blocks.append(Stripped("// No descendable properties"))
+        else:
+            blocks.append(Stripped("// No descendable properties\nyield break;"))
 
     return Stripped("\n\n".join(blocks))
 
@@ -580,41 +619,112 @@ def _generate_descend_body(cls: intermediate.ConcreteClass, recurse: bool) -> St
 def _generate_descend_once_method(cls: intermediate.ConcreteClass) -> Stripped:
     """Generate the ``DescendOnce`` method for the concrete class ``cls``."""
 
-    body = _generate_descend_body(cls=cls, recurse=False)
-
-    indented_body = textwrap.indent(body, I)
+    body = _generate_descend_body(cls=cls, recurse=False, callback=False)
 
-    return Stripped(
-        f"""\
+    writer = CodeWriter()
+    writer.write(
+        """\
 /// <summary>
 /// Iterate over all the class instances referenced from this instance
 /// without further recursion.
 /// </summary>
 public IEnumerable<IClass> DescendOnce()
-{{
-{indented_body}
-}}"""
+{
+"""
     )
 
+    with writer.indent(I):
+        writer.write(body)
+
+    writer.write("\n}")
+
+    return Stripped(writer.getvalue())
+
 
 def _generate_descend_method(cls: intermediate.ConcreteClass) -> Stripped:
     """Generate the recursive ``Descend`` method for the concrete class ``cls``."""
 
-    body = _generate_descend_body(cls=cls, recurse=True)
-
-    indented_body = textwrap.indent(body, I)
+    body = _generate_descend_body(cls=cls, recurse=True, callback=False)
 
-    return Stripped(
-        f"""\
+    writer = CodeWriter()
+    writer.write(
+        """\
 /// <summary>
 /// Iterate recursively over all the class instances referenced from this instance.
 /// </summary>
 public IEnumerable<IClass> Descend()
-{{
-{indented_body}
-}}"""
+{
+"""
+    )
+
+    with writer.indent(I):
+        writer.write(body)
+
+    writer.write("\n}")
+
+    return Stripped(writer.getvalue())
+
+
+def _generate_descend_once_with_action_method(
+    cls: intermediate.ConcreteClass,
+) -> Stripped:
+    """Generate the ``DescendOnce`` overload with an action for the class ``cls``."""
+
+    body = _generate_descend_body(cls=cls, recurse=False, callback=True)
+
+    writer = CodeWriter()
+    writer.write(
+        """\
+/// <summary>
+/// Apply the <paramref name="action" /> on all the class instances referenced
+/// from this instance without further recursion.
+/// </summary>
+/// <remarks>
+/// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+/// </remarks>
+public void DescendOnce(System.Action<IClass> action)
+{
+"""
+    )
+
+    with writer.indent(I):
+        writer.write(body)
+
+    writer.write("\n}")
+
+    return Stripped(writer.getvalue())
+
+
+def _generate_descend_with_action_method(
+    cls: intermediate.ConcreteClass,
+) -> Stripped:
+    """Generate the recursive ``Descend`` overload with an action for ``cls``."""
+
+    body = _generate_descend_body(cls=cls, recurse=True, callback=True)
+
+    writer = CodeWriter()
+    writer.write(
+        """\
+/// <summary>
+/// Apply the <paramref name="action" /> recursively on all the class instances
+/// referenced from this instance.
+/// </summary>
+/// <remarks>
+/// In contrast to <see cref="Descend()" />, no enumerator is allocated
+/// at any level of the recursion.
+/// </remarks>
+public void Descend(System.Action<IClass> action)
+{
+"""
     )
 
+    with writer.indent(I):
+        writer.write(body)
+
+    writer.write("\n}")
+
+    return Stripped(writer.getvalue())
+
 
 def _generate_default_value(default: intermediate.Default) -> Stripped:
     """Generate the C# code representing the default value of an argument."""
@@ -712,11 +822,12 @@ def _generate_constructor(
                     arg_name = csharp_naming.argument_name(stmt.argument)
 
                     # Write the assignment as a ternary operator
-                    writer = io.StringIO()
+                    writer = CodeWriter()
                     writer.write(f"{csharp_naming.property_name(stmt.name)} = ")
                     writer.write(f"({arg_name} != null)\n")
-                    writer.write(textwrap.indent(f"? {arg_name}\n", I))
-                    writer.write(textwrap.indent(f": new {prop_type}();", I))
+                    with writer.indent(I):
+                        writer.write(f"? {arg_name}\n")
+                        writer.write(f": new {prop_type}();")
 
                     body.append(writer.getvalue())
                 elif isinstance(
@@ -753,7 +864,7 @@ def _generate_class(
     spec_impls: specific_implementations.SpecificImplementations,
 ) -> Tuple[Optional[Stripped], Optional[Error]]:
     """Generate C# code for the given concrete class ``cls``."""
-    writer = io.StringIO()
+    writer = CodeWriter()
 
     if cls.description is not None:
         comment, error = csharp_description.generate_comment(cls.description)
@@ -799,7 +910,8 @@ def _generate_class(
             if i > 0:
                 writer.write(",\n")
 
-            writer.write(textwrap.indent(interface_name, II))
+            with writer.indent(II):
+                writer.write(interface_name)
 
         writer.write("\n{\n")
 
@@ -872,6 +984,10 @@ def _generate_class(
 
     blocks.append(_generate_descend_method(cls=cls))
 
+    blocks.append(_generate_descend_once_with_action_method(cls=cls))
+
+    blocks.append(_generate_descend_with_action_method(cls=cls))
+
     blocks.append(
         Stripped(
             textwrap.dedent(
@@ -975,52 +1091,23 @@ def _generate_class(
             errors,
         )
 
-    for i, code in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
+    with writer.indent(I):
+        for i, code in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
 
-        writer.write(textwrap.indent(code, I))
+            writer.write(code)
 
     writer.write("\n}")
 
     return Stripped(writer.getvalue()), None
 
 
-# fmt: off
-@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-@ensure(
-    lambda result:
-    not (result[0] is not None) or result[0].endswith('\n'),
-    "Trailing newline mandatory for valid end-of-files"
-)
-# fmt: on
-def generate(
-    symbol_table: VerifiedIntermediateSymbolTable,
-    namespace: csharp_common.NamespaceIdentifier,
-    spec_impls: specific_implementations.SpecificImplementations,
-) -> Tuple[Optional[str], Optional[List[Error]]]:
-    """
-    Generate the C# code of the structures based on the symbol table.
-
-    The ``namespace`` defines the AAS C# namespace.
-    """
-    blocks = [csharp_common.WARNING]  # type: List[Rstripped]
-
-    using_directives = [
-        "using EnumMemberAttribute = System.Runtime.Serialization.EnumMemberAttribute;",
-        "using System.Collections.Generic;  // can't alias",
-    ]  # type: List[str]
-
-    if len(using_directives) > 0:
-        blocks.append(Stripped("\n".join(using_directives)))
-
-    blocks.append(Stripped(f"namespace {namespace}\n{{"))
-
-    blocks.append(
-        Rstripped(
-            textwrap.indent(
-                textwrap.dedent(
-                    f"""\
+def _generate_iclass() -> Stripped:
+    """Generate the interface ``IClass`` common to all the model classes."""
+    return Stripped(
+        textwrap.dedent(
+            f"""\
         /// <summary>
         /// Represent a general class of an AAS model.
         /// </summary>
@@ -1037,6 +1124,40 @@ def generate(
             /// </summary>
             public IEnumerable<IClass> Descend();
 
+            /// <summary>
+            /// Apply the <paramref name="action" /> on all the class instances referenced
+            /// from this instance without further recursion.
+            /// </summary>
+            /// <remarks>
+            /// The generated classes implement this method without allocating
+            /// an enumerator. The implementation-specific classes can rely on
+            /// this default implementation.
+            /// </remarks>
+            public void DescendOnce(System.Action<IClass> action)
+            {{
+                foreach (var anInstance in DescendOnce())
+                {{
+                    action(anInstance);
+                }}
+            }}
+
+            /// <summary>
+            /// Apply the <paramref name="action" /> recursively on all the class instances
+            /// referenced from this instance.
+            /// </summary>
+            /// <remarks>
+            /// The generated classes implement this method without allocating
+            /// an enumerator. The implementation-specific classes can rely on
+            /// this default implementation.
+            /// </remarks>
+            public void Descend(System.Action<IClass> action)
+            {{
+                foreach (var anInstance in Descend())
+                {{
+                    action(anInstance);
+                }}
+            }}
+
             /// <summary>
             /// Accept the <paramref name="visitor" /> to visit this instance
             /// for double dispatch.
@@ -1062,73 +1183,221 @@ def generate(
             public T Transform<C, T>(
             {I}Visitation.ITransformerWithContext<C, T> transformer, C context);
         }}"""
-                ),
-                I,
-            )
         )
     )
 
-    errors = []  # type: List[Error]
 
-    for something in csharp_common.over_enumerations_classes_and_interfaces(
-        symbol_table
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_something(
+    something: Union[
+        intermediate.Enumeration, intermediate.ConcreteClass, intermediate.Interface
+    ],
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """Generate the C# code of an enumeration, a class or an interface."""
+    code = None  # type: Optional[Stripped]
+    error = None  # type: Optional[Error]
+
+    if (
+        isinstance(something, intermediate.Class)
+        and something.is_implementation_specific
     ):
-        code = None  # type: Optional[Stripped]
-        error = None  # type: Optional[Error]
+        implementation_key = specific_implementations.ImplementationKey(
+            f"{something.name}.cs"
+        )
 
-        if (
-            isinstance(something, intermediate.Class)
-            and something.is_implementation_specific
-        ):
-            implementation_key = specific_implementations.ImplementationKey(
-                f"{something.name}.cs"
+        code = spec_impls.get(implementation_key, None)
+        if code is None:
+            error = Error(
+                something.parsed.node,
+                f"The implementation is missing "
+                f"for the implementation-specific class: {implementation_key}",
             )
-
-            code = spec_impls.get(implementation_key, None)
-            if code is None:
-                error = Error(
-                    something.parsed.node,
-                    f"The implementation is missing "
-                    f"for the implementation-specific class: {implementation_key}",
-                )
+    else:
+        if isinstance(something, intermediate.Enumeration):
+            # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
+            code, error = _generate_enum(enum=something)
+        elif isinstance(something, intermediate.Interface):
+            # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
+            code, error = _generate_interface(interface=something)
+
+        elif isinstance(something, intermediate.ConcreteClass):
+            # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
+            code, error = _generate_class(cls=something, spec_impls=spec_impls)
         else:
-            if isinstance(something, intermediate.Enumeration):
-                # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
-                code, error = _generate_enum(enum=something)
-            elif isinstance(something, intermediate.Interface):
-                # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
-                code, error = _generate_interface(interface=something)
-
-            elif isinstance(something, intermediate.ConcreteClass):
-                # BEFORE-RELEASE (mristin, 2021-12-13): test in isolation
-                code, error = _generate_class(cls=something, spec_impls=spec_impls)
-            else:
-                assert_never(something)
+            assert_never(something)
+
+    return code, error
+
+
+def _write_start_of_file(
+    out: CodeWriter, namespace: csharp_common.NamespaceIdentifier
+) -> None:
+    """Write the warning, the using directives and open the ``namespace``."""
+    out.write(csharp_common.WARNING)
+
+    using_directives = [
+        "using EnumMemberAttribute = System.Runtime.Serialization.EnumMemberAttribute;",
+        "using System.Collections.Generic;  // can't alias",
+    ]  # type: List[str]
+
+    if len(using_directives) > 0:
+        out.write("\n\n")
+        out.write("\n".join(using_directives))
+
+    out.write(f"\n\nnamespace {namespace}\n{{")
+
+
+def _write_end_of_file(
+    out: CodeWriter, namespace: csharp_common.NamespaceIdentifier
+) -> None:
+    """Close the ``namespace`` and write the closing warning."""
+    out.write(f"\n\n}}  // namespace {namespace}")
+
+    out.write("\n\n")
+    out.write(csharp_common.WARNING)
 
-        assert (code is None) ^ (error is None)
+    out.write("\n")
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def generate_chunks(
+    symbol_table: VerifiedIntermediateSymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Iterator[str]], Optional[List[Error]]]:
+    """
+    Generate the C# code of the structures in chunks based on the symbol table.
+
+    The ``namespace`` defines the AAS C# namespace.
+
+    The chunks are meant to be streamed, *e.g.*, to a file, without joining them.
+    """
+    # The code is written to a single writer as we go so that we do not keep
+    # the code of all the symbols around.
+    out = CodeWriter()
+    _write_start_of_file(out=out, namespace=namespace)
+
+    with out.indent(I):
+        out.write("\n\n")
+        out.write(_generate_iclass())
+
+    errors = []  # type: List[Error]
+
+    for something in csharp_common.over_enumerations_classes_and_interfaces(
+        symbol_table
+    ):
+        code, error = _generate_something(something=something, spec_impls=spec_impls)
         if error is not None:
             errors.append(error)
         else:
             assert code is not None
-            blocks.append(Rstripped(textwrap.indent(code, "    ")))
+            with out.indent(I):
+                out.write("\n\n")
+                out.write(code)
 
     if len(errors) > 0:
         return None, errors
 
-    blocks.append(Rstripped(f"}}  // namespace {namespace}"))
+    _write_end_of_file(out=out, namespace=namespace)
 
-    blocks.append(csharp_common.WARNING)
+    return out.chunks(), None
 
-    out = io.StringIO()
-    for i, block in enumerate(blocks):
-        if i > 0:
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@ensure(
+    lambda result: not (result[0] is not None)
+    or all(code.endswith("\n") for code in result[0].values()),
+    "Trailing newline mandatory for valid end-of-files",
+)
+def generate_shards(
+    symbol_table: VerifiedIntermediateSymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Mapping[str, str]], Optional[List[Error]]]:
+    """
+    Generate the C# code of the structures in one file per C# type.
+
+    The ``namespace`` defines the AAS C# namespace.
+
+    Return the code mapped by the file names, *e.g.*, ``"ISubmodel.cs"``.
+    """
+    shards = dict()  # type: Dict[str, str]
+
+    out = CodeWriter()
+    _write_start_of_file(out=out, namespace=namespace)
+    with out.indent(I):
+        out.write("\n\n")
+        out.write(_generate_iclass())
+    _write_end_of_file(out=out, namespace=namespace)
+
+    shards["IClass.cs"] = out.getvalue()
+
+    errors = []  # type: List[Error]
+
+    for something in csharp_common.over_enumerations_classes_and_interfaces(
+        symbol_table
+    ):
+        code, error = _generate_something(something=something, spec_impls=spec_impls)
+        if error is not None:
+            errors.append(error)
+            continue
+
+        assert code is not None
+
+        name = None  # type: Optional[str]
+        if isinstance(something, intermediate.Enumeration):
+            name = csharp_naming.enum_name(something.name)
+        elif isinstance(something, intermediate.Interface):
+            name = csharp_naming.interface_name(something.name)
+        elif isinstance(something, intermediate.ConcreteClass):
+            name = csharp_naming.class_name(something.name)
+        else:
+            assert_never(something)
+
+        assert name is not None
+
+        out = CodeWriter()
+        _write_start_of_file(out=out, namespace=namespace)
+        with out.indent(I):
             out.write("\n\n")
+            out.write(code)
+        _write_end_of_file(out=out, namespace=namespace)
 
-        out.write(block)
+        shards[f"{name}.cs"] = out.getvalue()
 
-    out.write("\n")
+    if len(errors) > 0:
+        return None, errors
+
+    return shards, None
+
+
+# fmt: off
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@ensure(
+    lambda result:
+    not (result[0] is not None) or result[0].endswith('\n'),
+    "Trailing newline mandatory for valid end-of-files"
+)
+# fmt: on
+def generate(
+    symbol_table: VerifiedIntermediateSymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[str], Optional[List[Error]]]:
+    """
+    Generate the C# code of the structures based on the symbol table.
+
+    The ``namespace`` defines the AAS C# namespace.
+    """
+    chunks, errors = generate_chunks(
+        symbol_table=symbol_table, namespace=namespace, spec_impls=spec_impls
+    )
+    if errors is not None:
+        return None, errors
 
-    return out.getvalue(), None
+    assert chunks is not None
+    return "".join(chunks), None
 
 
 # endregion
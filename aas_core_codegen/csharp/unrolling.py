@@ -1,13 +1,11 @@
 """Provide code generation for unrolling recursive calls and iterations."""
 import abc
-import io
-import textwrap
 from typing import Sequence, List
 
 from icontract import DBC, require
 
 from aas_core_codegen import intermediate
-from aas_core_codegen.common import Identifier, assert_never
+from aas_core_codegen.common import Identifier, assert_never, CodeWriter
 from aas_core_codegen.csharp.common import INDENT as I
 
 
@@ -19,6 +17,27 @@ class Node:
         self.children = children
 
 
+def _render_to(node: Node, writer: CodeWriter) -> None:
+    """Render the node recursively to the ``writer``."""
+    writer.write(node.text)
+
+    if len(node.children) == 0:
+        return
+
+    writer.write("\n{")
+
+    with writer.indent(I):
+        for i, child in enumerate(node.children):
+            if i == 0:
+                writer.write("\n")
+            else:
+                writer.write("\n\n")
+
+            _render_to(node=child, writer=writer)
+
+    writer.write("\n}")
+
+
 def render(node: Node) -> str:
     """
     Render the node recursively.
@@ -29,22 +48,8 @@ def render(node: Node) -> str:
     >>> render(Node(text='parent', children=[Node(text='child', children=[])]))
     'parent\\n{\\n    child\\n}'
     """
-    if len(node.children) == 0:
-        return node.text
-
-    writer = io.StringIO()
-    writer.write(node.text)
-    writer.write("\n{")
-
-    for i, child in enumerate(node.children):
-        if i == 0:
-            writer.write("\n")
-        else:
-            writer.write("\n\n")
-
-        writer.write(textwrap.indent(render(child), I))
-
-    writer.write("\n}")
+    writer = CodeWriter()
+    _render_to(node=node, writer=writer)
 
     return writer.getvalue()
 
@@ -3,4 +3,6 @@
 from aas_core_codegen.csharp.verification import _generate
 
 verify = _generate.verify
+generate_chunks = _generate.generate_chunks
+generate_shards = _generate.generate_shards
 generate = _generate.generate
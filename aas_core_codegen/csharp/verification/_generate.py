@@ -9,19 +9,35 @@ from typing import (
     Union,
     Set,
     Mapping,
+    Iterator,
+    Dict,
+    Final,
 )
 
 from icontract import ensure, require
 
 from aas_core_codegen import intermediate, specific_implementations
-from aas_core_codegen.common import Error, Stripped, assert_never, Identifier
+from aas_core_codegen.common import (
+    Error,
+    Stripped,
+    assert_never,
+    Identifier,
+    CodeWriter,
+    indent_but_first_line,
+)
 from aas_core_codegen.csharp import (
     common as csharp_common,
     naming as csharp_naming,
     unrolling as csharp_unrolling,
     description as csharp_description,
 )
-from aas_core_codegen.csharp.common import INDENT as I, INDENT2 as II, INDENT3 as III
+from aas_core_codegen.csharp.regex_mode import RegexMode
+from aas_core_codegen.csharp.common import (
+    INDENT as I,
+    INDENT2 as II,
+    INDENT3 as III,
+    INDENT4 as IIII,
+)
 from aas_core_codegen.intermediate import type_inference as intermediate_type_inference
 from aas_core_codegen.parse import tree as parse_tree
 
@@ -135,13 +151,18 @@ class _PatternVerificationTranspiler(parse_tree.RestrictedTransformer[Stripped])
             return Stripped(f"var {variable} = {code};")
 
 
-@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def _transpile_pattern_verification(
+def _generate_regex_construction(
     verification: intermediate.PatternVerification,
-) -> Tuple[Optional[Stripped], Optional[Error]]:
-    """Generate the verification function that checks the regular expressions."""
-    # NOTE (mristin, 2021-12-19):
-    # We assume that we performed all the checks at the intermediate stage.
+    regex_mode: RegexMode,
+    regex_timeout_ms: Optional[int],
+) -> List[Stripped]:
+    """
+    Generate the construction of the regular expression and its static field.
+
+    The ``regex_mode`` must not be :py:attr:`RegexMode.GENERATED` as such
+    regular expressions are generated at build time.
+    """
+    assert regex_mode is not RegexMode.GENERATED
 
     construct_name = csharp_naming.private_method_name(
         Identifier(f"construct_{verification.name}")
@@ -151,8 +172,8 @@ def _transpile_pattern_verification(
 
     # region Construct block
 
-    writer = io.StringIO()
-    writer.write(
+    construct_writer = CodeWriter()
+    construct_writer.write(
         textwrap.dedent(
             f"""\
         private static Regex {construct_name}()
@@ -169,11 +190,12 @@ def _transpile_pattern_verification(
             break
 
         code = transpiler.transform(stmt)
-        writer.write(textwrap.indent(code, I))
-        writer.write("\n")
+        with construct_writer.indent(I):
+            construct_writer.write(code)
+        construct_writer.write("\n")
 
     if len(verification.parsed.body) >= 2:
-        writer.write("\n")
+        construct_writer.write("\n")
 
     assert len(verification.parsed.body) >= 1
 
@@ -196,15 +218,29 @@ def _transpile_pattern_verification(
     assert isinstance(match_call.args[0], parse_tree.Expression)
     pattern_expr = transpiler.transform(match_call.args[0])
 
-    # A pragmatic heuristics for breaking lines
-    if len(pattern_expr) < 50:
-        writer.write(textwrap.indent(f"return new Regex({pattern_expr});\n", I))
+    regex_args = [pattern_expr]  # type: List[str]
+    if regex_mode is RegexMode.COMPILED:
+        regex_args.append("RegexOptions.Compiled | RegexOptions.CultureInvariant")
+    elif regex_mode is RegexMode.INTERPRETED:
+        if regex_timeout_ms is not None:
+            regex_args.append("RegexOptions.None")
     else:
-        writer.write(textwrap.indent(f"return new Regex(\n{I}{pattern_expr});\n", I))
+        assert_never(regex_mode)
 
-    writer.write("}")
+    if regex_timeout_ms is not None:
+        regex_args.append(f"System.TimeSpan.FromMilliseconds({regex_timeout_ms})")
 
-    blocks.append(Stripped(writer.getvalue()))
+    # A pragmatic heuristics for breaking lines
+    with construct_writer.indent(I):
+        if len(regex_args) == 1 and len(pattern_expr) < 50:
+            construct_writer.write(f"return new Regex({pattern_expr});\n")
+        else:
+            joined_args = ",\n".join(f"{I}{arg}" for arg in regex_args)
+            construct_writer.write(f"return new Regex(\n{joined_args});\n")
+
+    construct_writer.write("}")
+
+    blocks.append(Stripped(construct_writer.getvalue()))
 
     # endregion
 
@@ -218,6 +254,78 @@ def _transpile_pattern_verification(
         Stripped(f"private static readonly Regex {regex_name} = {construct_name}();")
     )
 
+    # endregion
+
+    return blocks
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@require(
+    lambda regex_timeout_ms: regex_timeout_ms is None or regex_timeout_ms > 0,
+    "Timeout, if specified, must be positive",
+)
+def _transpile_pattern_verification(
+    verification: intermediate.PatternVerification,
+    regex_mode: RegexMode,
+    regex_timeout_ms: Optional[int],
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """
+    Generate the verification function that checks the regular expressions.
+
+    The regular expression is constructed according to the ``regex_mode``.
+    If ``regex_timeout_ms`` is given, the matching is limited to that many
+    milliseconds.
+    """
+    # NOTE (mristin, 2021-12-19):
+    # We assume that we performed all the checks at the intermediate stage.
+
+    blocks = []  # type: List[Stripped]
+
+    if regex_mode is RegexMode.GENERATED:
+        regex_name = csharp_naming.private_method_name(
+            Identifier(f"regex_{verification.name}")
+        )
+
+        # The source generator needs the pattern as a constant, so we can not
+        # transpile the statements of the function as we do for the other modes.
+        generated_regex_args = [
+            csharp_common.string_literal(verification.pattern),
+            "RegexOptions.CultureInvariant",
+        ]
+        if regex_timeout_ms is not None:
+            generated_regex_args.append(str(regex_timeout_ms))
+
+        joined_args = ",\n".join(f"{I}{arg}" for arg in generated_regex_args)
+
+        blocks.append(
+            Stripped(
+                f"""\
+[System.Text.RegularExpressions.GeneratedRegex(
+{joined_args})]
+private static partial Regex {regex_name}();"""
+            )
+        )
+
+        regex_instance = f"{regex_name}()"
+
+    elif regex_mode is RegexMode.INTERPRETED or regex_mode is RegexMode.COMPILED:
+        blocks.extend(
+            _generate_regex_construction(
+                verification=verification,
+                regex_mode=regex_mode,
+                regex_timeout_ms=regex_timeout_ms,
+            )
+        )
+
+        regex_instance = csharp_naming.private_property_name(
+            Identifier(f"regex_{verification.name}")
+        )
+
+    else:
+        assert_never(regex_mode)
+
+    # region Verification function
+
     assert len(verification.arguments) == 1
     assert isinstance(
         verification.arguments[0].type_annotation, intermediate.PrimitiveTypeAnnotation
@@ -230,6 +338,8 @@ def _transpile_pattern_verification(
 
     arg_name = csharp_naming.argument_name(verification.arguments[0].name)
 
+    method_name = csharp_naming.method_name(verification.name)
+
     writer = io.StringIO()
     if verification.description is not None:
         comment, error = csharp_description.generate_comment(verification.description)
@@ -241,15 +351,39 @@ def _transpile_pattern_verification(
         writer.write(comment)
         writer.write("\n")
 
-    writer.write(
-        textwrap.dedent(
-            f"""\
-            public static bool IsMimeType(string {arg_name})
-            {{
-            {I}return {regex_name}.IsMatch({arg_name});
-            }}"""
+    if regex_timeout_ms is None:
+        writer.write(
+            textwrap.dedent(
+                f"""\
+                public static bool {method_name}(string {arg_name})
+                {{
+                {I}return {regex_instance}.IsMatch({arg_name});
+                }}"""
+            )
+        )
+    else:
+        # The verification reports the text which times out as invalid on
+        # the path of the failed invariant, instead of propagating the exception.
+        writer.write(
+            textwrap.dedent(
+                f"""\
+                /// <remarks>
+                /// If the matching takes longer than {regex_timeout_ms} milliseconds,
+                /// the <paramref name="{arg_name}" /> is considered invalid.
+                /// </remarks>
+                public static bool {method_name}(string {arg_name})
+                {{
+                {I}try
+                {I}{{
+                {II}return {regex_instance}.IsMatch({arg_name});
+                {I}}}
+                {I}catch (System.Text.RegularExpressions.RegexMatchTimeoutException)
+                {I}{{
+                {II}return false;
+                {I}}}
+                }}"""
+            )
         )
-    )
 
     blocks.append(Stripped(writer.getvalue()))
 
@@ -266,7 +400,7 @@ def _transpile_pattern_verification(
 
 
 def _generate_enum_value_sets(symbol_table: intermediate.SymbolTable) -> Stripped:
-    """Generate a class that pre-computes the sets of allowed enumeration literals."""
+    """Generate a class that checks the membership in enumerations."""
     blocks = []  # type: List[Stripped]
 
     for symbol in symbol_table.symbols:
@@ -275,54 +409,218 @@ def _generate_enum_value_sets(symbol_table: intermediate.SymbolTable) -> Strippe
 
         enum_name = csharp_naming.enum_name(symbol.name)
 
+        # The C# enumerations are generated without explicit values so that
+        # the literals are numbered from zero without gaps. Hence the membership
+        # boils down to a single unsigned comparison against the last literal.
         if len(symbol.literals) == 0:
-            blocks.append(
-                Stripped(
-                    f"public static HashSet<int> For{enum_name} = new HashSet<int>();"
-                )
-            )
+            contains_expr = "false"
         else:
-            hash_set_writer = io.StringIO()
-            hash_set_writer.write(
-                f"public static HashSet<int> For{enum_name} = new HashSet<int>\n{{\n"
+            last_literal_name = csharp_naming.enum_literal_name(
+                symbol.literals[-1].name
             )
+            contains_expr = f"(uint)value <= (uint)Aas.{enum_name}.{last_literal_name}"
 
-            for i, literal in enumerate(symbol.literals):
-                literal_name = csharp_naming.enum_literal_name(literal.name)
-                hash_set_writer.write(f"{I}(int)Aas.{enum_name}.{literal_name}")
-                if i < len(symbol.literals) - 1:
-                    hash_set_writer.write(",\n")
-                else:
-                    hash_set_writer.write("\n")
-
-            hash_set_writer.write("};")
-
-            blocks.append(Stripped(hash_set_writer.getvalue()))
+        blocks.append(
+            Stripped(
+                textwrap.dedent(
+                    f"""\
+                    /// <summary>
+                    /// Check whether <paramref name="value" /> is a literal of
+                    /// <see cref="Aas.{enum_name}" />.
+                    /// </summary>
+                    public static bool Contains{enum_name}(int value)
+                    {{
+                    {I}return {contains_expr};
+                    }}"""
+                )
+            )
+        )
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             """\
         /// <summary>
-        /// Hash allowed enum values for efficient validation of enums.
+        /// Check efficiently whether the values are literals of the enumerations.
         /// </summary>
         private static class EnumValueSet
         {
         """
         )
     )
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
 
-        writer.write(textwrap.indent(block, I))
+            writer.write(block)
 
     writer.write("\n}  // private static class EnumValueSet")
 
     return Stripped(writer.getvalue())
 
 
+_PATH_SEGMENT = Stripped(
+    f"""\
+/// <summary>
+/// Represent a path to an instance as a chain of segments.
+/// </summary>
+/// <remarks>
+/// The verifiers pass the segments down as they descend, and render them
+/// as a string only when an error is recorded. Hence valid instances are
+/// verified without formatting any paths.
+/// </remarks>
+public sealed class PathSegment
+{{
+{I}/// <summary>
+{I}/// Segment which this segment extends, or null if this is the root
+{I}/// </summary>
+{I}public readonly PathSegment? Parent;
+
+{I}/// <summary>
+{I}/// Name of the property, or null if the segment is an index
+{I}/// </summary>
+{I}public readonly string? Name;
+
+{I}/// <summary>
+{I}/// Index of the item in a list, if the segment is not a name
+{I}/// </summary>
+{I}public readonly int Index;
+
+{I}/// <summary>
+{I}/// Initialize the root of a path with the given <paramref name="name" />.
+{I}/// </summary>
+{I}public PathSegment(string name)
+{I}{{
+{II}Name = name;
+{I}}}
+
+{I}/// <summary>
+{I}/// Initialize the segment of a property <paramref name="name" />.
+{I}/// </summary>
+{I}public PathSegment(PathSegment parent, string name)
+{I}{{
+{II}Parent = parent;
+{II}Name = name;
+{I}}}
+
+{I}/// <summary>
+{I}/// Initialize the segment of a list item at <paramref name="index" />.
+{I}/// </summary>
+{I}public PathSegment(PathSegment parent, int index)
+{I}{{
+{II}Parent = parent;
+{II}Index = index;
+{I}}}
+
+{I}/// <summary>
+{I}/// Render the path with the segments joined by slashes.
+{I}/// </summary>
+{I}public override string ToString()
+{I}{{
+{II}var segments = new List<PathSegment>();
+{II}for (PathSegment? segment = this; segment != null; segment = segment.Parent)
+{II}{{
+{III}segments.Add(segment);
+{II}}}
+
+{II}var builder = new System.Text.StringBuilder();
+{II}for (var i = segments.Count - 1; i >= 0; i--)
+{II}{{
+{III}if (i < segments.Count - 1)
+{III}{{
+{IIII}builder.Append('/');
+{III}}}
+
+{III}if (segments[i].Name != null)
+{III}{{
+{IIII}builder.Append(segments[i].Name);
+{III}}}
+{III}else
+{III}{{
+{IIII}builder.Append(segments[i].Index);
+{III}}}
+{II}}}
+
+{II}return builder.ToString();
+{I}}}
+
+{I}/// <summary>
+{I}/// Render the <paramref name="segment" /> for the implementation-specific
+{I}/// verification which still localizes the errors with string paths.
+{I}/// </summary>
+{I}public static implicit operator string(PathSegment segment)
+{I}{{
+{II}return segment.ToString();
+{I}}}
+}}  // public sealed class PathSegment"""
+)
+
+
+def _path_segment_expr(path: Sequence[str]) -> str:
+    """
+    Generate the C# expression which chains the ``path`` into path segments.
+
+    The first item of the ``path`` is the C# expression of the root segment, while
+    the remaining items are the names as string literals, or the indices as
+    variables.
+    """
+    expr = path[0]
+    for segment in path[1:]:
+        if "\n" in expr or expr.startswith("new "):
+            expr = (
+                f"new Verification.PathSegment(\n"
+                f"{I}{indent_but_first_line(expr, I)},\n"
+                f"{I}{segment})"
+            )
+        else:
+            expr = f"new Verification.PathSegment({expr}, {segment})"
+
+    return expr
+
+
+def _index_var_name(item_level: int) -> str:
+    """Generate the name of the index variable of a list at ``item_level``."""
+    if item_level > 15:
+        return f"i{item_level}"
+
+    # Use letters i, j, k *etc.* first before we resort to i16, i17 *etc.*
+    return chr(ord("i") + item_level)
+
+
+def _generate_index_loop(index_var: str, unrollee_expr: str) -> Stripped:
+    """Generate the header of the loop over the indices of a list."""
+    text = Stripped(
+        f"for(var {index_var} = 0; "
+        f"{index_var} < {unrollee_expr}.Count; "
+        f"{index_var}++)"
+    )
+
+    # Break into lines if too long.
+    # This is just a heuristics — we do not consider the actual prefix indention.
+    if len(text) > 50:
+        text = Stripped(
+            textwrap.dedent(
+                f"""\
+                for(
+                {I}var {index_var} = 0;
+                {I}{index_var} < {unrollee_expr}.Count;
+                {I}{index_var}++)"""
+            )
+        )
+
+    return text
+
+
 class _EnumerationCheckUnroller(csharp_unrolling.Unroller):
+    #: If set, generate the code which returns false on the first violation
+    #: instead of recording the errors
+    _fail_fast: Final[bool]
+
+    def __init__(self, fail_fast: bool) -> None:
+        """Initialize with the given values."""
+        self._fail_fast = fail_fast
+
     def _unroll_primitive_type_annotation(
         self,
         unrollee_expr: str,
@@ -352,21 +650,33 @@ class _EnumerationCheckUnroller(csharp_unrolling.Unroller):
             return []
 
         enum_name = csharp_naming.enum_name(symbol.name)
-        joined_pth = "/".join(path)
+
+        if self._fail_fast:
+            return [
+                csharp_unrolling.Node(
+                    text=f"""\
+if (!Verification.Implementation.EnumValueSet.Contains{enum_name}(
+{II}(int){unrollee_expr}))
+{{
+{I}return false;
+}}""",
+                    children=[],
+                )
+            ]
+
+        path_expr = _path_segment_expr(path)
 
         return [
             csharp_unrolling.Node(
-                text=textwrap.dedent(
-                    f"""\
-                        if (!Verification.Implementation.EnumValueSet.For{enum_name}.Contains(
-                        {II}(int){unrollee_expr}))
-                        {{
-                        {I}errors.Add(
-                        {II}new Verification.Error(
-                        {III}$"{{path}}/{joined_pth}",
-                        {III}$"Invalid {{nameof(Aas.{enum_name})}}: {{{unrollee_expr}}}"));
-                        }}"""
-                ),
+                text=f"""\
+if (!Verification.Implementation.EnumValueSet.Contains{enum_name}(
+{II}(int){unrollee_expr}))
+{{
+{I}errors.Add(
+{II}new Verification.Error(
+{III}{indent_but_first_line(path_expr, III)}.ToString(),
+{III}$"Invalid {{nameof(Aas.{enum_name})}}: {{{unrollee_expr}}}"));
+}}""",
                 children=[],
             )
         ]
@@ -379,15 +689,14 @@ class _EnumerationCheckUnroller(csharp_unrolling.Unroller):
         item_level: int,
         key_value_level: int,
     ) -> List[csharp_unrolling.Node]:
-        # Descend into the list items
-        item_var = csharp_unrolling.Unroller._loop_var_name(
-            level=item_level, suffix="Item"
-        )
+        # Descend into the list items. We iterate with the index so that we can
+        # construct meaningful paths.
+        index_var = _index_var_name(item_level=item_level)
 
         children = self.unroll(
-            unrollee_expr=item_var,
+            unrollee_expr=f"{unrollee_expr}[{index_var}]",
             type_annotation=type_annotation.items,
-            path=path + [f"{{{item_var}}}"],
+            path=path + [index_var],
             item_level=item_level + 1,
             key_value_level=key_value_level,
         )
@@ -396,7 +705,8 @@ class _EnumerationCheckUnroller(csharp_unrolling.Unroller):
             return []
 
         node = csharp_unrolling.Node(
-            text=f"foreach (var {item_var} in {unrollee_expr})", children=children
+            text=_generate_index_loop(index_var=index_var, unrollee_expr=unrollee_expr),
+            children=children,
         )
 
         return [node]
@@ -427,16 +737,22 @@ class _EnumerationCheckUnroller(csharp_unrolling.Unroller):
             return []
 
 
-def _unroll_enumeration_check(prop: intermediate.Property) -> Stripped:
-    """Generate the code for unrolling the enumeration checks for the given property."""
+def _unroll_enumeration_check(
+    prop: intermediate.Property, fail_fast: bool = False
+) -> Stripped:
+    """
+    Generate the code for unrolling the enumeration checks for the given property.
+
+    If ``fail_fast`` is set, the code returns false on the first violation.
+    """
     prop_name = csharp_naming.property_name(prop.name)
 
-    unroller = _EnumerationCheckUnroller()
+    unroller = _EnumerationCheckUnroller(fail_fast=fail_fast)
 
     roots = unroller.unroll(
         unrollee_expr=f"that.{prop_name}",
         type_annotation=prop.type_annotation,
-        path=[prop_name],
+        path=["path", csharp_common.string_literal(prop_name)],
         item_level=0,
         key_value_level=0,
     )
@@ -449,6 +765,14 @@ def _unroll_enumeration_check(prop: intermediate.Property) -> Stripped:
 
 
 class _ConstrainedPrimitiveCheckUnroller(csharp_unrolling.Unroller):
+    #: If set, generate the code which returns false on the first violation
+    #: instead of recording the errors
+    _fail_fast: Final[bool]
+
+    def __init__(self, fail_fast: bool) -> None:
+        """Initialize with the given values."""
+        self._fail_fast = fail_fast
+
     def _unroll_primitive_type_annotation(
         self,
         unrollee_expr: str,
@@ -479,17 +803,27 @@ class _ConstrainedPrimitiveCheckUnroller(csharp_unrolling.Unroller):
 
         cls_name = csharp_naming.class_name(type_annotation.symbol.name)
 
-        joined_pth = "/".join(path)
+        if self._fail_fast:
+            return [
+                csharp_unrolling.Node(
+                    text=f"""\
+if (!Verification.Implementation.IsValid{cls_name}({unrollee_expr}))
+{{
+{I}return false;
+}}""",
+                    children=[],
+                )
+            ]
+
+        path_expr = _path_segment_expr(path)
 
         return [
             csharp_unrolling.Node(
-                text=textwrap.dedent(
-                    f"""\
-                    Verification.Implementation.Verify{cls_name}(
-                    {I}{unrollee_expr},
-                    {I}$"{{path}}/{joined_pth}",
-                    {I}errors);"""
-                ),
+                text=f"""\
+Verification.Implementation.Verify{cls_name}(
+{I}{unrollee_expr},
+{I}{indent_but_first_line(path_expr, I)},
+{I}errors);""",
                 children=[],
             )
         ]
@@ -502,15 +836,14 @@ class _ConstrainedPrimitiveCheckUnroller(csharp_unrolling.Unroller):
         item_level: int,
         key_value_level: int,
     ) -> List[csharp_unrolling.Node]:
-        # Descend into the list items
-        item_var = csharp_unrolling.Unroller._loop_var_name(
-            level=item_level, suffix="Item"
-        )
+        # Descend into the list items. We iterate with the index so that we can
+        # construct meaningful paths.
+        index_var = _index_var_name(item_level=item_level)
 
         children = self.unroll(
-            unrollee_expr=item_var,
+            unrollee_expr=f"{unrollee_expr}[{index_var}]",
             type_annotation=type_annotation.items,
-            path=path + [f"{{{item_var}}}"],
+            path=path + [index_var],
             item_level=item_level + 1,
             key_value_level=key_value_level,
         )
@@ -519,7 +852,8 @@ class _ConstrainedPrimitiveCheckUnroller(csharp_unrolling.Unroller):
             return []
 
         node = csharp_unrolling.Node(
-            text=f"foreach (var {item_var} in {unrollee_expr})", children=children
+            text=_generate_index_loop(index_var=index_var, unrollee_expr=unrollee_expr),
+            children=children,
         )
 
         return [node]
@@ -550,16 +884,22 @@ class _ConstrainedPrimitiveCheckUnroller(csharp_unrolling.Unroller):
             return []
 
 
-def _unroll_constrained_primitive_check(prop: intermediate.Property) -> Stripped:
-    """Generate the code for unrolling primitive constraints on the property."""
+def _unroll_constrained_primitive_check(
+    prop: intermediate.Property, fail_fast: bool = False
+) -> Stripped:
+    """
+    Generate the code for unrolling primitive constraints on the property.
+
+    If ``fail_fast`` is set, the code returns false on the first violation.
+    """
     prop_name = csharp_naming.property_name(prop.name)
 
-    unroller = _ConstrainedPrimitiveCheckUnroller()
+    unroller = _ConstrainedPrimitiveCheckUnroller(fail_fast=fail_fast)
 
     roots = unroller.unroll(
         unrollee_expr=f"that.{prop_name}",
         type_annotation=prop.type_annotation,
-        path=[prop_name],
+        path=["path", csharp_common.string_literal(prop_name)],
         item_level=0,
         key_value_level=0,
     )
@@ -581,11 +921,9 @@ class _InvariantTranspiler(
         type_map: Mapping[
             parse_tree.Node, intermediate_type_inference.TypeAnnotationUnion
         ],
-        environment: intermediate_type_inference.Environment,
     ) -> None:
         """Initialize with the given values."""
         self.type_map = type_map
-        self.environment = environment
 
     @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
     def transform_member(
@@ -1099,9 +1437,14 @@ assert all(
 def _transpile_invariant(
     invariant: intermediate.Invariant,
     symbol_table: intermediate.SymbolTable,
-    environment: intermediate_type_inference.Environment,
+    fail_fast: bool = False,
 ) -> Tuple[Optional[Stripped], Optional[Error]]:
-    """Translate the invariant from the meta-model into C# code."""
+    """
+    Translate the invariant from the meta-model into C# code.
+
+    If ``fail_fast`` is set, the code returns false if the invariant is violated
+    instead of recording an error.
+    """
     # NOTE (mristin, 2021-10-24):
     # We manually transpile the invariant from our custom syntax without additional
     # semantic analysis in the :py:mod:`aas_core_codegen.intermediate` layer.
@@ -1111,30 +1454,20 @@ def _transpile_invariant(
     # of languages, we hope to have a much better understanding about the necessary
     # abstractions.
 
-    type_inferrer = intermediate_type_inference.Inferrer(
-        symbol_table=symbol_table, environment=environment
-    )
-    _ = type_inferrer.transform(invariant.body)
-    if len(type_inferrer.errors):
-        return None, Error(
-            invariant.parsed.node,
-            "Failed to infer the types in the invariant",
-            type_inferrer.errors,
-        )
-
-    transpiler = _InvariantTranspiler(
-        type_map=type_inferrer.type_map, environment=environment
-    )
+    # The types have been inferred only once per invariant in the intermediate layer,
+    # so we do not re-infer them here for every descendant.
+    transpiler = _InvariantTranspiler(type_map=symbol_table.type_map_of(invariant))
     expr, error = transpiler.transform(invariant.parsed.body)
     if error is not None:
         return None, error
 
     assert expr is not None
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     if len(expr) > 50 or "\n" in expr:
         writer.write("if (!(\n")
-        writer.write(textwrap.indent(expr, I))
+        with writer.indent(I):
+            writer.write(expr)
         writer.write("))\n{\n")
     else:
         no_parenthesis_type_in_this_context = (
@@ -1151,19 +1484,21 @@ def _transpile_invariant(
 
         writer.write(f"if ({not_expr})\n{{\n")
 
-    writer.write(
-        textwrap.indent(
+    if fail_fast:
+        writer.write(f"{I}return false;\n}}")
+        return Stripped(writer.getvalue()), None
+
+    with writer.indent(I):
+        writer.write(
             textwrap.dedent(
                 f"""\
-        errors.Add(
-        {I}new Verification.Error(
-        {II}path,
-        {II}"Invariant violated:\\n" +
-        """
-            ),
-            I,
+            errors.Add(
+            {I}new Verification.Error(
+            {II}path.ToString(),
+            {II}"Invariant violated:\\n" +
+            """
+            )
         )
-    )
 
     lines = []  # type: List[str]
     if invariant.description is not None:
@@ -1183,38 +1518,105 @@ def _transpile_invariant(
     return Stripped(writer.getvalue()), None
 
 
-@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def _generate_implementation_verify(
+def _invariants_are_shared(
+    symbol: Union[intermediate.ConstrainedPrimitive, intermediate.Class]
+) -> bool:
+    """
+    Check whether the own invariants of ``symbol`` are checked in shared functions.
+
+    This is the case if the ``symbol`` specifies invariants and has descendants
+    which inherit them. Otherwise, the invariants are transpiled in-line.
+    """
+    if isinstance(symbol, intermediate.ConcreteClass):
+        # The generated concrete class does not implement the interface generated
+        # for it, so it can not be passed to a function shared with its descendants.
+        return False
+
+    return len(symbol.descendant_id_set) > 0 and any(
+        invariant.specified_for is symbol for invariant in symbol.invariants
+    )
+
+
+def _transpile_invariants(
     something: Union[intermediate.ConcreteClass, intermediate.ConstrainedPrimitive],
     symbol_table: intermediate.SymbolTable,
-    base_environment: intermediate_type_inference.Environment,
-) -> Tuple[Optional[Stripped], Optional[Error]]:
-    """Generate the verify function in the ``Implementation`` class."""
-    errors = []  # type: List[Error]
-    blocks = []  # type: List[Stripped]
+    fail_fast: bool,
+) -> Tuple[List[Stripped], List[Error]]:
+    """
+    Translate the invariants of ``something`` into C# code blocks.
 
-    environment = intermediate_type_inference.MutableEnvironment(
-        parent=base_environment
-    )
+    The invariants specified for a symbol with shared invariants are checked with
+    a single call to the shared function instead of in-line.
 
-    assert environment.find(Identifier("self")) is None
-    environment.set(
-        identifier=Identifier("self"),
-        type_annotation=intermediate_type_inference.OurTypeAnnotation(symbol=something),
-    )
+    If ``fail_fast`` is set, the blocks return false on the first violation
+    instead of recording the errors.
+    """
+    blocks = []  # type: List[Stripped]
+    errors = []  # type: List[Error]
+
+    called_origins = set()  # type: Set[Identifier]
 
     for invariant in something.invariants:
+        origin = invariant.specified_for
+
+        if _invariants_are_shared(origin):
+            if origin.name in called_origins:
+                continue
+
+            called_origins.add(origin.name)
+            origin_name = csharp_naming.class_name(origin.name)
+
+            if fail_fast:
+                blocks.append(
+                    Stripped(
+                        f"""\
+if (!SatisfiesInvariantsOf{origin_name}(that))
+{{
+{I}return false;
+}}"""
+                    )
+                )
+            else:
+                blocks.append(
+                    Stripped(
+                        f"""\
+VerifyInvariantsOf{origin_name}(
+{I}that, path, errors);"""
+                    )
+                )
+
+            continue
+
         invariant_code, error = _transpile_invariant(
-            invariant=invariant, symbol_table=symbol_table, environment=environment
+            invariant=invariant, symbol_table=symbol_table, fail_fast=fail_fast
         )
         if error is not None:
             errors.append(error)
             continue
 
         assert invariant_code is not None
-
         blocks.append(invariant_code)
 
+    return blocks, errors
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_implementation_verify(
+    something: Union[intermediate.ConcreteClass, intermediate.ConstrainedPrimitive],
+    symbol_table: intermediate.SymbolTable,
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """Generate the verify function in the ``Implementation`` class."""
+    blocks = []  # type: List[Stripped]
+
+    invariant_blocks, errors = _transpile_invariants(
+        something=something, symbol_table=symbol_table, fail_fast=False
+    )
+
+    for invariant_block in invariant_blocks:
+        if len(blocks) > 0:
+            blocks.append(Stripped("if (errors.Full()) return;"))
+        blocks.append(invariant_block)
+
     if len(errors) > 0:
         return None, Error(
             something.parsed.node,
@@ -1254,7 +1656,7 @@ def _generate_implementation_verify(
 
     assert that_type is not None
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -1266,17 +1668,19 @@ def _generate_implementation_verify(
         /// </summary>
         public static void Verify{cls_name} (
         {I}{that_type} that,
-        {I}string path,
+        {I}Verification.PathSegment path,
         {I}Verification.Errors errors)
         {{
         """
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
+
+            writer.write(block)
 
     writer.write("\n}")
 
@@ -1285,111 +1689,370 @@ def _generate_implementation_verify(
 
 
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def _generate_implementation_class(
+def _generate_implementation_is_valid(
+    something: Union[intermediate.ConcreteClass, intermediate.ConstrainedPrimitive],
     symbol_table: intermediate.SymbolTable,
-    spec_impls: specific_implementations.SpecificImplementations,
-    base_environment: intermediate_type_inference.Environment,
-) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
-    """Generate a private static class, ``Implementation``, with verification logic."""
-    errors = []  # type: List[Error]
-    blocks = [
-        _generate_enum_value_sets(symbol_table=symbol_table)
-    ]  # type: List[Stripped]
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """
+    Generate the is-valid function in the ``Implementation`` class.
 
-    for symbol in symbol_table.symbols:
-        if isinstance(symbol, intermediate.Enumeration):
-            continue
+    The function short-circuits on the first violation and does not allocate
+    any errors. The instances referenced by ``something`` are not checked.
+    """
+    blocks, errors = _transpile_invariants(
+        something=something, symbol_table=symbol_table, fail_fast=True
+    )
 
-        elif isinstance(symbol, intermediate.ConstrainedPrimitive):
-            implementation_verify, error = _generate_implementation_verify(
-                something=symbol,
-                symbol_table=symbol_table,
-                base_environment=base_environment,
-            )
-            if error is not None:
-                errors.append(error)
-                continue
+    if len(errors) > 0:
+        return None, Error(
+            something.parsed.node,
+            f"Failed to parse one or more invariants of the class {something.name!r}",
+            errors,
+        )
 
-            assert implementation_verify is not None
+    if isinstance(something, intermediate.ConstrainedPrimitive):
+        pass
+    elif isinstance(something, intermediate.ConcreteClass):
+        for prop in something.properties:
+            enum_check_block = _unroll_enumeration_check(prop=prop, fail_fast=True)
+            if enum_check_block != "":
+                blocks.append(enum_check_block)
 
-            if implementation_verify != "":
-                blocks.append(implementation_verify)
+            constrained_primitive_check = _unroll_constrained_primitive_check(
+                prop=prop, fail_fast=True
+            )
+            if constrained_primitive_check != "":
+                blocks.append(constrained_primitive_check)
+    else:
+        assert_never(something)
 
-        elif isinstance(symbol, intermediate.AbstractClass):
-            # No verification of interfaces, and all abstract classes are modeled as
-            # interfaces in C#.
-            continue
+    blocks.append(Stripped("return true;"))
 
-        elif isinstance(symbol, intermediate.ConcreteClass):
-            if symbol.is_implementation_specific:
-                verify_key = specific_implementations.ImplementationKey(
-                    f"Verification/Implementation/verify_{symbol.name}.cs"
-                )
-                if verify_key not in spec_impls:
-                    errors.append(
-                        Error(
-                            symbol.parsed.node,
-                            f"The implementation snippet is missing for "
-                            f"the ``Verify`` method "
-                            f"of the ``Verification.Implementation`` class: {verify_key}",
-                        )
-                    )
-                    continue
-
-                blocks.append(spec_impls[verify_key])
-            else:
-                implementation_verify, error = _generate_implementation_verify(
-                    something=symbol,
-                    symbol_table=symbol_table,
-                    base_environment=base_environment,
-                )
-                if error is not None:
-                    errors.append(error)
-                    continue
-
-                assert implementation_verify is not None
+    cls_name = csharp_naming.class_name(something.name)
 
-                if implementation_verify != "":
-                    blocks.append(implementation_verify)
-        else:
-            assert_never(symbol)
+    that_type = None  # type: Optional[str]
+    if isinstance(something, intermediate.ConstrainedPrimitive):
+        that_type = csharp_common.PRIMITIVE_TYPE_MAP[something.constrainee]
+    elif isinstance(something, intermediate.ConcreteClass):
+        that_type = f"Aas.{cls_name}"
+    else:
+        assert_never(something)
 
-    if len(errors) > 0:
-        return None, errors
+    assert that_type is not None
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
-            """\
-            /// <summary>
-            /// Verify the instances of the model classes non-recursively.
-            /// </summary>
-            /// <remarks>
-            /// The methods provided by this class are re-used in the verification
-            /// visitors.
-            /// </remarks>
-            private static class Implementation
-            {
-            """
+            f"""\
+        /// <summary>
+        /// Check whether <paramref name="that" /> satisfies its own constraints
+        /// without allocating any errors.
+        /// </summary>
+        public static bool IsValid{cls_name}({that_type} that)
+        {{
+        """
         )
     )
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
 
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
 
-    writer.write("\n}  // private static class Implementation")
+            writer.write(block)
+
+    writer.write("\n}")
 
     return Stripped(writer.getvalue()), None
 
 
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def _generate_non_recursive_verifier(
+def _generate_implementation_verify_and_is_valid(
+    something: Union[intermediate.ConcreteClass, intermediate.ConstrainedPrimitive],
+    symbol_table: intermediate.SymbolTable,
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """Generate the verify and is-valid functions in the ``Implementation`` class."""
+    verify, error = _generate_implementation_verify(
+        something=something, symbol_table=symbol_table
+    )
+    if error is not None:
+        return None, error
+
+    assert verify is not None
+
+    is_valid, error = _generate_implementation_is_valid(
+        something=something, symbol_table=symbol_table
+    )
+    if error is not None:
+        return None, error
+
+    assert is_valid is not None
+
+    return Stripped(f"{verify}\n\n{is_valid}"), None
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_implementation_shared_invariants(
+    symbol: Union[intermediate.ConstrainedPrimitive, intermediate.Class],
+    symbol_table: intermediate.SymbolTable,
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """
+    Generate the functions checking the own invariants of ``symbol``.
+
+    The functions are shared by ``symbol`` and its descendants so that every
+    invariant is transpiled only once.
+    """
+    verify_blocks = []  # type: List[Stripped]
+    satisfies_blocks = []  # type: List[Stripped]
+    errors = []  # type: List[Error]
+
+    for invariant in symbol.invariants:
+        if invariant.specified_for is not symbol:
+            continue
+
+        verify_code, error = _transpile_invariant(
+            invariant=invariant, symbol_table=symbol_table
+        )
+        if error is not None:
+            errors.append(error)
+            continue
+
+        satisfies_code, error = _transpile_invariant(
+            invariant=invariant, symbol_table=symbol_table, fail_fast=True
+        )
+        if error is not None:
+            errors.append(error)
+            continue
+
+        assert verify_code is not None
+        assert satisfies_code is not None
+
+        if len(verify_blocks) > 0:
+            verify_blocks.append(Stripped("if (errors.Full()) return;"))
+        verify_blocks.append(verify_code)
+
+        satisfies_blocks.append(satisfies_code)
+
+    if len(errors) > 0:
+        return None, Error(
+            symbol.parsed.node,
+            f"Failed to parse one or more invariants of the class {symbol.name!r}",
+            errors,
+        )
+
+    satisfies_blocks.append(Stripped("return true;"))
+
+    name = csharp_naming.class_name(symbol.name)
+
+    that_type = None  # type: Optional[str]
+    if isinstance(symbol, intermediate.ConstrainedPrimitive):
+        that_type = csharp_common.PRIMITIVE_TYPE_MAP[symbol.constrainee]
+    elif isinstance(symbol, intermediate.Class):
+        assert symbol.interface is not None, (
+            f"Expected an interface for the class {symbol.name!r} "
+            f"as it has descendants"
+        )
+        that_type = f"Aas.{csharp_naming.name_of(symbol.interface)}"
+    else:
+        assert_never(symbol)
+
+    assert that_type is not None
+
+    if isinstance(symbol, intermediate.ConstrainedPrimitive):
+        subject = f"<c>{name}</c>"
+    else:
+        subject = f'<see cref="{that_type}" />'
+
+    verify_body = "\n\n".join(verify_blocks)
+    satisfies_body = "\n\n".join(satisfies_blocks)
+
+    return (
+        Stripped(
+            f"""\
+/// <summary>
+/// Verify the invariants specified for {subject} on
+/// <paramref name="that" /> and append any errors to <paramref name="errors" />.
+/// </summary>
+/// <remarks>
+/// The function is shared by all the descendants which inherit the invariants.
+/// </remarks>
+public static void VerifyInvariantsOf{name}(
+{I}{that_type} that,
+{I}Verification.PathSegment path,
+{I}Verification.Errors errors)
+{{
+{I}{indent_but_first_line(verify_body, I)}
+}}
+
+/// <summary>
+/// Check whether <paramref name="that" /> satisfies the invariants specified for
+/// {subject} without allocating any errors.
+/// </summary>
+public static bool SatisfiesInvariantsOf{name}({that_type} that)
+{{
+{I}{indent_but_first_line(satisfies_body, I)}
+}}"""
+        ),
+        None,
+    )
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_implementation_verify_of_symbol(
+    symbol: intermediate.Symbol,
+    symbol_table: intermediate.SymbolTable,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """
+    Generate the verify and is-valid functions of ``symbol`` in ``Implementation``.
+
+    If the invariants of ``symbol`` are inherited by its descendants, the shared
+    functions checking them are generated as well. Implementation-specific classes
+    only come with the verify function from the snippet. If the ``symbol`` needs
+    no verification, return an empty string.
+    """
+    if isinstance(symbol, intermediate.Enumeration):
+        return Stripped(""), None
+
+    blocks = []  # type: List[Stripped]
+
+    if _invariants_are_shared(symbol):
+        shared, error = _generate_implementation_shared_invariants(
+            symbol=symbol, symbol_table=symbol_table
+        )
+        if error is not None:
+            return None, error
+
+        assert shared is not None
+        blocks.append(shared)
+
+    if isinstance(symbol, intermediate.ConstrainedPrimitive):
+        code, error = _generate_implementation_verify_and_is_valid(
+            something=symbol,
+            symbol_table=symbol_table,
+        )
+        if error is not None:
+            return None, error
+
+        assert code is not None
+        blocks.append(code)
+
+    elif isinstance(symbol, intermediate.AbstractClass):
+        # No verification of interfaces, and all abstract classes are modeled as
+        # interfaces in C#. Only their shared invariants are generated.
+        pass
+
+    elif isinstance(symbol, intermediate.ConcreteClass):
+        if symbol.is_implementation_specific:
+            verify_key = specific_implementations.ImplementationKey(
+                f"Verification/Implementation/verify_{symbol.name}.cs"
+            )
+            if verify_key not in spec_impls:
+                return None, Error(
+                    symbol.parsed.node,
+                    f"The implementation snippet is missing for "
+                    f"the ``Verify`` method "
+                    f"of the ``Verification.Implementation`` class: {verify_key}",
+                )
+
+            blocks.append(spec_impls[verify_key])
+        else:
+            code, error = _generate_implementation_verify_and_is_valid(
+                something=symbol,
+                symbol_table=symbol_table,
+            )
+            if error is not None:
+                return None, error
+
+            assert code is not None
+            blocks.append(code)
+
+    else:
+        assert_never(symbol)
+
+    return Stripped("\n\n".join(blocks)), None
+
+
+def _wrap_in_class(
+    declaration: str, blocks: Sequence[Stripped], closing_comment: str
+) -> Stripped:
+    """
+    Wrap the ``blocks`` as the body of a class.
+
+    The ``declaration`` precedes the body and the ``closing_comment`` marks its end.
+    """
+    writer = CodeWriter()
+    writer.write(declaration)
+    writer.write("\n{\n")
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n\n")
+
+            writer.write(block)
+
+    writer.write(f"\n}}  // {closing_comment}")
+
+    return Stripped(writer.getvalue())
+
+
+_IMPLEMENTATION_DOCUMENTATION = Stripped(
+    textwrap.dedent(
+        """\
+        /// <summary>
+        /// Verify the instances of the model classes non-recursively.
+        /// </summary>
+        /// <remarks>
+        /// The methods provided by this class are re-used in the verification
+        /// visitors.
+        /// </remarks>"""
+    )
+)
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_implementation_class(
     symbol_table: intermediate.SymbolTable,
+    spec_impls: specific_implementations.SpecificImplementations,
 ) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
-    """Generate the non-recursive verifier which visits the concrete classes."""
+    """Generate a private static class, ``Implementation``, with verification logic."""
+    errors = []  # type: List[Error]
     blocks = [
+        _generate_enum_value_sets(symbol_table=symbol_table)
+    ]  # type: List[Stripped]
+
+    for symbol in symbol_table.symbols:
+        implementation_verify, error = _generate_implementation_verify_of_symbol(
+            symbol=symbol, symbol_table=symbol_table, spec_impls=spec_impls
+        )
+        if error is not None:
+            errors.append(error)
+            continue
+
+        assert implementation_verify is not None
+
+        if implementation_verify != "":
+            blocks.append(implementation_verify)
+
+    if len(errors) > 0:
+        return None, errors
+
+    return (
+        _wrap_in_class(
+            declaration=(
+                f"{_IMPLEMENTATION_DOCUMENTATION}\n"
+                f"private static class Implementation"
+            ),
+            blocks=blocks,
+            closing_comment="private static class Implementation",
+        ),
+        None,
+    )
+
+
+def _generate_non_recursive_verifier_common_blocks() -> List[Stripped]:
+    """Generate the members of the non-recursive verifier common to all classes."""
+    return [
         Stripped("public readonly Verification.Errors Errors;"),
         Stripped(
             textwrap.dedent(
@@ -1398,9 +2061,10 @@ def _generate_non_recursive_verifier(
             /// Initialize the visitor with the given <paramref name="errors" />.
             ///
             /// The errors observed during the visitation will be appended to
-            /// the <paramref name="errors" />.
+            /// the <paramref name="errors" />. The verification stops once
+            /// the capacity of the <paramref name="errors" /> has been reached.
             /// </summary>
-            NonRecursiveVerifier(Verification.Errors errors)
+            public NonRecursiveVerifier(Verification.Errors errors)
             {{
             {I}Errors = errors;
             }}"""
@@ -1409,65 +2073,84 @@ def _generate_non_recursive_verifier(
         Stripped(
             textwrap.dedent(
                 f"""\
-            public void Visit(Aas.IClass that, string context)
+            public void Visit(Aas.IClass that, Verification.PathSegment context)
             {{
             {I}that.Accept(this, context);
             }}"""
             )
         ),
-    ]  # type: List[Stripped]
-
-    for symbol in symbol_table.symbols:
-        if not isinstance(symbol, intermediate.ConcreteClass):
-            continue
+    ]
 
-        cls_name = csharp_naming.class_name(symbol.name)
 
-        blocks.append(
-            Stripped(
-                textwrap.dedent(
-                    f"""\
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.{cls_name} that, string context)
-            {{
-            {I}Implementation.Verify{cls_name}(
-            {II}that, context, Errors);
-            }}"""
-                )
-            )
-        )
+def _generate_non_recursive_verifier_visit(cls: intermediate.ConcreteClass) -> Stripped:
+    """Generate the ``Visit`` method of the ``NonRecursiveVerifier`` for the ``cls``."""
+    cls_name = csharp_naming.class_name(cls.name)
 
-    writer = io.StringIO()
-    writer.write(
+    return Stripped(
         textwrap.dedent(
             f"""\
         /// <summary>
-        /// Verify the instances of the model classes non-recursively.
+        /// Verify <paramref name="that" /> instance and
+        /// append any error to <see cref="Errors" />
+        /// where <paramref name="context" /> is used to localize the error.
         /// </summary>
-        public class NonRecursiveVerifier :
-        {I}Visitation.IVisitorWithContext<string>
+        public void Visit(Aas.{cls_name} that, Verification.PathSegment context)
         {{
-        """
+        {I}Implementation.Verify{cls_name}(
+        {II}that, context, Errors);
+        }}"""
         )
     )
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
 
-        writer.write(textwrap.indent(block, I))
 
-    writer.write("\n}  // public class NonRecursiveVerifier")
+_NON_RECURSIVE_VERIFIER_DOCUMENTATION = Stripped(
+    textwrap.dedent(
+        """\
+        /// <summary>
+        /// Verify the instances of the model classes non-recursively.
+        /// </summary>"""
+    )
+)
+
 
-    return Stripped(writer.getvalue()), None
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_non_recursive_verifier(
+    symbol_table: intermediate.SymbolTable,
+) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
+    """Generate the non-recursive verifier which visits the concrete classes."""
+    blocks = _generate_non_recursive_verifier_common_blocks()
+
+    for symbol in symbol_table.symbols:
+        if not isinstance(symbol, intermediate.ConcreteClass):
+            continue
+
+        blocks.append(_generate_non_recursive_verifier_visit(cls=symbol))
+
+    return (
+        _wrap_in_class(
+            declaration=(
+                f"{_NON_RECURSIVE_VERIFIER_DOCUMENTATION}\n"
+                f"public class NonRecursiveVerifier :\n"
+                f"{I}Visitation.IVisitorWithContext<Verification.PathSegment>"
+            ),
+            blocks=blocks,
+            closing_comment="public class NonRecursiveVerifier",
+        ),
+        None,
+    )
 
 
 class _RecursionInRecursiveVerifyUnroller(csharp_unrolling.Unroller):
     """Generate the code that unrolls the recursive visits for the given property."""
 
+    #: If set, generate the code which transforms the instances to their validity
+    #: and returns false on the first invalid one instead of visiting them
+    _fail_fast: Final[bool]
+
+    def __init__(self, fail_fast: bool) -> None:
+        """Initialize with the given values."""
+        self._fail_fast = fail_fast
+
     def _unroll_primitive_type_annotation(
         self,
         unrollee_expr: str,
@@ -1498,16 +2181,26 @@ class _RecursionInRecursiveVerifyUnroller(csharp_unrolling.Unroller):
 
         assert isinstance(symbol, intermediate.Class), "Exhaustive matching"
 
-        joined_pth = "/".join(path)
+        if self._fail_fast:
+            return [
+                csharp_unrolling.Node(
+                    text=f"""\
+if (!Transform({unrollee_expr}))
+{{
+{I}return false;
+}}""",
+                    children=[],
+                )
+            ]
+
+        path_expr = _path_segment_expr(path)
         return [
             csharp_unrolling.Node(
-                text=textwrap.dedent(
-                    f"""\
-                        if (Errors.Full()) return;
-                        Visit(
-                            {unrollee_expr},
-                            ${csharp_common.string_literal(joined_pth)});"""
-                ),
+                text=f"""\
+if (Errors.Full()) return;
+Visit(
+{I}{unrollee_expr},
+{I}{indent_but_first_line(path_expr, I)});""",
                 children=[],
             )
         ]
@@ -1525,16 +2218,12 @@ class _RecursionInRecursiveVerifyUnroller(csharp_unrolling.Unroller):
         # We need to iterate through the list with the index so that we can construct
         # meaningful paths.
 
-        if item_level > 15:
-            index_var = f"i{item_level}"
-        else:
-            # Use letters i, j, k *etc.* first before we resort to i16, i17 *etc.*
-            index_var = chr(ord("i") + item_level)
+        index_var = _index_var_name(item_level=item_level)
 
         children = self.unroll(
             unrollee_expr=f"{unrollee_expr}[{index_var}]",
             type_annotation=type_annotation.items,
-            path=path + [f"{{{index_var}}}"],
+            path=path + [index_var],
             item_level=item_level + 1,
             key_value_level=key_value_level,
         )
@@ -1542,26 +2231,14 @@ class _RecursionInRecursiveVerifyUnroller(csharp_unrolling.Unroller):
         if len(children) == 0:
             return []
 
-        text = Stripped(
-            f"for(var {index_var} = 0; "
-            f"{index_var} < {unrollee_expr}.Count; "
-            f"{index_var}++)"
-        )
-
-        # Break into lines if too long.
-        # This is just a heuristics — we do not consider the actual prefix indention.
-        if len(text) > 50:
-            text = Stripped(
-                textwrap.dedent(
-                    f"""\
-                    for(
-                    {I}var {index_var} = 0;
-                    {I}{index_var} < {unrollee_expr}.Count;
-                    {I}{index_var}++)"""
-                )
+        return [
+            csharp_unrolling.Node(
+                text=_generate_index_loop(
+                    index_var=index_var, unrollee_expr=unrollee_expr
+                ),
+                children=children,
             )
-
-        return [csharp_unrolling.Node(text=text, children=children)]
+        ]
 
     def _unroll_optional_type_annotation(
         self,
@@ -1589,16 +2266,22 @@ class _RecursionInRecursiveVerifyUnroller(csharp_unrolling.Unroller):
             return []
 
 
-def _unroll_recursion_in_recursive_verify(prop: intermediate.Property) -> Stripped:
-    """Generate the code for unrolling the recursive visits  for the given property."""
+def _unroll_recursion_in_recursive_verify(
+    prop: intermediate.Property, fail_fast: bool = False
+) -> Stripped:
+    """
+    Generate the code for unrolling the recursive visits  for the given property.
+
+    If ``fail_fast`` is set, the code returns false on the first invalid instance.
+    """
 
     prop_name = csharp_naming.property_name(prop.name)
 
-    unroller = _RecursionInRecursiveVerifyUnroller()
+    unroller = _RecursionInRecursiveVerifyUnroller(fail_fast=fail_fast)
     roots = unroller.unroll(
         unrollee_expr=f"that.{prop_name}",
         type_annotation=prop.type_annotation,
-        path=["{context}", prop_name],
+        path=["context", csharp_common.string_literal(prop_name)],
         item_level=0,
         key_value_level=0,
     )
@@ -1622,14 +2305,14 @@ def _generate_recursive_verifier_visit(
     """Generate the ``Visit`` method of the ``RecursiveVerifier`` for the ``cls``."""
     cls_name = csharp_naming.class_name(cls.name)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(textwrap.dedent(f'''\
         /// <summary>
         /// Verify recursively <paramref name="that" /> instance and
         /// append any error to <see cref="Errors" />
         /// where <paramref name="context" /> is used to localize the error.
         /// </summary>
-        public void Visit({cls_name} that, string context)
+        public void Visit({cls_name} that, Verification.PathSegment context)
         {{
         '''))
 
@@ -1655,23 +2338,20 @@ def _generate_recursive_verifier_visit(
         blocks.append(Stripped("// The recursion ends here."))
     # endregion
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write('\n\n')
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write('\n\n')
 
-        writer.write(textwrap.indent(block, I))
+            writer.write(block)
 
     writer.write('\n}')
     return Stripped(writer.getvalue())
 
 
-@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def _generate_recursive_verifier(
-    symbol_table: intermediate.SymbolTable,
-    spec_impls: specific_implementations.SpecificImplementations,
-) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
-    """Generate the ``Verifier`` class which visits the classes and verifies them."""
-    blocks = [
+def _generate_recursive_verifier_common_blocks() -> List[Stripped]:
+    """Generate the members of the recursive verifier common to all classes."""
+    return [
         Stripped("public readonly Errors Errors;"),
         Stripped(
             textwrap.dedent(
@@ -1680,9 +2360,11 @@ def _generate_recursive_verifier(
             /// Initialize the visitor with the given <paramref name="errors" />.
             ///
             /// The errors observed during the visitation will be appended to
-            /// the <paramref name="errors" />.
+            /// the <paramref name="errors" />. The verification and the descent
+            /// stop once the capacity of the <paramref name="errors" /> has been
+            /// reached.
             /// </summary>
-            RecursiveVerifier(Errors errors)
+            public RecursiveVerifier(Errors errors)
             {{
             {I}Errors = errors;
             }}"""
@@ -1691,13 +2373,58 @@ def _generate_recursive_verifier(
         Stripped(
             textwrap.dedent(
                 f"""\
-            public void Visit(IClass that, string context)
+            public void Visit(IClass that, Verification.PathSegment context)
             {{
             {I}that.Accept(this, context);
             }}"""
             )
         ),
-    ]  # type: List[Stripped]
+    ]
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_recursive_verifier_visit_of_class(
+    cls: intermediate.ConcreteClass,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Stripped], Optional[Error]]:
+    """Generate or fetch the ``Visit`` method of the ``RecursiveVerifier``."""
+    if cls.is_implementation_specific:
+        visit_key = specific_implementations.ImplementationKey(
+            f"Verification/RecursiveVerifier/visit_{cls.name}.cs"
+        )
+
+        implementation = spec_impls.get(visit_key, None)
+        if implementation is None:
+            return None, Error(
+                cls.parsed.node,
+                f"The implementation snippet is missing for "
+                f"the ``Visit`` method "
+                f"of the ``Verification.RecursiveVerifier`` class: "
+                f"{visit_key}",
+            )
+
+        return implementation, None
+
+    return _generate_recursive_verifier_visit(cls=cls), None
+
+
+_RECURSIVE_VERIFIER_DOCUMENTATION = Stripped(
+    textwrap.dedent(
+        """\
+        /// <summary>
+        /// Verify the instances of the model classes recursively.
+        /// </summary>"""
+    )
+)
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_recursive_verifier(
+    symbol_table: intermediate.SymbolTable,
+    spec_impls: specific_implementations.SpecificImplementations,
+) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
+    """Generate the ``Verifier`` class which visits the classes and verifies them."""
+    blocks = _generate_recursive_verifier_common_blocks()
 
     errors = []  # type: List[Error]
 
@@ -1705,90 +2432,194 @@ def _generate_recursive_verifier(
         if not isinstance(symbol, intermediate.ConcreteClass):
             continue
 
-        if symbol.is_implementation_specific:
-            visit_key = specific_implementations.ImplementationKey(
-                f"Verification/RecursiveVerifier/visit_{symbol.name}.cs"
-            )
-
-            implementation = spec_impls.get(visit_key, None)
-            if implementation is None:
-                errors.append(
-                    Error(
-                        symbol.parsed.node,
-                        f"The implementation snippet is missing for "
-                        f"the ``Visit`` method "
-                        f"of the ``Verification.RecursiveVerifier`` class: "
-                        f"{visit_key}",
-                    )
-                )
-                continue
+        visit, error = _generate_recursive_verifier_visit_of_class(
+            cls=symbol, spec_impls=spec_impls
+        )
+        if error is not None:
+            errors.append(error)
+            continue
 
-            blocks.append(implementation)
-        else:
-            blocks.append(_generate_recursive_verifier_visit(cls=symbol))
+        assert visit is not None
+        blocks.append(visit)
 
     if len(errors) > 0:
         return None, errors
 
-    writer = io.StringIO()
-    writer.write(
-        textwrap.dedent(
-            f"""\
+    return (
+        _wrap_in_class(
+            declaration=(
+                f"{_RECURSIVE_VERIFIER_DOCUMENTATION}\n"
+                f"public class RecursiveVerifier :\n"
+                f"{I}Visitation.IVisitorWithContext<Verification.PathSegment>"
+            ),
+            blocks=blocks,
+            closing_comment="public class RecursiveVerifier",
+        ),
+        None,
+    )
+
+
+# fmt: on
+@require(
+    lambda cls: not cls.is_implementation_specific,
+    "Implementation-specific classes are handled elsewhere",
+)
+# fmt: off
+def _generate_recursive_validator_transform(
+        cls: intermediate.ConcreteClass
+) -> Stripped:
+    """Generate the ``Transform`` method of the ``RecursiveValidator`` for the ``cls``."""
+    cls_name = csharp_naming.class_name(cls.name)
+
+    writer = CodeWriter()
+    writer.write(textwrap.dedent(f'''\
         /// <summary>
-        /// Verify the instances of the model classes recursively.
+        /// Check recursively whether <paramref name="that" /> instance is valid.
         /// </summary>
-        public class RecursiveVerifier :
-        {I}Visitation.IVisitorWithContext<string>
+        public bool Transform(Aas.{cls_name} that)
         {{
-        """
+        '''))
+
+    blocks = [
+        Stripped(textwrap.dedent(f'''\
+        if (!Implementation.IsValid{cls_name}(that))
+        {{
+        {I}return false;
+        }}'''))
+    ]  # type: List[Stripped]
+
+    for prop in cls.properties:
+        unrolled_prop_validation = _unroll_recursion_in_recursive_verify(
+            prop=prop, fail_fast=True
         )
-    )
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n\n")
 
-        writer.write(textwrap.indent(block, I))
+        if unrolled_prop_validation != '':
+            blocks.append(unrolled_prop_validation)
 
-    writer.write("\n}  // public class RecursiveVerifier")
+    blocks.append(Stripped("return true;"))
 
-    return Stripped(writer.getvalue()), None
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write('\n\n')
 
+            writer.write(block)
 
-# fmt: off
-@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-@ensure(
-    lambda result:
-    not (result[0] is not None) or result[0].endswith('\n'),
-    "Trailing newline mandatory for valid end-of-files"
-)
-# fmt: on
-def generate(
-    symbol_table: intermediate.SymbolTable,
-    namespace: csharp_common.NamespaceIdentifier,
-    spec_impls: specific_implementations.SpecificImplementations,
-) -> Tuple[Optional[str], Optional[List[Error]]]:
+    writer.write('\n}')
+    return Stripped(writer.getvalue())
+
+
+def _generate_recursive_validator_transform_of_class(
+    cls: intermediate.ConcreteClass,
+) -> Stripped:
     """
-    Generate the C# code of the structures based on the symbol table.
+    Generate the ``Transform`` method of the ``RecursiveValidator``.
 
-    The ``namespace`` defines the AAS C# namespace.
+    The implementation-specific classes are verified with the ``RecursiveVerifier``
+    with the capacity of a single error as we can not see through their snippets.
     """
-    blocks = [
-        csharp_common.WARNING,
-        Stripped(
+    if cls.is_implementation_specific:
+        cls_name = csharp_naming.class_name(cls.name)
+
+        return Stripped(
             textwrap.dedent(
                 f"""\
-            using Regex = System.Text.RegularExpressions.Regex;
-            using System.Collections.Generic;  // can't alias
-            using System.Collections.ObjectModel;  // can't alias
-            using System.Linq;  // can't alias"
+            /// <summary>
+            /// Check recursively whether <paramref name="that" /> instance is valid.
+            /// </summary>
+            public bool Transform(Aas.{cls_name} that)
+            {{
+            {I}var errors = new Verification.Errors(1);
+            {I}new RecursiveVerifier(errors).Visit(
+            {II}that, new Verification.PathSegment(""));
+            {I}return errors.Entries().Count == 0;
+            }}"""
+            )
+        )
+
+    return _generate_recursive_validator_transform(cls=cls)
+
 
-            using Aas = {namespace};
-            using Visitation = {namespace}.Visitation;"""
+def _generate_recursive_validator_common_blocks() -> List[Stripped]:
+    """Generate the members of the recursive validator common to all classes."""
+    return [
+        Stripped(
+            textwrap.dedent(
+                f"""\
+            public bool Transform(Aas.IClass that)
+            {{
+            {I}return that.Transform(this);
+            }}"""
             )
         ),
-    ]  # type: List[Stripped]
+    ]
 
-    verification_blocks = []  # type: List[Stripped]
+
+_RECURSIVE_VALIDATOR_DOCUMENTATION = Stripped(
+    textwrap.dedent(
+        """\
+        /// <summary>
+        /// Check the instances of the model classes recursively and stop at
+        /// the first violation.
+        /// </summary>
+        /// <remarks>
+        /// Unlike <see cref="RecursiveVerifier" />, no errors are allocated.
+        /// </remarks>"""
+    )
+)
+
+
+def _generate_recursive_validator(symbol_table: intermediate.SymbolTable) -> Stripped:
+    """Generate the ``RecursiveValidator`` class which checks the validity."""
+    blocks = _generate_recursive_validator_common_blocks()
+
+    for symbol in symbol_table.symbols:
+        if not isinstance(symbol, intermediate.ConcreteClass):
+            continue
+
+        blocks.append(_generate_recursive_validator_transform_of_class(cls=symbol))
+
+    return _wrap_in_class(
+        declaration=(
+            f"{_RECURSIVE_VALIDATOR_DOCUMENTATION}\n"
+            f"private class RecursiveValidator : Visitation.ITransformer<bool>"
+        ),
+        blocks=blocks,
+        closing_comment="private class RecursiveValidator",
+    )
+
+
+_IS_VALID = Stripped(
+    textwrap.dedent(
+        f"""\
+        private static readonly RecursiveValidator _recursiveValidator = (
+        {I}new RecursiveValidator());
+
+        /// <summary>
+        /// Check whether <paramref name="that" /> instance and all the instances
+        /// beneath it are valid.
+        /// </summary>
+        /// <remarks>
+        /// The check short-circuits on the first violation and allocates no errors.
+        /// Use <see cref="RecursiveVerifier" /> to find out what is invalid.
+        /// </remarks>
+        public static bool IsValid(Aas.IClass that)
+        {{
+        {I}return _recursiveValidator.Transform(that);
+        }}"""
+    )
+)
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _generate_verification_functions(
+    symbol_table: intermediate.SymbolTable,
+    spec_impls: specific_implementations.SpecificImplementations,
+    regex_mode: RegexMode,
+    regex_timeout_ms: Optional[int],
+) -> Tuple[Optional[List[Stripped]], Optional[List[Error]]]:
+    """Generate the error classes and the verification functions."""
+    blocks = []  # type: List[Stripped]
     errors = []  # type: List[Error]
 
     for implementation_key in [
@@ -1803,7 +2634,9 @@ def generate(
         if implementation is None:
             errors.append(Error(None, f"The snippet is missing: {implementation_key}"))
         else:
-            verification_blocks.append(implementation)
+            blocks.append(implementation)
+
+    blocks.append(_PATH_SEGMENT)
 
     for verification in symbol_table.verification_functions:
         if isinstance(verification, intermediate.ImplementationSpecificVerification):
@@ -1821,30 +2654,110 @@ def generate(
                     )
                 )
             else:
-                verification_blocks.append(implementation)
+                blocks.append(implementation)
 
         elif isinstance(verification, intermediate.PatternVerification):
             implementation, error = _transpile_pattern_verification(
-                verification=verification
+                verification=verification,
+                regex_mode=regex_mode,
+                regex_timeout_ms=regex_timeout_ms,
             )
 
             if error is not None:
                 errors.append(error)
             else:
                 assert implementation is not None
-                verification_blocks.append(implementation)
+                blocks.append(implementation)
 
         else:
             assert_never(verification)
 
-    base_environment = intermediate_type_inference.populate_base_environment(
-        symbol_table=symbol_table
+    if len(errors) > 0:
+        return None, errors
+
+    return blocks, None
+
+
+def _write_start_of_file(
+    out: CodeWriter, namespace: csharp_common.NamespaceIdentifier, partial: bool
+) -> None:
+    """
+    Write the header of a verification file and open the ``Verification`` class.
+
+    If ``partial`` is set, the class ``Verification`` is declared as partial.
+    """
+    out.write(csharp_common.WARNING)
+    out.write("\n\n")
+    out.write(
+        textwrap.dedent(
+            f"""\
+        using Regex = System.Text.RegularExpressions.Regex;
+        using RegexOptions = System.Text.RegularExpressions.RegexOptions;
+        using System.Collections.Generic;  // can't alias
+        using System.Collections.ObjectModel;  // can't alias
+        using System.Linq;  // can't alias"
+
+        using Aas = {namespace};
+        using Visitation = {namespace}.Visitation;"""
+        )
     )
+    out.write("\n\n")
+
+    keyword = "partial class" if partial else "class"
+    out.write(f"namespace {namespace}\n{{\n")
+    out.write(f"{I}public static {keyword} Verification\n" f"{I}{{\n")
+
+
+def _write_end_of_file(
+    out: CodeWriter, namespace: csharp_common.NamespaceIdentifier, partial: bool
+) -> None:
+    """Close the ``Verification`` class and write the footer of a verification file."""
+    keyword = "partial class" if partial else "class"
+    out.write(f"\n{I}}}  // public static {keyword} Verification")
+    out.write(f"\n}}  // namespace {namespace}")
+
+    out.write("\n\n")
+    out.write(csharp_common.WARNING)
+    out.write("\n")
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def generate_chunks(
+    symbol_table: intermediate.SymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+    regex_mode: RegexMode = RegexMode.INTERPRETED,
+    regex_timeout_ms: Optional[int] = None,
+) -> Tuple[Optional[Iterator[str]], Optional[List[Error]]]:
+    """
+    Generate the C# code for the verification in chunks based on the symbol table.
+
+    The ``namespace`` defines the AAS C# namespace.
+
+    The regular expressions are constructed according to the ``regex_mode``.
+    If ``regex_timeout_ms`` is given, the matching is limited to that many
+    milliseconds.
+
+    The chunks are meant to be streamed, *e.g.*, to a file, without joining them.
+    """
+    verification_blocks = []  # type: List[Stripped]
+    errors = []  # type: List[Error]
+
+    functions, functions_errors = _generate_verification_functions(
+        symbol_table=symbol_table,
+        spec_impls=spec_impls,
+        regex_mode=regex_mode,
+        regex_timeout_ms=regex_timeout_ms,
+    )
+    if functions_errors is not None:
+        errors.extend(functions_errors)
+    else:
+        assert functions is not None
+        verification_blocks.extend(functions)
 
     implementation_class, implementation_class_errors = _generate_implementation_class(
         symbol_table=symbol_table,
         spec_impls=spec_impls,
-        base_environment=base_environment,
     )
     if implementation_class_errors:
         errors.extend(implementation_class_errors)
@@ -1875,38 +2788,227 @@ def generate(
 
         verification_blocks.append(recursive)
 
+    verification_blocks.append(_generate_recursive_validator(symbol_table=symbol_table))
+    verification_blocks.append(_IS_VALID)
+
     if len(errors) > 0:
         return None, errors
 
-    verification_writer = io.StringIO()
-    verification_writer.write(f"namespace {namespace}\n{{\n")
-    verification_writer.write(f"{I}public static class Verification\n" f"{I}{{\n")
+    # The source generator implements the partial methods in a partial class.
+    partial = regex_mode is RegexMode.GENERATED
 
-    for i, verification_block in enumerate(verification_blocks):
-        if i > 0:
-            verification_writer.write("\n\n")
+    out = CodeWriter()
+    _write_start_of_file(out=out, namespace=namespace, partial=partial)
 
-        verification_writer.write(textwrap.indent(verification_block, II))
+    with out.indent(II):
+        for i, verification_block in enumerate(verification_blocks):
+            if i > 0:
+                out.write("\n\n")
 
-    verification_writer.write(f"\n{I}}}  // public static class Verification")
-    verification_writer.write(f"\n}}  // namespace {namespace}")
+            out.write(verification_block)
 
-    blocks.append(Stripped(verification_writer.getvalue()))
+    _write_end_of_file(out=out, namespace=namespace, partial=partial)
 
-    blocks.append(csharp_common.WARNING)
+    return out.chunks(), None
 
-    out = io.StringIO()
-    for i, block in enumerate(blocks):
-        if i > 0:
-            out.write("\n\n")
 
-        assert not block.startswith("\n")
-        assert not block.endswith("\n")
-        out.write(block)
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@ensure(
+    lambda result: not (result[0] is not None)
+    or all(code.endswith("\n") for code in result[0].values()),
+    "Trailing newline mandatory for valid end-of-files",
+)
+def generate_shards(
+    symbol_table: intermediate.SymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+    regex_mode: RegexMode = RegexMode.INTERPRETED,
+    regex_timeout_ms: Optional[int] = None,
+) -> Tuple[Optional[Mapping[str, str]], Optional[List[Error]]]:
+    """
+    Generate the C# code for the verification in one file per verified symbol.
 
-    out.write("\n")
+    The ``namespace`` defines the AAS C# namespace.
+
+    The ``regex_mode`` and ``regex_timeout_ms`` are handled as in
+    :py:func:`generate_chunks`.
+
+    The class ``Verification`` and its nested classes are split as partial classes.
+    The members common to all the symbols are generated in ``"Verification.cs"``.
+
+    Return the code mapped by the file names, *e.g.*, ``"Submodel.cs"``.
+    """
+    errors = []  # type: List[Error]
+
+    functions, functions_errors = _generate_verification_functions(
+        symbol_table=symbol_table,
+        spec_impls=spec_impls,
+        regex_mode=regex_mode,
+        regex_timeout_ms=regex_timeout_ms,
+    )
+    if functions_errors is not None:
+        errors.extend(functions_errors)
+
+    blocks_by_name = dict()  # type: Dict[str, List[Stripped]]
+
+    for symbol in symbol_table.symbols:
+        if isinstance(symbol, intermediate.Enumeration):
+            continue
+
+        blocks = []  # type: List[Stripped]
+
+        implementation_verify, error = _generate_implementation_verify_of_symbol(
+            symbol=symbol, symbol_table=symbol_table, spec_impls=spec_impls
+        )
+        if error is not None:
+            errors.append(error)
+        else:
+            assert implementation_verify is not None
+
+            if implementation_verify != "":
+                blocks.append(
+                    _wrap_in_class(
+                        declaration="private static partial class Implementation",
+                        blocks=[implementation_verify],
+                        closing_comment="private static partial class Implementation",
+                    )
+                )
+
+        if isinstance(symbol, intermediate.ConcreteClass):
+            blocks.append(
+                _wrap_in_class(
+                    declaration="public partial class NonRecursiveVerifier",
+                    blocks=[_generate_non_recursive_verifier_visit(cls=symbol)],
+                    closing_comment="public partial class NonRecursiveVerifier",
+                )
+            )
+
+            visit, error = _generate_recursive_verifier_visit_of_class(
+                cls=symbol, spec_impls=spec_impls
+            )
+            if error is not None:
+                errors.append(error)
+            else:
+                assert visit is not None
+                blocks.append(
+                    _wrap_in_class(
+                        declaration="public partial class RecursiveVerifier",
+                        blocks=[visit],
+                        closing_comment="public partial class RecursiveVerifier",
+                    )
+                )
+
+            blocks.append(
+                _wrap_in_class(
+                    declaration="private partial class RecursiveValidator",
+                    blocks=[
+                        _generate_recursive_validator_transform_of_class(cls=symbol)
+                    ],
+                    closing_comment="private partial class RecursiveValidator",
+                )
+            )
+
+        if len(blocks) > 0:
+            blocks_by_name[csharp_naming.class_name(symbol.name)] = blocks
+
+    if len(errors) > 0:
+        return None, errors
+
+    assert functions is not None
+
+    blocks_by_name["Verification"] = functions + [
+        _wrap_in_class(
+            declaration=(
+                f"{_IMPLEMENTATION_DOCUMENTATION}\n"
+                f"private static partial class Implementation"
+            ),
+            blocks=[_generate_enum_value_sets(symbol_table=symbol_table)],
+            closing_comment="private static partial class Implementation",
+        ),
+        _wrap_in_class(
+            declaration=(
+                f"{_NON_RECURSIVE_VERIFIER_DOCUMENTATION}\n"
+                f"public partial class NonRecursiveVerifier :\n"
+                f"{I}Visitation.IVisitorWithContext<Verification.PathSegment>"
+            ),
+            blocks=_generate_non_recursive_verifier_common_blocks(),
+            closing_comment="public partial class NonRecursiveVerifier",
+        ),
+        _wrap_in_class(
+            declaration=(
+                f"{_RECURSIVE_VERIFIER_DOCUMENTATION}\n"
+                f"public partial class RecursiveVerifier :\n"
+                f"{I}Visitation.IVisitorWithContext<Verification.PathSegment>"
+            ),
+            blocks=_generate_recursive_verifier_common_blocks(),
+            closing_comment="public partial class RecursiveVerifier",
+        ),
+        _wrap_in_class(
+            declaration=(
+                f"{_RECURSIVE_VALIDATOR_DOCUMENTATION}\n"
+                f"private partial class RecursiveValidator :\n"
+                f"{I}Visitation.ITransformer<bool>"
+            ),
+            blocks=_generate_recursive_validator_common_blocks(),
+            closing_comment="private partial class RecursiveValidator",
+        ),
+        _IS_VALID,
+    ]
+
+    shards = dict()  # type: Dict[str, str]
+    for name, blocks in blocks_by_name.items():
+        out = CodeWriter()
+        _write_start_of_file(out=out, namespace=namespace, partial=True)
+
+        with out.indent(II):
+            for i, block in enumerate(blocks):
+                if i > 0:
+                    out.write("\n\n")
+
+                out.write(block)
+
+        _write_end_of_file(out=out, namespace=namespace, partial=True)
+
+        shards[f"{name}.cs"] = out.getvalue()
+
+    return shards, None
+
+
+# fmt: off
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+@ensure(
+    lambda result:
+    not (result[0] is not None) or result[0].endswith('\n'),
+    "Trailing newline mandatory for valid end-of-files"
+)
+# fmt: on
+def generate(
+    symbol_table: intermediate.SymbolTable,
+    namespace: csharp_common.NamespaceIdentifier,
+    spec_impls: specific_implementations.SpecificImplementations,
+    regex_mode: RegexMode = RegexMode.INTERPRETED,
+    regex_timeout_ms: Optional[int] = None,
+) -> Tuple[Optional[str], Optional[List[Error]]]:
+    """
+    Generate the C# code for the verification based on the symbol table.
+
+    The ``namespace`` defines the AAS C# namespace.
+
+    The ``regex_mode`` and ``regex_timeout_ms`` are handled as in
+    :py:func:`generate_chunks`.
+    """
+    chunks, errors = generate_chunks(
+        symbol_table=symbol_table,
+        namespace=namespace,
+        spec_impls=spec_impls,
+        regex_mode=regex_mode,
+        regex_timeout_ms=regex_timeout_ms,
+    )
+    if errors is not None:
+        return None, errors
 
-    return out.getvalue(), None
+    assert chunks is not None
+    return "".join(chunks), None
 
 
 # endregion
@@ -10,7 +10,13 @@ import aas_core_codegen.csharp.common as csharp_common
 from aas_core_codegen.csharp.common import INDENT as I, INDENT2 as II
 import aas_core_codegen.csharp.naming as csharp_naming
 from aas_core_codegen import intermediate
-from aas_core_codegen.common import Error, Stripped, Rstripped, assert_never
+from aas_core_codegen.common import (
+    Error,
+    Stripped,
+    Rstripped,
+    assert_never,
+    CodeWriter,
+)
 
 
 # region Generate
@@ -40,7 +46,7 @@ def _generate_ivisitor(symbol_table: intermediate.SymbolTable) -> Stripped:
         else:
             assert_never(symbol)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             """\
@@ -54,10 +60,11 @@ def _generate_ivisitor(symbol_table: intermediate.SymbolTable) -> Stripped:
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n")
+            writer.write(block)
 
     writer.write("\n}  // public interface IVisitor")
 
@@ -100,7 +107,7 @@ def _generate_visitor_through(symbol_table: intermediate.SymbolTable) -> Strippe
         else:
             assert_never(symbol)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             """\
@@ -122,10 +129,11 @@ def _generate_visitor_through(symbol_table: intermediate.SymbolTable) -> Strippe
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n")
+            writer.write(block)
 
     writer.write("\n}  // public class VisitorThrough")
 
@@ -156,7 +164,7 @@ def _generate_ivisitor_with_context(symbol_table: intermediate.SymbolTable) -> S
         else:
             assert_never(symbol)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             """\
@@ -171,10 +179,11 @@ def _generate_ivisitor_with_context(symbol_table: intermediate.SymbolTable) -> S
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n")
+            writer.write(block)
 
     writer.write("\n}  // public interface IVisitorWithContext")
 
@@ -206,7 +215,7 @@ def _generate_itransformer(symbol_table: intermediate.SymbolTable) -> Stripped:
         else:
             assert_never(symbol)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             """\
@@ -222,10 +231,11 @@ def _generate_itransformer(symbol_table: intermediate.SymbolTable) -> Stripped:
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n")
+            writer.write(block)
 
     writer.write("\n}  // public interface ITransformer")
 
@@ -259,7 +269,7 @@ def _generate_itransformer_with_context(
         else:
             assert_never(symbol)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             """\
@@ -276,10 +286,11 @@ def _generate_itransformer_with_context(
         )
     )
 
-    for i, block in enumerate(blocks):
-        if i > 0:
-            writer.write("\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for i, block in enumerate(blocks):
+            if i > 0:
+                writer.write("\n")
+            writer.write(block)
 
     writer.write("\n}  // public interface ITransformerWithContext")
 
@@ -304,7 +315,7 @@ def generate(
     """
     blocks = [csharp_common.WARNING]  # type: List[Rstripped]
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(f"namespace {namespace}\n{{\n")
     writer.write(f"{I}public static class Visitation\n" f"{I}{{\n")
 
@@ -315,11 +326,12 @@ def generate(
         _generate_itransformer_with_context(symbol_table=symbol_table),
     ]
 
-    for i, visitation_block in enumerate(visitation_blocks):
-        if i > 0:
-            writer.write("\n\n")
+    with writer.indent(II):
+        for i, visitation_block in enumerate(visitation_blocks):
+            if i > 0:
+                writer.write("\n\n")
 
-        writer.write(textwrap.indent(visitation_block, II))
+            writer.write(visitation_block)
 
     writer.write(f"\n{I}}}  // public static class Visitation")
     writer.write(f"\n}}  // namespace {namespace}")
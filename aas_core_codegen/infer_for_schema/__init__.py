@@ -1,6 +1,6 @@
 """Infer constraints representable in common schemas such as JSON Schema or XSD."""
 
-from aas_core_codegen.infer_for_schema import _len, _pattern, _stringify
+from aas_core_codegen.infer_for_schema import _len, _pattern, _index, _stringify
 
 LenConstraint = _len.LenConstraint
 infer_len_constraints_by_class_properties = (
@@ -14,6 +14,9 @@ infer_patterns_on_self = _pattern.infer_patterns_on_self
 PatternVerificationsByName = _pattern.PatternVerificationsByName
 map_pattern_verifications_by_name = _pattern.map_pattern_verifications_by_name
 
+ConstraintIndex = _index.ConstraintIndex
+build_constraint_index = _index.build_constraint_index
+
 dump = _stringify.dump
 dump_len_constraints_by_properties = _stringify.dump_len_constraints_by_properties
 dump_patterns = _stringify.dump_patterns
@@ -0,0 +1,342 @@
+"""Index all the constraints inferred for schemas once per symbol table."""
+import weakref
+from typing import Mapping, MutableMapping, Sequence, List, Optional, Tuple
+
+from icontract import ensure
+
+from aas_core_codegen import intermediate
+from aas_core_codegen.common import Error, assert_never
+from aas_core_codegen.infer_for_schema import _len, _pattern
+
+
+class ConstraintIndex:
+    """
+    Hold the constraints inferred over all the symbols of a symbol table.
+
+    The constraints of the properties of a class are inferred only from the genuine
+    invariants of the class. The constraints of a constrained primitive are given
+    both as inferred from its genuine invariants (*e.g.*, for schemas which
+    refer to the ancestors), and stacked with the constraints of its ancestors
+    (*e.g.*, for schemas which in-line the constrained primitives).
+
+    Implementation-specific classes are not indexed since their schema definitions
+    come from the snippets.
+    """
+
+    def __init__(
+        self,
+        len_constraints_by_class: Mapping[
+            intermediate.Class,
+            Mapping[intermediate.Property, _len.LenConstraint],
+        ],
+        patterns_by_class: Mapping[
+            intermediate.Class,
+            Mapping[intermediate.Property, List[_pattern.PatternConstraint]],
+        ],
+        len_constraint_by_constrained_primitive: Mapping[
+            intermediate.ConstrainedPrimitive, _len.LenConstraint
+        ],
+        patterns_by_constrained_primitive: Mapping[
+            intermediate.ConstrainedPrimitive, Sequence[_pattern.PatternConstraint]
+        ],
+        stacked_len_constraint_by_constrained_primitive: Mapping[
+            intermediate.ConstrainedPrimitive, _len.LenConstraint
+        ],
+        stacked_patterns_by_constrained_primitive: Mapping[
+            intermediate.ConstrainedPrimitive, Sequence[_pattern.PatternConstraint]
+        ],
+    ) -> None:
+        """Initialize with the given values."""
+        self._len_constraints_by_class = len_constraints_by_class
+        self._patterns_by_class = patterns_by_class
+        self._len_constraint_by_constrained_primitive = (
+            len_constraint_by_constrained_primitive
+        )
+        self._patterns_by_constrained_primitive = patterns_by_constrained_primitive
+        self._stacked_len_constraint_by_constrained_primitive = (
+            stacked_len_constraint_by_constrained_primitive
+        )
+        self._stacked_patterns_by_constrained_primitive = (
+            stacked_patterns_by_constrained_primitive
+        )
+
+    def len_constraints_by_property(
+        self, cls: intermediate.Class
+    ) -> Mapping[intermediate.Property, _len.LenConstraint]:
+        """Retrieve the constraints on ``len(.)`` of the properties of ``cls``."""
+        return self._len_constraints_by_class[cls]
+
+    def patterns_by_property(
+        self, cls: intermediate.Class
+    ) -> Mapping[intermediate.Property, List[_pattern.PatternConstraint]]:
+        """Retrieve the pattern constraints of the properties of ``cls``."""
+        return self._patterns_by_class[cls]
+
+    def len_constraint_of_self(
+        self, constrained_primitive: intermediate.ConstrainedPrimitive
+    ) -> Optional[_len.LenConstraint]:
+        """
+        Retrieve the genuine constraint on ``len(self)``, if applicable.
+
+        The constraint is None if the constrainee can not have a length.
+        """
+        return self._len_constraint_by_constrained_primitive.get(
+            constrained_primitive, None
+        )
+
+    def patterns_on_self(
+        self, constrained_primitive: intermediate.ConstrainedPrimitive
+    ) -> Sequence[_pattern.PatternConstraint]:
+        """Retrieve the genuine pattern constraints of ``constrained_primitive``."""
+        return self._patterns_by_constrained_primitive.get(constrained_primitive, [])
+
+    def stacked_len_constraint_of_self(
+        self, constrained_primitive: intermediate.ConstrainedPrimitive
+    ) -> Optional[_len.LenConstraint]:
+        """
+        Retrieve the constraint on ``len(self)`` including the ancestors.
+
+        The constraint is None if the constrainee can not have a length.
+        """
+        return self._stacked_len_constraint_by_constrained_primitive.get(
+            constrained_primitive, None
+        )
+
+    def stacked_patterns_on_self(
+        self, constrained_primitive: intermediate.ConstrainedPrimitive
+    ) -> Sequence[_pattern.PatternConstraint]:
+        """Retrieve the pattern constraints including the ancestors."""
+        return self._stacked_patterns_by_constrained_primitive.get(
+            constrained_primitive, []
+        )
+
+
+def _stack_len_constraints(
+    symbol_table: intermediate.SymbolTable,
+    len_constraint_by_constrained_primitive: Mapping[
+        intermediate.ConstrainedPrimitive, _len.LenConstraint
+    ],
+) -> MutableMapping[intermediate.ConstrainedPrimitive, _len.LenConstraint]:
+    """Stack the constraints on ``len(.)`` of the ancestors in topological order."""
+    result: MutableMapping[
+        intermediate.ConstrainedPrimitive, _len.LenConstraint
+    ] = dict()
+
+    for symbol in symbol_table.symbols_topologically_sorted:
+        if not isinstance(symbol, intermediate.ConstrainedPrimitive):
+            continue
+
+        genuine_len_constraint = len_constraint_by_constrained_primitive.get(
+            symbol, None
+        )
+        if genuine_len_constraint is None:
+            continue
+
+        # NOTE (mristin, 2022-02-11):
+        # We make the copy in order to avoid bugs when we start processing
+        # the inheritances.
+        len_constraint = genuine_len_constraint.copy()
+
+        for inheritance in symbol.inheritances:
+            # The ancestors have been already stacked, so we re-use their
+            # constraints instead of going through their invariants again.
+            inherited_len_constraint = result.get(inheritance, None)
+            assert inherited_len_constraint is not None, "Expected topological order"
+
+            if inherited_len_constraint.min_value is not None:
+                len_constraint.min_value = (
+                    max(len_constraint.min_value, inherited_len_constraint.min_value)
+                    if len_constraint.min_value is not None
+                    else inherited_len_constraint.min_value
+                )
+
+            if inherited_len_constraint.max_value is not None:
+                len_constraint.max_value = (
+                    min(len_constraint.max_value, inherited_len_constraint.max_value)
+                    if len_constraint.max_value is not None
+                    else inherited_len_constraint.max_value
+                )
+
+        result[symbol] = len_constraint
+
+    return result
+
+
+def _stack_patterns(
+    symbol_table: intermediate.SymbolTable,
+    patterns_by_constrained_primitive: Mapping[
+        intermediate.ConstrainedPrimitive, Sequence[_pattern.PatternConstraint]
+    ],
+) -> MutableMapping[
+    intermediate.ConstrainedPrimitive, Sequence[_pattern.PatternConstraint]
+]:
+    """Stack the pattern constraints of the ancestors in topological order."""
+    result: MutableMapping[
+        intermediate.ConstrainedPrimitive, Sequence[_pattern.PatternConstraint]
+    ] = dict()
+
+    for symbol in symbol_table.symbols_topologically_sorted:
+        if not isinstance(symbol, intermediate.ConstrainedPrimitive):
+            continue
+
+        # NOTE (mristin, 2022-02-11):
+        # We make the copy in order to avoid bugs when we start processing
+        # the inheritances.
+        patterns = list(patterns_by_constrained_primitive.get(symbol, []))
+
+        for inheritance in symbol.inheritances:
+            inherited_patterns = result.get(inheritance, None)
+            assert inherited_patterns is not None, "Expected topological order"
+
+            patterns = list(inherited_patterns) + patterns
+
+        result[symbol] = patterns
+
+    return result
+
+
+#: Indices built from the verification functions of their symbol tables. The entries
+#: are dropped together with the symbol tables.
+_INDEX_BY_SYMBOL_TABLE = (
+    weakref.WeakKeyDictionary()
+)  # type: MutableMapping[intermediate.SymbolTable, ConstraintIndex]
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def build_constraint_index(
+    symbol_table: intermediate.SymbolTable,
+    pattern_verifications_by_name: Optional[_pattern.PatternVerificationsByName] = None,
+) -> Tuple[Optional[ConstraintIndex], Optional[List[Error]]]:
+    """
+    Infer the constraints of all the symbols in ``symbol_table`` in one go.
+
+    If ``pattern_verifications_by_name`` is not given, it is mapped from
+    the verification functions of the ``symbol_table``. The index is then built only
+    once per ``symbol_table`` and shared by all the subsequent calls, *e.g.*, from
+    the different backends.
+    """
+    if pattern_verifications_by_name is not None:
+        return _build_constraint_index(
+            symbol_table=symbol_table,
+            pattern_verifications_by_name=pattern_verifications_by_name,
+        )
+
+    constraint_index = _INDEX_BY_SYMBOL_TABLE.get(symbol_table, None)
+    if constraint_index is not None:
+        return constraint_index, None
+
+    constraint_index, errors = _build_constraint_index(
+        symbol_table=symbol_table,
+        pattern_verifications_by_name=_pattern.map_pattern_verifications_by_name(
+            verifications=symbol_table.verification_functions
+        ),
+    )
+    if errors is not None:
+        return None, errors
+
+    assert constraint_index is not None
+    _INDEX_BY_SYMBOL_TABLE[symbol_table] = constraint_index
+
+    return constraint_index, None
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def _build_constraint_index(
+    symbol_table: intermediate.SymbolTable,
+    pattern_verifications_by_name: _pattern.PatternVerificationsByName,
+) -> Tuple[Optional[ConstraintIndex], Optional[List[Error]]]:
+    """Infer the constraints of all the symbols in ``symbol_table``."""
+
+    errors = []  # type: List[Error]
+
+    len_constraints_by_class: MutableMapping[
+        intermediate.Class, Mapping[intermediate.Property, _len.LenConstraint]
+    ] = dict()
+
+    patterns_by_class: MutableMapping[
+        intermediate.Class,
+        Mapping[intermediate.Property, List[_pattern.PatternConstraint]],
+    ] = dict()
+
+    len_constraint_by_constrained_primitive: MutableMapping[
+        intermediate.ConstrainedPrimitive, _len.LenConstraint
+    ] = dict()
+
+    patterns_by_constrained_primitive: MutableMapping[
+        intermediate.ConstrainedPrimitive, Sequence[_pattern.PatternConstraint]
+    ] = dict()
+
+    for symbol in symbol_table.symbols:
+        if isinstance(symbol, intermediate.Enumeration):
+            continue
+
+        elif isinstance(symbol, intermediate.ConstrainedPrimitive):
+            if symbol.constrainee in _len.LENGTHABLE_PRIMITIVES:
+                (
+                    len_constraint,
+                    len_constraint_errors,
+                ) = _len.infer_len_constraint_of_self(constrained_primitive=symbol)
+
+                if len_constraint_errors is not None:
+                    errors.extend(len_constraint_errors)
+                else:
+                    assert len_constraint is not None
+                    len_constraint_by_constrained_primitive[symbol] = len_constraint
+
+            if symbol.constrainee == intermediate.PrimitiveType.STR:
+                patterns_by_constrained_primitive[
+                    symbol
+                ] = _pattern.infer_patterns_on_self(
+                    constrained_primitive=symbol,
+                    pattern_verifications_by_name=pattern_verifications_by_name,
+                )
+
+        elif isinstance(
+            symbol, (intermediate.AbstractClass, intermediate.ConcreteClass)
+        ):
+            if symbol.is_implementation_specific:
+                continue
+
+            (
+                len_constraints_by_property,
+                len_constraints_errors,
+            ) = _len.infer_len_constraints_by_class_properties(cls=symbol)
+
+            if len_constraints_errors is not None:
+                errors.extend(len_constraints_errors)
+            else:
+                assert len_constraints_by_property is not None
+                len_constraints_by_class[symbol] = len_constraints_by_property
+
+            patterns_by_class[symbol] = _pattern.infer_patterns_by_class_properties(
+                cls=symbol,
+                pattern_verifications_by_name=pattern_verifications_by_name,
+            )
+
+        else:
+            assert_never(symbol)
+
+    if len(errors) > 0:
+        return None, errors
+
+    return (
+        ConstraintIndex(
+            len_constraints_by_class=len_constraints_by_class,
+            patterns_by_class=patterns_by_class,
+            len_constraint_by_constrained_primitive=(
+                len_constraint_by_constrained_primitive
+            ),
+            patterns_by_constrained_primitive=patterns_by_constrained_primitive,
+            stacked_len_constraint_by_constrained_primitive=_stack_len_constraints(
+                symbol_table=symbol_table,
+                len_constraint_by_constrained_primitive=(
+                    len_constraint_by_constrained_primitive
+                ),
+            ),
+            stacked_patterns_by_constrained_primitive=_stack_patterns(
+                symbol_table=symbol_table,
+                patterns_by_constrained_primitive=patterns_by_constrained_primitive,
+            ),
+        ),
+        None,
+    )
@@ -8,7 +8,6 @@ from aas_core_codegen.common import (
     assert_never,
     Error,
     Identifier,
-    assert_union_of_descendants_exhaustive,
 )
 from aas_core_codegen.infer_for_schema import _common as infer_for_schema_common
 from aas_core_codegen.parse import tree as parse_tree
@@ -508,4 +507,3 @@ def infer_len_constraint_of_self(
 
 
 _ConstraintUnion = Union[_MinLength, _MaxLength, _ExactLength]
-assert_union_of_descendants_exhaustive(union=_ConstraintUnion, base_class=_Constraint)
@@ -42,8 +42,6 @@ _DISPATCH = {
     PatternConstraint: _stringify_pattern_constraint,
 }
 
-stringify.assert_dispatch_exhaustive(dispatch=_DISPATCH, dumpable=Dumpable)
-
 
 def _stringify(that: Optional[Dumpable]) -> Optional[stringify.Entity]:
     """Dispatch to the correct ``_stringify_*`` method."""
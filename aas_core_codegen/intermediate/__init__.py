@@ -37,10 +37,10 @@ ImplementationSpecificVerification = _types.ImplementationSpecificVerification
 PatternVerification = _types.PatternVerification
 Signature = _types.Signature
 Interface = _types.Interface
+SymbolReferences = _types.SymbolReferences
 SymbolTable = _types.SymbolTable
 
 map_descendability = _types.map_descendability
-collect_ids_of_symbols_in_properties = _types.collect_ids_of_symbols_in_properties
 
 translate = _translate.translate
 errors_if_contracts_for_functions_or_methods_defined = (
@@ -49,5 +49,8 @@ errors_if_contracts_for_functions_or_methods_defined = (
 errors_if_non_implementation_specific_methods = (
     _translate.errors_if_non_implementation_specific_methods
 )
+errors_if_patterns_prone_to_catastrophic_backtracking = (
+    _translate.errors_if_patterns_prone_to_catastrophic_backtracking
+)
 
 dump = _stringify.dump
@@ -3,7 +3,7 @@
 from typing import Union, Optional
 
 from aas_core_codegen import stringify
-from aas_core_codegen.intermediate import _types, construction
+from aas_core_codegen.intermediate import construction
 from aas_core_codegen.intermediate._types import (
     AbstractClass,
     Argument,
@@ -36,6 +36,7 @@ from aas_core_codegen.intermediate._types import (
     SignatureLike,
     Snapshot,
     Symbol,
+    SymbolReferences,
     SymbolTable,
     TypeAnnotation,
     Verification,
@@ -559,6 +560,43 @@ def _stringify_meta_model(
     return result
 
 
+def _stringify_symbol_references(
+    that: SymbolReferences,
+) -> stringify.Entity:
+    result = stringify.Entity(
+        name=that.__class__.__name__,
+        properties=[
+            stringify.Property(
+                "properties",
+                [
+                    f"Reference to property {prop.name} "
+                    f"specified for {prop.specified_for.name}"
+                    for prop in that.properties
+                ],
+            ),
+            stringify.Property(
+                "classes",
+                [f"Reference to symbol {cls.name}" for cls in that.classes],
+            ),
+            stringify.Property(
+                "arguments",
+                [f"Reference to argument {arg.name}" for arg in that.arguments],
+            ),
+            stringify.Property(
+                "invariants",
+                [
+                    f"Reference to invariant specified for "
+                    f"{invariant.specified_for.name}"
+                    for invariant in that.invariants
+                ],
+            ),
+            stringify.PropertyEllipsis("descriptions", that.descriptions),
+        ],
+    )
+
+    return result
+
+
 def _stringify_symbol_table(
     that: SymbolTable,
 ) -> stringify.Entity:
@@ -616,16 +654,13 @@ Dumpable = Union[
     SignatureLike,
     Snapshot,
     Symbol,
+    SymbolReferences,
     SymbolTable,
     TypeAnnotation,
     Verification,
     UnderstoodMethod,
 ]
 
-stringify.assert_all_public_types_listed_as_dumpables(
-    dumpable=Dumpable, types_module=_types
-)
-
 _DISPATCH = {
     AbstractClass: _stringify_abstract_class,
     Argument: _stringify_argument,
@@ -653,12 +688,11 @@ _DISPATCH = {
     Serialization: _stringify_serialization,
     Signature: _stringify_signature,
     Snapshot: _stringify_snapshot,
+    SymbolReferences: _stringify_symbol_references,
     SymbolTable: _stringify_symbol_table,
     UnderstoodMethod: _stringify_understood_method,
 }
 
-stringify.assert_dispatch_exhaustive(dispatch=_DISPATCH, dumpable=Dumpable)
-
 
 def _stringify(that: Optional[Dumpable]) -> Optional[stringify.Entity]:
     """Dispatch to the correct ``_stringify_*`` method."""
@@ -18,6 +18,7 @@ from typing import (
     Final,
     Type,
     Any,
+    Set,
 )
 
 import asttokens
@@ -37,7 +38,9 @@ from aas_core_codegen.intermediate import (
     _hierarchy,
     construction,
     doc,
+    pattern_analysis,
     pattern_verification,
+    type_inference,
 )
 from aas_core_codegen.intermediate._types import (
     SymbolTable,
@@ -77,8 +80,8 @@ from aas_core_codegen.intermediate._types import (
     ClassUnion,
     VerificationUnion,
     UnderstoodMethod,
-    collect_ids_of_symbols_in_properties,
     SymbolExceptEnumeration,
+    SymbolReferences,
 )
 from aas_core_codegen.parse import tree as parse_tree
 
@@ -935,7 +938,7 @@ def _stack_invariants(
             invariants_map[parsed_cls.name] = invariants
 
         # noinspection PyTypeChecker
-        invariants.extend(
+        own_invariants = [
             Invariant(
                 description=parsed_invariant.description,
                 body=parsed_invariant.body,
@@ -943,9 +946,12 @@ def _stack_invariants(
                 parsed=parsed_invariant,
             )
             for parsed_invariant in parsed_cls.invariants
-        )
+        ]
+        invariants.extend(own_invariants)
 
-        # Propagate all the invariants to the descendants
+        # Propagate only the own invariants to the descendants. The invariants
+        # inherited by this class are propagated by its ancestors as the descendants
+        # include all the descendants, not only the direct ones.
 
         for descendant in ontology.list_descendants(parsed_cls):
             descendant_invariants = invariants_map.get(descendant.name, None)
@@ -954,7 +960,7 @@ def _stack_invariants(
                 descendant_invariants = []
                 invariants_map[descendant.name] = descendant_invariants
 
-            descendant_invariants.extend(invariants)
+            descendant_invariants.extend(own_invariants)
 
     return invariants_map
 
@@ -1299,38 +1305,54 @@ def _second_pass_to_resolve_symbols_in_atomic_types_in_place(
     """Resolve the symbol references in the atomic types in-place."""
     errors = []  # type: List[Error]
 
+    our_type_annotations = []  # type: List[OurTypeAnnotation]
+
     for symbol in symbol_table.symbols:
         if isinstance(symbol, Enumeration):
             continue
 
-        for our_type_annotation in _over_our_type_annotations(symbol):
-            assert isinstance(
-                our_type_annotation.symbol, _PlaceholderSymbol
-            ), "Expected only placeholder symbols to be assigned in the first pass"
+        our_type_annotations.extend(_over_our_type_annotations(symbol))
 
-            if not IDENTIFIER_RE.match(our_type_annotation.symbol.name):
-                errors.append(
-                    Error(
-                        our_type_annotation.parsed.node,
-                        f"The symbol is invalid: "
-                        f"{our_type_annotation.symbol.name!r}",
-                    )
+    # The verification functions are not symbols, but their signatures can still
+    # reference the symbols.
+    for verification in symbol_table.verification_functions:
+        for argument in verification.arguments:
+            our_type_annotations.extend(
+                _over_our_type_annotations(argument.type_annotation)
+            )
+
+        if verification.returns is not None:
+            our_type_annotations.extend(
+                _over_our_type_annotations(verification.returns)
+            )
+
+    for our_type_annotation in our_type_annotations:
+        assert isinstance(
+            our_type_annotation.symbol, _PlaceholderSymbol
+        ), "Expected only placeholder symbols to be assigned in the first pass"
+
+        if not IDENTIFIER_RE.match(our_type_annotation.symbol.name):
+            errors.append(
+                Error(
+                    our_type_annotation.parsed.node,
+                    f"The symbol is invalid: " f"{our_type_annotation.symbol.name!r}",
                 )
-                continue
+            )
+            continue
 
-            identifier = Identifier(our_type_annotation.symbol.name)
-            referenced_symbol = symbol_table.find(identifier)
-            if referenced_symbol is None:
-                errors.append(
-                    Error(
-                        our_type_annotation.parsed.node,
-                        f"The symbol with identifier {identifier!r} is not available "
-                        f"in the symbol table.",
-                    )
+        identifier = Identifier(our_type_annotation.symbol.name)
+        referenced_symbol = symbol_table.find(identifier)
+        if referenced_symbol is None:
+            errors.append(
+                Error(
+                    our_type_annotation.parsed.node,
+                    f"The symbol with identifier {identifier!r} is not available "
+                    f"in the symbol table.",
                 )
-                continue
+            )
+            continue
 
-            our_type_annotation.symbol = referenced_symbol
+        our_type_annotation.symbol = referenced_symbol
 
     return errors
 
@@ -1928,9 +1950,9 @@ def _second_pass_to_resolve_descendants_in_place(
         elif isinstance(symbol, ConstrainedPrimitive):
             constrained_primitive_descendants = []  # type: List[ConstrainedPrimitive]
             for descendant in ontology.list_descendants(symbol.parsed):
-                symbol = symbol_table.must_find(descendant.name)
-                assert isinstance(symbol, ConstrainedPrimitive)
-                constrained_primitive_descendants.append(symbol)
+                descendant_symbol = symbol_table.must_find(descendant.name)
+                assert isinstance(descendant_symbol, ConstrainedPrimitive)
+                constrained_primitive_descendants.append(descendant_symbol)
 
             symbol._set_descendants(constrained_primitive_descendants)
 
@@ -2037,6 +2059,234 @@ def _second_pass_to_resolve_interfaces_in_place(
             cls.interface = None
 
 
+class _NameCollector(parse_tree.Visitor):
+    """
+    Collect the identifiers of the free names in an expression.
+
+    The names bound in the enclosing scope, or by an assignment, refer to the local
+    variables and not to the symbols, so we skip them.
+    """
+
+    #: Collected identifiers in order of appearance; there might be duplicates.
+    identifiers: List[Identifier]
+
+    #: Identifiers of the names bound so far
+    _bound: Set[Identifier]
+
+    def __init__(self, bound: Sequence[Identifier]) -> None:
+        """Initialize with the given values."""
+        self.identifiers = []
+        self._bound = set(bound)
+
+    def visit_name(self, node: parse_tree.Name) -> None:
+        if node.identifier not in self._bound:
+            self.identifiers.append(node.identifier)
+
+    def visit_assignment(self, node: parse_tree.Assignment) -> None:
+        self.visit(node.value)
+
+        if isinstance(node.target, parse_tree.Name):
+            self._bound.add(node.target.identifier)
+        else:
+            self.visit(node.target)
+
+
+def _second_pass_to_index_references_in_place(symbol_table: SymbolTable) -> None:
+    """
+    Build the reverse index from the symbols to the points where they are referenced.
+
+    This pass expects all the references in the symbol table to be resolved. The index
+    is built in a single pass over the symbol table so that the downstream code does
+    not have to re-scan the symbols.
+    """
+    properties_map = {
+        id(symbol): [] for symbol in symbol_table.symbols
+    }  # type: Mapping[int, List[Property]]
+
+    classes_map = {
+        id(symbol): [] for symbol in symbol_table.symbols
+    }  # type: Mapping[int, List[ClassUnion]]
+
+    arguments_map = {
+        id(symbol): [] for symbol in symbol_table.symbols
+    }  # type: Mapping[int, List[Argument]]
+
+    invariants_map = {
+        id(symbol): [] for symbol in symbol_table.symbols
+    }  # type: Mapping[int, List[Invariant]]
+
+    descriptions_map = {
+        id(symbol): [] for symbol in symbol_table.symbols
+    }  # type: Mapping[int, List[Description]]
+
+    # region Properties
+
+    for symbol in symbol_table.symbols:
+        if not isinstance(symbol, Class):
+            continue
+
+        for prop in symbol.properties:
+            for our_type_annotation in _over_our_type_annotations(prop.type_annotation):
+                symbol_id = id(our_type_annotation.symbol)
+                properties_map[symbol_id].append(prop)
+
+                classes = classes_map[symbol_id]
+                if len(classes) == 0 or classes[-1] is not symbol:
+                    classes.append(symbol)
+
+    # endregion
+
+    # region Arguments
+
+    for arg in _over_arguments(symbol_table):
+        for our_type_annotation in _over_our_type_annotations(arg.type_annotation):
+            arguments_map[id(our_type_annotation.symbol)].append(arg)
+
+    # endregion
+
+    # region Invariants
+
+    # The invariants are stacked over the descendants, but the instances are shared.
+    # We need to visit each invariant only once.
+    visited_invariant_ids = set()  # type: Set[int]
+
+    for symbol in symbol_table.symbols:
+        if isinstance(symbol, Enumeration):
+            continue
+
+        for invariant in symbol.invariants:
+            if id(invariant) in visited_invariant_ids:
+                continue
+
+            visited_invariant_ids.add(id(invariant))
+
+            # The invariants bind ``self`` as the only argument of their lambda.
+            collector = _NameCollector(bound=[Identifier("self")])
+            collector.visit(invariant.body)
+
+            referenced_symbol_ids = set()  # type: Set[int]
+            for identifier in collector.identifiers:
+                referenced_symbol = symbol_table.find(identifier)
+                if (
+                    referenced_symbol is None
+                    or id(referenced_symbol) in referenced_symbol_ids
+                ):
+                    continue
+
+                referenced_symbol_ids.add(id(referenced_symbol))
+                invariants_map[id(referenced_symbol)].append(invariant)
+
+    # endregion
+
+    # region Descriptions
+
+    # The descriptions of the inherited properties share the document with
+    # the description of the original property. We index each document only once.
+    visited_document_ids = set()  # type: Set[int]
+
+    for _, description in _over_descriptions(symbol_table):
+        if id(description.document) in visited_document_ids:
+            continue
+
+        visited_document_ids.add(id(description.document))
+
+        symbol_in_doc_ids = set()
+
+        for node in description.document.findall(
+            condition=lambda a_node: isinstance(
+                a_node, (doc.SymbolReference, doc.AttributeReference)
+            )
+        ):
+            symbol_in_doc = None  # type: Optional[Symbol]
+
+            if isinstance(node, doc.SymbolReference):
+                symbol_in_doc = node.symbol
+
+            elif isinstance(node, doc.AttributeReference):
+                if isinstance(node.reference, doc.PropertyReference):
+                    symbol_in_doc = node.reference.cls
+
+                elif isinstance(node.reference, doc.EnumerationLiteralReference):
+                    symbol_in_doc = node.reference.symbol
+
+                else:
+                    assert_never(node.reference)
+
+            else:
+                raise AssertionError(f"Unexpected node: {node}")
+
+            assert symbol_in_doc is not None
+            if id(symbol_in_doc) in symbol_in_doc_ids:
+                continue
+
+            symbol_in_doc_ids.add(id(symbol_in_doc))
+            descriptions_map[id(symbol_in_doc)].append(description)
+
+    # endregion
+
+    # noinspection PyProtectedMember
+    symbol_table._set_references(  # pylint: disable=protected-access
+        references_by_symbol_id={
+            id(symbol): SymbolReferences(
+                properties=properties_map[id(symbol)],
+                classes=classes_map[id(symbol)],
+                arguments=arguments_map[id(symbol)],
+                invariants=invariants_map[id(symbol)],
+                descriptions=descriptions_map[id(symbol)],
+            )
+            for symbol in symbol_table.symbols
+        }
+    )
+
+
+def _second_pass_to_infer_types_in_invariants_in_place(
+    symbol_table: SymbolTable,
+) -> List[Error]:
+    """
+    Infer the types in the invariants and set them in the ``symbol_table`` in-place.
+
+    The invariants are stacked over the descendants, but the instances are shared.
+    Hence we infer the types only once per invariant.
+    """
+    errors = []  # type: List[Error]
+
+    base_environment = type_inference.populate_base_environment(
+        symbol_table=symbol_table
+    )
+
+    type_maps_by_invariant_id: MutableMapping[
+        int, Mapping[parse_tree.Node, type_inference.TypeAnnotationUnion]
+    ] = dict()
+
+    for symbol in symbol_table.symbols:
+        if isinstance(symbol, Enumeration):
+            continue
+
+        for invariant in symbol.invariants:
+            if id(invariant) in type_maps_by_invariant_id:
+                continue
+
+            type_map, error = type_inference.infer_for_invariant(
+                invariant=invariant,
+                symbol_table=symbol_table,
+                base_environment=base_environment,
+            )
+
+            if error is not None:
+                errors.append(error)
+                continue
+
+            assert type_map is not None
+            type_maps_by_invariant_id[id(invariant)] = type_map
+
+    # noinspection PyProtectedMember
+    symbol_table._set_type_maps(  # pylint: disable=protected-access
+        type_maps_by_invariant_id=type_maps_by_invariant_id
+    )
+
+    return errors
+
+
 class _PropertyOfClass:
     """Represent the property with its corresponding class."""
 
@@ -2201,15 +2451,11 @@ def _verify(symbol_table: SymbolTable, ontology: _hierarchy.Ontology) -> List[Er
 
     # region Check ``with_model_type`` for classes with at least one concrete descendant
 
-    symbols_in_properties = collect_ids_of_symbols_in_properties(
-        symbol_table=symbol_table
-    )
-
     for symbol in symbol_table.symbols:
         if not isinstance(symbol, Class):
             continue
 
-        if id(symbol) in symbols_in_properties:
+        if len(symbol_table.references_to(symbol).properties) > 0:
             if len(symbol.concrete_descendants) >= 1:
                 if not symbol.serialization.with_model_type:
                     descendants_str = ", ".join(
@@ -2581,8 +2827,17 @@ def translate(
         symbol_table=symbol_table, ontology=ontology
     )
 
+    _second_pass_to_index_references_in_place(symbol_table=symbol_table)
+
     underlying_errors.extend(_verify(symbol_table=symbol_table, ontology=ontology))
 
+    if len(underlying_errors) > 0:
+        return None, bundle_underlying_errors()
+
+    underlying_errors.extend(
+        _second_pass_to_infer_types_in_invariants_in_place(symbol_table=symbol_table)
+    )
+
     if len(underlying_errors) > 0:
         return None, bundle_underlying_errors()
 
@@ -2661,3 +2916,55 @@ def errors_if_non_implementation_specific_methods(
         return errors
 
     return None
+
+
+def errors_if_patterns_prone_to_catastrophic_backtracking(
+    symbol_table: SymbolTable,
+) -> Optional[List[Error]]:
+    """
+    Generate an error if a pattern verification might backtrack catastrophically.
+
+    The analysis is conservative, so some of the reported patterns can still be
+    matched in linear time. The patterns which we can not analyze are reported as
+    well. Hence, we run this check only on the explicit request.
+    """
+    errors = []  # type: List[Error]
+
+    for verification in symbol_table.verification_functions:
+        if not isinstance(verification, PatternVerification):
+            continue
+
+        regex, parse_error = pattern_analysis.parse(verification.pattern)
+        if parse_error is not None:
+            errors.append(
+                Error(
+                    verification.parsed.node,
+                    f"We could not analyze the pattern {verification.pattern!r} "
+                    f"of {verification.name!r}: {parse_error}",
+                )
+            )
+            continue
+
+        assert regex is not None
+
+        explanations = pattern_analysis.find_catastrophic_backtracking(regex)
+        if len(explanations) > 0:
+            errors.append(
+                Error(
+                    verification.parsed.node,
+                    f"The pattern {verification.pattern!r} of {verification.name!r} "
+                    f"is prone to catastrophic backtracking, which makes "
+                    f"the generated verification vulnerable to the denial-of-service "
+                    f"attacks. Please re-write the pattern so that each text can be "
+                    f"matched in a single way.",
+                    [
+                        Error(verification.parsed.node, explanation)
+                        for explanation in explanations
+                    ],
+                )
+            )
+
+    if len(errors) > 0:
+        return errors
+
+    return None
@@ -12,7 +12,7 @@ from typing import (
     MutableMapping,
     Final,
     FrozenSet,
-    Set,
+    TYPE_CHECKING,
 )
 
 import docutils.nodes
@@ -22,12 +22,15 @@ from aas_core_codegen import parse
 from aas_core_codegen.common import (
     Identifier,
     assert_never,
-    assert_union_of_descendants_exhaustive,
-    assert_union_without_excluded,
 )
 from aas_core_codegen.intermediate import construction
 from aas_core_codegen.parse import tree as parse_tree
 
+if TYPE_CHECKING:
+    # The type inference depends on this module, so we can only import it for
+    # the static type checks to avoid circular imports.
+    from aas_core_codegen.intermediate import type_inference
+
 _MODULE_NAME = pathlib.Path(__file__).parent.name
 
 
@@ -130,10 +133,6 @@ TypeAnnotationUnion = Union[
     OptionalTypeAnnotation,
 ]
 
-assert_union_of_descendants_exhaustive(
-    union=TypeAnnotationUnion, base_class=TypeAnnotation
-)
-
 
 def type_annotations_equal(
     that: TypeAnnotationUnion, other: TypeAnnotationUnion
@@ -1447,6 +1446,54 @@ class MetaModel:
         self.description = description
 
 
+class SymbolReferences:
+    """
+    Collect the references to a single symbol throughout the meta-model.
+
+    This is a reverse index so that the generators do not have to scan all
+    the symbols and their members whenever they need to know where a symbol is used.
+    """
+
+    #: Properties whose type annotations reference the symbol.
+    #:
+    #: Mind that the properties are stacked over the ancestors so that a property
+    #: inherited by multiple descendants is listed for each one of them. Use
+    #: ``specified_for`` of the property if you need to distinguish them.
+    properties: Final[Sequence[Property]]
+
+    #: Classes with at least one property referencing the symbol, in the order of
+    #: the symbols in the symbol table
+    classes: Final[Sequence["ClassUnion"]]
+
+    #: Arguments of methods, constructors and verification functions whose type
+    #: annotations reference the symbol
+    arguments: Final[Sequence[Argument]]
+
+    #: Invariants whose bodies reference the symbol by its name (*e.g.*, to
+    #: access an enumeration literal). Each invariant is listed only once even though
+    #: it is stacked over the descendants.
+    invariants: Final[Sequence[Invariant]]
+
+    #: Descriptions referencing the symbol either directly or through one of its
+    #: attributes
+    descriptions: Final[Sequence[Description]]
+
+    def __init__(
+        self,
+        properties: Sequence[Property],
+        classes: Sequence["ClassUnion"],
+        arguments: Sequence[Argument],
+        invariants: Sequence[Invariant],
+        descriptions: Sequence[Description],
+    ) -> None:
+        """Initialize with the given values."""
+        self.properties = properties
+        self.classes = classes
+        self.arguments = arguments
+        self.invariants = invariants
+        self.descriptions = descriptions
+
+
 class SymbolTable:
     """Represent all the symbols of the intermediate representation."""
 
@@ -1467,6 +1514,17 @@ class SymbolTable:
 
     _name_to_symbol: Final[Mapping[Identifier, "Symbol"]]
 
+    # The reverse index can only be built once all the references in the symbol
+    # table have been resolved. Hence it is set at the very end of the translation
+    # through ``_set_references``.
+    _references_by_symbol_id: Mapping[int, SymbolReferences]
+
+    # The types are inferred only once for each invariant at the end of
+    # the translation, and set through ``_set_type_maps``.
+    _type_maps_by_invariant_id: Mapping[
+        int, Mapping[parse_tree.Node, "type_inference.TypeAnnotationUnion"]
+    ]
+
     # fmt: off
     @require(
         lambda symbols: (
@@ -1527,6 +1585,9 @@ class SymbolTable:
 
         self._name_to_symbol = {symbol.name: symbol for symbol in symbols}
 
+        self._references_by_symbol_id = dict()
+        self._type_maps_by_invariant_id = dict()
+
     def find(self, name: Identifier) -> Optional["Symbol"]:
         """Find the symbol with the given ``name``."""
         return self._name_to_symbol.get(name, None)
@@ -1546,6 +1607,63 @@ class SymbolTable:
 
         return result
 
+    @require(lambda self, symbol: self.find(symbol.name) is symbol)
+    def references_to(self, symbol: "Symbol") -> SymbolReferences:
+        """
+        Retrieve all the references to the ``symbol`` from the reverse index.
+
+        The look-up runs in constant time as the index is computed only once at
+        the end of the translation.
+        """
+        return self._references_by_symbol_id[id(symbol)]
+
+    # fmt: off
+    @require(
+        lambda self, references_by_symbol_id:
+        all(
+            id(symbol) in references_by_symbol_id
+            for symbol in self.symbols
+        ),
+        "All symbols indexed"
+    )
+    # fmt: on
+    def _set_references(
+        self, references_by_symbol_id: Mapping[int, SymbolReferences]
+    ) -> None:
+        """
+        Set the reverse index of the references to the symbols.
+
+        This method is expected to be called only during the translation phase.
+        """
+        self._references_by_symbol_id = references_by_symbol_id
+
+    def type_map_of(
+        self, invariant: Invariant
+    ) -> Mapping[parse_tree.Node, "type_inference.TypeAnnotationUnion"]:
+        """
+        Retrieve the types inferred for the nodes in the body of the ``invariant``.
+
+        The types are inferred only once per invariant, even though the invariants
+        are stacked over the descendants, so that all the code generators can share
+        the inference.
+
+        :raise: :py:class:`KeyError` if the ``invariant`` is not in the table.
+        """
+        return self._type_maps_by_invariant_id[id(invariant)]
+
+    def _set_type_maps(
+        self,
+        type_maps_by_invariant_id: Mapping[
+            int, Mapping[parse_tree.Node, "type_inference.TypeAnnotationUnion"]
+        ],
+    ) -> None:
+        """
+        Set the types inferred for the invariants.
+
+        This method is expected to be called only during the translation phase.
+        """
+        self._type_maps_by_invariant_id = type_maps_by_invariant_id
+
 
 def map_descendability(
     type_annotation: TypeAnnotationUnion,
@@ -1614,56 +1732,10 @@ class _ConstructorArgumentOfClass:
         self.cls = cls
 
 
-def collect_ids_of_symbols_in_properties(symbol_table: SymbolTable) -> Set[int]:
-    """
-    Collect the IDs of the symbols occurring in type annotations of the properties.
-
-    The IDs refer to IDs of the Python objects in this context.
-    """
-    result = set()  # type: Set[int]
-    for symbol in symbol_table.symbols:
-        if isinstance(symbol, Enumeration):
-            continue
-
-        elif isinstance(symbol, ConstrainedPrimitive):
-            continue
-
-        elif isinstance(symbol, Class):
-            for prop in symbol.properties:
-                type_anno = prop.type_annotation
-
-                old_type_anno = None  # type: Optional[TypeAnnotation]
-                while True:
-                    if isinstance(type_anno, OptionalTypeAnnotation):
-                        # noinspection PyUnresolvedReferences
-                        type_anno = type_anno.value
-                    elif isinstance(type_anno, ListTypeAnnotation):
-                        type_anno = type_anno.items
-                    elif isinstance(type_anno, PrimitiveTypeAnnotation):
-                        break
-                    elif isinstance(type_anno, OurTypeAnnotation):
-                        result.add(id(type_anno.symbol))
-                        break
-                    else:
-                        assert_never(type_anno)
-
-                    assert old_type_anno is not type_anno, "Loop invariant"
-                    old_type_anno = type_anno
-        else:
-            assert_never(symbol)
-
-    return result
-
-
 ClassUnion = Union[AbstractClass, ConcreteClass]
-assert_union_of_descendants_exhaustive(union=ClassUnion, base_class=Class)
 
 Symbol = Union[Enumeration, ConstrainedPrimitive, ClassUnion]
 
 SymbolExceptEnumeration = Union[ConstrainedPrimitive, ClassUnion]
-assert_union_without_excluded(
-    original_union=Symbol, subset_union=SymbolExceptEnumeration, excluded=[Enumeration]
-)
 
 VerificationUnion = Union[ImplementationSpecificVerification, PatternVerification]
-assert_union_of_descendants_exhaustive(union=VerificationUnion, base_class=Verification)
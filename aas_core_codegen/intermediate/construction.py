@@ -22,7 +22,6 @@ from aas_core_codegen import parse, stringify
 from aas_core_codegen.common import (
     Identifier,
     Error,
-    assert_union_of_descendants_exhaustive,
 )
 from aas_core_codegen.parse import Method
 
@@ -696,8 +695,6 @@ _DISPATCH = {
     AssignArgument: _stringify_assign_argument,
 }
 
-stringify.assert_dispatch_exhaustive(dispatch=_DISPATCH, dumpable=Dumpable)
-
 
 def _stringify(that: Optional[Dumpable]) -> Optional[stringify.Entity]:
     """Dispatch to the correct ``_stringify_*`` method."""
@@ -727,4 +724,3 @@ def dump(that: Optional[Dumpable]) -> str:
 
 
 DefaultUnion = Union[EmptyList, DefaultEnumLiteral]
-assert_union_of_descendants_exhaustive(union=DefaultUnion, base_class=Default)
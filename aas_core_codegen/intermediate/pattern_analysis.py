@@ -0,0 +1,1300 @@
+"""
+Analyze the regular expressions of the pattern verification functions.
+
+The pattern is parsed into a small abstract syntax tree so that we can detect
+the constructs prone to catastrophic backtracking, and simplify the pattern where
+the simplification is obviously equivalent.
+
+We support only the subset of Python regular expressions which we can reasonably
+transpile to other languages and schemas. For example, back-references and inline
+flags are not supported.
+"""
+import re
+from typing import List, Optional, Sequence, Tuple, Union
+
+from icontract import ensure
+
+from aas_core_codegen.common import assert_never
+
+#: The maximum code point in Unicode
+_MAX_CODE_POINT = 0x10FFFF
+
+
+class Char:
+    """Represent a single character."""
+
+    def __init__(self, code_point: int) -> None:
+        """Initialize with the given values."""
+        self.code_point = code_point
+
+
+class ShorthandClass:
+    """Represent a shorthand character class such as ``\\d`` or ``\\W``."""
+
+    def __init__(self, letter: str) -> None:
+        """Initialize with the given values."""
+        self.letter = letter
+
+
+class Range:
+    """Represent a range of characters in a character class such as ``a-z``."""
+
+    def __init__(self, start: int, end: int) -> None:
+        """Initialize with the given values."""
+        self.start = start
+        self.end = end
+
+
+class CharacterClass:
+    """Represent a character class such as ``[a-z_]``."""
+
+    def __init__(
+        self,
+        items: Sequence[Union[Range, ShorthandClass]],
+        complementing: bool,
+    ) -> None:
+        """Initialize with the given values."""
+        self.items = items
+        self.complementing = complementing
+
+
+class Dot:
+    """Represent ``.``, matching any character except a new line."""
+
+
+class Anchor:
+    """Represent a zero-width assertion such as ``^``, ``$`` or ``\\b``."""
+
+    def __init__(self, text: str) -> None:
+        """Initialize with the given values."""
+        self.text = text
+
+
+class Group:
+    """
+    Represent a group such as ``(...)``, ``(?:...)`` or ``(?=...)``.
+
+    The ``prefix`` is the part of the opening which follows the parenthesis, *e.g.*,
+    ``?:`` or ``?P<name>``, and is empty for plain capturing groups.
+    """
+
+    def __init__(self, prefix: str, alternation: "Alternation") -> None:
+        """Initialize with the given values."""
+        self.prefix = prefix
+        self.alternation = alternation
+
+
+_LOOKAROUND_PREFIXES = ("?=", "?!", "?<=", "?<!")
+
+Atom = Union[Char, ShorthandClass, CharacterClass, Dot, Anchor, Group]
+
+
+class Quantifier:
+    """
+    Represent a quantifier such as ``*`` or ``{2,5}``.
+
+    The ``suffix`` is ``?`` for lazy and ``+`` for possessive quantifiers, and empty
+    for greedy ones.
+    """
+
+    def __init__(self, minimum: int, maximum: Optional[int], suffix: str) -> None:
+        """Initialize with the given values."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.suffix = suffix
+
+
+class Term:
+    """Represent an atom with an optional quantifier."""
+
+    def __init__(self, atom: Atom, quantifier: Optional[Quantifier]) -> None:
+        """Initialize with the given values."""
+        self.atom = atom
+        self.quantifier = quantifier
+
+
+class Concatenation:
+    """Represent a sequence of terms."""
+
+    def __init__(self, terms: Sequence[Term]) -> None:
+        """Initialize with the given values."""
+        self.terms = terms
+
+
+class Alternation:
+    """Represent the branches separated by ``|``."""
+
+    def __init__(self, branches: Sequence[Concatenation]) -> None:
+        """Initialize with the given values."""
+        self.branches = branches
+
+
+class Regex:
+    """Represent a parsed regular expression."""
+
+    def __init__(self, alternation: Alternation) -> None:
+        """Initialize with the given values."""
+        self.alternation = alternation
+
+
+# region Parse
+
+
+class _ParseError(Exception):
+    """Signal that the pattern could not be parsed."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize with the given values."""
+        Exception.__init__(self, message)
+        self.message = message
+
+
+_SINGLE_CHARACTER_ESCAPES = {
+    "t": 0x09,
+    "n": 0x0A,
+    "v": 0x0B,
+    "f": 0x0C,
+    "r": 0x0D,
+    "a": 0x07,
+}
+
+_SHORTHAND_LETTERS = frozenset("dDwWsS")
+
+_QUANTIFIER_RE = re.compile(r"\{([0-9]*)(?:(,)([0-9]*))?}")
+
+
+class _Parser:
+    """Parse a pattern by recursive descent."""
+
+    def __init__(self, text: str) -> None:
+        """Initialize with the given values."""
+        self.text = text
+        self.cursor = 0
+
+    def _peek(self) -> Optional[str]:
+        """Return the current character, or None at the end."""
+        if self.cursor < len(self.text):
+            return self.text[self.cursor]
+
+        return None
+
+    def _expect_more(self) -> str:
+        """Return the current character and move on, or raise at the end."""
+        if self.cursor >= len(self.text):
+            raise _ParseError("Unexpected end of the pattern")
+
+        character = self.text[self.cursor]
+        self.cursor += 1
+        return character
+
+    def parse_alternation(self) -> Alternation:
+        """Parse the branches until the end of the pattern or the closing ``)``."""
+        branches = [self.parse_concatenation()]
+
+        while self._peek() == "|":
+            self.cursor += 1
+            branches.append(self.parse_concatenation())
+
+        return Alternation(branches=branches)
+
+    def parse_concatenation(self) -> Concatenation:
+        """Parse the terms until ``|``, ``)`` or the end of the pattern."""
+        terms = []  # type: List[Term]
+
+        while True:
+            character = self._peek()
+            if character is None or character in "|)":
+                break
+
+            atom = self._parse_atom()
+            quantifier = self._parse_quantifier()
+            terms.append(Term(atom=atom, quantifier=quantifier))
+
+        return Concatenation(terms=terms)
+
+    def _parse_quantifier(self) -> Optional[Quantifier]:
+        """Parse the quantifier, if any, following an atom."""
+        character = self._peek()
+
+        minimum = None  # type: Optional[int]
+        maximum = None  # type: Optional[int]
+
+        if character == "*":
+            self.cursor += 1
+            minimum, maximum = 0, None
+        elif character == "+":
+            self.cursor += 1
+            minimum, maximum = 1, None
+        elif character == "?":
+            self.cursor += 1
+            minimum, maximum = 0, 1
+        elif character == "{":
+            mtch = _QUANTIFIER_RE.match(self.text, self.cursor)
+            if mtch is None:
+                return None
+
+            lower, comma, upper = mtch.group(1), mtch.group(2), mtch.group(3)
+
+            if comma is None:
+                if lower == "":
+                    return None
+
+                minimum = int(lower)
+                maximum = minimum
+            else:
+                if lower == "" and upper == "":
+                    return None
+
+                minimum = int(lower) if lower != "" else 0
+                maximum = int(upper) if upper != "" else None
+
+            self.cursor = mtch.end()
+        else:
+            return None
+
+        suffix = ""
+        if self._peek() in ("?", "+"):
+            suffix = self._expect_more()
+
+        return Quantifier(minimum=minimum, maximum=maximum, suffix=suffix)
+
+    def _parse_atom(self) -> Atom:
+        """Parse a single atom."""
+        character = self._expect_more()
+
+        if character == "(":
+            return self._parse_group()
+
+        if character == "[":
+            return self._parse_character_class()
+
+        if character == ".":
+            return Dot()
+
+        if character in "^$":
+            return Anchor(text=character)
+
+        if character == "\\":
+            return self._parse_escape(in_class=False)
+
+        if character in "*+?":
+            raise _ParseError(
+                f"Nothing to repeat at position {self.cursor - 1}: {character!r}"
+            )
+
+        return Char(code_point=ord(character))
+
+    def _parse_group(self) -> Group:
+        """Parse the group after the opening parenthesis."""
+        prefix = ""
+
+        if self._peek() == "?":
+            for candidate in ("?:", "?=", "?!", "?<=", "?<!", "?>"):
+                if self.text.startswith(candidate, self.cursor):
+                    prefix = candidate
+                    break
+            else:
+                mtch = re.compile(r"\?P<[a-zA-Z_][a-zA-Z_0-9]*>").match(
+                    self.text, self.cursor
+                )
+                if mtch is None:
+                    raise _ParseError(
+                        f"We do not support the group construct "
+                        f"at position {self.cursor - 1}, such as inline flags, "
+                        f"comments or named back-references"
+                    )
+
+                prefix = mtch.group(0)
+
+            self.cursor += len(prefix)
+
+        alternation = self.parse_alternation()
+
+        if self._peek() != ")":
+            raise _ParseError(
+                f"Expected a closing parenthesis at position {self.cursor}"
+            )
+        self.cursor += 1
+
+        return Group(prefix=prefix, alternation=alternation)
+
+    def _parse_escape(self, in_class: bool) -> Union[Char, ShorthandClass, Anchor]:
+        """Parse the escape sequence after the backslash."""
+        start = self.cursor - 1
+        character = self._expect_more()
+
+        if character in _SHORTHAND_LETTERS:
+            return ShorthandClass(letter=character)
+
+        if character in _SINGLE_CHARACTER_ESCAPES:
+            return Char(code_point=_SINGLE_CHARACTER_ESCAPES[character])
+
+        if character == "b" and in_class:
+            return Char(code_point=0x08)
+
+        if character in "bBAZ":
+            if in_class:
+                raise _ParseError(
+                    f"Unexpected anchor in a character class at position {start}"
+                )
+
+            return Anchor(text="\\" + character)
+
+        for letter, length in (("x", 2), ("u", 4), ("U", 8)):
+            if character == letter:
+                digits = self.text[self.cursor : self.cursor + length]
+                if len(digits) != length or not all(
+                    digit in "0123456789abcdefABCDEF" for digit in digits
+                ):
+                    raise _ParseError(
+                        f"Expected {length} hexadecimal digits "
+                        f"after \\{letter} at position {start}"
+                    )
+
+                self.cursor += length
+                return Char(code_point=int(digits, 16))
+
+        if character == "0":
+            digits = ""
+            while len(digits) < 2 and self._peek() is not None:
+                peeked = self._peek()
+                assert peeked is not None
+                if peeked not in "01234567":
+                    break
+
+                digits += self._expect_more()
+
+            return Char(code_point=int("0" + digits, 8))
+
+        if character.isdigit():
+            raise _ParseError(
+                f"We do not support back-references "
+                f"such as \\{character} at position {start}"
+            )
+
+        if character.isascii() and character.isalpha():
+            raise _ParseError(
+                f"We do not support the escape sequence \\{character} "
+                f"at position {start}"
+            )
+
+        return Char(code_point=ord(character))
+
+    def _parse_class_member(self) -> Union[Char, ShorthandClass]:
+        """Parse a single character or a shorthand in a character class."""
+        character = self._expect_more()
+
+        if character == "\\":
+            escaped = self._parse_escape(in_class=True)
+            assert not isinstance(escaped, Anchor)
+            return escaped
+
+        return Char(code_point=ord(character))
+
+    def _parse_character_class(self) -> CharacterClass:
+        """Parse the character class after the opening bracket."""
+        start = self.cursor - 1
+
+        complementing = False
+        if self._peek() == "^":
+            complementing = True
+            self.cursor += 1
+
+        items = []  # type: List[Union[Range, ShorthandClass]]
+
+        first = True
+        while True:
+            character = self._peek()
+            if character is None:
+                raise _ParseError(
+                    f"Unterminated character class starting at position {start}"
+                )
+
+            if character == "]" and not first:
+                self.cursor += 1
+                break
+
+            first = False
+
+            member = self._parse_class_member()
+            if isinstance(member, ShorthandClass):
+                items.append(member)
+                continue
+
+            if (
+                self._peek() == "-"
+                and self.cursor + 1 < len(self.text)
+                and self.text[self.cursor + 1] != "]"
+            ):
+                self.cursor += 1
+                end = self._parse_class_member()
+                if isinstance(end, ShorthandClass):
+                    raise _ParseError(
+                        f"Unexpected shorthand class as the end of a range "
+                        f"in the character class starting at position {start}"
+                    )
+
+                if end.code_point < member.code_point:
+                    raise _ParseError(
+                        f"Invalid range in the character class "
+                        f"starting at position {start}"
+                    )
+
+                items.append(Range(start=member.code_point, end=end.code_point))
+            else:
+                items.append(Range(start=member.code_point, end=member.code_point))
+
+        return CharacterClass(items=items, complementing=complementing)
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def parse(pattern: str) -> Tuple[Optional[Regex], Optional[str]]:
+    """
+    Parse the ``pattern`` into a regular expression tree.
+
+    Return the tree, or the reason why the pattern could not be parsed.
+    """
+    parser = _Parser(text=pattern)
+
+    try:
+        alternation = parser.parse_alternation()
+
+        if parser.cursor != len(pattern):
+            raise _ParseError(
+                f"Unmatched closing parenthesis at position {parser.cursor}"
+            )
+    except _ParseError as exception:
+        return None, exception.message
+
+    return Regex(alternation=alternation), None
+
+
+# endregion
+
+# region Render
+
+_SPECIAL_OUTSIDE_CLASS = frozenset("\\.^$*+?{}[]|()")
+_SPECIAL_IN_CLASS = frozenset("\\]^-[")
+
+_ESCAPES_BY_CODE_POINT = {
+    code_point: "\\" + letter
+    for letter, code_point in _SINGLE_CHARACTER_ESCAPES.items()
+    if letter != "a"
+}
+
+
+def _render_code_point(code_point: int, in_class: bool) -> str:
+    """Render a single character, escaped as necessary."""
+    character = chr(code_point)
+
+    special = _SPECIAL_IN_CLASS if in_class else _SPECIAL_OUTSIDE_CLASS
+    if character in special:
+        return "\\" + character
+
+    escape = _ESCAPES_BY_CODE_POINT.get(code_point, None)
+    if escape is not None:
+        return escape
+
+    if 0x20 <= code_point <= 0x7E:
+        return character
+
+    if code_point <= 0xFF:
+        return f"\\x{code_point:02x}"
+
+    if code_point <= 0xFFFF:
+        return f"\\u{code_point:04x}"
+
+    return f"\\U{code_point:08x}"
+
+
+def _render_quantifier(quantifier: Quantifier) -> str:
+    """Render the quantifier including its suffix."""
+    minimum, maximum = quantifier.minimum, quantifier.maximum
+
+    if (minimum, maximum) == (0, None):
+        text = "*"
+    elif (minimum, maximum) == (1, None):
+        text = "+"
+    elif (minimum, maximum) == (0, 1):
+        text = "?"
+    elif maximum is None:
+        text = f"{{{minimum},}}"
+    elif minimum == maximum:
+        text = f"{{{minimum}}}"
+    else:
+        text = f"{{{minimum},{maximum}}}"
+
+    return text + quantifier.suffix
+
+
+def _render_atom(atom: Atom) -> str:
+    """Render the atom as a pattern."""
+    if isinstance(atom, Char):
+        return _render_code_point(atom.code_point, in_class=False)
+
+    elif isinstance(atom, ShorthandClass):
+        return "\\" + atom.letter
+
+    elif isinstance(atom, CharacterClass):
+        parts = ["[^" if atom.complementing else "["]
+        for item in atom.items:
+            if isinstance(item, ShorthandClass):
+                parts.append("\\" + item.letter)
+            elif isinstance(item, Range):
+                parts.append(_render_code_point(item.start, in_class=True))
+                if item.end != item.start:
+                    parts.append("-")
+                    parts.append(_render_code_point(item.end, in_class=True))
+            else:
+                assert_never(item)
+
+        parts.append("]")
+        return "".join(parts)
+
+    elif isinstance(atom, Dot):
+        return "."
+
+    elif isinstance(atom, Anchor):
+        return atom.text
+
+    elif isinstance(atom, Group):
+        return f"({atom.prefix}{_render_alternation(atom.alternation)})"
+
+    else:
+        assert_never(atom)
+
+    raise AssertionError("Should not have gotten here")
+
+
+def _render_term(term: Term) -> str:
+    """Render the term as a pattern."""
+    if term.quantifier is None:
+        return _render_atom(term.atom)
+
+    return _render_atom(term.atom) + _render_quantifier(term.quantifier)
+
+
+def _render_concatenation(concatenation: Concatenation) -> str:
+    """Render the concatenation as a pattern."""
+    return "".join(_render_term(term) for term in concatenation.terms)
+
+
+def _render_alternation(alternation: Alternation) -> str:
+    """Render the alternation as a pattern."""
+    return "|".join(_render_concatenation(branch) for branch in alternation.branches)
+
+
+def render(regex: Regex) -> str:
+    """Render the ``regex`` back as a pattern."""
+    return _render_alternation(regex.alternation)
+
+
+# endregion
+
+# region Detect catastrophic backtracking
+
+# We represent sets of characters as sorted lists of disjoint inclusive intervals
+# of code points. The sets of the shorthand classes are over-approximated for
+# the non-ASCII characters so that the detection stays on the safe side.
+
+_Intervals = List[Tuple[int, int]]
+
+_ASCII_INTERVALS_BY_SHORTHAND = {
+    "d": [(0x30, 0x39)],
+    "w": [(0x30, 0x39), (0x41, 0x5A), (0x5F, 0x5F), (0x61, 0x7A)],
+    "s": [(0x09, 0x0D), (0x1C, 0x20)],
+}
+
+
+def _normalize(intervals: _Intervals) -> _Intervals:
+    """Sort the intervals and merge the overlapping and adjacent ones."""
+    result = []  # type: _Intervals
+    for start, end in sorted(intervals):
+        if len(result) > 0 and start <= result[-1][1] + 1:
+            result[-1] = (result[-1][0], max(result[-1][1], end))
+        else:
+            result.append((start, end))
+
+    return result
+
+
+def _complement(intervals: _Intervals, upper: int) -> _Intervals:
+    """Complement the normalized ``intervals`` in the range ``[0, upper]``."""
+    result = []  # type: _Intervals
+    next_start = 0
+    for start, end in intervals:
+        if start > upper:
+            break
+
+        if start > next_start:
+            result.append((next_start, start - 1))
+
+        next_start = end + 1
+
+    if next_start <= upper:
+        result.append((next_start, upper))
+
+    return result
+
+
+def _overlap(that: _Intervals, other: _Intervals) -> bool:
+    """Check whether the two normalized interval lists share a code point."""
+    i = 0
+    j = 0
+    while i < len(that) and j < len(other):
+        if that[i][1] < other[j][0]:
+            i += 1
+        elif other[j][1] < that[i][0]:
+            j += 1
+        else:
+            return True
+
+    return False
+
+
+def _intervals_of_shorthand(letter: str) -> _Intervals:
+    """Over-approximate the characters matched by the shorthand class."""
+    ascii_intervals = _ASCII_INTERVALS_BY_SHORTHAND[letter.lower()]
+    if letter.islower():
+        return ascii_intervals + [(0x80, _MAX_CODE_POINT)]
+
+    return _complement(ascii_intervals, upper=0x7F) + [(0x80, _MAX_CODE_POINT)]
+
+
+def _ascii_intervals_of_shorthand(letter: str) -> _Intervals:
+    """Compute exactly the ASCII characters matched by the shorthand class."""
+    ascii_intervals = _ASCII_INTERVALS_BY_SHORTHAND[letter.lower()]
+    if letter.islower():
+        return list(ascii_intervals)
+
+    return _complement(ascii_intervals, upper=0x7F)
+
+
+def _intervals_of_atom(
+    atom: Union[Char, ShorthandClass, CharacterClass, Dot]
+) -> _Intervals:
+    """Over-approximate the characters matched by a single-character atom."""
+    if isinstance(atom, Char):
+        return [(atom.code_point, atom.code_point)]
+
+    elif isinstance(atom, ShorthandClass):
+        return _intervals_of_shorthand(atom.letter)
+
+    elif isinstance(atom, CharacterClass):
+        intervals = []  # type: _Intervals
+        for item in atom.items:
+            if isinstance(item, ShorthandClass):
+                if atom.complementing:
+                    # The complement of an over-approximation is not an
+                    # over-approximation. We complement the exact ASCII part
+                    # instead, and leave all the non-ASCII characters in.
+                    intervals.extend(_ascii_intervals_of_shorthand(item.letter))
+                else:
+                    intervals.extend(_intervals_of_shorthand(item.letter))
+            elif isinstance(item, Range):
+                intervals.append((item.start, item.end))
+            else:
+                assert_never(item)
+
+        normalized = _normalize(intervals)
+
+        if atom.complementing:
+            return _complement(normalized, upper=_MAX_CODE_POINT)
+
+        return normalized
+
+    elif isinstance(atom, Dot):
+        return [(0, 0x09), (0x0B, _MAX_CODE_POINT)]
+
+    else:
+        assert_never(atom)
+
+    raise AssertionError("Should not have gotten here")
+
+
+def _is_zero_width(atom: Atom) -> bool:
+    """Check whether the atom never consumes any character."""
+    return isinstance(atom, Anchor) or (
+        isinstance(atom, Group) and atom.prefix in _LOOKAROUND_PREFIXES
+    )
+
+
+def _nullable_term(term: Term) -> bool:
+    """Check whether the term can match an empty string."""
+    if term.quantifier is not None and term.quantifier.minimum == 0:
+        return True
+
+    if _is_zero_width(term.atom):
+        return True
+
+    if isinstance(term.atom, Group):
+        return _nullable_alternation(term.atom.alternation)
+
+    return False
+
+
+def _nullable_concatenation(concatenation: Concatenation) -> bool:
+    """Check whether the concatenation can match an empty string."""
+    return all(_nullable_term(term) for term in concatenation.terms)
+
+
+def _nullable_alternation(alternation: Alternation) -> bool:
+    """Check whether the alternation can match an empty string."""
+    return any(_nullable_concatenation(branch) for branch in alternation.branches)
+
+
+def _consumes(atom: Atom) -> bool:
+    """Check whether the atom can match a non-empty string."""
+    if _is_zero_width(atom):
+        return False
+
+    if isinstance(atom, Group):
+        return any(
+            any(
+                _consumes(term.atom)
+                and (term.quantifier is None or term.quantifier.maximum != 0)
+                for term in branch.terms
+            )
+            for branch in atom.alternation.branches
+        )
+
+    return True
+
+
+def _first_of_term(term: Term) -> _Intervals:
+    """Over-approximate the characters a match of the term can start with."""
+    if term.quantifier is not None and term.quantifier.maximum == 0:
+        return []
+
+    if _is_zero_width(term.atom):
+        return []
+
+    if isinstance(term.atom, Group):
+        return _first_of_alternation(term.atom.alternation)
+
+    assert not isinstance(term.atom, Anchor)
+    return _intervals_of_atom(term.atom)
+
+
+def _first_of_concatenation(concatenation: Concatenation) -> _Intervals:
+    """Over-approximate the characters a match of the sequence can start with."""
+    intervals = []  # type: _Intervals
+    for term in concatenation.terms:
+        intervals.extend(_first_of_term(term))
+        if not _nullable_term(term):
+            break
+
+    return _normalize(intervals)
+
+
+def _first_of_alternation(alternation: Alternation) -> _Intervals:
+    """Over-approximate the characters a match of the branches can start with."""
+    intervals = []  # type: _Intervals
+    for branch in alternation.branches:
+        intervals.extend(_first_of_concatenation(branch))
+
+    return _normalize(intervals)
+
+
+def _is_single_character(concatenation: Concatenation) -> bool:
+    """
+    Check whether the branch always matches exactly one character.
+
+    We also consider the groups of single-character alternatives, such as
+    ``([a-z]|[0-9])``, since they match a single character as well.
+    """
+    if len(concatenation.terms) != 1 or concatenation.terms[0].quantifier is not None:
+        return False
+
+    atom = concatenation.terms[0].atom
+    if isinstance(atom, (Char, ShorthandClass, CharacterClass, Dot)):
+        return True
+
+    if isinstance(atom, Group) and atom.prefix in ("", "?:"):
+        return all(_is_single_character(branch) for branch in atom.alternation.branches)
+
+    return False
+
+
+def _intervals_of_single_character(atom: Atom) -> Optional[_Intervals]:
+    """
+    Over-approximate the characters matched by an atom of width one.
+
+    Return None if the atom does not always match exactly one character.
+    """
+    if isinstance(atom, (Char, ShorthandClass, CharacterClass, Dot)):
+        return _intervals_of_atom(atom)
+
+    if isinstance(atom, Group) and all(
+        _is_single_character(branch) for branch in atom.alternation.branches
+    ):
+        intervals = []  # type: _Intervals
+        for branch in atom.alternation.branches:
+            branch_intervals = _intervals_of_single_character(branch.terms[0].atom)
+            assert branch_intervals is not None
+            intervals.extend(branch_intervals)
+
+        return _normalize(intervals)
+
+    return None
+
+
+def _fixed_prefix(terms: Sequence[Term], length: int) -> Tuple[List[_Intervals], bool]:
+    """
+    Over-approximate the characters at the first positions of a match of ``terms``.
+
+    We stop at the first term whose width varies or which we do not understand,
+    so the prefix can be shorter than ``length``.
+
+    Return the characters for each position of the prefix, and whether the prefix
+    spans the whole match.
+    """
+    prefix = []  # type: List[_Intervals]
+
+    for term in terms:
+        if len(prefix) >= length:
+            return prefix[:length], False
+
+        minimum = 1 if term.quantifier is None else term.quantifier.minimum
+        fixed = term.quantifier is None or term.quantifier.maximum == minimum
+
+        intervals = _intervals_of_single_character(term.atom)
+        if intervals is not None:
+            prefix.extend([intervals] * minimum)
+        elif (
+            minimum > 0
+            and isinstance(term.atom, Group)
+            and term.atom.prefix in ("", "?:", "?>")
+            and len(term.atom.alternation.branches) == 1
+        ):
+            sub_prefix, complete = _fixed_prefix(
+                term.atom.alternation.branches[0].terms, length - len(prefix)
+            )
+            prefix.extend(sub_prefix)
+            if not (complete and term.quantifier is None):
+                return prefix[:length], False
+        else:
+            return prefix[:length], False
+
+        if not fixed:
+            return prefix[:length], False
+
+    return prefix[:length], len(prefix) <= length
+
+
+# We look only a couple of characters ahead so that the analysis stays cheap.
+_LOOKAHEAD = 4
+
+
+def _distinguished_by_lookahead(
+    term: Term, following: Sequence[Term], lookahead: int = _LOOKAHEAD
+) -> bool:
+    """
+    Check whether another iteration of ``term`` and ``following`` differ early on.
+
+    The matcher then tries the wrong choice for at most a couple of characters,
+    so the choice does not multiply the ways to match the text.
+    """
+    iteration, _ = _fixed_prefix([Term(atom=term.atom, quantifier=None)], lookahead)
+    follower, _ = _fixed_prefix(following, lookahead)
+
+    return any(not _overlap(that, other) for that, other in zip(iteration, follower))
+
+
+def _repeats_variably(quantifier: Optional[Quantifier]) -> bool:
+    """Check whether the quantifier allows for a varying number of repetitions."""
+    return (
+        quantifier is not None
+        and quantifier.suffix != "+"
+        and quantifier.maximum != quantifier.minimum
+    )
+
+
+def _explain_ambiguity_of_concatenation(
+    concatenation: Concatenation,
+) -> Optional[str]:
+    """
+    Explain why a repeated ``concatenation`` can match a string in many ways.
+
+    Return None if we could not find such an ambiguity.
+    """
+    terms = concatenation.terms
+
+    for i, term in enumerate(terms):
+        if not (_repeats_variably(term.quantifier) and _consumes(term.atom)):
+            continue
+
+        # The terms which follow the variably-repeated term delimit its match only
+        # if they can not start with the same character. Since the concatenation is
+        # repeated, the terms wrap around to the start of the next repetition.
+        following = []  # type: _Intervals
+        for k in range(1, len(terms) + 1):
+            other = terms[(i + k) % len(terms)]
+            following.extend(_first_of_term(other))
+            if not _nullable_term(other):
+                break
+
+        if _overlap(
+            _first_of_term(term), _normalize(following)
+        ) and not _distinguished_by_lookahead(
+            term, [terms[(i + k) % len(terms)] for k in range(1, len(terms) + 1)]
+        ):
+            return (
+                f"the repeated part contains the nested quantified "
+                f"sub-pattern {_render_term(term)!r}"
+            )
+
+    non_nullable = [
+        term for term in terms if not _nullable_term(term)
+    ]  # type: List[Term]
+
+    # If two or more terms always consume characters, the alternatives nested in
+    # one term are delimited by the others. This is a heuristic, and we might miss
+    # some ambiguities such as ``((a|a)b)+``.
+    if len(non_nullable) > 1:
+        return None
+
+    candidates = non_nullable if len(non_nullable) == 1 else terms
+
+    for term in candidates:
+        if isinstance(term.atom, Group) and not (
+            term.atom.prefix in _LOOKAROUND_PREFIXES or term.atom.prefix == "?>"
+        ):
+            explanation = _explain_ambiguity_of_alternation(term.atom.alternation)
+            if explanation is not None:
+                return explanation
+
+    return None
+
+
+def _flatten_branches(alternation: Alternation) -> List[Concatenation]:
+    """
+    List the branches of ``alternation`` with the nested alternatives in-lined.
+
+    For example, the branches of ``([a-z]|%[0-9])|:`` are ``[a-z]``, ``%[0-9]``
+    and ``:``.
+    """
+    result = []  # type: List[Concatenation]
+    for branch in alternation.branches:
+        if (
+            len(branch.terms) == 1
+            and branch.terms[0].quantifier is None
+            and isinstance(branch.terms[0].atom, Group)
+            and branch.terms[0].atom.prefix in ("", "?:")
+        ):
+            result.extend(_flatten_branches(branch.terms[0].atom.alternation))
+        else:
+            result.append(branch)
+
+    return result
+
+
+def _explain_ambiguity_of_alternation(alternation: Alternation) -> Optional[str]:
+    """
+    Explain why a repeated ``alternation`` can match a string in many ways.
+
+    Return None if we could not find such an ambiguity.
+    """
+    branches = _flatten_branches(alternation)
+
+    firsts = [
+        _first_of_concatenation(branch) for branch in branches
+    ]  # type: List[_Intervals]
+
+    for i, branch in enumerate(branches):
+        for j in range(i + 1, len(branches)):
+            other = branches[j]
+
+            if _overlap(firsts[i], firsts[j]):
+                return (
+                    f"the repeated alternatives {_render_concatenation(branch)!r} "
+                    f"and {_render_concatenation(other)!r} can start with "
+                    f"the same character"
+                )
+
+    for branch in branches:
+        explanation = _explain_ambiguity_of_concatenation(branch)
+        if explanation is not None:
+            return explanation
+
+    return None
+
+
+def _over_terms_of_alternation(alternation: Alternation) -> List[Term]:
+    """List all the terms of the ``alternation`` including the nested ones."""
+    result = []  # type: List[Term]
+
+    stack = [alternation]  # type: List[Alternation]
+    while len(stack) > 0:
+        current = stack.pop()
+        for branch in current.branches:
+            for term in branch.terms:
+                result.append(term)
+                if isinstance(term.atom, Group):
+                    stack.append(term.atom.alternation)
+
+    return result
+
+
+def find_catastrophic_backtracking(regex: Regex) -> List[str]:
+    """
+    Find the repetitions in ``regex`` prone to catastrophic backtracking.
+
+    We look for repetitions over the sub-patterns which can match the same text in
+    more than one way, *e.g.*, nested quantifiers such as ``(a+)+`` or overlapping
+    alternatives such as ``(a|ab)*``. The failing match then needs to try out
+    exponentially many ways before it gives up.
+
+    The detection is heuristic, and not exhaustive.
+
+    Return the explanation for each such repetition.
+    """
+    result = []  # type: List[str]
+
+    for term in _over_terms_of_alternation(regex.alternation):
+        if (
+            term.quantifier is None
+            or term.quantifier.suffix == "+"
+            or not (term.quantifier.maximum is None or term.quantifier.maximum > 1)
+        ):
+            continue
+
+        if not isinstance(term.atom, Group):
+            continue
+
+        if term.atom.prefix in _LOOKAROUND_PREFIXES or term.atom.prefix == "?>":
+            continue
+
+        explanation = _explain_ambiguity_of_alternation(term.atom.alternation)
+        if explanation is not None:
+            result.append(
+                f"The repetition {_render_term(term)!r} is prone to "
+                f"catastrophic backtracking since {explanation}"
+            )
+
+    return result
+
+
+# endregion
+
+# region Simplify
+
+
+def _simplify_character_class(
+    character_class: CharacterClass,
+) -> Union[Char, CharacterClass]:
+    """Merge the ranges of the class, and collapse a single character to a literal."""
+    shorthands = [
+        item for item in character_class.items if isinstance(item, ShorthandClass)
+    ]  # type: List[ShorthandClass]
+
+    intervals = _normalize(
+        [
+            (item.start, item.end)
+            for item in character_class.items
+            if isinstance(item, Range)
+        ]
+    )
+
+    if (
+        not character_class.complementing
+        and len(shorthands) == 0
+        and len(intervals) == 1
+        and intervals[0][0] == intervals[0][1]
+    ):
+        return Char(code_point=intervals[0][0])
+
+    items = []  # type: List[Union[Range, ShorthandClass]]
+    items.extend(shorthands)
+    items.extend(Range(start=start, end=end) for start, end in intervals)
+
+    return CharacterClass(items=items, complementing=character_class.complementing)
+
+
+def _simplify_term(term: Term) -> Term:
+    """Simplify the atom of the term, and unwrap the needless groups."""
+    atom = term.atom
+
+    if isinstance(atom, CharacterClass):
+        return Term(atom=_simplify_character_class(atom), quantifier=term.quantifier)
+
+    if not isinstance(atom, Group):
+        return term
+
+    alternation = _simplify_alternation(atom.alternation)
+
+    # We unwrap a group over a single character, such as ``([a-z])+``, since
+    # the group does not change what is matched.
+    if (
+        atom.prefix in ("", "?:")
+        and len(alternation.branches) == 1
+        and _is_single_character(alternation.branches[0])
+    ):
+        return Term(
+            atom=alternation.branches[0].terms[0].atom, quantifier=term.quantifier
+        )
+
+    return Term(
+        atom=Group(prefix=atom.prefix, alternation=alternation),
+        quantifier=term.quantifier,
+    )
+
+
+def _merge_single_characters(
+    branches: Sequence[Concatenation],
+) -> List[Concatenation]:
+    """Merge the branches of single characters into a single character class."""
+    single_character_indices = [
+        i
+        for i, branch in enumerate(branches)
+        if len(branch.terms) == 1
+        and branch.terms[0].quantifier is None
+        and (
+            isinstance(branch.terms[0].atom, (Char, ShorthandClass))
+            or (
+                isinstance(branch.terms[0].atom, CharacterClass)
+                and not branch.terms[0].atom.complementing
+            )
+        )
+    ]  # type: List[int]
+
+    if len(single_character_indices) < 2:
+        return list(branches)
+
+    items = []  # type: List[Union[Range, ShorthandClass]]
+    for i in single_character_indices:
+        atom = branches[i].terms[0].atom
+        if isinstance(atom, Char):
+            items.append(Range(start=atom.code_point, end=atom.code_point))
+        elif isinstance(atom, ShorthandClass):
+            items.append(atom)
+        elif isinstance(atom, CharacterClass):
+            items.extend(atom.items)
+        else:
+            raise AssertionError(f"Unexpected single-character atom: {atom}")
+
+    merged = Concatenation(
+        terms=[
+            Term(
+                atom=_simplify_character_class(
+                    CharacterClass(items=items, complementing=False)
+                ),
+                quantifier=None,
+            )
+        ]
+    )
+
+    result = []  # type: List[Concatenation]
+    for i, branch in enumerate(branches):
+        if i == single_character_indices[0]:
+            result.append(merged)
+        elif i not in single_character_indices:
+            result.append(branch)
+
+    return result
+
+
+def _common_prefix_length(branches: Sequence[Concatenation]) -> int:
+    """Compute the number of the leading terms rendered equally in all ``branches``."""
+    length = 0
+    while all(length < len(branch.terms) for branch in branches):
+        rendered = {_render_term(branch.terms[length]) for branch in branches}
+        if len(rendered) != 1:
+            break
+
+        length += 1
+
+    return length
+
+
+def _factor_common_prefixes(
+    branches: Sequence[Concatenation],
+) -> List[Concatenation]:
+    """Factor out the common leading terms of the adjacent branches."""
+    result = []  # type: List[Concatenation]
+
+    i = 0
+    while i < len(branches):
+        # Find the run of adjacent branches which start with the same term
+        j = i + 1
+        while (
+            j < len(branches)
+            and len(branches[i].terms) > 0
+            and len(branches[j].terms) > 0
+            and _render_term(branches[i].terms[0]) == _render_term(branches[j].terms[0])
+        ):
+            j += 1
+
+        if j - i < 2:
+            result.append(branches[i])
+            i += 1
+            continue
+
+        run = branches[i:j]
+        prefix_length = _common_prefix_length(run)
+        prefix = list(run[0].terms[:prefix_length])
+
+        rests = [
+            Concatenation(terms=branch.terms[prefix_length:]) for branch in run
+        ]  # type: List[Concatenation]
+
+        non_empty_rests = []  # type: List[Concatenation]
+        for rest in rests:
+            if len(rest.terms) > 0 and all(
+                _render_concatenation(rest) != _render_concatenation(other)
+                for other in non_empty_rests
+            ):
+                non_empty_rests.append(rest)
+
+        if len(non_empty_rests) == 0:
+            result.append(Concatenation(terms=prefix))
+        else:
+            # The empty rest is expressed by making the group optional.
+            some_rest_empty = any(len(rest.terms) == 0 for rest in rests)
+
+            group = _simplify_term(
+                Term(
+                    atom=Group(
+                        prefix="", alternation=Alternation(branches=non_empty_rests)
+                    ),
+                    quantifier=(
+                        Quantifier(minimum=0, maximum=1, suffix="")
+                        if some_rest_empty
+                        else None
+                    ),
+                )
+            )
+
+            result.append(Concatenation(terms=prefix + [group]))
+
+        i = j
+
+    return result
+
+
+def _simplify_alternation(alternation: Alternation) -> Alternation:
+    """Simplify the branches recursively."""
+    branches = [
+        Concatenation(terms=[_simplify_term(term) for term in branch.terms])
+        for branch in alternation.branches
+    ]  # type: List[Concatenation]
+
+    branches = _merge_single_characters(branches)
+    branches = _factor_common_prefixes(branches)
+
+    return Alternation(branches=branches)
+
+
+def simplify(regex: Regex) -> Regex:
+    """
+    Simplify the ``regex`` into an equivalent regular expression.
+
+    We merge the ranges of the character classes, merge the alternatives of single
+    characters into a single character class, and factor out the common leading
+    terms of the adjacent alternatives. The capturing groups might change, but
+    the simplified expression matches exactly the same strings.
+    """
+    return Regex(alternation=_simplify_alternation(regex.alternation))
+
+
+# endregion
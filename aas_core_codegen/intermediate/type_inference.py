@@ -9,7 +9,15 @@ be traced back to the parse stage.
 """
 import abc
 import enum
-from typing import Mapping, MutableMapping, Optional, List, Final, Union, get_args
+from typing import (
+    Mapping,
+    MutableMapping,
+    Optional,
+    List,
+    Final,
+    Union,
+    Tuple,
+)
 
 from icontract import DBC, ensure
 
@@ -17,7 +25,6 @@ from aas_core_codegen.common import (
     Identifier,
     Error,
     assert_never,
-    assert_union_of_descendants_exhaustive,
 )
 from aas_core_codegen.intermediate import _types
 from aas_core_codegen.intermediate._types import Enumeration
@@ -431,8 +438,21 @@ class Environment(DBC):
     See, for example: https://craftinginterpreters.com/resolving-and-binding.html.
 
     The most outer, global, scope is parentless.
+
+    To avoid walking the chain of the ancestor scopes on every look-up, each
+    environment keeps a flattened view of all the names visible in its scope. The view
+    is shared with the parent and copied only on write, so that the look-ups run in
+    constant time. Mind that a scope sees its parent scope as it was at the moment
+    the scope has been created.
     """
 
+    #: Flattened mapping of all the names visible in this scope
+    _flattened: Mapping[Identifier, "TypeAnnotationUnion"]
+
+    #: If set, ``_flattened`` might be shared with other environments and needs to
+    #: be copied before a write.
+    _flattened_shared: bool
+
     @property
     @abc.abstractmethod
     def mapping(self) -> Mapping[Identifier, "TypeAnnotationUnion"]:
@@ -443,20 +463,23 @@ class Environment(DBC):
         """Initialize with the given values."""
         self.parent = parent
 
+        if parent is not None:
+            # The parent needs to copy its flattened view before it changes it so
+            # that the changes do not leak into this scope.
+            parent._flattened_shared = True  # pylint: disable=protected-access
+            self._flattened = parent._flattened  # pylint: disable=protected-access
+        else:
+            self._flattened = dict()
+
+        self._flattened_shared = True
+
     def find(self, identifier: Identifier) -> Optional["TypeAnnotationUnion"]:
         """
         Search for the type annotation of the given ``identifier``.
 
         We search all the way to the most outer scope.
         """
-        type_anno = self.mapping.get(identifier, None)
-        if type_anno is not None:
-            return type_anno
-
-        if self.parent is not None:
-            return self.parent.find(identifier)
-
-        return None
+        return self._flattened.get(identifier, None)
 
 
 class ImmutableEnvironment(Environment):
@@ -474,10 +497,17 @@ class ImmutableEnvironment(Environment):
         mapping: Mapping[Identifier, "TypeAnnotationUnion"],
         parent: Optional["Environment"] = None,
     ) -> None:
-        self._mapping = mapping
+        # We copy the mapping so that the environment is frozen even if the caller
+        # changes the original mapping.
+        self._mapping = dict(mapping)
 
         Environment.__init__(self, parent)
 
+        if len(self._mapping) > 0:
+            flattened = dict(self._flattened)
+            flattened.update(self._mapping)
+            self._flattened = flattened
+
 
 class MutableEnvironment(Environment):
     """
@@ -502,6 +532,13 @@ class MutableEnvironment(Environment):
         """Set the ``type_annotation`` for the given ``identifier``."""
         self._mapping[identifier] = type_annotation
 
+        if self._flattened_shared:
+            self._flattened = dict(self._flattened)
+            self._flattened_shared = False
+
+        assert isinstance(self._flattened, dict)
+        self._flattened[identifier] = type_annotation
+
 
 class Inferrer(parse_tree.RestrictedTransformer[Optional["TypeAnnotationUnion"]]):
     """Infer the types of the given parse tree."""
@@ -958,6 +995,47 @@ def populate_base_environment(symbol_table: _types.SymbolTable) -> Environment:
     return ImmutableEnvironment(mapping=mapping, parent=None)
 
 
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def infer_for_invariant(
+    invariant: _types.Invariant,
+    symbol_table: _types.SymbolTable,
+    base_environment: Environment,
+) -> Tuple[Optional[Mapping[parse_tree.Node, "TypeAnnotationUnion"]], Optional[Error]]:
+    """
+    Infer the types of the nodes in the body of the ``invariant``.
+
+    The ``self`` is bound to the symbol where the invariant has been specified. Since
+    the invariants are stacked over the descendants, this allows us to infer the types
+    only once per invariant instead of once per descendant.
+    """
+    symbol = invariant.specified_for
+    assert isinstance(
+        symbol,
+        (_types.ConstrainedPrimitive, _types.AbstractClass, _types.ConcreteClass),
+    )
+
+    environment = MutableEnvironment(parent=base_environment)
+
+    # The argument ``self`` shadows any global of the same name, as in Python.
+    environment.set(
+        identifier=Identifier("self"),
+        type_annotation=OurTypeAnnotation(symbol=symbol),
+    )
+
+    type_inferrer = Inferrer(symbol_table=symbol_table, environment=environment)
+
+    _ = type_inferrer.transform(invariant.body)
+
+    if len(type_inferrer.errors) > 0:
+        return None, Error(
+            invariant.parsed.node,
+            "Failed to infer the types in the invariant",
+            type_inferrer.errors,
+        )
+
+    return type_inferrer.type_map, None
+
+
 TypeAnnotationUnion = Union[
     PrimitiveTypeAnnotation,
     OurTypeAnnotation,
@@ -968,16 +1046,10 @@ TypeAnnotationUnion = Union[
     OptionalTypeAnnotation,
     EnumerationAsTypeTypeAnnotation,
 ]
-assert_union_of_descendants_exhaustive(
-    union=TypeAnnotationUnion, base_class=TypeAnnotation
-)
 
 FunctionTypeAnnotationUnion = Union[
     VerificationTypeAnnotation, BuiltinFunctionTypeAnnotation
 ]
-assert_union_of_descendants_exhaustive(
-    union=FunctionTypeAnnotationUnion, base_class=FunctionTypeAnnotation
-)
 
 # NOTE (mristin, 2021-12-27):
 # Mypy is not smart enough to work with ``get_args``, so we have to manually write it
@@ -986,4 +1058,3 @@ FunctionTypeAnnotationUnionAsTuple = (
     VerificationTypeAnnotation,
     BuiltinFunctionTypeAnnotation,
 )
-assert FunctionTypeAnnotationUnionAsTuple == get_args(FunctionTypeAnnotationUnion)
@@ -10,7 +10,6 @@ from typing import (
     List,
     Sequence,
     Mapping,
-    Set,
 )
 
 from icontract import ensure
@@ -241,8 +240,8 @@ def _define_type(
 
 def _define_for_constrained_primitive(
     constrained_primitive: intermediate.ConstrainedPrimitive,
-    pattern_verifications_by_name: infer_for_schema.PatternVerificationsByName,
-) -> Tuple[Optional[MutableMapping[str, Any]], Optional[List[Error]]]:
+    constraint_index: infer_for_schema.ConstraintIndex,
+) -> MutableMapping[str, Any]:
     """
     Generate the JSON definitions based on the ``constrained_primitive``.
 
@@ -261,27 +260,9 @@ def _define_for_constrained_primitive(
 
     # region Constraints
 
-    errors = []  # type: List[Error]
-
-    (
-        len_constraint,
-        len_constraint_errors,
-    ) = infer_for_schema.infer_len_constraint_of_self(
-        constrained_primitive=constrained_primitive
-    )
-
-    if len_constraint_errors is not None:
-        errors.extend(len_constraint_errors)
-
-    if len(errors) > 0:
-        return None, errors
-
-    assert len_constraint is not None
+    len_constraint = constraint_index.len_constraint_of_self(constrained_primitive)
 
-    pattern_constraints = infer_for_schema.infer_patterns_on_self(
-        constrained_primitive=constrained_primitive,
-        pattern_verifications_by_name=pattern_verifications_by_name,
-    )
+    pattern_constraints = constraint_index.patterns_on_self(constrained_primitive)
 
     type_definition = _define_primitive_type(
         primitive_type=constrained_primitive.constrainee,
@@ -301,7 +282,7 @@ def _define_for_constrained_primitive(
     ), "At least the type definition for the primitive type expected"
     result[model_type] = {"allOf": all_of} if len(all_of) > 1 else all_of[0]
 
-    return result, None
+    return result
 
 
 # fmt: off
@@ -312,7 +293,7 @@ def _define_for_constrained_primitive(
 # fmt: on
 def _define_properties_and_required(
     cls: intermediate.Class,
-    pattern_verifications_by_name: infer_for_schema.PatternVerificationsByName,
+    constraint_index: infer_for_schema.ConstraintIndex,
 ) -> Tuple[
     Optional[MutableMapping[str, Any]],
     Optional[List[Identifier]],
@@ -321,24 +302,8 @@ def _define_properties_and_required(
     """Define the ``properties`` and ``required`` part for the given class ``cls``."""
     errors = []  # type: List[Error]
 
-    (
-        len_constraints_by_property,
-        len_constraints_errors,
-    ) = infer_for_schema.infer_len_constraints_by_class_properties(cls=cls)
-
-    if len_constraints_errors is not None:
-        errors.extend(len_constraints_errors)
-
-    if len(errors) > 0:
-        return None, None, errors
-
-    assert len_constraints_by_property is not None
-
-    pattern_constraints_by_property = (
-        infer_for_schema.infer_patterns_by_class_properties(
-            cls=cls, pattern_verifications_by_name=pattern_verifications_by_name
-        )
-    )
+    len_constraints_by_property = constraint_index.len_constraints_by_property(cls)
+    pattern_constraints_by_property = constraint_index.patterns_by_property(cls)
 
     properties = collections.OrderedDict()  # type: MutableMapping[str, Any]
     required = []  # type: List[Identifier]
@@ -389,8 +354,8 @@ def _define_properties_and_required(
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
 def _define_for_class(
     cls: intermediate.Class,
-    ids_of_classes_in_properties: Set[int],
-    pattern_verifications_by_name: infer_for_schema.PatternVerificationsByName,
+    references: intermediate.SymbolReferences,
+    constraint_index: infer_for_schema.ConstraintIndex,
 ) -> Tuple[Optional[MutableMapping[str, Any]], Optional[List[Error]]]:
     """
     Generate the JSON definitions based on the class ``cls``.
@@ -414,7 +379,7 @@ def _define_for_class(
 
     properties, required, properties_error = _define_properties_and_required(
         cls=cls,
-        pattern_verifications_by_name=pattern_verifications_by_name,
+        constraint_index=constraint_index,
     )
 
     if properties_error is not None:
@@ -457,7 +422,7 @@ def _define_for_class(
     # the type of one or more properties in the meta-model. Otherwise, we can ignore
     # the abstract definition as it wouldn't be used during the validation.
 
-    if len(cls.concrete_descendants) > 0 and id(cls) in ids_of_classes_in_properties:
+    if len(cls.concrete_descendants) > 0 and len(references.properties) > 0:
         model_type_abstract = f"{model_type}_abstract"
 
         one_of = [
@@ -516,13 +481,13 @@ def _generate(
 
     definitions = collections.OrderedDict()
 
-    pattern_verifications_by_name = infer_for_schema.map_pattern_verifications_by_name(
-        verifications=symbol_table.verification_functions
-    )
-
-    ids_of_symbols_in_properties = intermediate.collect_ids_of_symbols_in_properties(
+    constraint_index, constraint_index_errors = infer_for_schema.build_constraint_index(
         symbol_table=symbol_table
     )
+    if constraint_index_errors is not None:
+        return None, constraint_index_errors
+
+    assert constraint_index is not None
 
     for symbol in symbol_table.symbols:
         # Key-value pairs to extend the definitions
@@ -569,29 +534,25 @@ def _generate(
                 continue
         else:
             if isinstance(symbol, intermediate.Enumeration):
-                if id(symbol) not in ids_of_symbols_in_properties:
+                if len(symbol_table.references_to(symbol).properties) == 0:
                     continue
 
                 extension = _define_for_enumeration(enumeration=symbol)
 
             elif isinstance(symbol, intermediate.ConstrainedPrimitive):
-                if id(symbol) not in ids_of_symbols_in_properties:
+                if len(symbol_table.references_to(symbol).properties) == 0:
                     continue
 
-                extension, definition_errors = _define_for_constrained_primitive(
+                extension = _define_for_constrained_primitive(
                     constrained_primitive=symbol,
-                    pattern_verifications_by_name=pattern_verifications_by_name,
+                    constraint_index=constraint_index,
                 )
 
-                if definition_errors is not None:
-                    errors.extend(definition_errors)
-                    continue
-
             elif isinstance(symbol, intermediate.Class):
                 extension, definition_errors = _define_for_class(
                     cls=symbol,
-                    ids_of_classes_in_properties=ids_of_symbols_in_properties,
-                    pattern_verifications_by_name=pattern_verifications_by_name,
+                    references=symbol_table.references_to(symbol),
+                    constraint_index=constraint_index,
                 )
 
                 if definition_errors is not None:
@@ -675,7 +636,7 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
 
     pth = context.output_dir / "schema.json"
     try:
-        pth.write_text(code, encoding="utf-8")
+        digest = run.write_text(path=pth, text=code)
     except Exception as exception:
         run.write_error_report(
             message=f"Failed to write the JSON schema to {pth}",
@@ -684,5 +645,17 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
         )
         return 1
 
+    try:
+        run.write_manifest(
+            context=context, target="jsonschema", hashes={pth.name: digest}
+        )
+    except Exception as exception:
+        run.write_error_report(
+            message=f"Failed to write the manifest to {context.output_dir}",
+            errors=[str(exception)],
+            stderr=stderr,
+        )
+        return 1
+
     stdout.write(f"Code generated to: {context.output_dir}\n")
     return 0
@@ -2,16 +2,17 @@
 
 import argparse
 import enum
+import importlib
 import pathlib
 import sys
-from typing import TextIO
+import types
+from typing import TextIO, Mapping, Optional, Callable
 
 import aas_core_codegen
-from aas_core_codegen import parse, run, specific_implementations, intermediate
-from aas_core_codegen.common import LinenoColumner, assert_never
-import aas_core_codegen.csharp.main as csharp_main
-import aas_core_codegen.jsonschema.main as jsonschema_main
-import aas_core_codegen.rdf_shacl.main as rdf_shacl_main
+from aas_core_codegen.csharp import (
+    layout as csharp_layout,
+    regex_mode as csharp_regex_mode,
+)
 
 assert aas_core_codegen.__doc__ == __doc__
 
@@ -24,6 +25,24 @@ class Target(enum.Enum):
     RDF_SHACL = "rdf_shacl"
 
 
+#: Map the targets to the modules of their backends.
+#:
+#: The backends are imported only once their target is selected so that we do not
+#: pay for loading all the generators on every start-up.
+BACKEND_MODULES = {
+    Target.CSHARP: "aas_core_codegen.csharp.main",
+    Target.JSONSCHEMA: "aas_core_codegen.jsonschema.main",
+    Target.RDF_SHACL: "aas_core_codegen.rdf_shacl.main",
+}  # type: Mapping[Target, str]
+
+assert all(target in BACKEND_MODULES for target in Target)
+
+
+def load_backend(target: Target) -> types.ModuleType:
+    """Import the module of the backend for the ``target``."""
+    return importlib.import_module(BACKEND_MODULES[target])
+
+
 class Parameters:
     """Represent the program parameters."""
 
@@ -33,17 +52,33 @@ class Parameters:
         target: Target,
         snippets_dir: pathlib.Path,
         output_dir: pathlib.Path,
+        csharp_layout: csharp_layout.Layout = csharp_layout.Layout.SINGLE_FILE,
+        csharp_regex_mode: csharp_regex_mode.RegexMode = (
+            csharp_regex_mode.RegexMode.INTERPRETED
+        ),
+        csharp_regex_timeout_ms: Optional[int] = None,
+        check_patterns: bool = False,
     ) -> None:
         """Initialize with the given values."""
         self.model_path = model_path
         self.target = target
         self.snippets_dir = snippets_dir
         self.output_dir = output_dir
+        self.csharp_layout = csharp_layout
+        self.csharp_regex_mode = csharp_regex_mode
+        self.csharp_regex_timeout_ms = csharp_regex_timeout_ms
+        self.check_patterns = check_patterns
 
 
 # noinspection SpellCheckingInspection
 def execute(params: Parameters, stdout: TextIO, stderr: TextIO) -> int:
     """Run the program."""
+    # We import the modules for parsing and translating the meta-model here so
+    # that the options such as ``--version`` and ``--help`` start up fast.
+    # pylint: disable=import-outside-toplevel
+    from aas_core_codegen import parse, run, specific_implementations, intermediate
+    from aas_core_codegen.common import LinenoColumner
+
     # region Basic checks
     # BEFORE-RELEASE (mristin, 2021-12-13): test this failure case
     if not params.model_path.exists():
@@ -161,6 +196,19 @@ def execute(params: Parameters, stdout: TextIO, stderr: TextIO) -> int:
 
     assert ir_symbol_table is not None
 
+    if params.check_patterns:
+        errors = intermediate.errors_if_patterns_prone_to_catastrophic_backtracking(
+            symbol_table=ir_symbol_table
+        )
+        if errors is not None:
+            run.write_error_report(
+                message=f"The patterns in {params.model_path} failed the check",
+                errors=[lineno_columner.error_message(error) for error in errors],
+                stderr=stderr,
+            )
+
+            return 1
+
     # endregion
 
     # region Dispatch
@@ -173,25 +221,23 @@ def execute(params: Parameters, stdout: TextIO, stderr: TextIO) -> int:
         output_dir=params.output_dir,
     )
 
-    if params.target is Target.CSHARP:
-        return csharp_main.execute(context=run_context, stdout=stdout, stderr=stderr)
+    # The backends are loaded dynamically, so we need to spell out the signature.
+    execute_backend = load_backend(params.target).execute  # type: Callable[..., int]
 
-    elif params.target is Target.JSONSCHEMA:
-        return jsonschema_main.execute(
-            context=run_context, stdout=stdout, stderr=stderr
+    if params.target is Target.CSHARP:
+        return execute_backend(
+            context=run_context,
+            stdout=stdout,
+            stderr=stderr,
+            layout=params.csharp_layout,
+            regex_mode=params.csharp_regex_mode,
+            regex_timeout_ms=params.csharp_regex_timeout_ms,
         )
 
-    elif params.target is Target.RDF_SHACL:
-        return rdf_shacl_main.execute(context=run_context, stdout=stdout, stderr=stderr)
-
-    else:
-        assert_never(params.target)
+    return execute_backend(context=run_context, stdout=stdout, stderr=stderr)
 
     # endregion
 
-    stdout.write(f"Code generated to: {params.output_dir}\n")
-    return 0
-
 
 def main(prog: str) -> int:
     """
@@ -216,9 +262,50 @@ def main(prog: str) -> int:
         required=True,
         choices=[literal.value for literal in Target],
     )
+    parser.add_argument(
+        "--csharp_layout",
+        help=(
+            "layout of the generated C# code: everything in a few files, "
+            "or one file per symbol (only for the csharp target)"
+        ),
+        default=csharp_layout.Layout.SINGLE_FILE.value,
+        choices=[literal.value for literal in csharp_layout.Layout],
+    )
+    parser.add_argument(
+        "--csharp_regex",
+        help=(
+            "how the generated C# code constructs the regular expressions: "
+            "interpreted, compiled to IL at run time, or generated at build time "
+            "with [GeneratedRegex] (requires .NET 7 or later; only for "
+            "the csharp target)"
+        ),
+        default=csharp_regex_mode.RegexMode.INTERPRETED.value,
+        choices=[literal.value for literal in csharp_regex_mode.RegexMode],
+    )
+    parser.add_argument(
+        "--csharp_regex_timeout_ms",
+        help=(
+            "if set, the generated C# code limits the matching of a regular "
+            "expression to this many milliseconds (only for the csharp target)"
+        ),
+        type=int,
+    )
+    parser.add_argument(
+        "--check_patterns",
+        help=(
+            "fail if a pattern of the verification functions is prone to "
+            "catastrophic backtracking or can not be analyzed"
+        ),
+        action="store_true",
+    )
     parser.add_argument(
         "--version", help="show the current version and exit", action="store_true"
     )
+    parser.add_argument(
+        "--self_check",
+        help="check the internal consistency of the generator and exit",
+        action="store_true",
+    )
 
     # NOTE (mristin, 2022-01-14):
     # The module ``argparse`` is not flexible enough to understand special options such
@@ -227,15 +314,42 @@ def main(prog: str) -> int:
         print(aas_core_codegen.__version__)
         return 1
 
+    if "--self_check" in sys.argv and "--help" not in sys.argv:
+        # pylint: disable=import-outside-toplevel
+        from aas_core_codegen import self_check
+
+        failures = self_check.run()
+        if len(failures) > 0:
+            for failure in failures:
+                print(failure, file=sys.stderr)
+            return 1
+
+        print("The self-check passed.")
+        return 0
+
     args = parser.parse_args()
 
+    if args.csharp_regex_timeout_ms is not None and args.csharp_regex_timeout_ms <= 0:
+        parser.error(
+            f"Expected a positive --csharp_regex_timeout_ms, "
+            f"but got: {args.csharp_regex_timeout_ms}"
+        )
+
     target_to_str = {literal.value: literal for literal in Target}
+    csharp_layout_to_str = {literal.value: literal for literal in csharp_layout.Layout}
+    csharp_regex_mode_to_str = {
+        literal.value: literal for literal in csharp_regex_mode.RegexMode
+    }
 
     params = Parameters(
         model_path=pathlib.Path(args.model_path),
         target=target_to_str[args.target],
         snippets_dir=pathlib.Path(args.snippets_dir),
         output_dir=pathlib.Path(args.output_dir),
+        csharp_layout=csharp_layout_to_str[args.csharp_layout],
+        csharp_regex_mode=csharp_regex_mode_to_str[args.csharp_regex],
+        csharp_regex_timeout_ms=args.csharp_regex_timeout_ms,
+        check_patterns=args.check_patterns,
     )
 
     return execute(params=params, stdout=sys.stdout, stderr=sys.stderr)
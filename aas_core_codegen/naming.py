@@ -1,4 +1,5 @@
 """Generate names from our ``Pasal_case`` for the respective targets."""
+import functools
 from typing import List
 
 from icontract import ensure
@@ -8,6 +9,7 @@ from aas_core_codegen.common import Identifier
 UPPERCASE_ABBREVIATION_SET = {"IRI", "IRDI", "IEC", "URL"}
 
 
+@functools.lru_cache(maxsize=None)
 def json_property(identifier: Identifier) -> Identifier:
     """
     Generate a JSON name of a property based on its meta-model ``identifier``.
@@ -36,6 +38,7 @@ def json_property(identifier: Identifier) -> Identifier:
     return Identifier("".join(cased_parts))
 
 
+@functools.lru_cache(maxsize=None)
 # fmt: off
 @ensure(
     lambda result: "_" not in result
@@ -63,6 +66,7 @@ def json_model_type(identifier: Identifier) -> Identifier:
     return Identifier("".join(cased_parts))
 
 
+@functools.lru_cache(maxsize=None)
 def xml_class_name(identifier: Identifier) -> Identifier:
     """
     Generate the XML tag name for the given class based on its ``identifier``.
@@ -89,6 +93,7 @@ def xml_class_name(identifier: Identifier) -> Identifier:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def xml_property(identifier: Identifier) -> Identifier:
     """
     Generate the XML name for the given property based on its ``identifier``.
@@ -449,9 +449,6 @@ def _assert_chains_follow_file_structure() -> None:
     ), f"{expected_parse_names=} != {parse_names_in_chain=}"
 
 
-_assert_chains_follow_file_structure()
-
-
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
 def ast_node_to_our_node(node: ast.AST) -> Tuple[Optional[tree.Node], Optional[Error]]:
     """
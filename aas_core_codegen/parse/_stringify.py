@@ -2,7 +2,6 @@
 from typing import Optional, Union
 
 from aas_core_codegen import stringify
-from aas_core_codegen.parse import _types
 from aas_core_codegen.parse import tree
 from aas_core_codegen.parse._types import (
     AbstractClass,
@@ -413,10 +412,6 @@ Dumpable = Union[
     UnverifiedSymbolTable,
 ]
 
-stringify.assert_all_public_types_listed_as_dumpables(
-    dumpable=Dumpable, types_module=_types
-)
-
 _DISPATCH = {
     AbstractClass: _stringify_abstract_class,
     Argument: _stringify_argument,
@@ -442,8 +437,6 @@ _DISPATCH = {
     UnverifiedSymbolTable: _stringify_unverified_symbol_table,
 }
 
-stringify.assert_dispatch_exhaustive(dispatch=_DISPATCH, dumpable=Dumpable)
-
 
 def _stringify(that: Optional[Dumpable]) -> Optional[stringify.Entity]:
     """Dispatch to the correct ``_stringify_*`` method."""
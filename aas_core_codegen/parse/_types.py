@@ -8,7 +8,7 @@ from typing import Sequence, Optional, Union, Final, Mapping
 import docutils.nodes
 from icontract import require, DBC, ensure, invariant
 
-from aas_core_codegen.common import Identifier, assert_union_of_descendants_exhaustive
+from aas_core_codegen.common import Identifier
 from aas_core_codegen.parse import tree
 
 _MODULE_NAME = pathlib.Path(os.path.realpath(__file__)).parent.name
@@ -799,11 +799,8 @@ class SymbolTable(UnverifiedSymbolTable):
 
 
 ClassUnion = Union[AbstractClass, ConcreteClass]
-assert_union_of_descendants_exhaustive(union=ClassUnion, base_class=Class)
 
 FunctionUnion = Union[UnderstoodMethod, ImplementationSpecificMethod]
 MethodUnion = Union[
     UnderstoodMethod, ImplementationSpecificMethod, ConstructorToBeUnderstood
 ]
-
-assert_union_of_descendants_exhaustive(union=MethodUnion, base_class=Method)
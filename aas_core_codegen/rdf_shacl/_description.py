@@ -4,7 +4,7 @@ from typing import Optional, List, Tuple, Sequence, cast, Union
 import docutils.nodes
 from icontract import ensure
 
-from aas_core_codegen.common import assert_never, assert_union_of_descendants_exhaustive
+from aas_core_codegen.common import assert_never
 from aas_core_codegen.intermediate import (
     doc as intermediate_doc,
     rendering as intermediate_rendering,
@@ -277,4 +277,3 @@ class Renderer(intermediate_rendering.DocutilsElementTransformer[List["TokenUnio
 
 
 TokenUnion = Union[TokenText, TokenParagraphBreak, TokenLineBreak]
-assert_union_of_descendants_exhaustive(union=TokenUnion, base_class=Token)
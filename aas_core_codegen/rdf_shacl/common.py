@@ -8,7 +8,6 @@ from aas_core_codegen.rdf_shacl import naming as rdf_shacl_naming
 from aas_core_codegen.common import (
     Stripped,
     Error,
-    assert_union_without_excluded,
     assert_never,
 )
 
@@ -134,12 +133,6 @@ TypeAnnotationExceptOptional = Union[
     intermediate.ListTypeAnnotation,
 ]
 
-assert_union_without_excluded(
-    original_union=intermediate.TypeAnnotationUnion,
-    subset_union=TypeAnnotationExceptOptional,
-    excluded=[intermediate.OptionalTypeAnnotation],
-)
-
 
 def beneath_optional(
     type_annotation: intermediate.TypeAnnotationUnion,
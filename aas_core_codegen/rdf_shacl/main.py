@@ -1,7 +1,7 @@
 """Generate the RDF ontology and the SHACL schema corresponding to the meta-model."""
 
 import pathlib
-from typing import TextIO
+from typing import TextIO, Dict
 
 import aas_core_codegen
 import aas_core_codegen.rdf_shacl.rdf
@@ -55,9 +55,11 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
 
     # endregion
 
+    hashes = dict()  # type: Dict[str, str]
+
     # region RDF ontology
 
-    rdf_code, errors = aas_core_codegen.rdf_shacl.rdf.generate(
+    rdf_code_chunks, errors = aas_core_codegen.rdf_shacl.rdf.generate_chunks(
         symbol_table=context.symbol_table,
         class_to_rdfs_range=class_to_rdfs_range,
         spec_impls=context.spec_impls,
@@ -73,11 +75,11 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
         )
         return 1
 
-    assert rdf_code is not None
+    assert rdf_code_chunks is not None
 
     pth = context.output_dir / "rdf-ontology.ttl"
     try:
-        pth.write_text(rdf_code, encoding="utf-8")
+        hashes[pth.name] = run.write_chunks(path=pth, chunks=rdf_code_chunks)
     except Exception as exception:
         run.write_error_report(
             message=f"Failed to write the RDF ontology to {pth}",
@@ -90,7 +92,7 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
 
     # region SHACL schema
 
-    shacl_code, errors = aas_core_codegen.rdf_shacl.shacl.generate(
+    shacl_code_chunks, errors = aas_core_codegen.rdf_shacl.shacl.generate_chunks(
         symbol_table=context.symbol_table,
         class_to_rdfs_range=class_to_rdfs_range,
         spec_impls=context.spec_impls,
@@ -106,11 +108,11 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
         )
         return 1
 
-    assert shacl_code is not None
+    assert shacl_code_chunks is not None
 
     pth = context.output_dir / "shacl-schema.ttl"
     try:
-        pth.write_text(shacl_code, encoding="utf-8")
+        hashes[pth.name] = run.write_chunks(path=pth, chunks=shacl_code_chunks)
     except Exception as exception:
         run.write_error_report(
             message=f"Failed to write the SHACL schema to {pth}",
@@ -121,5 +123,15 @@ def execute(context: run.Context, stdout: TextIO, stderr: TextIO) -> int:
 
     # endregion
 
+    try:
+        run.write_manifest(context=context, target="rdf_shacl", hashes=hashes)
+    except Exception as exception:
+        run.write_error_report(
+            message=f"Failed to write the manifest to {context.output_dir}",
+            errors=[str(exception)],
+            stderr=stderr,
+        )
+        return 1
+
     stdout.write(f"Code generated to: {context.output_dir}\n")
     return 0
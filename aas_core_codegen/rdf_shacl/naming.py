@@ -1,10 +1,12 @@
 """Generate RDF and SHACL identifiers based on the identifiers from the meta-model."""
+import functools
 from typing import List
 
 from aas_core_codegen.common import Identifier, Stripped
 from aas_core_codegen import naming
 
 
+@functools.lru_cache(maxsize=None)
 def class_name(identifier: Identifier) -> Identifier:
     """
     Generate the class name from the intermediate class ``identifier``.
@@ -30,6 +32,7 @@ def class_name(identifier: Identifier) -> Identifier:
 _LOWERCASE_WORDS_IN_LABEL = {"to", "in"}
 
 
+@functools.lru_cache(maxsize=None)
 def class_label(identifier: Identifier) -> Stripped:
     """
     Generate the class label from the intermediate class ``identifier``.
@@ -54,6 +57,7 @@ def class_label(identifier: Identifier) -> Stripped:
     return Stripped(" ".join(cased))
 
 
+@functools.lru_cache(maxsize=None)
 def property_name(identifier: Identifier) -> Identifier:
     """
     Generate a property name based on its meta-model ``identifier``.
@@ -79,6 +83,7 @@ def property_name(identifier: Identifier) -> Identifier:
     return Identifier("".join(cased))
 
 
+@functools.lru_cache(maxsize=None)
 def property_label(identifier: Identifier) -> Stripped:
     """
     Generate the property label from the intermediate class ``identifier``.
@@ -101,6 +106,7 @@ def property_label(identifier: Identifier) -> Stripped:
     return Stripped(" ".join(cased))
 
 
+@functools.lru_cache(maxsize=None)
 def enumeration_literal(identifier: Identifier) -> Stripped:
     """
     Generate the enumeration literal for its intermediate ``identifier``.
@@ -115,6 +121,7 @@ def enumeration_literal(identifier: Identifier) -> Stripped:
     return Stripped("".join(part.capitalize() for part in parts))
 
 
+@functools.lru_cache(maxsize=None)
 def enumeration_literal_label(identifier: Identifier) -> Stripped:
     """
     Generate the label for an enumeration literal with intermediate ``identifier``.
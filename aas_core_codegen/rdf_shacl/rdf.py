@@ -1,12 +1,18 @@
 """Generate the RDF ontology based on the meta-model."""
 import io
 import textwrap
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Iterator
 
 from icontract import ensure, require
 
 from aas_core_codegen import intermediate, specific_implementations
-from aas_core_codegen.common import Stripped, Error, assert_never, Identifier
+from aas_core_codegen.common import (
+    Stripped,
+    Error,
+    assert_never,
+    Identifier,
+    CodeWriter,
+)
 from aas_core_codegen.rdf_shacl import (
     naming as rdf_shacl_naming,
     common as rdf_shacl_common,
@@ -317,13 +323,17 @@ def _define_for_class(
 
 
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def generate(
+def generate_chunks(
     symbol_table: intermediate.SymbolTable,
     class_to_rdfs_range: rdf_shacl_common.ClassToRdfsRange,
     spec_impls: specific_implementations.SpecificImplementations,
     url_prefix: Stripped,
-) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
-    """Generate the RDF ontology based on the ``symbol_table."""
+) -> Tuple[Optional[Iterator[str]], Optional[List[Error]]]:
+    """
+    Generate the RDF ontology in chunks based on the ``symbol_table``.
+
+    The chunks are meant to be streamed, *e.g.*, to a file, without joining them.
+    """
     errors = []  # type: List[Error]
 
     preamble_key = specific_implementations.ImplementationKey("rdf/preamble.ttl")
@@ -403,4 +413,32 @@ def generate(
     if len(errors) > 0:
         return None, errors
 
-    return Stripped("\n\n".join(blocks)), None
+    out = CodeWriter()
+    for i, block in enumerate(blocks):
+        if i > 0:
+            out.write("\n\n")
+
+        out.write(block)
+
+    return out.chunks(), None
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def generate(
+    symbol_table: intermediate.SymbolTable,
+    class_to_rdfs_range: rdf_shacl_common.ClassToRdfsRange,
+    spec_impls: specific_implementations.SpecificImplementations,
+    url_prefix: Stripped,
+) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
+    """Generate the RDF ontology based on the ``symbol_table``."""
+    chunks, errors = generate_chunks(
+        symbol_table=symbol_table,
+        class_to_rdfs_range=class_to_rdfs_range,
+        spec_impls=spec_impls,
+        url_prefix=url_prefix,
+    )
+    if errors is not None:
+        return None, errors
+
+    assert chunks is not None
+    return Stripped("".join(chunks)), None
@@ -1,12 +1,17 @@
 """Generate the SHACL schema based on the meta-model."""
-import io
 import textwrap
-from typing import Tuple, Optional, List, Mapping, MutableMapping
+from typing import Tuple, Optional, List, Iterator
 
 from icontract import ensure, require
 
 from aas_core_codegen import intermediate, specific_implementations, infer_for_schema
-from aas_core_codegen.common import Stripped, Error, assert_never, Identifier
+from aas_core_codegen.common import (
+    Stripped,
+    Error,
+    assert_never,
+    Identifier,
+    CodeWriter,
+)
 from aas_core_codegen.rdf_shacl import (
     naming as rdf_shacl_naming,
     common as rdf_shacl_common,
@@ -21,18 +26,7 @@ def _define_property_shape(
     cls: intermediate.ClassUnion,
     url_prefix: Stripped,
     class_to_rdfs_range: rdf_shacl_common.ClassToRdfsRange,
-    len_constraints_by_property: Mapping[
-        intermediate.Property, infer_for_schema.LenConstraint
-    ],
-    pattern_constraints_by_property: Mapping[
-        intermediate.Property, List[infer_for_schema.PatternConstraint]
-    ],
-    len_constraints_by_constrained_primitive: Mapping[
-        intermediate.ConstrainedPrimitive, infer_for_schema.LenConstraint
-    ],
-    pattern_constraints_by_constrained_primitive: Mapping[
-        intermediate.ConstrainedPrimitive, List[infer_for_schema.PatternConstraint]
-    ],
+    constraint_index: infer_for_schema.ConstraintIndex,
 ) -> Tuple[Optional[Stripped], Optional[Error]]:
     """Generate the shape of a property ``prop`` of the intermediate ``symbol``."""
 
@@ -87,7 +81,7 @@ def _define_property_shape(
     min_length = None  # type: Optional[int]
     max_length = None  # type: Optional[int]
 
-    len_constraint = len_constraints_by_property.get(prop, None)
+    len_constraint = constraint_index.len_constraints_by_property(cls).get(prop, None)
 
     if len_constraint is not None:
         if isinstance(type_anno, intermediate.ListTypeAnnotation):
@@ -150,7 +144,10 @@ def _define_property_shape(
             or type_anno.symbol.constrainee is intermediate.PrimitiveType.BYTEARRAY
         )
     ):
-        len_constraint = len_constraints_by_constrained_primitive[type_anno.symbol]
+        len_constraint = constraint_index.stacked_len_constraint_of_self(
+            type_anno.symbol
+        )
+        assert len_constraint is not None
 
         if len_constraint.min_value is not None:
             min_length = (
@@ -182,7 +179,9 @@ def _define_property_shape(
 
     # region Define patterns
 
-    pattern_constraints = pattern_constraints_by_property.get(prop, [])
+    # We copy the constraints as we extend them below, while the constraint index
+    # is shared.
+    pattern_constraints = list(constraint_index.patterns_by_property(cls).get(prop, []))
 
     # NOTE (mristin, 2022-02-11):
     # We in-line here the constrained primitives as we do not want to introduce
@@ -193,7 +192,7 @@ def _define_property_shape(
         and (type_anno.symbol.constrainee is intermediate.PrimitiveType.STR)
     ):
         pattern_constraints.extend(
-            pattern_constraints_by_constrained_primitive.get(type_anno.symbol, [])
+            constraint_index.stacked_patterns_on_self(type_anno.symbol)
         )
 
     for pattern_constraint in pattern_constraints:
@@ -203,11 +202,12 @@ def _define_property_shape(
 
     # endregion
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write("sh:property [")
-    for stmt in stmts:
-        writer.write("\n")
-        writer.write(textwrap.indent(stmt, I))
+    with writer.indent(I):
+        for stmt in stmts:
+            writer.write("\n")
+            writer.write(stmt)
 
     writer.write("\n] ;")
 
@@ -225,49 +225,19 @@ def _define_for_class(
     cls: intermediate.ClassUnion,
     class_to_rdfs_range: rdf_shacl_common.ClassToRdfsRange,
     url_prefix: Stripped,
-    pattern_verifications_by_name: infer_for_schema.PatternVerificationsByName,
-    len_constraints_by_constrained_primitive: Mapping[
-        intermediate.ConstrainedPrimitive, infer_for_schema.LenConstraint
-    ],
-    pattern_constraints_by_constrained_primitive: Mapping[
-        intermediate.ConstrainedPrimitive, List[infer_for_schema.PatternConstraint]
-    ],
+    constraint_index: infer_for_schema.ConstraintIndex,
 ) -> Tuple[Optional[Stripped], Optional[Error]]:
     """Generate the definition for the class ``cls``."""
     prop_blocks = []  # type: List[Stripped]
     errors = []  # type: List[Error]
 
-    (
-        len_constraints_by_property,
-        len_constraints_errors,
-    ) = infer_for_schema.infer_len_constraints_by_class_properties(cls=cls)
-
-    if len_constraints_errors is not None:
-        errors.extend(len_constraints_errors)
-
-    pattern_constraints_by_property = (
-        infer_for_schema.infer_patterns_by_class_properties(
-            cls=cls, pattern_verifications_by_name=pattern_verifications_by_name
-        )
-    )
-
-    if len(errors) > 0:
-        return None, Error(
-            cls.parsed.node, f"Failed to infer the constraints for {cls.name}"
-        )
-
-    assert len_constraints_by_property is not None
-
     for prop in cls.properties:
         prop_block, error = _define_property_shape(
             prop=prop,
             cls=cls,
             url_prefix=url_prefix,
             class_to_rdfs_range=class_to_rdfs_range,
-            len_constraints_by_property=len_constraints_by_property,
-            pattern_constraints_by_property=pattern_constraints_by_property,
-            len_constraints_by_constrained_primitive=len_constraints_by_constrained_primitive,
-            pattern_constraints_by_constrained_primitive=pattern_constraints_by_constrained_primitive,
+            constraint_index=constraint_index,
         )
 
         if error is not None:
@@ -284,7 +254,7 @@ def _define_for_class(
     shape_name = rdf_shacl_naming.class_name(Identifier(cls.name + "_shape"))
     cls_name = rdf_shacl_naming.class_name(cls.name)
 
-    writer = io.StringIO()
+    writer = CodeWriter()
     writer.write(
         textwrap.dedent(
             f"""\
@@ -297,9 +267,10 @@ def _define_for_class(
         subclass_name = rdf_shacl_naming.class_name(inheritance.name)
         writer.write(f"\n{I}rdfs:subClassOf {subclass_name} ;")
 
-    for block in prop_blocks:
-        writer.write("\n")
-        writer.write(textwrap.indent(block, I))
+    with writer.indent(I):
+        for block in prop_blocks:
+            writer.write("\n")
+            writer.write(block)
 
     writer.write("\n.")
 
@@ -307,149 +278,17 @@ def _define_for_class(
 
 
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def _infer_len_constraints_by_constrained_primitive(
-    symbol_table: intermediate.SymbolTable,
-) -> Tuple[
-    Optional[
-        MutableMapping[
-            intermediate.ConstrainedPrimitive, infer_for_schema.LenConstraint
-        ]
-    ],
-    Optional[List[Error]],
-]:
-    """Infer the constraints on ``len(.)`` of the constrained primitives."""
-
-    # NOTE (mristin, 2022-02-11):
-    # We do this inference in two passes. In the first pass, we only infer
-    # the constraints defined for the constrained primitive and ignore the ancestors.
-    # In the second pass, we stack the constraints of the ancestors as well.
-
-    errors = []  # type: List[Error]
-
-    first_pass: MutableMapping[
-        intermediate.ConstrainedPrimitive, infer_for_schema.LenConstraint
-    ] = dict()
-
-    for symbol in symbol_table.symbols:
-        if isinstance(symbol, intermediate.ConstrainedPrimitive):
-            (
-                len_constraint,
-                len_constraint_errors,
-            ) = infer_for_schema.infer_len_constraint_of_self(
-                constrained_primitive=symbol
-            )
-
-            if len_constraint_errors is not None:
-                errors.extend(len_constraint_errors)
-            else:
-                assert len_constraint is not None
-
-                first_pass[symbol] = len_constraint
-
-    if len(errors) > 0:
-        return None, errors
-
-    second_pass: MutableMapping[
-        intermediate.ConstrainedPrimitive, infer_for_schema.LenConstraint
-    ] = dict()
-
-    for symbol in symbol_table.symbols_topologically_sorted:
-        if isinstance(symbol, intermediate.ConstrainedPrimitive):
-            # NOTE (mristin, 2022-02-11):
-            # We make the copy in order to avoid bugs when we start processing
-            # the inheritances.
-            len_constraint = first_pass[symbol].copy()
-
-            for inheritance in symbol.inheritances:
-                inherited_len_constraint = second_pass.get(inheritance, None)
-                assert (
-                    inherited_len_constraint is not None
-                ), "Expected topological order"
-
-                if inherited_len_constraint.min_value is not None:
-                    len_constraint.min_value = (
-                        max(
-                            len_constraint.min_value, inherited_len_constraint.min_value
-                        )
-                        if len_constraint.min_value is not None
-                        else inherited_len_constraint.min_value
-                    )
-
-                if inherited_len_constraint.max_value is not None:
-                    len_constraint.max_value = (
-                        min(
-                            len_constraint.max_value, inherited_len_constraint.max_value
-                        )
-                        if len_constraint.max_value is not None
-                        else inherited_len_constraint.max_value
-                    )
-
-            second_pass[symbol] = len_constraint
-
-    assert len(errors) == 0
-    return second_pass, None
-
-
-def _infer_pattern_constraints_by_constrained_primitive(
-    symbol_table: intermediate.SymbolTable,
-    pattern_verifications_by_name: infer_for_schema.PatternVerificationsByName,
-) -> MutableMapping[
-    intermediate.ConstrainedPrimitive, List[infer_for_schema.PatternConstraint]
-]:
-    """Infer the pattern constraints of the constrained strings."""
-
-    # NOTE (mristin, 2022-02-11):
-    # We do this inference in two passes. In the first pass, we only infer
-    # the constraints defined for the constrained primitive and ignore the ancestors.
-    # In the second pass, we stack the constraints of the ancestors as well.
-
-    first_pass: MutableMapping[
-        intermediate.ConstrainedPrimitive, List[infer_for_schema.PatternConstraint]
-    ] = dict()
-
-    for symbol in symbol_table.symbols:
-        if isinstance(symbol, intermediate.ConstrainedPrimitive):
-            pattern_constraints = infer_for_schema.infer_patterns_on_self(
-                constrained_primitive=symbol,
-                pattern_verifications_by_name=pattern_verifications_by_name,
-            )
-
-            first_pass[symbol] = pattern_constraints
-
-    second_pass: MutableMapping[
-        intermediate.ConstrainedPrimitive, List[infer_for_schema.PatternConstraint]
-    ] = dict()
-
-    for symbol in symbol_table.symbols_topologically_sorted:
-        if isinstance(symbol, intermediate.ConstrainedPrimitive):
-            # NOTE (mristin, 2022-02-11):
-            # We make the copy in order to avoid bugs when we start processing
-            # the inheritances.
-            pattern_constraints = first_pass[symbol][:]
-
-            for inheritance in symbol.inheritances:
-                inherited_pattern_constraints = second_pass.get(inheritance, None)
-                assert (
-                    inherited_pattern_constraints is not None
-                ), "Expected topological order"
-
-                pattern_constraints = (
-                    inherited_pattern_constraints + pattern_constraints
-                )
-
-            second_pass[symbol] = pattern_constraints
-
-    return second_pass
-
-
-@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
-def generate(
+def generate_chunks(
     symbol_table: intermediate.SymbolTable,
     class_to_rdfs_range: rdf_shacl_common.ClassToRdfsRange,
     spec_impls: specific_implementations.SpecificImplementations,
     url_prefix: Stripped,
-) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
-    """Generate the SHACL schema based on the ``symbol_table."""
+) -> Tuple[Optional[Iterator[str]], Optional[List[Error]]]:
+    """
+    Generate the SHACL schema in chunks based on the ``symbol_table``.
+
+    The chunks are meant to be streamed, *e.g.*, to a file, without joining them.
+    """
     errors = []  # type: List[Error]
 
     preamble_key = specific_implementations.ImplementationKey("shacl/preamble.ttl")
@@ -470,28 +309,13 @@ def generate(
     assert preamble is not None
     blocks = [preamble]  # type: List[Stripped]
 
-    pattern_verifications_by_name = infer_for_schema.map_pattern_verifications_by_name(
-        verifications=symbol_table.verification_functions
+    constraint_index, constraint_index_errors = infer_for_schema.build_constraint_index(
+        symbol_table=symbol_table
     )
+    if constraint_index_errors is not None:
+        return None, constraint_index_errors
 
-    (
-        len_constraints_by_constrained_primitive,
-        some_errors,
-    ) = _infer_len_constraints_by_constrained_primitive(symbol_table=symbol_table)
-    if some_errors is not None:
-        errors.extend(some_errors)
-
-    if len(errors) > 0:
-        return None, errors
-
-    assert len_constraints_by_constrained_primitive is not None
-
-    pattern_constraints_by_constrained_primitive = (
-        _infer_pattern_constraints_by_constrained_primitive(
-            symbol_table=symbol_table,
-            pattern_verifications_by_name=pattern_verifications_by_name,
-        )
-    )
+    assert constraint_index is not None
 
     for symbol in symbol_table.symbols:
         # noinspection PyUnusedLocal
@@ -533,13 +357,7 @@ def generate(
                     cls=symbol,
                     class_to_rdfs_range=class_to_rdfs_range,
                     url_prefix=url_prefix,
-                    pattern_verifications_by_name=pattern_verifications_by_name,
-                    len_constraints_by_constrained_primitive=(
-                        len_constraints_by_constrained_primitive
-                    ),
-                    pattern_constraints_by_constrained_primitive=(
-                        pattern_constraints_by_constrained_primitive
-                    ),
+                    constraint_index=constraint_index,
                 )
 
                 if error is not None:
@@ -553,4 +371,32 @@ def generate(
     if len(errors) > 0:
         return None, errors
 
-    return Stripped("\n\n".join(blocks)), None
+    out = CodeWriter()
+    for i, block in enumerate(blocks):
+        if i > 0:
+            out.write("\n\n")
+
+        out.write(block)
+
+    return out.chunks(), None
+
+
+@ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
+def generate(
+    symbol_table: intermediate.SymbolTable,
+    class_to_rdfs_range: rdf_shacl_common.ClassToRdfsRange,
+    spec_impls: specific_implementations.SpecificImplementations,
+    url_prefix: Stripped,
+) -> Tuple[Optional[Stripped], Optional[List[Error]]]:
+    """Generate the SHACL schema based on the ``symbol_table``."""
+    chunks, errors = generate_chunks(
+        symbol_table=symbol_table,
+        class_to_rdfs_range=class_to_rdfs_range,
+        spec_impls=spec_impls,
+        url_prefix=url_prefix,
+    )
+    if errors is not None:
+        return None, errors
+
+    assert chunks is not None
+    return Stripped("".join(chunks)), None
@@ -1,10 +1,15 @@
 """Encapsulate the entry point to different generators."""
+import hashlib
+import json
+import os
 import pathlib
+import shutil
 import textwrap
-from typing import Sequence, TextIO
+from typing import Sequence, TextIO, Iterable, Mapping, Optional, BinaryIO
 
 from icontract import require
 
+import aas_core_codegen
 from aas_core_codegen import specific_implementations, intermediate
 from aas_core_codegen.common import LinenoColumner
 
@@ -18,7 +23,7 @@ class Context:
         self,
         model_path: pathlib.Path,
         symbol_table: intermediate.SymbolTable,
-        spec_impls: specific_implementations.SpecificImplementations,
+        spec_impls: specific_implementations.SnippetStore,
         lineno_columner: LinenoColumner,
         output_dir: pathlib.Path,
     ) -> None:
@@ -53,3 +58,208 @@ def write_error_report(message: str, errors: Sequence[str], stderr: TextIO) -> N
         indented = textwrap.indent(error, "  ")
         indented = "* " + indented[2:]
         stderr.write(f"{indented}\n")
+
+
+@require(lambda path: path.parent.exists() and path.parent.is_dir())
+def write_chunks(path: pathlib.Path, chunks: Iterable[str]) -> str:
+    """
+    Write the ``chunks`` of the generated code to ``path`` encoded as UTF-8.
+
+    The chunks are compared against the existing file as they are streamed, and
+    the file is only written if its content changed. Hence unchanged files keep
+    their modification times, and the build tools downstream do not rebuild them.
+
+    The changed content is written to a temporary file next to ``path``, which
+    then atomically replaces ``path``, so that an interrupted run never leaves
+    a half-written file behind. The mode of the existing file is preserved.
+
+    Return the SHA-256 hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+
+    existing = None  # type: Optional[BinaryIO]
+    try:
+        existing = path.open("rb")
+    except FileNotFoundError:
+        pass
+
+    tmp_pth = path.parent / f".{path.name}.{os.getpid()}.tmp"
+
+    # The number of bytes of the existing file equal to the content so far
+    matched = 0
+
+    tmp = None  # type: Optional[BinaryIO]
+    try:
+        for chunk in chunks:
+            if os.linesep != "\n":
+                chunk = chunk.replace("\n", os.linesep)
+
+            data = chunk.encode("utf-8")
+            digest.update(data)
+
+            if tmp is None and existing is not None:
+                if existing.read(len(data)) == data:
+                    matched += len(data)
+                    continue
+
+            if tmp is None:
+                tmp = tmp_pth.open("wb")
+
+                if existing is not None:
+                    existing.seek(0)
+                    tmp.write(existing.read(matched))
+
+            tmp.write(data)
+
+        if tmp is None and (existing is None or existing.read(1) != b""):
+            # The existing file is missing or longer than the content.
+            tmp = tmp_pth.open("wb")
+
+            if existing is not None:
+                existing.seek(0)
+                tmp.write(existing.read(matched))
+
+        existed = existing is not None
+        if existing is not None:
+            existing.close()
+            existing = None
+
+        if tmp is not None:
+            tmp.close()
+            tmp = None
+
+            if existed:
+                shutil.copymode(path, tmp_pth)
+
+            os.replace(tmp_pth, path)
+
+    except BaseException:
+        if tmp is not None:
+            tmp.close()
+
+        if tmp_pth.exists():
+            tmp_pth.unlink()
+
+        raise
+
+    finally:
+        if existing is not None:
+            existing.close()
+
+    return digest.hexdigest()
+
+
+@require(lambda path: path.parent.exists() and path.parent.is_dir())
+def write_text(path: pathlib.Path, text: str) -> str:
+    """
+    Write the generated ``text`` to ``path`` only if it changed.
+
+    See :py:func:`write_chunks` for details. Return the SHA-256 hex digest.
+    """
+    return write_chunks(path=path, chunks=[text])
+
+
+#: Name of the manifest file in the output directory
+MANIFEST_FILE_NAME = ".aas-core-codegen-manifest.json"
+
+
+def _remove_stale_files(
+    output_dir: pathlib.Path, target: str, hashes: Mapping[str, str]
+) -> None:
+    """
+    Remove the files listed in the previous manifest which are not in ``hashes``.
+
+    Only the files generated for the same ``target`` are removed. The files of the
+    other targets sharing the ``output_dir`` are left alone.
+
+    The directories left empty by the removal are removed as well. The paths which
+    point outside of the ``output_dir`` are ignored.
+    """
+    try:
+        previous = json.loads(
+            (output_dir / MANIFEST_FILE_NAME).read_text(encoding="utf-8")
+        )
+    except FileNotFoundError:
+        return
+
+    if previous.get("generator", dict()).get("target", None) != target:
+        return
+
+    previous_files = previous.get("files", dict())  # type: Mapping[str, str]
+
+    for relative in previous_files:
+        if relative in hashes:
+            continue
+
+        relative_pth = pathlib.PurePosixPath(relative)
+        if relative_pth.is_absolute() or ".." in relative_pth.parts:
+            continue
+
+        pth = output_dir.joinpath(*relative_pth.parts)
+        if pth.is_file():
+            pth.unlink()
+
+        directory = pth.parent
+        while directory != output_dir and directory.is_dir():
+            if any(directory.iterdir()):
+                break
+
+            directory.rmdir()
+            directory = directory.parent
+
+
+@require(
+    lambda hashes: all(not pathlib.PurePosixPath(pth).is_absolute() for pth in hashes)
+)
+def write_manifest(
+    context: Context,
+    target: str,
+    hashes: Mapping[str, str],
+    options: Optional[Mapping[str, str]] = None,
+) -> None:
+    """
+    Write the manifest of the generated files to the output directory.
+
+    The manifest records the ``target`` and the target-specific ``options``, such
+    as the layout of the C# code, which produced the files.
+
+    The ``hashes`` map the paths of the generated files, relative to the output
+    directory, to the SHA-256 hex digests of their content. The manifest lists
+    them together with the hashes of the inputs which produced them.
+
+    Only the snippets which have been accessed are listed as inputs. The unused
+    snippets are listed by their keys.
+
+    The files listed in the previous manifest of the same ``target``, but not
+    generated anymore, are removed so that, *e.g.*, a renamed class or a switch of
+    the layout does not leave stale code behind. The files of the other targets
+    are left alone.
+    """
+    _remove_stale_files(output_dir=context.output_dir, target=target, hashes=hashes)
+
+    snippets = {
+        str(key): hashlib.sha256(context.spec_impls[key].encode("utf-8")).hexdigest()
+        for key in context.spec_impls.accessed_keys()
+    }
+
+    manifest = {
+        "generator": {
+            "version": aas_core_codegen.__version__,
+            "target": target,
+            "options": dict(options) if options is not None else dict(),
+        },
+        "inputs": {
+            "model": {
+                "path": context.model_path.resolve().as_posix(),
+                "sha256": hashlib.sha256(context.model_path.read_bytes()).hexdigest(),
+            },
+            "snippets": snippets,
+        },
+        "unused_snippets": sorted(context.spec_impls.unused_keys()),
+        "files": dict(hashes),
+    }
+
+    write_text(
+        path=context.output_dir / MANIFEST_FILE_NAME,
+        text=json.dumps(manifest, indent=2, sort_keys=True) + "\n",
+    )
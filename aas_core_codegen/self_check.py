@@ -0,0 +1,200 @@
+"""
+Check the internal consistency of the code generator.
+
+The checks inspect the type unions, the dispatch tables and the maps of the
+generator with :py:mod:`inspect` and typing introspection. They are not run on
+import so that the production start-up does not pay for them. The test suite
+runs them, and you can run them on demand with ``aas-core-codegen --self_check``.
+"""
+# pylint: disable=protected-access
+from typing import Callable, List, Sequence, Tuple, get_args
+
+from aas_core_codegen import stringify
+from aas_core_codegen.common import (
+    assert_union_of_descendants_exhaustive,
+    assert_union_without_excluded,
+)
+from aas_core_codegen.csharp import common as csharp_common
+from aas_core_codegen.infer_for_schema import (
+    _len as infer_for_schema_len,
+    _stringify as infer_for_schema_stringify,
+)
+from aas_core_codegen.intermediate import (
+    _stringify as intermediate_stringify,
+    _types as intermediate_types,
+    construction as intermediate_construction,
+    type_inference as intermediate_type_inference,
+)
+from aas_core_codegen.parse import (
+    _rules as parse_rules,
+    _stringify as parse_stringify,
+    _types as parse_types,
+)
+from aas_core_codegen.rdf_shacl import (
+    _description as rdf_shacl_description,
+    common as rdf_shacl_common,
+)
+
+
+def _assert_function_type_annotation_union_as_tuple() -> None:
+    """Check that the tuple of function type annotations follows the union."""
+    assert intermediate_type_inference.FunctionTypeAnnotationUnionAsTuple == get_args(
+        intermediate_type_inference.FunctionTypeAnnotationUnion
+    )
+
+
+#: Self-checks given as (description, check) where the check raises
+#: an :py:class:`AssertionError` on inconsistency
+CHECKS = [
+    (
+        "parse: ClassUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=parse_types.ClassUnion, base_class=parse_types.Class
+        ),
+    ),
+    (
+        "parse: MethodUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=parse_types.MethodUnion, base_class=parse_types.Method
+        ),
+    ),
+    (
+        "parse: the chain of rules follows the file structure",
+        parse_rules._assert_chains_follow_file_structure,
+    ),
+    (
+        "parse: all public types are dumpable",
+        lambda: stringify.assert_all_public_types_listed_as_dumpables(
+            dumpable=parse_stringify.Dumpable, types_module=parse_types
+        ),
+    ),
+    (
+        "parse: stringification dispatch is exhaustive",
+        lambda: stringify.assert_dispatch_exhaustive(
+            dispatch=parse_stringify._DISPATCH, dumpable=parse_stringify.Dumpable
+        ),
+    ),
+    (
+        "intermediate: TypeAnnotationUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=intermediate_types.TypeAnnotationUnion,
+            base_class=intermediate_types.TypeAnnotation,
+        ),
+    ),
+    (
+        "intermediate: ClassUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=intermediate_types.ClassUnion, base_class=intermediate_types.Class
+        ),
+    ),
+    (
+        "intermediate: SymbolExceptEnumeration excludes only Enumeration",
+        lambda: assert_union_without_excluded(
+            original_union=intermediate_types.Symbol,
+            subset_union=intermediate_types.SymbolExceptEnumeration,
+            excluded=[intermediate_types.Enumeration],
+        ),
+    ),
+    (
+        "intermediate: VerificationUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=intermediate_types.VerificationUnion,
+            base_class=intermediate_types.Verification,
+        ),
+    ),
+    (
+        "intermediate: all public types are dumpable",
+        lambda: stringify.assert_all_public_types_listed_as_dumpables(
+            dumpable=intermediate_stringify.Dumpable, types_module=intermediate_types
+        ),
+    ),
+    (
+        "intermediate: stringification dispatch is exhaustive",
+        lambda: stringify.assert_dispatch_exhaustive(
+            dispatch=intermediate_stringify._DISPATCH,
+            dumpable=intermediate_stringify.Dumpable,
+        ),
+    ),
+    (
+        "intermediate: stringification dispatch of the construction is exhaustive",
+        lambda: stringify.assert_dispatch_exhaustive(
+            dispatch=intermediate_construction._DISPATCH,
+            dumpable=intermediate_construction.Dumpable,
+        ),
+    ),
+    (
+        "intermediate: DefaultUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=intermediate_construction.DefaultUnion,
+            base_class=intermediate_construction.Default,
+        ),
+    ),
+    (
+        "intermediate: TypeAnnotationUnion of the type inference is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=intermediate_type_inference.TypeAnnotationUnion,
+            base_class=intermediate_type_inference.TypeAnnotation,
+        ),
+    ),
+    (
+        "intermediate: FunctionTypeAnnotationUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=intermediate_type_inference.FunctionTypeAnnotationUnion,
+            base_class=intermediate_type_inference.FunctionTypeAnnotation,
+        ),
+    ),
+    (
+        "intermediate: FunctionTypeAnnotationUnionAsTuple follows the union",
+        _assert_function_type_annotation_union_as_tuple,
+    ),
+    (
+        "infer_for_schema: the union of constraints is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=infer_for_schema_len._ConstraintUnion,
+            base_class=infer_for_schema_len._Constraint,
+        ),
+    ),
+    (
+        "infer_for_schema: stringification dispatch is exhaustive",
+        lambda: stringify.assert_dispatch_exhaustive(
+            dispatch=infer_for_schema_stringify._DISPATCH,
+            dumpable=infer_for_schema_stringify.Dumpable,
+        ),
+    ),
+    (
+        "csharp: all primitive types are mapped",
+        csharp_common._assert_all_primitive_types_are_mapped,
+    ),
+    (
+        "rdf_shacl: TokenUnion is exhaustive",
+        lambda: assert_union_of_descendants_exhaustive(
+            union=rdf_shacl_description.TokenUnion,
+            base_class=rdf_shacl_description.Token,
+        ),
+    ),
+    (
+        "rdf_shacl: TypeAnnotationExceptOptional excludes only OptionalTypeAnnotation",
+        lambda: assert_union_without_excluded(
+            original_union=intermediate_types.TypeAnnotationUnion,
+            subset_union=rdf_shacl_common.TypeAnnotationExceptOptional,
+            excluded=[intermediate_types.OptionalTypeAnnotation],
+        ),
+    ),
+]  # type: Sequence[Tuple[str, Callable[[], None]]]
+
+
+def run() -> List[str]:
+    """
+    Run all the self-checks.
+
+    :return: descriptions of the failed checks together with the messages
+    """
+    failures = []  # type: List[str]
+
+    for description, check in CHECKS:
+        try:
+            check()
+        except AssertionError as exception:
+            failures.append(f"{description}: {exception}")
+
+    return failures
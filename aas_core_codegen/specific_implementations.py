@@ -1,8 +1,9 @@
 """Handle implementation snippets regardless for all implementation languages."""
 
+import os
 import pathlib
 import re
-from typing import cast, Mapping, Tuple, Optional, List
+from typing import Mapping, Tuple, Optional, List, Dict, Iterator, Iterable
 
 from icontract import require, ensure
 
@@ -16,41 +17,106 @@ class ImplementationKey(str):
 
     @require(lambda key: IMPLEMENTATION_KEY_RE.fullmatch(key))
     def __new__(cls, key: str) -> "ImplementationKey":
-        return cast(ImplementationKey, key)
+        return str.__new__(cls, key)
 
 
 SpecificImplementations = Mapping[ImplementationKey, Stripped]
 
 
+class SnippetStore(Mapping[ImplementationKey, Stripped]):
+    """
+    Provide the implementation-specific snippets from a directory lazily.
+
+    The paths to the snippets are indexed on construction, but a snippet is read
+    only when a generator accesses it for the first time. The store records
+    the accessed snippets so that we know on which snippets the generated code
+    actually depends.
+    """
+
+    def __init__(self, paths: Mapping[ImplementationKey, pathlib.Path]) -> None:
+        """Initialize with the ``paths`` to the snippets indexed by their keys."""
+        self._paths = paths
+        self._snippets = dict()  # type: Dict[ImplementationKey, Stripped]
+
+    def __getitem__(self, key: ImplementationKey) -> Stripped:
+        """Read the snippet for the ``key``, if not already read, and return it."""
+        snippet = self._snippets.get(key, None)
+        if snippet is None:
+            snippet = Stripped(self._paths[key].read_text(encoding="utf-8").strip())
+            self._snippets[key] = snippet
+
+        return snippet
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check whether there is a snippet for the ``key``.
+
+        The snippet is recorded as accessed, since the generated code depends on
+        its presence.
+        """
+        if not isinstance(key, str) or key not in self._paths:
+            return False
+
+        _ = self[ImplementationKey(key)]
+        return True
+
+    def __iter__(self) -> Iterator[ImplementationKey]:
+        """Iterate over the keys of all the snippets."""
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        """Return the number of all the snippets."""
+        return len(self._paths)
+
+    def accessed_keys(self) -> List[ImplementationKey]:
+        """List the keys of the snippets accessed so far in the order of access."""
+        return list(self._snippets)
+
+    def unused_keys(self) -> List[ImplementationKey]:
+        """List the keys of the snippets which have not been accessed so far."""
+        return [key for key in self._paths if key not in self._snippets]
+
+    def record_accessed(self, keys: Iterable[ImplementationKey]) -> None:
+        """
+        Record the snippets of ``keys`` as accessed.
+
+        This is necessary if the snippets have been accessed in a copy of the store,
+        *e.g.*, in a forked process.
+        """
+        for key in keys:
+            _ = self[key]
+
+
 @ensure(lambda result: (result[0] is not None) ^ (result[1] is not None))
 def read_from_directory(
     snippets_dir: pathlib.Path,
-) -> Tuple[Optional[SpecificImplementations], Optional[List[str]]]:
+) -> Tuple[Optional[SnippetStore], Optional[List[str]]]:
     """
-    Read all the implementation-specific code snippets from the ``snippets_dir``.
+    Index all the implementation-specific code snippets from the ``snippets_dir``.
+
+    The snippets are read only once they are accessed.
 
-    :return: either the map of the implementations, or the errors
+    :return: either the store of the implementations, or the errors
     """
-    mapping = dict()  # pylint: disable=use-dict-literal
+    paths = dict()  # type: Dict[ImplementationKey, pathlib.Path]
 
     errors = []  # type: List[str]
-    for pth in snippets_dir.glob("**/*"):
-        if pth.is_dir():
-            continue
-
-        maybe_key = (pth.relative_to(snippets_dir).parent / pth.name).as_posix()
-        if not IMPLEMENTATION_KEY_RE.match(maybe_key):
-            errors.append(
-                f"The snippet key is not valid "
-                f"according to {IMPLEMENTATION_KEY_RE.pattern}: {maybe_key}"
-            )
-            continue
-
-        key = ImplementationKey(maybe_key)
-        value = Stripped(pth.read_text().strip())
-        mapping[key] = value
+    for dirpath, _, filenames in os.walk(snippets_dir):
+        directory = pathlib.Path(dirpath)
+        prefix = directory.relative_to(snippets_dir).as_posix()
+
+        for filename in filenames:
+            maybe_key = filename if prefix == "." else f"{prefix}/{filename}"
+            if not IMPLEMENTATION_KEY_RE.fullmatch(maybe_key):
+                errors.append(
+                    f"The snippet key is not valid "
+                    f"according to {IMPLEMENTATION_KEY_RE.pattern}: {maybe_key}"
+                )
+                continue
+
+            paths[ImplementationKey(maybe_key)] = directory / filename
 
     if errors:
         return None, errors
 
-    return mapping, None
+    return SnippetStore(paths=paths), None
@@ -38,262 +38,167 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Extension":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Extension>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Extension from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "IdentifierKeyValuePair":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.IdentifierKeyValuePair>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null IdentifierKeyValuePair from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Qualifier":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Qualifier>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Qualifier from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "View":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.View>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null View from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Extension.EncodedUtf8Bytes))
+                        {
+                            return Converters.Extension.Read(
+                                ref reader, typeof(Aas.Extension), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.IdentifierKeyValuePair.EncodedUtf8Bytes))
+                        {
+                            return Converters.IdentifierKeyValuePair.Read(
+                                ref reader, typeof(Aas.IdentifierKeyValuePair), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Qualifier.EncodedUtf8Bytes))
+                        {
+                            return Converters.Qualifier.Read(
+                                ref reader, typeof(Aas.Qualifier), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.View.EncodedUtf8Bytes))
+                        {
+                            return Converters.View.Read(
+                                ref reader, typeof(Aas.View), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -304,76 +209,76 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case Extension theExtension:
-                    Json.JsonSerializer.Serialize(
-                        writer, theExtension);
+                    Converters.Extension.Write(
+                        writer, theExtension, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case IdentifierKeyValuePair theIdentifierKeyValuePair:
-                    Json.JsonSerializer.Serialize(
-                        writer, theIdentifierKeyValuePair);
+                    Converters.IdentifierKeyValuePair.Write(
+                        writer, theIdentifierKeyValuePair, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Qualifier theQualifier:
-                    Json.JsonSerializer.Serialize(
-                        writer, theQualifier);
+                    Converters.Qualifier.Write(
+                        writer, theQualifier, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 case View theView:
-                    Json.JsonSerializer.Serialize(
-                        writer, theView);
+                    Converters.View.Write(
+                        writer, theView, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -417,52 +322,44 @@ namespace AasCore.Aas3
                                 theRefersTo);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "name":
-                                    theName =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueType":
-                                    theValueType =  (
-                                        Json.JsonSerializer.Deserialize<DataTypeDef>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "refersTo":
-                                    theRefersTo =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Name.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theName = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueType = Converters.DataTypeDef.Read(
+                                    ref reader, typeof(Aas.DataTypeDef), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.RefersTo.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theRefersTo = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -482,34 +379,29 @@ namespace AasCore.Aas3
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("name");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Name);
+                writer.WritePropertyName(PropertyNames.Name);
+                writer.WriteStringValue(that.Name);
 
                 if (that.ValueType != null)
                 {
-                    writer.WritePropertyName("valueType");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueType);
+                    writer.WritePropertyName(PropertyNames.ValueType);
+                    Converters.DataTypeDef.Write(writer, that.ValueType.Value, options);
                 }
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    writer.WriteStringValue(that.Value);
                 }
 
                 if (that.RefersTo != null)
                 {
-                    writer.WritePropertyName("refersTo");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.RefersTo);
+                    writer.WritePropertyName(PropertyNames.RefersTo);
+                    Converters.IReference.Write(writer, that.RefersTo, options);
                 }
 
                 writer.WriteEndObject();
@@ -534,251 +426,160 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
-                    {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "AssetAdministrationShell":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AssetAdministrationShell>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AssetAdministrationShell from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ConceptDescription":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ConceptDescription>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ConceptDescription from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "View":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.View>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null View from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AssetAdministrationShell.EncodedUtf8Bytes))
+                        {
+                            return Converters.AssetAdministrationShell.Read(
+                                ref reader, typeof(Aas.AssetAdministrationShell), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ConceptDescription.EncodedUtf8Bytes))
+                        {
+                            return Converters.ConceptDescription.Read(
+                                ref reader, typeof(Aas.ConceptDescription), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.View.EncodedUtf8Bytes))
+                        {
+                            return Converters.View.Read(
+                                ref reader, typeof(Aas.View), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -789,72 +590,72 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case AssetAdministrationShell theAssetAdministrationShell:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAssetAdministrationShell);
+                    Converters.AssetAdministrationShell.Write(
+                        writer, theAssetAdministrationShell, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case ConceptDescription theConceptDescription:
-                    Json.JsonSerializer.Serialize(
-                        writer, theConceptDescription);
+                    Converters.ConceptDescription.Write(
+                        writer, theConceptDescription, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 case View theView:
-                    Json.JsonSerializer.Serialize(
-                        writer, theView);
+                    Converters.View.Write(
+                        writer, theView, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -882,251 +683,160 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "AssetAdministrationShell":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AssetAdministrationShell>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AssetAdministrationShell from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ConceptDescription":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ConceptDescription>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ConceptDescription from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "View":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.View>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null View from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AssetAdministrationShell.EncodedUtf8Bytes))
+                        {
+                            return Converters.AssetAdministrationShell.Read(
+                                ref reader, typeof(Aas.AssetAdministrationShell), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ConceptDescription.EncodedUtf8Bytes))
+                        {
+                            return Converters.ConceptDescription.Read(
+                                ref reader, typeof(Aas.ConceptDescription), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.View.EncodedUtf8Bytes))
+                        {
+                            return Converters.View.Read(
+                                ref reader, typeof(Aas.View), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -1137,72 +847,72 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case AssetAdministrationShell theAssetAdministrationShell:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAssetAdministrationShell);
+                    Converters.AssetAdministrationShell.Write(
+                        writer, theAssetAdministrationShell, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case ConceptDescription theConceptDescription:
-                    Json.JsonSerializer.Serialize(
-                        writer, theConceptDescription);
+                    Converters.ConceptDescription.Write(
+                        writer, theConceptDescription, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 case View theView:
-                    Json.JsonSerializer.Serialize(
-                        writer, theView);
+                    Converters.View.Write(
+                        writer, theView, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -1230,97 +940,62 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AssetAdministrationShell":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AssetAdministrationShell>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AssetAdministrationShell from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ConceptDescription":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ConceptDescription>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ConceptDescription from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AssetAdministrationShell.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.AssetAdministrationShell.Read(
+                                ref reader, typeof(Aas.AssetAdministrationShell), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ConceptDescription.EncodedUtf8Bytes))
+                        {
+                            return Converters.ConceptDescription.Read(
+                                ref reader, typeof(Aas.ConceptDescription), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -1331,16 +1006,16 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AssetAdministrationShell theAssetAdministrationShell:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAssetAdministrationShell);
+                    Converters.AssetAdministrationShell.Write(
+                        writer, theAssetAdministrationShell, options);
                     break;
                 case ConceptDescription theConceptDescription:
-                    Json.JsonSerializer.Serialize(
-                        writer, theConceptDescription);
+                    Converters.ConceptDescription.Write(
+                        writer, theConceptDescription, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -1363,16 +1038,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.ModelingKind? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.ModelingKindFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.ModelingKindFromString(text);
                 }
 
-                Aas.ModelingKind? value = Stringification.ModelingKindFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid ModelingKind: {text}");
+                    $"Invalid ModelingKind: {reader.GetString()}");
             }
 
             public override void Write(
@@ -1409,218 +1095,139 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -1631,60 +1238,60 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -1712,262 +1319,167 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
+                        throw new Json.JsonException();
                     }
-                    else
+
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        buffer.Write(reader.ValueSpan);
-                    }
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
+                        {
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AdministrativeInformation.EncodedUtf8Bytes))
+                        {
+                            return Converters.AdministrativeInformation.Read(
+                                ref reader, typeof(Aas.AdministrativeInformation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AssetAdministrationShell.EncodedUtf8Bytes))
+                        {
+                            return Converters.AssetAdministrationShell.Read(
+                                ref reader, typeof(Aas.AssetAdministrationShell), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ConceptDescription.EncodedUtf8Bytes))
+                        {
+                            return Converters.ConceptDescription.Read(
+                                ref reader, typeof(Aas.ConceptDescription), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
 
-                    switch (reader.TokenType)
-                    {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AdministrativeInformation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AdministrativeInformation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AdministrativeInformation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "AssetAdministrationShell":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AssetAdministrationShell>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AssetAdministrationShell from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ConceptDescription":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ConceptDescription>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ConceptDescription from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "View":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.View>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null View from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.View.EncodedUtf8Bytes))
+                        {
+                            return Converters.View.Read(
+                                ref reader, typeof(Aas.View), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -1978,76 +1490,76 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AdministrativeInformation theAdministrativeInformation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAdministrativeInformation);
+                    Converters.AdministrativeInformation.Write(
+                        writer, theAdministrativeInformation, options);
                     break;
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case AssetAdministrationShell theAssetAdministrationShell:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAssetAdministrationShell);
+                    Converters.AssetAdministrationShell.Write(
+                        writer, theAssetAdministrationShell, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case ConceptDescription theConceptDescription:
-                    Json.JsonSerializer.Serialize(
-                        writer, theConceptDescription);
+                    Converters.ConceptDescription.Write(
+                        writer, theConceptDescription, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 case View theView:
-                    Json.JsonSerializer.Serialize(
-                        writer, theView);
+                    Converters.View.Write(
+                        writer, theView, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -2086,42 +1598,32 @@ namespace AasCore.Aas3
                                 theDataSpecifications);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "version":
-                                    theVersion =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "revision":
-                                    theRevision =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Version.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theVersion = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Revision.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theRevision = ReadString(ref reader);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -2139,22 +1641,23 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
                 if (that.Version != null)
                 {
-                    writer.WritePropertyName("version");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Version);
+                    writer.WritePropertyName(PropertyNames.Version);
+                    writer.WriteStringValue(that.Version);
                 }
 
                 if (that.Revision != null)
                 {
-                    writer.WritePropertyName("revision");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Revision);
+                    writer.WritePropertyName(PropertyNames.Revision);
+                    writer.WriteStringValue(that.Revision);
                 }
 
                 writer.WriteEndObject();
@@ -2179,86 +1682,55 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "Formula":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Formula>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Formula from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Qualifier":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Qualifier>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Qualifier from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Formula.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.Formula.Read(
+                                ref reader, typeof(Aas.Formula), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Qualifier.EncodedUtf8Bytes))
+                        {
+                            return Converters.Qualifier.Read(
+                                ref reader, typeof(Aas.Qualifier), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -2269,12 +1741,12 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case Formula theFormula:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFormula);
+                    Converters.Formula.Write(
+                        writer, theFormula, options);
                     break;
                 case Qualifier theQualifier:
-                    Json.JsonSerializer.Serialize(
-                        writer, theQualifier);
+                    Converters.Qualifier.Write(
+                        writer, theQualifier, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -2302,218 +1774,139 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Submodel":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Submodel>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Submodel from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Submodel.EncodedUtf8Bytes))
+                        {
+                            return Converters.Submodel.Read(
+                                ref reader, typeof(Aas.Submodel), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -2524,60 +1917,60 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case Submodel theSubmodel:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodel);
+                    Converters.Submodel.Write(
+                        writer, theSubmodel, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -2622,55 +2015,45 @@ namespace AasCore.Aas3
                                 theSemanticId);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "type":
-                                    theType =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueType":
-                                    theValueType =  (
-                                        Json.JsonSerializer.Deserialize<DataTypeDef>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueId":
-                                    theValueId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Type.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theType = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueType = Converters.DataTypeDef.Read(
+                                    ref reader, typeof(Aas.DataTypeDef), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -2688,37 +2071,30 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Qualifier");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Qualifier);
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("type");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Type);
+                writer.WritePropertyName(PropertyNames.Type);
+                writer.WriteStringValue(that.Type);
 
-                writer.WritePropertyName("valueType");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ValueType);
+                writer.WritePropertyName(PropertyNames.ValueType);
+                Converters.DataTypeDef.Write(writer, that.ValueType, options);
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    writer.WriteStringValue(that.Value);
                 }
 
                 if (that.ValueId != null)
                 {
-                    writer.WritePropertyName("valueId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueId);
+                    writer.WritePropertyName(PropertyNames.ValueId);
+                    Converters.IReference.Write(writer, that.ValueId, options);
                 }
 
                 writer.WriteEndObject();
@@ -2750,35 +2126,21 @@ namespace AasCore.Aas3
                                 theDependsOn);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dependsOn":
-                                    theDependsOn =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DependsOn.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDependsOn = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -2796,13 +2158,14 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Formula");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Formula);
 
-                writer.WritePropertyName("dependsOn");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DependsOn);
+                writer.WritePropertyName(PropertyNames.DependsOn);
+                WriteList(
+                    writer,
+                    that.DependsOn,
+                    Converters.IReference,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -2856,85 +2219,92 @@ namespace AasCore.Aas3
                                 theSubmodels);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "id":
-                                    theId =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "administration":
-                                    theAdministration =  (
-                                        Json.JsonSerializer.Deserialize<AdministrativeInformation>(
-                                            ref reader));
-                                    break;
-                                case "derivedFrom":
-                                    theDerivedFrom =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "assetInformation":
-                                    theAssetInformation =  (
-                                        Json.JsonSerializer.Deserialize<AssetInformation>(
-                                            ref reader));
-                                    break;
-                                case "submodels":
-                                    theSubmodels =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Id.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theId = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Administration.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAdministration = Converters.AdministrativeInformation.Read(
+                                    ref reader, typeof(Aas.AdministrativeInformation), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DerivedFrom.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDerivedFrom = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.AssetInformation.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAssetInformation = Converters.AssetInformation.Read(
+                                    ref reader, typeof(Aas.AssetInformation), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Submodels.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSubmodels = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -2952,71 +2322,70 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "AssetAdministrationShell");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.AssetAdministrationShell);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
-                writer.WritePropertyName("id");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Id);
+                writer.WritePropertyName(PropertyNames.Id);
+                writer.WriteStringValue(that.Id);
 
                 if (that.Administration != null)
                 {
-                    writer.WritePropertyName("administration");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Administration);
+                    writer.WritePropertyName(PropertyNames.Administration);
+                    Converters.AdministrativeInformation.Write(writer, that.Administration, options);
                 }
 
                 if (that.DerivedFrom != null)
                 {
-                    writer.WritePropertyName("derivedFrom");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DerivedFrom);
+                    writer.WritePropertyName(PropertyNames.DerivedFrom);
+                    Converters.IReference.Write(writer, that.DerivedFrom, options);
                 }
 
-                writer.WritePropertyName("assetInformation");
-                Json.JsonSerializer.Serialize(
-                    writer, that.AssetInformation);
+                writer.WritePropertyName(PropertyNames.AssetInformation);
+                Converters.AssetInformation.Write(writer, that.AssetInformation, options);
 
-                writer.WritePropertyName("submodels");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Submodels);
+                writer.WritePropertyName(PropertyNames.Submodels);
+                WriteList(
+                    writer,
+                    that.Submodels,
+                    Converters.IReference,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -3054,47 +2423,39 @@ namespace AasCore.Aas3
                                 theDefaultThumbnail);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "assetKind":
-                                    theAssetKind =  (
-                                        Json.JsonSerializer.Deserialize<AssetKind>(
-                                            ref reader));
-                                    break;
-                                case "globalAssetId":
-                                    theGlobalAssetId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "specificAssetId":
-                                    theSpecificAssetId =  (
-                                        Json.JsonSerializer.Deserialize<IdentifierKeyValuePair>(
-                                            ref reader));
-                                    break;
-                                case "defaultThumbnail":
-                                    theDefaultThumbnail =  (
-                                        Json.JsonSerializer.Deserialize<File>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.AssetKind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAssetKind = Converters.AssetKind.Read(
+                                    ref reader, typeof(Aas.AssetKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.GlobalAssetId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theGlobalAssetId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SpecificAssetId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSpecificAssetId = Converters.IdentifierKeyValuePair.Read(
+                                    ref reader, typeof(Aas.IdentifierKeyValuePair), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DefaultThumbnail.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDefaultThumbnail = Converters.File.Read(
+                                    ref reader, typeof(Aas.File), options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -3112,29 +2473,25 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("assetKind");
-                Json.JsonSerializer.Serialize(
-                    writer, that.AssetKind);
+                writer.WritePropertyName(PropertyNames.AssetKind);
+                Converters.AssetKind.Write(writer, that.AssetKind, options);
 
                 if (that.GlobalAssetId != null)
                 {
-                    writer.WritePropertyName("globalAssetId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.GlobalAssetId);
+                    writer.WritePropertyName(PropertyNames.GlobalAssetId);
+                    Converters.IReference.Write(writer, that.GlobalAssetId, options);
                 }
 
                 if (that.SpecificAssetId != null)
                 {
-                    writer.WritePropertyName("specificAssetId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SpecificAssetId);
+                    writer.WritePropertyName(PropertyNames.SpecificAssetId);
+                    Converters.IdentifierKeyValuePair.Write(writer, that.SpecificAssetId, options);
                 }
 
                 if (that.DefaultThumbnail != null)
                 {
-                    writer.WritePropertyName("defaultThumbnail");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DefaultThumbnail);
+                    writer.WritePropertyName(PropertyNames.DefaultThumbnail);
+                    Converters.File.Write(writer, that.DefaultThumbnail, options);
                 }
 
                 writer.WriteEndObject();
@@ -3154,16 +2511,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.AssetKind? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.AssetKindFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.AssetKindFromString(text);
                 }
 
-                Aas.AssetKind? value = Stringification.AssetKindFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid AssetKind: {text}");
+                    $"Invalid AssetKind: {reader.GetString()}");
             }
 
             public override void Write(
@@ -3215,47 +2583,37 @@ namespace AasCore.Aas3
                                 theSemanticId);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "key":
-                                    theKey =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "externalSubjectId":
-                                    theExternalSubjectId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Key.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKey = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ExternalSubjectId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExternalSubjectId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -3275,24 +2633,20 @@ namespace AasCore.Aas3
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("key");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Key);
+                writer.WritePropertyName(PropertyNames.Key);
+                writer.WriteStringValue(that.Key);
 
-                writer.WritePropertyName("value");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Value);
+                writer.WritePropertyName(PropertyNames.Value);
+                writer.WriteStringValue(that.Value);
 
                 if (that.ExternalSubjectId != null)
                 {
-                    writer.WritePropertyName("externalSubjectId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ExternalSubjectId);
+                    writer.WritePropertyName(PropertyNames.ExternalSubjectId);
+                    Converters.IReference.Write(writer, that.ExternalSubjectId, options);
                 }
 
                 writer.WriteEndObject();
@@ -3348,90 +2702,101 @@ namespace AasCore.Aas3
                                 theDataSpecifications);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "id":
-                                    theId =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "administration":
-                                    theAdministration =  (
-                                        Json.JsonSerializer.Deserialize<AdministrativeInformation>(
-                                            ref reader));
-                                    break;
-                                case "submodelElements":
-                                    theSubmodelElements =  (
-                                        Json.JsonSerializer.Deserialize<List<ISubmodelElement>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Id.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theId = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Administration.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAdministration = Converters.AdministrativeInformation.Read(
+                                    ref reader, typeof(Aas.AdministrativeInformation), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SubmodelElements.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSubmodelElements = ReadList(
+                                    ref reader,
+                                    Converters.ISubmodelElement,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -3449,78 +2814,80 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Submodel");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Submodel);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
-                writer.WritePropertyName("id");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Id);
+                writer.WritePropertyName(PropertyNames.Id);
+                writer.WriteStringValue(that.Id);
 
                 if (that.Administration != null)
                 {
-                    writer.WritePropertyName("administration");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Administration);
+                    writer.WritePropertyName(PropertyNames.Administration);
+                    Converters.AdministrativeInformation.Write(writer, that.Administration, options);
                 }
 
-                writer.WritePropertyName("submodelElements");
-                Json.JsonSerializer.Serialize(
-                    writer, that.SubmodelElements);
+                writer.WritePropertyName(PropertyNames.SubmodelElements);
+                WriteList(
+                    writer,
+                    that.SubmodelElements,
+                    Converters.ISubmodelElement,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -3544,207 +2911,132 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
+                        {
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
+                        {
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Capability.EncodedUtf8Bytes))
+                        {
+                            return Converters.Capability.Read(
+                                ref reader, typeof(Aas.Capability), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Entity.EncodedUtf8Bytes))
+                        {
+                            return Converters.Entity.Read(
+                                ref reader, typeof(Aas.Entity), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Operation.EncodedUtf8Bytes))
+                        {
+                            return Converters.Operation.Read(
+                                ref reader, typeof(Aas.Operation), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementList.EncodedUtf8Bytes))
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Capability":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Capability>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Capability from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Entity":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Entity>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Entity from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Operation":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Operation>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Operation from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementList":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementList>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementList from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "SubmodelElementStruct":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.SubmodelElementStruct>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null SubmodelElementStruct from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            return Converters.SubmodelElementList.Read(
+                                ref reader, typeof(Aas.SubmodelElementList), options);
                         }
-                        case Json.JsonTokenType.PropertyName:
-                        {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.SubmodelElementStruct.EncodedUtf8Bytes))
+                        {
+                            return Converters.SubmodelElementStruct.Read(
+                                ref reader, typeof(Aas.SubmodelElementStruct), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -3755,56 +3047,56 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case Capability theCapability:
-                    Json.JsonSerializer.Serialize(
-                        writer, theCapability);
+                    Converters.Capability.Write(
+                        writer, theCapability, options);
                     break;
                 case Entity theEntity:
-                    Json.JsonSerializer.Serialize(
-                        writer, theEntity);
+                    Converters.Entity.Write(
+                        writer, theEntity, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Operation theOperation:
-                    Json.JsonSerializer.Serialize(
-                        writer, theOperation);
+                    Converters.Operation.Write(
+                        writer, theOperation, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 case SubmodelElementList theSubmodelElementList:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementList);
+                    Converters.SubmodelElementList.Write(
+                        writer, theSubmodelElementList, options);
                     break;
                 case SubmodelElementStruct theSubmodelElementStruct:
-                    Json.JsonSerializer.Serialize(
-                        writer, theSubmodelElementStruct);
+                    Converters.SubmodelElementStruct.Write(
+                        writer, theSubmodelElementStruct, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -3832,75 +3124,48 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "AnnotatedRelationshipElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.AnnotatedRelationshipElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null AnnotatedRelationshipElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
-                        {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.AnnotatedRelationshipElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.AnnotatedRelationshipElement.Read(
+                                ref reader, typeof(Aas.AnnotatedRelationshipElement), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -3911,8 +3176,8 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case AnnotatedRelationshipElement theAnnotatedRelationshipElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theAnnotatedRelationshipElement);
+                    Converters.AnnotatedRelationshipElement.Write(
+                        writer, theAnnotatedRelationshipElement, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -3972,95 +3237,109 @@ namespace AasCore.Aas3
                                 theValueTypeValues);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "submodelElementTypeValues":
-                                    theSubmodelElementTypeValues =  (
-                                        Json.JsonSerializer.Deserialize<SubmodelElements>(
-                                            ref reader));
-                                    break;
-                                case "values":
-                                    theValues =  (
-                                        Json.JsonSerializer.Deserialize<List<ISubmodelElement>>(
-                                            ref reader));
-                                    break;
-                                case "semanticIdValues":
-                                    theSemanticIdValues =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "valueTypeValues":
-                                    theValueTypeValues =  (
-                                        Json.JsonSerializer.Deserialize<DataTypeDef>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SubmodelElementTypeValues.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSubmodelElementTypeValues = Converters.SubmodelElements.Read(
+                                    ref reader, typeof(Aas.SubmodelElements), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Values.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValues = ReadList(
+                                    ref reader,
+                                    Converters.ISubmodelElement,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticIdValues.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticIdValues = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueTypeValues.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueTypeValues = Converters.DataTypeDef.Read(
+                                    ref reader, typeof(Aas.DataTypeDef), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -4078,84 +3357,85 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "SubmodelElementList");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.SubmodelElementList);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("submodelElementTypeValues");
-                Json.JsonSerializer.Serialize(
-                    writer, that.SubmodelElementTypeValues);
+                writer.WritePropertyName(PropertyNames.SubmodelElementTypeValues);
+                Converters.SubmodelElements.Write(writer, that.SubmodelElementTypeValues, options);
 
-                writer.WritePropertyName("values");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Values);
+                writer.WritePropertyName(PropertyNames.Values);
+                WriteList(
+                    writer,
+                    that.Values,
+                    Converters.ISubmodelElement,
+                    options);
 
                 if (that.SemanticIdValues != null)
                 {
-                    writer.WritePropertyName("semanticIdValues");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticIdValues);
+                    writer.WritePropertyName(PropertyNames.SemanticIdValues);
+                    Converters.IReference.Write(writer, that.SemanticIdValues, options);
                 }
 
                 if (that.ValueTypeValues != null)
                 {
-                    writer.WritePropertyName("valueTypeValues");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueTypeValues);
+                    writer.WritePropertyName(PropertyNames.ValueTypeValues);
+                    Converters.DataTypeDef.Write(writer, that.ValueTypeValues.Value, options);
                 }
 
                 writer.WriteEndObject();
@@ -4205,80 +3485,88 @@ namespace AasCore.Aas3
                                 theValues);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "values":
-                                    theValues =  (
-                                        Json.JsonSerializer.Deserialize<List<ISubmodelElement>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Values.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValues = ReadList(
+                                    ref reader,
+                                    Converters.ISubmodelElement,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -4296,67 +3584,71 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "SubmodelElementStruct");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.SubmodelElementStruct);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("values");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Values);
+                writer.WritePropertyName(PropertyNames.Values);
+                WriteList(
+                    writer,
+                    that.Values,
+                    Converters.ISubmodelElement,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -4380,130 +3672,83 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "Blob":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Blob>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Blob from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "File":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.File>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null File from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "MultiLanguageProperty":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.MultiLanguageProperty>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null MultiLanguageProperty from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Property":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Property>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Property from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "Range":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.Range>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null Range from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ReferenceElement":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ReferenceElement>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ReferenceElement from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Blob.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.Blob.Read(
+                                ref reader, typeof(Aas.Blob), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.File.EncodedUtf8Bytes))
+                        {
+                            return Converters.File.Read(
+                                ref reader, typeof(Aas.File), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.MultiLanguageProperty.EncodedUtf8Bytes))
+                        {
+                            return Converters.MultiLanguageProperty.Read(
+                                ref reader, typeof(Aas.MultiLanguageProperty), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Property.EncodedUtf8Bytes))
+                        {
+                            return Converters.Property.Read(
+                                ref reader, typeof(Aas.Property), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.Range.EncodedUtf8Bytes))
+                        {
+                            return Converters.Range.Read(
+                                ref reader, typeof(Aas.Range), options);
+                        }
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ReferenceElement.EncodedUtf8Bytes))
+                        {
+                            return Converters.ReferenceElement.Read(
+                                ref reader, typeof(Aas.ReferenceElement), options);
+                        }
+
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -4514,28 +3759,28 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case Blob theBlob:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBlob);
+                    Converters.Blob.Write(
+                        writer, theBlob, options);
                     break;
                 case File theFile:
-                    Json.JsonSerializer.Serialize(
-                        writer, theFile);
+                    Converters.File.Write(
+                        writer, theFile, options);
                     break;
                 case MultiLanguageProperty theMultiLanguageProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theMultiLanguageProperty);
+                    Converters.MultiLanguageProperty.Write(
+                        writer, theMultiLanguageProperty, options);
                     break;
                 case Property theProperty:
-                    Json.JsonSerializer.Serialize(
-                        writer, theProperty);
+                    Converters.Property.Write(
+                        writer, theProperty, options);
                     break;
                 case Range theRange:
-                    Json.JsonSerializer.Serialize(
-                        writer, theRange);
+                    Converters.Range.Write(
+                        writer, theRange, options);
                     break;
                 case ReferenceElement theReferenceElement:
-                    Json.JsonSerializer.Serialize(
-                        writer, theReferenceElement);
+                    Converters.ReferenceElement.Write(
+                        writer, theReferenceElement, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -4594,90 +3839,99 @@ namespace AasCore.Aas3
                                 theValueId);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "valueType":
-                                    theValueType =  (
-                                        Json.JsonSerializer.Deserialize<DataTypeDef>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueId":
-                                    theValueId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueType = Converters.DataTypeDef.Read(
+                                    ref reader, typeof(Aas.DataTypeDef), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -4695,80 +3949,78 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Property");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Property);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("valueType");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ValueType);
+                writer.WritePropertyName(PropertyNames.ValueType);
+                Converters.DataTypeDef.Write(writer, that.ValueType, options);
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    writer.WriteStringValue(that.Value);
                 }
 
                 if (that.ValueId != null)
                 {
-                    writer.WritePropertyName("valueId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueId);
+                    writer.WritePropertyName(PropertyNames.ValueId);
+                    Converters.IReference.Write(writer, that.ValueId, options);
                 }
 
                 writer.WriteEndObject();
@@ -4820,85 +4072,93 @@ namespace AasCore.Aas3
                                 theValueId);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "valueId":
-                                    theValueId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -4916,76 +4176,75 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "MultiLanguageProperty");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.MultiLanguageProperty);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    Converters.LangStringSet.Write(writer, that.Value, options);
                 }
 
                 if (that.ValueId != null)
                 {
-                    writer.WritePropertyName("valueId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueId);
+                    writer.WritePropertyName(PropertyNames.ValueId);
+                    Converters.IReference.Write(writer, that.ValueId, options);
                 }
 
                 writer.WriteEndObject();
@@ -5041,90 +4300,98 @@ namespace AasCore.Aas3
                                 theMax);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "valueType":
-                                    theValueType =  (
-                                        Json.JsonSerializer.Deserialize<DataTypeDef>(
-                                            ref reader));
-                                    break;
-                                case "min":
-                                    theMin =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "max":
-                                    theMax =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueType = Converters.DataTypeDef.Read(
+                                    ref reader, typeof(Aas.DataTypeDef), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Min.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theMin = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Max.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theMax = ReadString(ref reader);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -5142,80 +4409,78 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Range");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Range);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("valueType");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ValueType);
+                writer.WritePropertyName(PropertyNames.ValueType);
+                Converters.DataTypeDef.Write(writer, that.ValueType, options);
 
                 if (that.Min != null)
                 {
-                    writer.WritePropertyName("min");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Min);
+                    writer.WritePropertyName(PropertyNames.Min);
+                    writer.WriteStringValue(that.Min);
                 }
 
                 if (that.Max != null)
                 {
-                    writer.WritePropertyName("max");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Max);
+                    writer.WritePropertyName(PropertyNames.Max);
+                    writer.WriteStringValue(that.Max);
                 }
 
                 writer.WriteEndObject();
@@ -5266,80 +4531,86 @@ namespace AasCore.Aas3
                                 theValue);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -5357,69 +4628,69 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "ReferenceElement");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.ReferenceElement);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    Converters.IReference.Write(writer, that.Value, options);
                 }
 
                 writer.WriteEndObject();
@@ -5473,85 +4744,91 @@ namespace AasCore.Aas3
                                 theValue);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "mimeType":
-                                    theMimeType =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<byte[]>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.MimeType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theMimeType = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadBytes(ref reader);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -5569,73 +4846,72 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Blob");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Blob);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("mimeType");
-                Json.JsonSerializer.Serialize(
-                    writer, that.MimeType);
+                writer.WritePropertyName(PropertyNames.MimeType);
+                writer.WriteStringValue(that.MimeType);
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    writer.WriteBase64StringValue(that.Value);
                 }
 
                 writer.WriteEndObject();
@@ -5689,85 +4965,91 @@ namespace AasCore.Aas3
                                 theValue);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "mimeType":
-                                    theMimeType =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.MimeType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theMimeType = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -5785,73 +5067,72 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "File");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.File);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("mimeType");
-                Json.JsonSerializer.Serialize(
-                    writer, that.MimeType);
+                writer.WritePropertyName(PropertyNames.MimeType);
+                writer.WriteStringValue(that.MimeType);
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    writer.WriteStringValue(that.Value);
                 }
 
                 writer.WriteEndObject();
@@ -5907,90 +5188,102 @@ namespace AasCore.Aas3
                                 theAnnotation);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "first":
-                                    theFirst =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "second":
-                                    theSecond =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "annotation":
-                                    theAnnotation =  (
-                                        Json.JsonSerializer.Deserialize<List<IDataElement>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.First.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theFirst = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Second.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSecond = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Annotation.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAnnotation = ReadList(
+                                    ref reader,
+                                    Converters.IDataElement,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -6008,75 +5301,77 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "AnnotatedRelationshipElement");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.AnnotatedRelationshipElement);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("first");
-                Json.JsonSerializer.Serialize(
-                    writer, that.First);
+                writer.WritePropertyName(PropertyNames.First);
+                Converters.IReference.Write(writer, that.First, options);
 
-                writer.WritePropertyName("second");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Second);
+                writer.WritePropertyName(PropertyNames.Second);
+                Converters.IReference.Write(writer, that.Second, options);
 
-                writer.WritePropertyName("annotation");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Annotation);
+                writer.WritePropertyName(PropertyNames.Annotation);
+                WriteList(
+                    writer,
+                    that.Annotation,
+                    Converters.IDataElement,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -6095,16 +5390,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.EntityType? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.EntityTypeFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.EntityTypeFromString(text);
                 }
 
-                Aas.EntityType? value = Stringification.EntityTypeFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid EntityType: {text}");
+                    $"Invalid EntityType: {reader.GetString()}");
             }
 
             public override void Write(
@@ -6173,95 +5479,109 @@ namespace AasCore.Aas3
                                 theSpecificAssetId);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "entityType":
-                                    theEntityType =  (
-                                        Json.JsonSerializer.Deserialize<EntityType>(
-                                            ref reader));
-                                    break;
-                                case "statements":
-                                    theStatements =  (
-                                        Json.JsonSerializer.Deserialize<List<ISubmodelElement>>(
-                                            ref reader));
-                                    break;
-                                case "globalAssetId":
-                                    theGlobalAssetId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "specificAssetId":
-                                    theSpecificAssetId =  (
-                                        Json.JsonSerializer.Deserialize<IdentifierKeyValuePair>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.EntityType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theEntityType = Converters.EntityType.Read(
+                                    ref reader, typeof(Aas.EntityType), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Statements.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theStatements = ReadList(
+                                    ref reader,
+                                    Converters.ISubmodelElement,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.GlobalAssetId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theGlobalAssetId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SpecificAssetId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSpecificAssetId = Converters.IdentifierKeyValuePair.Read(
+                                    ref reader, typeof(Aas.IdentifierKeyValuePair), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -6279,84 +5599,85 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Entity");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Entity);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("entityType");
-                Json.JsonSerializer.Serialize(
-                    writer, that.EntityType);
+                writer.WritePropertyName(PropertyNames.EntityType);
+                Converters.EntityType.Write(writer, that.EntityType, options);
 
-                writer.WritePropertyName("statements");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Statements);
+                writer.WritePropertyName(PropertyNames.Statements);
+                WriteList(
+                    writer,
+                    that.Statements,
+                    Converters.ISubmodelElement,
+                    options);
 
                 if (that.GlobalAssetId != null)
                 {
-                    writer.WritePropertyName("globalAssetId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.GlobalAssetId);
+                    writer.WritePropertyName(PropertyNames.GlobalAssetId);
+                    Converters.IReference.Write(writer, that.GlobalAssetId, options);
                 }
 
                 if (that.SpecificAssetId != null)
                 {
-                    writer.WritePropertyName("specificAssetId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SpecificAssetId);
+                    writer.WritePropertyName(PropertyNames.SpecificAssetId);
+                    Converters.IdentifierKeyValuePair.Write(writer, that.SpecificAssetId, options);
                 }
 
                 writer.WriteEndObject();
@@ -6381,75 +5702,48 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "BasicEvent":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.BasicEvent>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null BasicEvent from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
-                        {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.BasicEvent.EncodedUtf8Bytes))
+                        {
+                            return Converters.BasicEvent.Read(
+                                ref reader, typeof(Aas.BasicEvent), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -6460,8 +5754,8 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case BasicEvent theBasicEvent:
-                    Json.JsonSerializer.Serialize(
-                        writer, theBasicEvent);
+                    Converters.BasicEvent.Write(
+                        writer, theBasicEvent, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -6516,80 +5810,86 @@ namespace AasCore.Aas3
                                 theDataSpecifications);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "observed":
-                                    theObserved =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Observed.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theObserved = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -6607,67 +5907,67 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "BasicEvent");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.BasicEvent);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
-                writer.WritePropertyName("observed");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Observed);
+                writer.WritePropertyName(PropertyNames.Observed);
+                Converters.IReference.Write(writer, that.Observed, options);
 
                 writer.WriteEndObject();
             }
@@ -6720,90 +6020,106 @@ namespace AasCore.Aas3
                                 theInoutputVariables);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "inputVariables":
-                                    theInputVariables =  (
-                                        Json.JsonSerializer.Deserialize<List<OperationVariable>>(
-                                            ref reader));
-                                    break;
-                                case "outputVariables":
-                                    theOutputVariables =  (
-                                        Json.JsonSerializer.Deserialize<List<OperationVariable>>(
-                                            ref reader));
-                                    break;
-                                case "inoutputVariables":
-                                    theInoutputVariables =  (
-                                        Json.JsonSerializer.Deserialize<List<OperationVariable>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.InputVariables.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theInputVariables = ReadList(
+                                    ref reader,
+                                    Converters.OperationVariable,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.OutputVariables.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theOutputVariables = ReadList(
+                                    ref reader,
+                                    Converters.OperationVariable,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.InoutputVariables.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theInoutputVariables = ReadList(
+                                    ref reader,
+                                    Converters.OperationVariable,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -6821,75 +6137,85 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Operation");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Operation);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
-                }
-
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
-
-                writer.WritePropertyName("inputVariables");
-                Json.JsonSerializer.Serialize(
-                    writer, that.InputVariables);
-
-                writer.WritePropertyName("outputVariables");
-                Json.JsonSerializer.Serialize(
-                    writer, that.OutputVariables);
-
-                writer.WritePropertyName("inoutputVariables");
-                Json.JsonSerializer.Serialize(
-                    writer, that.InoutputVariables);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
+                }
+
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
+
+                writer.WritePropertyName(PropertyNames.InputVariables);
+                WriteList(
+                    writer,
+                    that.InputVariables,
+                    Converters.OperationVariable,
+                    options);
+
+                writer.WritePropertyName(PropertyNames.OutputVariables);
+                WriteList(
+                    writer,
+                    that.OutputVariables,
+                    Converters.OperationVariable,
+                    options);
+
+                writer.WritePropertyName(PropertyNames.InoutputVariables);
+                WriteList(
+                    writer,
+                    that.InoutputVariables,
+                    Converters.OperationVariable,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -6921,32 +6247,18 @@ namespace AasCore.Aas3
                                     "Required property is missing: value"));
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<ISubmodelElement>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = Converters.ISubmodelElement.Read(
+                                    ref reader, typeof(Aas.ISubmodelElement), options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -6964,9 +6276,8 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("value");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Value);
+                writer.WritePropertyName(PropertyNames.Value);
+                Converters.ISubmodelElement.Write(writer, that.Value, options);
 
                 writer.WriteEndObject();
             }
@@ -7013,75 +6324,79 @@ namespace AasCore.Aas3
                                 theDataSpecifications);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "kind":
-                                    theKind =  (
-                                        Json.JsonSerializer.Deserialize<ModelingKind>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "qualifiers":
-                                    theQualifiers =  (
-                                        Json.JsonSerializer.Deserialize<List<IConstraint>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Kind.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKind = Converters.ModelingKind.Read(
+                                    ref reader, typeof(Aas.ModelingKind), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Qualifiers.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theQualifiers = ReadList(
+                                    ref reader,
+                                    Converters.IConstraint,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -7099,63 +6414,64 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "Capability");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.Capability);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.Kind != null)
                 {
-                    writer.WritePropertyName("kind");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Kind);
+                    writer.WritePropertyName(PropertyNames.Kind);
+                    Converters.ModelingKind.Write(writer, that.Kind.Value, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("qualifiers");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Qualifiers);
+                writer.WritePropertyName(PropertyNames.Qualifiers);
+                WriteList(
+                    writer,
+                    that.Qualifiers,
+                    Converters.IConstraint,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -7204,75 +6520,78 @@ namespace AasCore.Aas3
                                 theDataSpecifications);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "id":
-                                    theId =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "administration":
-                                    theAdministration =  (
-                                        Json.JsonSerializer.Deserialize<AdministrativeInformation>(
-                                            ref reader));
-                                    break;
-                                case "isCaseOf":
-                                    theIsCaseOf =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Id.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theId = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Administration.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAdministration = Converters.AdministrativeInformation.Read(
+                                    ref reader, typeof(Aas.AdministrativeInformation), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IsCaseOf.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIsCaseOf = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -7290,60 +6609,61 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "ConceptDescription");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.ConceptDescription);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
-                writer.WritePropertyName("id");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Id);
+                writer.WritePropertyName(PropertyNames.Id);
+                writer.WriteStringValue(that.Id);
 
                 if (that.Administration != null)
                 {
-                    writer.WritePropertyName("administration");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Administration);
+                    writer.WritePropertyName(PropertyNames.Administration);
+                    Converters.AdministrativeInformation.Write(writer, that.Administration, options);
                 }
 
-                writer.WritePropertyName("isCaseOf");
-                Json.JsonSerializer.Serialize(
-                    writer, that.IsCaseOf);
+                writer.WritePropertyName(PropertyNames.IsCaseOf);
+                WriteList(
+                    writer,
+                    that.IsCaseOf,
+                    Converters.IReference,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -7388,70 +6708,72 @@ namespace AasCore.Aas3
                                 theContainedElements);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "dataSpecifications":
-                                    theDataSpecifications =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "extensions":
-                                    theExtensions =  (
-                                        Json.JsonSerializer.Deserialize<List<Extension>>(
-                                            ref reader));
-                                    break;
-                                case "idShort":
-                                    theIdShort =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "displayName":
-                                    theDisplayName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "category":
-                                    theCategory =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "description":
-                                    theDescription =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "semanticId":
-                                    theSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "containedElements":
-                                    theContainedElements =  (
-                                        Json.JsonSerializer.Deserialize<List<IReference>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.DataSpecifications.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataSpecifications = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Extensions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theExtensions = ReadList(
+                                    ref reader,
+                                    Converters.Extension,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.IdShort.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theIdShort = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DisplayName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDisplayName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Category.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theCategory = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Description.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDescription = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ContainedElements.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theContainedElements = ReadList(
+                                    ref reader,
+                                    Converters.IReference,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -7469,56 +6791,58 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "View");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.View);
 
-                writer.WritePropertyName("dataSpecifications");
-                Json.JsonSerializer.Serialize(
-                    writer, that.DataSpecifications);
+                writer.WritePropertyName(PropertyNames.DataSpecifications);
+                WriteList(
+                    writer,
+                    that.DataSpecifications,
+                    Converters.IReference,
+                    options);
 
-                writer.WritePropertyName("extensions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Extensions);
+                writer.WritePropertyName(PropertyNames.Extensions);
+                WriteList(
+                    writer,
+                    that.Extensions,
+                    Converters.Extension,
+                    options);
 
                 if (that.IdShort != null)
                 {
-                    writer.WritePropertyName("idShort");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.IdShort);
+                    writer.WritePropertyName(PropertyNames.IdShort);
+                    writer.WriteStringValue(that.IdShort);
                 }
 
                 if (that.DisplayName != null)
                 {
-                    writer.WritePropertyName("displayName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DisplayName);
+                    writer.WritePropertyName(PropertyNames.DisplayName);
+                    Converters.LangStringSet.Write(writer, that.DisplayName, options);
                 }
 
                 if (that.Category != null)
                 {
-                    writer.WritePropertyName("category");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Category);
+                    writer.WritePropertyName(PropertyNames.Category);
+                    writer.WriteStringValue(that.Category);
                 }
 
                 if (that.Description != null)
                 {
-                    writer.WritePropertyName("description");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Description);
+                    writer.WritePropertyName(PropertyNames.Description);
+                    Converters.LangStringSet.Write(writer, that.Description, options);
                 }
 
                 if (that.SemanticId != null)
                 {
-                    writer.WritePropertyName("semanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SemanticId);
+                    writer.WritePropertyName(PropertyNames.SemanticId);
+                    Converters.IReference.Write(writer, that.SemanticId, options);
                 }
 
-                writer.WritePropertyName("containedElements");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ContainedElements);
+                writer.WritePropertyName(PropertyNames.ContainedElements);
+                WriteList(
+                    writer,
+                    that.ContainedElements,
+                    Converters.IReference,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -7542,86 +6866,55 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "GlobalReference":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.GlobalReference>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null GlobalReference from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "ModelReference":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.ModelReference>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null ModelReference from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.GlobalReference.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.GlobalReference.Read(
+                                ref reader, typeof(Aas.GlobalReference), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.ModelReference.EncodedUtf8Bytes))
+                        {
+                            return Converters.ModelReference.Read(
+                                ref reader, typeof(Aas.ModelReference), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -7632,12 +6925,12 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case GlobalReference theGlobalReference:
-                    Json.JsonSerializer.Serialize(
-                        writer, theGlobalReference);
+                    Converters.GlobalReference.Write(
+                        writer, theGlobalReference, options);
                     break;
                 case ModelReference theModelReference:
-                    Json.JsonSerializer.Serialize(
-                        writer, theModelReference);
+                    Converters.ModelReference.Write(
+                        writer, theModelReference, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -7673,35 +6966,21 @@ namespace AasCore.Aas3
                                     "Required property is missing: values"));
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "values":
-                                    theValues =  (
-                                        Json.JsonSerializer.Deserialize<List<string>>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.Values.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValues = ReadList(
+                                    ref reader,
+                                    (Json.Serialization.JsonConverter<string>)options.GetConverter(typeof(string)),
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -7719,13 +6998,14 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "GlobalReference");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.GlobalReference);
 
-                writer.WritePropertyName("values");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Values);
+                writer.WritePropertyName(PropertyNames.Values);
+                WriteList(
+                    writer,
+                    that.Values,
+                    (Json.Serialization.JsonConverter<string>)options.GetConverter(typeof(string)),
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -7759,40 +7039,28 @@ namespace AasCore.Aas3
                                 theReferredSemanticId);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "keys":
-                                    theKeys =  (
-                                        Json.JsonSerializer.Deserialize<List<Key>>(
-                                            ref reader));
-                                    break;
-                                case "referredSemanticId":
-                                    theReferredSemanticId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "modelType":
-                                    // Ignore the property modelType as we already know the exact type
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.Keys.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theKeys = ReadList(
+                                    ref reader,
+                                    Converters.Key,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ReferredSemanticId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theReferredSemanticId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore the property modelType as we already know the exact type,
+                                // and ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -7810,19 +7078,19 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("modelType");
-                Json.JsonSerializer.Serialize(
-                    writer, "ModelReference");
+                writer.WriteString(PropertyNames.ModelType, ModelTypes.ModelReference);
 
-                writer.WritePropertyName("keys");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Keys);
+                writer.WritePropertyName(PropertyNames.Keys);
+                WriteList(
+                    writer,
+                    that.Keys,
+                    Converters.Key,
+                    options);
 
                 if (that.ReferredSemanticId != null)
                 {
-                    writer.WritePropertyName("referredSemanticId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ReferredSemanticId);
+                    writer.WritePropertyName(PropertyNames.ReferredSemanticId);
+                    Converters.IReference.Write(writer, that.ReferredSemanticId, options);
                 }
 
                 writer.WriteEndObject();
@@ -7858,37 +7126,24 @@ namespace AasCore.Aas3
                                     "Required property is missing: value"));
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "type":
-                                    theType =  (
-                                        Json.JsonSerializer.Deserialize<KeyElements>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.Type.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theType = Converters.KeyElements.Read(
+                                    ref reader, typeof(Aas.KeyElements), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -7906,13 +7161,11 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("type");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Type);
+                writer.WritePropertyName(PropertyNames.Type);
+                Converters.KeyElements.Write(writer, that.Type, options);
 
-                writer.WritePropertyName("value");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Value);
+                writer.WritePropertyName(PropertyNames.Value);
+                writer.WriteStringValue(that.Value);
 
                 writer.WriteEndObject();
             }
@@ -7931,16 +7184,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.IdentifiableElements? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.IdentifiableElementsFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.IdentifiableElementsFromString(text);
                 }
 
-                Aas.IdentifiableElements? value = Stringification.IdentifiableElementsFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid IdentifiableElements: {text}");
+                    $"Invalid IdentifiableElements: {reader.GetString()}");
             }
 
             public override void Write(
@@ -7972,16 +7236,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.ReferableElements? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.ReferableElementsFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.ReferableElementsFromString(text);
                 }
 
-                Aas.ReferableElements? value = Stringification.ReferableElementsFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid ReferableElements: {text}");
+                    $"Invalid ReferableElements: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8013,16 +7288,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.KeyElements? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.KeyElementsFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.KeyElementsFromString(text);
                 }
 
-                Aas.KeyElements? value = Stringification.KeyElementsFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid KeyElements: {text}");
+                    $"Invalid KeyElements: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8054,16 +7340,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.SubmodelElements? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.SubmodelElementsFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.SubmodelElementsFromString(text);
                 }
 
-                Aas.SubmodelElements? value = Stringification.SubmodelElementsFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid SubmodelElements: {text}");
+                    $"Invalid SubmodelElements: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8095,16 +7392,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.BuildInListTypes? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.BuildInListTypesFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.BuildInListTypesFromString(text);
                 }
 
-                Aas.BuildInListTypes? value = Stringification.BuildInListTypesFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid BuildInListTypes: {text}");
+                    $"Invalid BuildInListTypes: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8136,16 +7444,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.DecimalBuildInTypes? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.DecimalBuildInTypesFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.DecimalBuildInTypesFromString(text);
                 }
 
-                Aas.DecimalBuildInTypes? value = Stringification.DecimalBuildInTypesFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid DecimalBuildInTypes: {text}");
+                    $"Invalid DecimalBuildInTypes: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8177,16 +7496,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.DurationBuildInTypes? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.DurationBuildInTypesFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.DurationBuildInTypesFromString(text);
                 }
 
-                Aas.DurationBuildInTypes? value = Stringification.DurationBuildInTypesFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid DurationBuildInTypes: {text}");
+                    $"Invalid DurationBuildInTypes: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8218,16 +7548,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.PrimitiveTypes? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.PrimitiveTypesFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.PrimitiveTypesFromString(text);
                 }
 
-                Aas.PrimitiveTypes? value = Stringification.PrimitiveTypesFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid PrimitiveTypes: {text}");
+                    $"Invalid PrimitiveTypes: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8259,16 +7600,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.StringBuildInTypes? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.StringBuildInTypesFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.StringBuildInTypesFromString(text);
                 }
 
-                Aas.StringBuildInTypes? value = Stringification.StringBuildInTypesFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid StringBuildInTypes: {text}");
+                    $"Invalid StringBuildInTypes: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8300,16 +7652,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.DataTypeDef? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.DataTypeDefFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.DataTypeDefFromString(text);
                 }
 
-                Aas.DataTypeDef? value = Stringification.DataTypeDefFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid DataTypeDef: {text}");
+                    $"Invalid DataTypeDef: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8366,86 +7729,55 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? modelType = null;
-
-                // The initialization at 512 bytes is arbitrary, but plausible.
-                using var buffer = new System.IO.MemoryStream(512);
-
-                while (reader.Read())
+                // The reader is a struct, so the copy acts as a checkpoint.
+                Json.Utf8JsonReader peekReader = reader;
+                while (peekReader.Read()
+                    && peekReader.TokenType != Json.JsonTokenType.EndObject)
                 {
-                    // See https://docs.microsoft.com/en-us/dotnet/api/system.text.json.utf8jsonreader.valuespan#remarks
-                    if (reader.HasValueSequence)
-                    {
-                            foreach (var item in reader.ValueSequence)
-                            {
-                                buffer.Write(item.Span);
-                            }
-                    }
-                    else
+                    if (peekReader.TokenType != Json.JsonTokenType.PropertyName)
                     {
-                        buffer.Write(reader.ValueSpan);
+                        throw new Json.JsonException();
                     }
 
-                    switch (reader.TokenType)
+                    bool isModelType = peekReader.ValueTextEquals(
+                        PropertyNames.ModelType.EncodedUtf8Bytes);
+
+                    MoveToValue(ref peekReader);
+
+                    if (isModelType)
                     {
-                        case Json.JsonTokenType.EndObject:
+                        if (peekReader.TokenType != Json.JsonTokenType.String)
                         {
-                            var secondPassReader = new Json.Utf8JsonReader(
-                                buffer.GetBuffer(),
-                                new Json.JsonReaderOptions
-                                {
-                                    AllowTrailingCommas = options.AllowTrailingCommas,
-                                    CommentHandling = options.ReadCommentHandling,
-                                    MaxDepth = options.MaxDepth
-                                });
-                            switch (modelType)
-                            {
-                                case "DataSpecificationIec61360":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.DataSpecificationIec61360>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null DataSpecificationIec61360 from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                case "DataSpecificationPhysicalUnit":
-                                {
-                                    var deserialized = Json.JsonSerializer.Deserialize<Aas.DataSpecificationPhysicalUnit>(
-                                        ref secondPassReader);
-                                    if (deserialized == null)
-                                    {
-                                        throw new System.InvalidOperationException(
-                                            "Unexpected null DataSpecificationPhysicalUnit from Deserialize call");
-                                    }
-                                    return deserialized;
-                                }
-                                default:
-                                    throw new Json.JsonException(
-                                        $"Unknown model type: {modelType}");
-                            }  // switch on modelType
+                            throw new Json.JsonException(
+                                "Expected modelType to be a string");
                         }
-                        case Json.JsonTokenType.PropertyName:
+
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.DataSpecificationIec61360.EncodedUtf8Bytes))
                         {
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected null property name");
+                            return Converters.DataSpecificationIec61360.Read(
+                                ref reader, typeof(Aas.DataSpecificationIec61360), options);
+                        }
 
-                            if (propertyName == "modelType")
-                            {
-                                modelType = Json.JsonSerializer.Deserialize<string>(
-                                    ref reader);
-                            }
-                                break;
+                        if (peekReader.ValueTextEquals(
+                            ModelTypes.DataSpecificationPhysicalUnit.EncodedUtf8Bytes))
+                        {
+                            return Converters.DataSpecificationPhysicalUnit.Read(
+                                ref reader, typeof(Aas.DataSpecificationPhysicalUnit), options);
                         }
-                        default:
-                            throw new Json.JsonException();
-                    }  // switch on token type
-                }  // while reader.Reader
 
-                throw new Json.JsonException();
+                        throw new Json.JsonException(
+                            $"Unknown model type: {peekReader.GetString()}");
+                    }
+
+                    if (!peekReader.TrySkip())
+                    {
+                        throw new Json.JsonException();
+                    }
+                }  // while peekReader.Read
+
+                throw new Json.JsonException(
+                    "Expected a modelType, but got none");
             }
 
             public override void Write(
@@ -8456,12 +7788,12 @@ namespace AasCore.Aas3
             switch (that)
             {
                 case DataSpecificationIec61360 theDataSpecificationIec61360:
-                    Json.JsonSerializer.Serialize(
-                        writer, theDataSpecificationIec61360);
+                    Converters.DataSpecificationIec61360.Write(
+                        writer, theDataSpecificationIec61360, options);
                     break;
                 case DataSpecificationPhysicalUnit theDataSpecificationPhysicalUnit:
-                    Json.JsonSerializer.Serialize(
-                        writer, theDataSpecificationPhysicalUnit);
+                    Converters.DataSpecificationPhysicalUnit.Write(
+                        writer, theDataSpecificationPhysicalUnit, options);
                     break;
                 default:
                     throw new System.ArgumentException(
@@ -8484,16 +7816,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.DataTypeIec61360? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.DataTypeIec61360FromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.DataTypeIec61360FromString(text);
                 }
 
-                Aas.DataTypeIec61360? value = Stringification.DataTypeIec61360FromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid DataTypeIec61360: {text}");
+                    $"Invalid DataTypeIec61360: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8525,16 +7868,27 @@ namespace AasCore.Aas3
                     throw new Json.JsonException();
                 }
 
-                string? text = reader.GetString();
-                if (text == null)
+                // Parse the UTF-8 bytes in place unless they need to be unescaped.
+                Aas.LevelType? value;
+                if (!reader.HasValueSequence
+                    && System.MemoryExtensions.IndexOf(
+                        reader.ValueSpan, (byte)'\\') == -1)
                 {
-                    throw new Json.JsonException();
+                    value = Stringification.LevelTypeFromUtf8(reader.ValueSpan);
+                }
+                else
+                {
+                    string? text = reader.GetString();
+                    if (text == null)
+                    {
+                        throw new Json.JsonException();
+                    }
+
+                    value = Stringification.LevelTypeFromString(text);
                 }
 
-                Aas.LevelType? value = Stringification.LevelTypeFromString(
-                    text);
                 return value ?? throw new Json.JsonException(
-                    $"Invalid LevelType: {text}");
+                    $"Invalid LevelType: {reader.GetString()}");
             }
 
             public override void Write(
@@ -8582,37 +7936,24 @@ namespace AasCore.Aas3
                                     "Required property is missing: valueId"));
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueId":
-                                    theValueId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -8630,13 +7971,11 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("value");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Value);
+                writer.WritePropertyName(PropertyNames.Value);
+                writer.WriteStringValue(that.Value);
 
-                writer.WritePropertyName("valueId");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ValueId);
+                writer.WritePropertyName(PropertyNames.ValueId);
+                Converters.IReference.Write(writer, that.ValueId, options);
 
                 writer.WriteEndObject();
             }
@@ -8667,32 +8006,20 @@ namespace AasCore.Aas3
                                 theValueReferencePairs);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "valueReferencePairs":
-                                    theValueReferencePairs =  (
-                                        Json.JsonSerializer.Deserialize<List<ValueReferencePair>>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.ValueReferencePairs.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueReferencePairs = ReadList(
+                                    ref reader,
+                                    Converters.ValueReferencePair,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -8710,9 +8037,12 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("valueReferencePairs");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ValueReferencePairs);
+                writer.WritePropertyName(PropertyNames.ValueReferencePairs);
+                WriteList(
+                    writer,
+                    that.ValueReferencePairs,
+                    Converters.ValueReferencePair,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -8767,92 +8097,97 @@ namespace AasCore.Aas3
                                 theLevelType);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "preferredName":
-                                    thePreferredName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "shortName":
-                                    theShortName =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "unit":
-                                    theUnit =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "unitId":
-                                    theUnitId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "sourceOfDefinition":
-                                    theSourceOfDefinition =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "symbol":
-                                    theSymbol =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "dataType":
-                                    theDataType =  (
-                                        Json.JsonSerializer.Deserialize<DataTypeIec61360>(
-                                            ref reader));
-                                    break;
-                                case "definition":
-                                    theDefinition =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "valueFormat":
-                                    theValueFormat =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueList":
-                                    theValueList =  (
-                                        Json.JsonSerializer.Deserialize<ValueList>(
-                                            ref reader));
-                                    break;
-                                case "value":
-                                    theValue =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "valueId":
-                                    theValueId =  (
-                                        Json.JsonSerializer.Deserialize<IReference>(
-                                            ref reader));
-                                    break;
-                                case "levelType":
-                                    theLevelType =  (
-                                        Json.JsonSerializer.Deserialize<LevelType>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.PreferredName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                thePreferredName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ShortName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theShortName = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Unit.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theUnit = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.UnitId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theUnitId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SourceOfDefinition.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSourceOfDefinition = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Symbol.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSymbol = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DataType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDataType = Converters.DataTypeIec61360.Read(
+                                    ref reader, typeof(Aas.DataTypeIec61360), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Definition.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDefinition = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueFormat.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueFormat = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueList.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueList = Converters.ValueList.Read(
+                                    ref reader, typeof(Aas.ValueList), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Value.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValue = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ValueId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theValueId = Converters.IReference.Read(
+                                    ref reader, typeof(Aas.IReference), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.LevelType.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theLevelType = Converters.LevelType.Read(
+                                    ref reader, typeof(Aas.LevelType), options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -8872,93 +8207,80 @@ namespace AasCore.Aas3
 
                 if (that.PreferredName != null)
                 {
-                    writer.WritePropertyName("preferredName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.PreferredName);
+                    writer.WritePropertyName(PropertyNames.PreferredName);
+                    Converters.LangStringSet.Write(writer, that.PreferredName, options);
                 }
 
                 if (that.ShortName != null)
                 {
-                    writer.WritePropertyName("shortName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ShortName);
+                    writer.WritePropertyName(PropertyNames.ShortName);
+                    Converters.LangStringSet.Write(writer, that.ShortName, options);
                 }
 
                 if (that.Unit != null)
                 {
-                    writer.WritePropertyName("unit");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Unit);
+                    writer.WritePropertyName(PropertyNames.Unit);
+                    writer.WriteStringValue(that.Unit);
                 }
 
                 if (that.UnitId != null)
                 {
-                    writer.WritePropertyName("unitId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.UnitId);
+                    writer.WritePropertyName(PropertyNames.UnitId);
+                    Converters.IReference.Write(writer, that.UnitId, options);
                 }
 
                 if (that.SourceOfDefinition != null)
                 {
-                    writer.WritePropertyName("sourceOfDefinition");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SourceOfDefinition);
+                    writer.WritePropertyName(PropertyNames.SourceOfDefinition);
+                    writer.WriteStringValue(that.SourceOfDefinition);
                 }
 
                 if (that.Symbol != null)
                 {
-                    writer.WritePropertyName("symbol");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Symbol);
+                    writer.WritePropertyName(PropertyNames.Symbol);
+                    writer.WriteStringValue(that.Symbol);
                 }
 
                 if (that.DataType != null)
                 {
-                    writer.WritePropertyName("dataType");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DataType);
+                    writer.WritePropertyName(PropertyNames.DataType);
+                    Converters.DataTypeIec61360.Write(writer, that.DataType.Value, options);
                 }
 
                 if (that.Definition != null)
                 {
-                    writer.WritePropertyName("definition");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Definition);
+                    writer.WritePropertyName(PropertyNames.Definition);
+                    Converters.LangStringSet.Write(writer, that.Definition, options);
                 }
 
                 if (that.ValueFormat != null)
                 {
-                    writer.WritePropertyName("valueFormat");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueFormat);
+                    writer.WritePropertyName(PropertyNames.ValueFormat);
+                    writer.WriteStringValue(that.ValueFormat);
                 }
 
                 if (that.ValueList != null)
                 {
-                    writer.WritePropertyName("valueList");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueList);
+                    writer.WritePropertyName(PropertyNames.ValueList);
+                    Converters.ValueList.Write(writer, that.ValueList, options);
                 }
 
                 if (that.Value != null)
                 {
-                    writer.WritePropertyName("value");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Value);
+                    writer.WritePropertyName(PropertyNames.Value);
+                    writer.WriteStringValue(that.Value);
                 }
 
                 if (that.ValueId != null)
                 {
-                    writer.WritePropertyName("valueId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ValueId);
+                    writer.WritePropertyName(PropertyNames.ValueId);
+                    Converters.IReference.Write(writer, that.ValueId, options);
                 }
 
                 if (that.LevelType != null)
                 {
-                    writer.WritePropertyName("levelType");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.LevelType);
+                    writer.WritePropertyName(PropertyNames.LevelType);
+                    Converters.LevelType.Write(writer, that.LevelType.Value, options);
                 }
 
                 writer.WriteEndObject();
@@ -9012,87 +8334,84 @@ namespace AasCore.Aas3
                                 theSupplier);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "unitName":
-                                    theUnitName =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "unitSymbol":
-                                    theUnitSymbol =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "definition":
-                                    theDefinition =  (
-                                        Json.JsonSerializer.Deserialize<LangStringSet>(
-                                            ref reader));
-                                    break;
-                                case "siNotation":
-                                    theSiNotation =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "dinNotation":
-                                    theDinNotation =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "eceName":
-                                    theEceName =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "eceCode":
-                                    theEceCode =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "nistName":
-                                    theNistName =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "sourceOfDefinition":
-                                    theSourceOfDefinition =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "conversionFactor":
-                                    theConversionFactor =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "registrationAuthorityId":
-                                    theRegistrationAuthorityId =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                case "supplier":
-                                    theSupplier =  (
-                                        Json.JsonSerializer.Deserialize<string>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.UnitName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theUnitName = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.UnitSymbol.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theUnitSymbol = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Definition.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDefinition = Converters.LangStringSet.Read(
+                                    ref reader, typeof(Aas.LangStringSet), options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SiNotation.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSiNotation = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.DinNotation.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theDinNotation = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.EceName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theEceName = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.EceCode.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theEceCode = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.NistName.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theNistName = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.SourceOfDefinition.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSourceOfDefinition = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ConversionFactor.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theConversionFactor = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.RegistrationAuthorityId.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theRegistrationAuthorityId = ReadString(ref reader);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Supplier.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSupplier = ReadString(ref reader);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -9112,86 +8431,74 @@ namespace AasCore.Aas3
 
                 if (that.UnitName != null)
                 {
-                    writer.WritePropertyName("unitName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.UnitName);
+                    writer.WritePropertyName(PropertyNames.UnitName);
+                    writer.WriteStringValue(that.UnitName);
                 }
 
                 if (that.UnitSymbol != null)
                 {
-                    writer.WritePropertyName("unitSymbol");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.UnitSymbol);
+                    writer.WritePropertyName(PropertyNames.UnitSymbol);
+                    writer.WriteStringValue(that.UnitSymbol);
                 }
 
                 if (that.Definition != null)
                 {
-                    writer.WritePropertyName("definition");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Definition);
+                    writer.WritePropertyName(PropertyNames.Definition);
+                    Converters.LangStringSet.Write(writer, that.Definition, options);
                 }
 
                 if (that.SiNotation != null)
                 {
-                    writer.WritePropertyName("siNotation");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SiNotation);
+                    writer.WritePropertyName(PropertyNames.SiNotation);
+                    writer.WriteStringValue(that.SiNotation);
                 }
 
                 if (that.DinNotation != null)
                 {
-                    writer.WritePropertyName("dinNotation");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.DinNotation);
+                    writer.WritePropertyName(PropertyNames.DinNotation);
+                    writer.WriteStringValue(that.DinNotation);
                 }
 
                 if (that.EceName != null)
                 {
-                    writer.WritePropertyName("eceName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.EceName);
+                    writer.WritePropertyName(PropertyNames.EceName);
+                    writer.WriteStringValue(that.EceName);
                 }
 
                 if (that.EceCode != null)
                 {
-                    writer.WritePropertyName("eceCode");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.EceCode);
+                    writer.WritePropertyName(PropertyNames.EceCode);
+                    writer.WriteStringValue(that.EceCode);
                 }
 
                 if (that.NistName != null)
                 {
-                    writer.WritePropertyName("nistName");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.NistName);
+                    writer.WritePropertyName(PropertyNames.NistName);
+                    writer.WriteStringValue(that.NistName);
                 }
 
                 if (that.SourceOfDefinition != null)
                 {
-                    writer.WritePropertyName("sourceOfDefinition");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.SourceOfDefinition);
+                    writer.WritePropertyName(PropertyNames.SourceOfDefinition);
+                    writer.WriteStringValue(that.SourceOfDefinition);
                 }
 
                 if (that.ConversionFactor != null)
                 {
-                    writer.WritePropertyName("conversionFactor");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.ConversionFactor);
+                    writer.WritePropertyName(PropertyNames.ConversionFactor);
+                    writer.WriteStringValue(that.ConversionFactor);
                 }
 
                 if (that.RegistrationAuthorityId != null)
                 {
-                    writer.WritePropertyName("registrationAuthorityId");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.RegistrationAuthorityId);
+                    writer.WritePropertyName(PropertyNames.RegistrationAuthorityId);
+                    writer.WriteStringValue(that.RegistrationAuthorityId);
                 }
 
                 if (that.Supplier != null)
                 {
-                    writer.WritePropertyName("supplier");
-                    Json.JsonSerializer.Serialize(
-                        writer, that.Supplier);
+                    writer.WritePropertyName(PropertyNames.Supplier);
+                    writer.WriteStringValue(that.Supplier);
                 }
 
                 writer.WriteEndObject();
@@ -9227,42 +8534,38 @@ namespace AasCore.Aas3
                                 theConceptDescriptions);
 
                         case Json.JsonTokenType.PropertyName:
-                            string propertyName = reader.GetString()
-                                ?? throw new System.InvalidOperationException(
-                                    "Unexpected property name null");
-
-                            switch (propertyName)
-                            {
-                                case "assetAdministrationShells":
-                                    theAssetAdministrationShells =  (
-                                        Json.JsonSerializer.Deserialize<List<AssetAdministrationShell>>(
-                                            ref reader));
-                                    break;
-                                case "submodels":
-                                    theSubmodels =  (
-                                        Json.JsonSerializer.Deserialize<List<Submodel>>(
-                                            ref reader));
-                                    break;
-                                case "conceptDescriptions":
-                                    theConceptDescriptions =  (
-                                        Json.JsonSerializer.Deserialize<List<ConceptDescription>>(
-                                            ref reader));
-                                    break;
-                                default:
-                                    // Ignore an unknown property
-                                    if (!reader.Read())
-                                    {
-                                        throw new Json.JsonException(
-                                            $"Unexpected end-of-stream after the property: {propertyName}");
-                                    }
-                                    if (!reader.TrySkip())
-                                    {
-                                        throw new Json.JsonException(
-                                            "Unexpected end-of-stream when skipping " +
-                                            $"the value of the unknown property: {propertyName}");
-                                    }
-                                    break;
-                            }  // switch on propertyName
+                            if (reader.ValueTextEquals(
+                                PropertyNames.AssetAdministrationShells.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theAssetAdministrationShells = ReadList(
+                                    ref reader,
+                                    Converters.AssetAdministrationShell,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.Submodels.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theSubmodels = ReadList(
+                                    ref reader,
+                                    Converters.Submodel,
+                                    options);
+                            }
+                            else if (reader.ValueTextEquals(
+                                PropertyNames.ConceptDescriptions.EncodedUtf8Bytes))
+                            {
+                                MoveToValue(ref reader);
+                                theConceptDescriptions = ReadList(
+                                    ref reader,
+                                    Converters.ConceptDescription,
+                                    options);
+                            }
+                            else
+                            {
+                                // Ignore an unknown property
+                                SkipProperty(ref reader);
+                            }
                             break;
 
                         default:
@@ -9280,17 +8583,26 @@ namespace AasCore.Aas3
             {
                 writer.WriteStartObject();
 
-                writer.WritePropertyName("assetAdministrationShells");
-                Json.JsonSerializer.Serialize(
-                    writer, that.AssetAdministrationShells);
-
-                writer.WritePropertyName("submodels");
-                Json.JsonSerializer.Serialize(
-                    writer, that.Submodels);
-
-                writer.WritePropertyName("conceptDescriptions");
-                Json.JsonSerializer.Serialize(
-                    writer, that.ConceptDescriptions);
+                writer.WritePropertyName(PropertyNames.AssetAdministrationShells);
+                WriteList(
+                    writer,
+                    that.AssetAdministrationShells,
+                    Converters.AssetAdministrationShell,
+                    options);
+
+                writer.WritePropertyName(PropertyNames.Submodels);
+                WriteList(
+                    writer,
+                    that.Submodels,
+                    Converters.Submodel,
+                    options);
+
+                writer.WritePropertyName(PropertyNames.ConceptDescriptions);
+                WriteList(
+                    writer,
+                    that.ConceptDescriptions,
+                    Converters.ConceptDescription,
+                    options);
 
                 writer.WriteEndObject();
             }
@@ -9367,6 +8679,480 @@ namespace AasCore.Aas3
                 new EnvironmentJsonConverter()
             };
         }
+
+        /// <summary>
+        /// Hold a shared instance of each converter so that the converters
+        /// call each other directly instead of looking each other up
+        /// in the serializer options.
+        /// </summary>
+        private static class Converters
+        {
+            internal static readonly IHasSemanticsJsonConverter IHasSemantics =
+                new IHasSemanticsJsonConverter();
+            internal static readonly ExtensionJsonConverter Extension =
+                new ExtensionJsonConverter();
+            internal static readonly IHasExtensionsJsonConverter IHasExtensions =
+                new IHasExtensionsJsonConverter();
+            internal static readonly IReferableJsonConverter IReferable =
+                new IReferableJsonConverter();
+            internal static readonly IIdentifiableJsonConverter IIdentifiable =
+                new IIdentifiableJsonConverter();
+            internal static readonly ModelingKindJsonConverter ModelingKind =
+                new ModelingKindJsonConverter();
+            internal static readonly IHasKindJsonConverter IHasKind =
+                new IHasKindJsonConverter();
+            internal static readonly IHasDataSpecificationJsonConverter IHasDataSpecification =
+                new IHasDataSpecificationJsonConverter();
+            internal static readonly AdministrativeInformationJsonConverter AdministrativeInformation =
+                new AdministrativeInformationJsonConverter();
+            internal static readonly IConstraintJsonConverter IConstraint =
+                new IConstraintJsonConverter();
+            internal static readonly IQualifiableJsonConverter IQualifiable =
+                new IQualifiableJsonConverter();
+            internal static readonly QualifierJsonConverter Qualifier =
+                new QualifierJsonConverter();
+            internal static readonly FormulaJsonConverter Formula =
+                new FormulaJsonConverter();
+            internal static readonly AssetAdministrationShellJsonConverter AssetAdministrationShell =
+                new AssetAdministrationShellJsonConverter();
+            internal static readonly AssetInformationJsonConverter AssetInformation =
+                new AssetInformationJsonConverter();
+            internal static readonly AssetKindJsonConverter AssetKind =
+                new AssetKindJsonConverter();
+            internal static readonly IdentifierKeyValuePairJsonConverter IdentifierKeyValuePair =
+                new IdentifierKeyValuePairJsonConverter();
+            internal static readonly SubmodelJsonConverter Submodel =
+                new SubmodelJsonConverter();
+            internal static readonly ISubmodelElementJsonConverter ISubmodelElement =
+                new ISubmodelElementJsonConverter();
+            internal static readonly IRelationshipElementJsonConverter IRelationshipElement =
+                new IRelationshipElementJsonConverter();
+            internal static readonly SubmodelElementListJsonConverter SubmodelElementList =
+                new SubmodelElementListJsonConverter();
+            internal static readonly SubmodelElementStructJsonConverter SubmodelElementStruct =
+                new SubmodelElementStructJsonConverter();
+            internal static readonly IDataElementJsonConverter IDataElement =
+                new IDataElementJsonConverter();
+            internal static readonly PropertyJsonConverter Property =
+                new PropertyJsonConverter();
+            internal static readonly MultiLanguagePropertyJsonConverter MultiLanguageProperty =
+                new MultiLanguagePropertyJsonConverter();
+            internal static readonly RangeJsonConverter Range =
+                new RangeJsonConverter();
+            internal static readonly ReferenceElementJsonConverter ReferenceElement =
+                new ReferenceElementJsonConverter();
+            internal static readonly BlobJsonConverter Blob =
+                new BlobJsonConverter();
+            internal static readonly FileJsonConverter File =
+                new FileJsonConverter();
+            internal static readonly AnnotatedRelationshipElementJsonConverter AnnotatedRelationshipElement =
+                new AnnotatedRelationshipElementJsonConverter();
+            internal static readonly EntityTypeJsonConverter EntityType =
+                new EntityTypeJsonConverter();
+            internal static readonly EntityJsonConverter Entity =
+                new EntityJsonConverter();
+            internal static readonly IEventJsonConverter IEvent =
+                new IEventJsonConverter();
+            internal static readonly BasicEventJsonConverter BasicEvent =
+                new BasicEventJsonConverter();
+            internal static readonly OperationJsonConverter Operation =
+                new OperationJsonConverter();
+            internal static readonly OperationVariableJsonConverter OperationVariable =
+                new OperationVariableJsonConverter();
+            internal static readonly CapabilityJsonConverter Capability =
+                new CapabilityJsonConverter();
+            internal static readonly ConceptDescriptionJsonConverter ConceptDescription =
+                new ConceptDescriptionJsonConverter();
+            internal static readonly ViewJsonConverter View =
+                new ViewJsonConverter();
+            internal static readonly IReferenceJsonConverter IReference =
+                new IReferenceJsonConverter();
+            internal static readonly GlobalReferenceJsonConverter GlobalReference =
+                new GlobalReferenceJsonConverter();
+            internal static readonly ModelReferenceJsonConverter ModelReference =
+                new ModelReferenceJsonConverter();
+            internal static readonly KeyJsonConverter Key =
+                new KeyJsonConverter();
+            internal static readonly IdentifiableElementsJsonConverter IdentifiableElements =
+                new IdentifiableElementsJsonConverter();
+            internal static readonly ReferableElementsJsonConverter ReferableElements =
+                new ReferableElementsJsonConverter();
+            internal static readonly KeyElementsJsonConverter KeyElements =
+                new KeyElementsJsonConverter();
+            internal static readonly SubmodelElementsJsonConverter SubmodelElements =
+                new SubmodelElementsJsonConverter();
+            internal static readonly BuildInListTypesJsonConverter BuildInListTypes =
+                new BuildInListTypesJsonConverter();
+            internal static readonly DecimalBuildInTypesJsonConverter DecimalBuildInTypes =
+                new DecimalBuildInTypesJsonConverter();
+            internal static readonly DurationBuildInTypesJsonConverter DurationBuildInTypes =
+                new DurationBuildInTypesJsonConverter();
+            internal static readonly PrimitiveTypesJsonConverter PrimitiveTypes =
+                new PrimitiveTypesJsonConverter();
+            internal static readonly StringBuildInTypesJsonConverter StringBuildInTypes =
+                new StringBuildInTypesJsonConverter();
+            internal static readonly DataTypeDefJsonConverter DataTypeDef =
+                new DataTypeDefJsonConverter();
+            internal static readonly LangStringSetJsonConverter LangStringSet =
+                new LangStringSetJsonConverter();
+            internal static readonly IDataSpecificationContentJsonConverter IDataSpecificationContent =
+                new IDataSpecificationContentJsonConverter();
+            internal static readonly DataTypeIec61360JsonConverter DataTypeIec61360 =
+                new DataTypeIec61360JsonConverter();
+            internal static readonly LevelTypeJsonConverter LevelType =
+                new LevelTypeJsonConverter();
+            internal static readonly ValueReferencePairJsonConverter ValueReferencePair =
+                new ValueReferencePairJsonConverter();
+            internal static readonly ValueListJsonConverter ValueList =
+                new ValueListJsonConverter();
+            internal static readonly DataSpecificationIec61360JsonConverter DataSpecificationIec61360 =
+                new DataSpecificationIec61360JsonConverter();
+            internal static readonly DataSpecificationPhysicalUnitJsonConverter DataSpecificationPhysicalUnit =
+                new DataSpecificationPhysicalUnitJsonConverter();
+            internal static readonly EnvironmentJsonConverter Environment =
+                new EnvironmentJsonConverter();
+        }  // private static class Converters
+
+        /// <summary>
+        /// Hold the property names encoded in UTF-8 so that the readers match
+        /// them without allocating strings and the writers do not re-encode them.
+        /// </summary>
+        private static class PropertyNames
+        {
+            internal static readonly Json.JsonEncodedText Administration =
+                Json.JsonEncodedText.Encode("administration");
+            internal static readonly Json.JsonEncodedText Annotation =
+                Json.JsonEncodedText.Encode("annotation");
+            internal static readonly Json.JsonEncodedText AssetAdministrationShells =
+                Json.JsonEncodedText.Encode("assetAdministrationShells");
+            internal static readonly Json.JsonEncodedText AssetInformation =
+                Json.JsonEncodedText.Encode("assetInformation");
+            internal static readonly Json.JsonEncodedText AssetKind =
+                Json.JsonEncodedText.Encode("assetKind");
+            internal static readonly Json.JsonEncodedText Category =
+                Json.JsonEncodedText.Encode("category");
+            internal static readonly Json.JsonEncodedText ConceptDescriptions =
+                Json.JsonEncodedText.Encode("conceptDescriptions");
+            internal static readonly Json.JsonEncodedText ContainedElements =
+                Json.JsonEncodedText.Encode("containedElements");
+            internal static readonly Json.JsonEncodedText ConversionFactor =
+                Json.JsonEncodedText.Encode("conversionFactor");
+            internal static readonly Json.JsonEncodedText DataSpecifications =
+                Json.JsonEncodedText.Encode("dataSpecifications");
+            internal static readonly Json.JsonEncodedText DataType =
+                Json.JsonEncodedText.Encode("dataType");
+            internal static readonly Json.JsonEncodedText DefaultThumbnail =
+                Json.JsonEncodedText.Encode("defaultThumbnail");
+            internal static readonly Json.JsonEncodedText Definition =
+                Json.JsonEncodedText.Encode("definition");
+            internal static readonly Json.JsonEncodedText DependsOn =
+                Json.JsonEncodedText.Encode("dependsOn");
+            internal static readonly Json.JsonEncodedText DerivedFrom =
+                Json.JsonEncodedText.Encode("derivedFrom");
+            internal static readonly Json.JsonEncodedText Description =
+                Json.JsonEncodedText.Encode("description");
+            internal static readonly Json.JsonEncodedText DinNotation =
+                Json.JsonEncodedText.Encode("dinNotation");
+            internal static readonly Json.JsonEncodedText DisplayName =
+                Json.JsonEncodedText.Encode("displayName");
+            internal static readonly Json.JsonEncodedText EceCode =
+                Json.JsonEncodedText.Encode("eceCode");
+            internal static readonly Json.JsonEncodedText EceName =
+                Json.JsonEncodedText.Encode("eceName");
+            internal static readonly Json.JsonEncodedText EntityType =
+                Json.JsonEncodedText.Encode("entityType");
+            internal static readonly Json.JsonEncodedText Extensions =
+                Json.JsonEncodedText.Encode("extensions");
+            internal static readonly Json.JsonEncodedText ExternalSubjectId =
+                Json.JsonEncodedText.Encode("externalSubjectId");
+            internal static readonly Json.JsonEncodedText First =
+                Json.JsonEncodedText.Encode("first");
+            internal static readonly Json.JsonEncodedText GlobalAssetId =
+                Json.JsonEncodedText.Encode("globalAssetId");
+            internal static readonly Json.JsonEncodedText Id =
+                Json.JsonEncodedText.Encode("id");
+            internal static readonly Json.JsonEncodedText IdShort =
+                Json.JsonEncodedText.Encode("idShort");
+            internal static readonly Json.JsonEncodedText InoutputVariables =
+                Json.JsonEncodedText.Encode("inoutputVariables");
+            internal static readonly Json.JsonEncodedText InputVariables =
+                Json.JsonEncodedText.Encode("inputVariables");
+            internal static readonly Json.JsonEncodedText IsCaseOf =
+                Json.JsonEncodedText.Encode("isCaseOf");
+            internal static readonly Json.JsonEncodedText Key =
+                Json.JsonEncodedText.Encode("key");
+            internal static readonly Json.JsonEncodedText Keys =
+                Json.JsonEncodedText.Encode("keys");
+            internal static readonly Json.JsonEncodedText Kind =
+                Json.JsonEncodedText.Encode("kind");
+            internal static readonly Json.JsonEncodedText LevelType =
+                Json.JsonEncodedText.Encode("levelType");
+            internal static readonly Json.JsonEncodedText Max =
+                Json.JsonEncodedText.Encode("max");
+            internal static readonly Json.JsonEncodedText MimeType =
+                Json.JsonEncodedText.Encode("mimeType");
+            internal static readonly Json.JsonEncodedText Min =
+                Json.JsonEncodedText.Encode("min");
+            internal static readonly Json.JsonEncodedText ModelType =
+                Json.JsonEncodedText.Encode("modelType");
+            internal static readonly Json.JsonEncodedText Name =
+                Json.JsonEncodedText.Encode("name");
+            internal static readonly Json.JsonEncodedText NistName =
+                Json.JsonEncodedText.Encode("nistName");
+            internal static readonly Json.JsonEncodedText Observed =
+                Json.JsonEncodedText.Encode("observed");
+            internal static readonly Json.JsonEncodedText OutputVariables =
+                Json.JsonEncodedText.Encode("outputVariables");
+            internal static readonly Json.JsonEncodedText PreferredName =
+                Json.JsonEncodedText.Encode("preferredName");
+            internal static readonly Json.JsonEncodedText Qualifiers =
+                Json.JsonEncodedText.Encode("qualifiers");
+            internal static readonly Json.JsonEncodedText ReferredSemanticId =
+                Json.JsonEncodedText.Encode("referredSemanticId");
+            internal static readonly Json.JsonEncodedText RefersTo =
+                Json.JsonEncodedText.Encode("refersTo");
+            internal static readonly Json.JsonEncodedText RegistrationAuthorityId =
+                Json.JsonEncodedText.Encode("registrationAuthorityId");
+            internal static readonly Json.JsonEncodedText Revision =
+                Json.JsonEncodedText.Encode("revision");
+            internal static readonly Json.JsonEncodedText Second =
+                Json.JsonEncodedText.Encode("second");
+            internal static readonly Json.JsonEncodedText SemanticId =
+                Json.JsonEncodedText.Encode("semanticId");
+            internal static readonly Json.JsonEncodedText SemanticIdValues =
+                Json.JsonEncodedText.Encode("semanticIdValues");
+            internal static readonly Json.JsonEncodedText ShortName =
+                Json.JsonEncodedText.Encode("shortName");
+            internal static readonly Json.JsonEncodedText SiNotation =
+                Json.JsonEncodedText.Encode("siNotation");
+            internal static readonly Json.JsonEncodedText SourceOfDefinition =
+                Json.JsonEncodedText.Encode("sourceOfDefinition");
+            internal static readonly Json.JsonEncodedText SpecificAssetId =
+                Json.JsonEncodedText.Encode("specificAssetId");
+            internal static readonly Json.JsonEncodedText Statements =
+                Json.JsonEncodedText.Encode("statements");
+            internal static readonly Json.JsonEncodedText SubmodelElementTypeValues =
+                Json.JsonEncodedText.Encode("submodelElementTypeValues");
+            internal static readonly Json.JsonEncodedText SubmodelElements =
+                Json.JsonEncodedText.Encode("submodelElements");
+            internal static readonly Json.JsonEncodedText Submodels =
+                Json.JsonEncodedText.Encode("submodels");
+            internal static readonly Json.JsonEncodedText Supplier =
+                Json.JsonEncodedText.Encode("supplier");
+            internal static readonly Json.JsonEncodedText Symbol =
+                Json.JsonEncodedText.Encode("symbol");
+            internal static readonly Json.JsonEncodedText Type =
+                Json.JsonEncodedText.Encode("type");
+            internal static readonly Json.JsonEncodedText Unit =
+                Json.JsonEncodedText.Encode("unit");
+            internal static readonly Json.JsonEncodedText UnitId =
+                Json.JsonEncodedText.Encode("unitId");
+            internal static readonly Json.JsonEncodedText UnitName =
+                Json.JsonEncodedText.Encode("unitName");
+            internal static readonly Json.JsonEncodedText UnitSymbol =
+                Json.JsonEncodedText.Encode("unitSymbol");
+            internal static readonly Json.JsonEncodedText Value =
+                Json.JsonEncodedText.Encode("value");
+            internal static readonly Json.JsonEncodedText ValueFormat =
+                Json.JsonEncodedText.Encode("valueFormat");
+            internal static readonly Json.JsonEncodedText ValueId =
+                Json.JsonEncodedText.Encode("valueId");
+            internal static readonly Json.JsonEncodedText ValueList =
+                Json.JsonEncodedText.Encode("valueList");
+            internal static readonly Json.JsonEncodedText ValueReferencePairs =
+                Json.JsonEncodedText.Encode("valueReferencePairs");
+            internal static readonly Json.JsonEncodedText ValueType =
+                Json.JsonEncodedText.Encode("valueType");
+            internal static readonly Json.JsonEncodedText ValueTypeValues =
+                Json.JsonEncodedText.Encode("valueTypeValues");
+            internal static readonly Json.JsonEncodedText Values =
+                Json.JsonEncodedText.Encode("values");
+            internal static readonly Json.JsonEncodedText Version =
+                Json.JsonEncodedText.Encode("version");
+        }  // private static class PropertyNames
+
+        /// <summary>
+        /// Hold the model types encoded in UTF-8.
+        /// </summary>
+        private static class ModelTypes
+        {
+            internal static readonly Json.JsonEncodedText AdministrativeInformation =
+                Json.JsonEncodedText.Encode("AdministrativeInformation");
+            internal static readonly Json.JsonEncodedText AnnotatedRelationshipElement =
+                Json.JsonEncodedText.Encode("AnnotatedRelationshipElement");
+            internal static readonly Json.JsonEncodedText AssetAdministrationShell =
+                Json.JsonEncodedText.Encode("AssetAdministrationShell");
+            internal static readonly Json.JsonEncodedText BasicEvent =
+                Json.JsonEncodedText.Encode("BasicEvent");
+            internal static readonly Json.JsonEncodedText Blob =
+                Json.JsonEncodedText.Encode("Blob");
+            internal static readonly Json.JsonEncodedText Capability =
+                Json.JsonEncodedText.Encode("Capability");
+            internal static readonly Json.JsonEncodedText ConceptDescription =
+                Json.JsonEncodedText.Encode("ConceptDescription");
+            internal static readonly Json.JsonEncodedText DataSpecificationIec61360 =
+                Json.JsonEncodedText.Encode("DataSpecificationIec61360");
+            internal static readonly Json.JsonEncodedText DataSpecificationPhysicalUnit =
+                Json.JsonEncodedText.Encode("DataSpecificationPhysicalUnit");
+            internal static readonly Json.JsonEncodedText Entity =
+                Json.JsonEncodedText.Encode("Entity");
+            internal static readonly Json.JsonEncodedText Extension =
+                Json.JsonEncodedText.Encode("Extension");
+            internal static readonly Json.JsonEncodedText File =
+                Json.JsonEncodedText.Encode("File");
+            internal static readonly Json.JsonEncodedText Formula =
+                Json.JsonEncodedText.Encode("Formula");
+            internal static readonly Json.JsonEncodedText GlobalReference =
+                Json.JsonEncodedText.Encode("GlobalReference");
+            internal static readonly Json.JsonEncodedText IdentifierKeyValuePair =
+                Json.JsonEncodedText.Encode("IdentifierKeyValuePair");
+            internal static readonly Json.JsonEncodedText ModelReference =
+                Json.JsonEncodedText.Encode("ModelReference");
+            internal static readonly Json.JsonEncodedText MultiLanguageProperty =
+                Json.JsonEncodedText.Encode("MultiLanguageProperty");
+            internal static readonly Json.JsonEncodedText Operation =
+                Json.JsonEncodedText.Encode("Operation");
+            internal static readonly Json.JsonEncodedText Property =
+                Json.JsonEncodedText.Encode("Property");
+            internal static readonly Json.JsonEncodedText Qualifier =
+                Json.JsonEncodedText.Encode("Qualifier");
+            internal static readonly Json.JsonEncodedText Range =
+                Json.JsonEncodedText.Encode("Range");
+            internal static readonly Json.JsonEncodedText ReferenceElement =
+                Json.JsonEncodedText.Encode("ReferenceElement");
+            internal static readonly Json.JsonEncodedText Submodel =
+                Json.JsonEncodedText.Encode("Submodel");
+            internal static readonly Json.JsonEncodedText SubmodelElementList =
+                Json.JsonEncodedText.Encode("SubmodelElementList");
+            internal static readonly Json.JsonEncodedText SubmodelElementStruct =
+                Json.JsonEncodedText.Encode("SubmodelElementStruct");
+            internal static readonly Json.JsonEncodedText View =
+                Json.JsonEncodedText.Encode("View");
+        }  // private static class ModelTypes
+
+        private static void MoveToValue(ref Json.Utf8JsonReader reader)
+        {
+            if (!reader.Read())
+            {
+                throw new Json.JsonException(
+                    "Unexpected end-of-stream after a property name");
+            }
+        }
+
+        private static void SkipProperty(ref Json.Utf8JsonReader reader)
+        {
+            // The reader stays on the property name if the skip fails.
+            if (!reader.TrySkip())
+            {
+                throw new Json.JsonException(
+                    "Unexpected end-of-stream when skipping " +
+                    $"the value of the property: {reader.GetString()}");
+            }
+        }
+
+        private static bool ReadBool(ref Json.Utf8JsonReader reader)
+        {
+            switch (reader.TokenType)
+            {
+                case Json.JsonTokenType.True:
+                    return true;
+                case Json.JsonTokenType.False:
+                    return false;
+                default:
+                    throw new Json.JsonException(
+                        $"Expected a boolean, but got: {reader.TokenType}");
+            }
+        }
+
+        private static int ReadInt(ref Json.Utf8JsonReader reader)
+        {
+            if (reader.TokenType != Json.JsonTokenType.Number
+                || !reader.TryGetInt32(out int value))
+            {
+                throw new Json.JsonException(
+                    $"Expected a 32-bit integer, but got: {reader.TokenType}");
+            }
+
+            return value;
+        }
+
+        private static float ReadFloat(ref Json.Utf8JsonReader reader)
+        {
+            if (reader.TokenType != Json.JsonTokenType.Number
+                || !reader.TryGetSingle(out float value))
+            {
+                throw new Json.JsonException(
+                    $"Expected a single-precision number, but got: {reader.TokenType}");
+            }
+
+            return value;
+        }
+
+        private static string ReadString(ref Json.Utf8JsonReader reader)
+        {
+            if (reader.TokenType != Json.JsonTokenType.String)
+            {
+                throw new Json.JsonException(
+                    $"Expected a string, but got: {reader.TokenType}");
+            }
+
+            return reader.GetString()
+                ?? throw new System.InvalidOperationException(
+                    "Unexpected null string");
+        }
+
+        private static byte[] ReadBytes(ref Json.Utf8JsonReader reader)
+        {
+            if (reader.TokenType != Json.JsonTokenType.String
+                || !reader.TryGetBytesFromBase64(out byte[]? value))
+            {
+                throw new Json.JsonException(
+                    $"Expected a base64-encoded string, but got: {reader.TokenType}");
+            }
+
+            return value;
+        }
+
+        private static List<T> ReadList<T>(
+            ref Json.Utf8JsonReader reader,
+            Json.Serialization.JsonConverter<T> converter,
+            Json.JsonSerializerOptions options)
+        {
+            if (reader.TokenType != Json.JsonTokenType.StartArray)
+            {
+                throw new Json.JsonException(
+                    $"Expected an array, but got: {reader.TokenType}");
+            }
+
+            var result = new List<T>();
+            while (reader.Read())
+            {
+                if (reader.TokenType == Json.JsonTokenType.EndArray)
+                {
+                    return result;
+                }
+
+                result.Add(
+                    converter.Read(ref reader, typeof(T), options)
+                    ?? throw new Json.JsonException("Unexpected null item"));
+            }
+
+            throw new Json.JsonException("Unexpected end-of-stream in an array");
+        }
+
+        private static void WriteList<T>(
+            Json.Utf8JsonWriter writer,
+            List<T> items,
+            Json.Serialization.JsonConverter<T> converter,
+            Json.JsonSerializerOptions options)
+        {
+            writer.WriteStartArray();
+            foreach (var item in items)
+            {
+                converter.Write(writer, item, options);
+            }
+            writer.WriteEndArray();
+        }
     }  // public static class Jsonization
 }  // namespace AasCore.Aas3
 
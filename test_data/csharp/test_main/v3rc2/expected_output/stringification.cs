@@ -3,20 +3,43 @@
  * Do NOT edit or append.
  */
 
-using System.Collections.Generic;  // can't alias
-
 using Aas = AasCore.Aas3;
 
 namespace AasCore.Aas3
 {
     public static class Stringification
     {
-        private static readonly Dictionary<Aas.ModelingKind, string> _modelingKindToString = (
-            new Dictionary<Aas.ModelingKind, string>()
+        /// <summary>
+        /// Compare the characters of <paramref name="text" /> ordinally
+        /// with <paramref name="literal" />.
+        /// </summary>
+        private static bool EqualsOrdinal(System.ReadOnlySpan<char> text, string literal)
+        {
+            return System.MemoryExtensions.SequenceEqual(
+                text, (System.ReadOnlySpan<char>)literal);
+        }
+
+        /// <summary>
+        /// Compare the UTF-8 bytes of <paramref name="text" /> with
+        /// the ASCII <paramref name="literal" />.
+        /// </summary>
+        private static bool EqualsAscii(System.ReadOnlySpan<byte> text, string literal)
+        {
+            if (text.Length != literal.Length)
+            {
+                return false;
+            }
+
+            for (int i = 0; i < literal.Length; i++)
             {
-                { Aas.ModelingKind.Template, "TEMPLATE" },
-                { Aas.ModelingKind.Instance, "INSTANCE" }
-            });
+                if (text[i] != literal[i])
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -26,23 +49,14 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.ModelingKind that)
         {
-            if (_modelingKindToString.TryGetValue(that, out string? value))
+            return that switch
             {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+                Aas.ModelingKind.Template => "TEMPLATE",
+                Aas.ModelingKind.Instance => "INSTANCE",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.ModelingKind> _modelingKindFromString = (
-            new Dictionary<string, Aas.ModelingKind>()
-            {
-                { "TEMPLATE", Aas.ModelingKind.Template },
-                { "INSTANCE", Aas.ModelingKind.Instance }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="ModelingKind" />.
         /// </summary>
@@ -53,22 +67,78 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.ModelingKind? ModelingKindFromString(string text)
         {
-            if (_modelingKindFromString.TryGetValue(text, out ModelingKind value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return ModelingKindFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="ModelingKind" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="ModelingKind" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.ModelingKind? ModelingKindFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 8:
+                    switch (text[0])
+                    {
+                        case 'T':
+                            if (EqualsOrdinal(text, "TEMPLATE"))
+                            {
+                                return Aas.ModelingKind.Template;
+                            }
+                            break;
+                        case 'I':
+                            if (EqualsOrdinal(text, "INSTANCE"))
+                            {
+                                return Aas.ModelingKind.Instance;
+                            }
+                            break;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.AssetKind, string> _assetKindToString = (
-            new Dictionary<Aas.AssetKind, string>()
-            {
-                { Aas.AssetKind.Type, "Type" },
-                { Aas.AssetKind.Instance, "Instance" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="ModelingKind" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="ModelingKind" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.ModelingKind? ModelingKindFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 8:
+                    switch (text[0])
+                    {
+                        case (byte)'T':
+                            if (EqualsAscii(text, "TEMPLATE"))
+                            {
+                                return Aas.ModelingKind.Template;
+                            }
+                            break;
+                        case (byte)'I':
+                            if (EqualsAscii(text, "INSTANCE"))
+                            {
+                                return Aas.ModelingKind.Instance;
+                            }
+                            break;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -78,23 +148,14 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.AssetKind that)
         {
-            if (_assetKindToString.TryGetValue(that, out string? value))
+            return that switch
             {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+                Aas.AssetKind.Type => "Type",
+                Aas.AssetKind.Instance => "Instance",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.AssetKind> _assetKindFromString = (
-            new Dictionary<string, Aas.AssetKind>()
-            {
-                { "Type", Aas.AssetKind.Type },
-                { "Instance", Aas.AssetKind.Instance }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="AssetKind" />.
         /// </summary>
@@ -105,22 +166,68 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.AssetKind? AssetKindFromString(string text)
         {
-            if (_assetKindFromString.TryGetValue(text, out AssetKind value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return AssetKindFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="AssetKind" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="AssetKind" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.AssetKind? AssetKindFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    if (EqualsOrdinal(text, "Type"))
+                    {
+                        return Aas.AssetKind.Type;
+                    }
+                    break;
+                case 8:
+                    if (EqualsOrdinal(text, "Instance"))
+                    {
+                        return Aas.AssetKind.Instance;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.EntityType, string> _entityTypeToString = (
-            new Dictionary<Aas.EntityType, string>()
-            {
-                { Aas.EntityType.CoManagedEntity, "COMANAGEDENTITY" },
-                { Aas.EntityType.SelfManagedEntity, "SELFMANAGEDENTITY" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="AssetKind" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="AssetKind" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.AssetKind? AssetKindFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    if (EqualsAscii(text, "Type"))
+                    {
+                        return Aas.AssetKind.Type;
+                    }
+                    break;
+                case 8:
+                    if (EqualsAscii(text, "Instance"))
+                    {
+                        return Aas.AssetKind.Instance;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -130,23 +237,14 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.EntityType that)
         {
-            if (_entityTypeToString.TryGetValue(that, out string? value))
+            return that switch
             {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+                Aas.EntityType.CoManagedEntity => "COMANAGEDENTITY",
+                Aas.EntityType.SelfManagedEntity => "SELFMANAGEDENTITY",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.EntityType> _entityTypeFromString = (
-            new Dictionary<string, Aas.EntityType>()
-            {
-                { "COMANAGEDENTITY", Aas.EntityType.CoManagedEntity },
-                { "SELFMANAGEDENTITY", Aas.EntityType.SelfManagedEntity }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="EntityType" />.
         /// </summary>
@@ -157,23 +255,68 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.EntityType? EntityTypeFromString(string text)
         {
-            if (_entityTypeFromString.TryGetValue(text, out EntityType value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return EntityTypeFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="EntityType" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="EntityType" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.EntityType? EntityTypeFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 15:
+                    if (EqualsOrdinal(text, "COMANAGEDENTITY"))
+                    {
+                        return Aas.EntityType.CoManagedEntity;
+                    }
+                    break;
+                case 17:
+                    if (EqualsOrdinal(text, "SELFMANAGEDENTITY"))
+                    {
+                        return Aas.EntityType.SelfManagedEntity;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.IdentifiableElements, string> _identifiableElementsToString = (
-            new Dictionary<Aas.IdentifiableElements, string>()
-            {
-                { Aas.IdentifiableElements.AssetAdministrationShell, "AssetAdministrationShell" },
-                { Aas.IdentifiableElements.ConceptDescription, "ConceptDescription" },
-                { Aas.IdentifiableElements.Submodel, "Submodel" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="EntityType" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="EntityType" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.EntityType? EntityTypeFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 15:
+                    if (EqualsAscii(text, "COMANAGEDENTITY"))
+                    {
+                        return Aas.EntityType.CoManagedEntity;
+                    }
+                    break;
+                case 17:
+                    if (EqualsAscii(text, "SELFMANAGEDENTITY"))
+                    {
+                        return Aas.EntityType.SelfManagedEntity;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -183,24 +326,15 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.IdentifiableElements that)
         {
-            if (_identifiableElementsToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
+            return that switch
             {
-                return null;
-            }
+                Aas.IdentifiableElements.AssetAdministrationShell => "AssetAdministrationShell",
+                Aas.IdentifiableElements.ConceptDescription => "ConceptDescription",
+                Aas.IdentifiableElements.Submodel => "Submodel",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.IdentifiableElements> _identifiableElementsFromString = (
-            new Dictionary<string, Aas.IdentifiableElements>()
-            {
-                { "AssetAdministrationShell", Aas.IdentifiableElements.AssetAdministrationShell },
-                { "ConceptDescription", Aas.IdentifiableElements.ConceptDescription },
-                { "Submodel", Aas.IdentifiableElements.Submodel }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="IdentifiableElements" />.
         /// </summary>
@@ -211,42 +345,80 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.IdentifiableElements? IdentifiableElementsFromString(string text)
         {
-            if (_identifiableElementsFromString.TryGetValue(text, out IdentifiableElements value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return IdentifiableElementsFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="IdentifiableElements" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="IdentifiableElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.IdentifiableElements? IdentifiableElementsFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 8:
+                    if (EqualsOrdinal(text, "Submodel"))
+                    {
+                        return Aas.IdentifiableElements.Submodel;
+                    }
+                    break;
+                case 18:
+                    if (EqualsOrdinal(text, "ConceptDescription"))
+                    {
+                        return Aas.IdentifiableElements.ConceptDescription;
+                    }
+                    break;
+                case 24:
+                    if (EqualsOrdinal(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.IdentifiableElements.AssetAdministrationShell;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.ReferableElements, string> _referableElementsToString = (
-            new Dictionary<Aas.ReferableElements, string>()
-            {
-                { Aas.ReferableElements.AccessPermissionRule, "AccessPermissionRule" },
-                { Aas.ReferableElements.AnnotatedRelationshipElement, "AnnotatedRelationshipElement" },
-                { Aas.ReferableElements.Asset, "Asset" },
-                { Aas.ReferableElements.AssetAdministrationShell, "AssetAdministrationShell" },
-                { Aas.ReferableElements.BasicEvent, "BasicEvent" },
-                { Aas.ReferableElements.Blob, "Blob" },
-                { Aas.ReferableElements.Capability, "Capability" },
-                { Aas.ReferableElements.ConceptDescription, "ConceptDescription" },
-                { Aas.ReferableElements.DataElement, "DataElement" },
-                { Aas.ReferableElements.Entity, "Entity" },
-                { Aas.ReferableElements.Event, "Event" },
-                { Aas.ReferableElements.File, "File" },
-                { Aas.ReferableElements.MultiLanguageProperty, "MultiLanguageProperty" },
-                { Aas.ReferableElements.Operation, "Operation" },
-                { Aas.ReferableElements.Property, "Property" },
-                { Aas.ReferableElements.Range, "Range" },
-                { Aas.ReferableElements.ReferenceElement, "ReferenceElement" },
-                { Aas.ReferableElements.RelationshipElement, "RelationshipElement" },
-                { Aas.ReferableElements.Submodel, "Submodel" },
-                { Aas.ReferableElements.SubmodelElement, "SubmodelElement" },
-                { Aas.ReferableElements.SubmodelElementList, "SubmodelElementList" },
-                { Aas.ReferableElements.SubmodelElementStruct, "SubmodelElementStruct" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="IdentifiableElements" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="IdentifiableElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.IdentifiableElements? IdentifiableElementsFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 8:
+                    if (EqualsAscii(text, "Submodel"))
+                    {
+                        return Aas.IdentifiableElements.Submodel;
+                    }
+                    break;
+                case 18:
+                    if (EqualsAscii(text, "ConceptDescription"))
+                    {
+                        return Aas.IdentifiableElements.ConceptDescription;
+                    }
+                    break;
+                case 24:
+                    if (EqualsAscii(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.IdentifiableElements.AssetAdministrationShell;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -256,43 +428,34 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.ReferableElements that)
         {
-            if (_referableElementsToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.ReferableElements.AccessPermissionRule => "AccessPermissionRule",
+                Aas.ReferableElements.AnnotatedRelationshipElement => "AnnotatedRelationshipElement",
+                Aas.ReferableElements.Asset => "Asset",
+                Aas.ReferableElements.AssetAdministrationShell => "AssetAdministrationShell",
+                Aas.ReferableElements.BasicEvent => "BasicEvent",
+                Aas.ReferableElements.Blob => "Blob",
+                Aas.ReferableElements.Capability => "Capability",
+                Aas.ReferableElements.ConceptDescription => "ConceptDescription",
+                Aas.ReferableElements.DataElement => "DataElement",
+                Aas.ReferableElements.Entity => "Entity",
+                Aas.ReferableElements.Event => "Event",
+                Aas.ReferableElements.File => "File",
+                Aas.ReferableElements.MultiLanguageProperty => "MultiLanguageProperty",
+                Aas.ReferableElements.Operation => "Operation",
+                Aas.ReferableElements.Property => "Property",
+                Aas.ReferableElements.Range => "Range",
+                Aas.ReferableElements.ReferenceElement => "ReferenceElement",
+                Aas.ReferableElements.RelationshipElement => "RelationshipElement",
+                Aas.ReferableElements.Submodel => "Submodel",
+                Aas.ReferableElements.SubmodelElement => "SubmodelElement",
+                Aas.ReferableElements.SubmodelElementList => "SubmodelElementList",
+                Aas.ReferableElements.SubmodelElementStruct => "SubmodelElementStruct",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.ReferableElements> _referableElementsFromString = (
-            new Dictionary<string, Aas.ReferableElements>()
-            {
-                { "AccessPermissionRule", Aas.ReferableElements.AccessPermissionRule },
-                { "AnnotatedRelationshipElement", Aas.ReferableElements.AnnotatedRelationshipElement },
-                { "Asset", Aas.ReferableElements.Asset },
-                { "AssetAdministrationShell", Aas.ReferableElements.AssetAdministrationShell },
-                { "BasicEvent", Aas.ReferableElements.BasicEvent },
-                { "Blob", Aas.ReferableElements.Blob },
-                { "Capability", Aas.ReferableElements.Capability },
-                { "ConceptDescription", Aas.ReferableElements.ConceptDescription },
-                { "DataElement", Aas.ReferableElements.DataElement },
-                { "Entity", Aas.ReferableElements.Entity },
-                { "Event", Aas.ReferableElements.Event },
-                { "File", Aas.ReferableElements.File },
-                { "MultiLanguageProperty", Aas.ReferableElements.MultiLanguageProperty },
-                { "Operation", Aas.ReferableElements.Operation },
-                { "Property", Aas.ReferableElements.Property },
-                { "Range", Aas.ReferableElements.Range },
-                { "ReferenceElement", Aas.ReferableElements.ReferenceElement },
-                { "RelationshipElement", Aas.ReferableElements.RelationshipElement },
-                { "Submodel", Aas.ReferableElements.Submodel },
-                { "SubmodelElement", Aas.ReferableElements.SubmodelElement },
-                { "SubmodelElementList", Aas.ReferableElements.SubmodelElementList },
-                { "SubmodelElementStruct", Aas.ReferableElements.SubmodelElementStruct }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="ReferableElements" />.
         /// </summary>
@@ -303,44 +466,368 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.ReferableElements? ReferableElementsFromString(string text)
         {
-            if (_referableElementsFromString.TryGetValue(text, out ReferableElements value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return ReferableElementsFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="ReferableElements" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="ReferableElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.ReferableElements? ReferableElementsFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'B':
+                            if (EqualsOrdinal(text, "Blob"))
+                            {
+                                return Aas.ReferableElements.Blob;
+                            }
+                            break;
+                        case 'F':
+                            if (EqualsOrdinal(text, "File"))
+                            {
+                                return Aas.ReferableElements.File;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case 'A':
+                            if (EqualsOrdinal(text, "Asset"))
+                            {
+                                return Aas.ReferableElements.Asset;
+                            }
+                            break;
+                        case 'E':
+                            if (EqualsOrdinal(text, "Event"))
+                            {
+                                return Aas.ReferableElements.Event;
+                            }
+                            break;
+                        case 'R':
+                            if (EqualsOrdinal(text, "Range"))
+                            {
+                                return Aas.ReferableElements.Range;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsOrdinal(text, "Entity"))
+                    {
+                        return Aas.ReferableElements.Entity;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case 'P':
+                            if (EqualsOrdinal(text, "Property"))
+                            {
+                                return Aas.ReferableElements.Property;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "Submodel"))
+                            {
+                                return Aas.ReferableElements.Submodel;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    if (EqualsOrdinal(text, "Operation"))
+                    {
+                        return Aas.ReferableElements.Operation;
+                    }
+                    break;
+                case 10:
+                    switch (text[0])
+                    {
+                        case 'B':
+                            if (EqualsOrdinal(text, "BasicEvent"))
+                            {
+                                return Aas.ReferableElements.BasicEvent;
+                            }
+                            break;
+                        case 'C':
+                            if (EqualsOrdinal(text, "Capability"))
+                            {
+                                return Aas.ReferableElements.Capability;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsOrdinal(text, "DataElement"))
+                    {
+                        return Aas.ReferableElements.DataElement;
+                    }
+                    break;
+                case 15:
+                    if (EqualsOrdinal(text, "SubmodelElement"))
+                    {
+                        return Aas.ReferableElements.SubmodelElement;
+                    }
+                    break;
+                case 16:
+                    if (EqualsOrdinal(text, "ReferenceElement"))
+                    {
+                        return Aas.ReferableElements.ReferenceElement;
+                    }
+                    break;
+                case 18:
+                    if (EqualsOrdinal(text, "ConceptDescription"))
+                    {
+                        return Aas.ReferableElements.ConceptDescription;
+                    }
+                    break;
+                case 19:
+                    switch (text[0])
+                    {
+                        case 'R':
+                            if (EqualsOrdinal(text, "RelationshipElement"))
+                            {
+                                return Aas.ReferableElements.RelationshipElement;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElementList"))
+                            {
+                                return Aas.ReferableElements.SubmodelElementList;
+                            }
+                            break;
+                    }
+                    break;
+                case 20:
+                    if (EqualsOrdinal(text, "AccessPermissionRule"))
+                    {
+                        return Aas.ReferableElements.AccessPermissionRule;
+                    }
+                    break;
+                case 21:
+                    switch (text[0])
+                    {
+                        case 'M':
+                            if (EqualsOrdinal(text, "MultiLanguageProperty"))
+                            {
+                                return Aas.ReferableElements.MultiLanguageProperty;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElementStruct"))
+                            {
+                                return Aas.ReferableElements.SubmodelElementStruct;
+                            }
+                            break;
+                    }
+                    break;
+                case 24:
+                    if (EqualsOrdinal(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.ReferableElements.AssetAdministrationShell;
+                    }
+                    break;
+                case 28:
+                    if (EqualsOrdinal(text, "AnnotatedRelationshipElement"))
+                    {
+                        return Aas.ReferableElements.AnnotatedRelationshipElement;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.KeyElements, string> _keyElementsToString = (
-            new Dictionary<Aas.KeyElements, string>()
-            {
-                { Aas.KeyElements.FragmentReference, "FragmentReference" },
-                { Aas.KeyElements.AccessPermissionRule, "AccessPermissionRule" },
-                { Aas.KeyElements.AnnotatedRelationshipElement, "AnnotatedRelationshipElement" },
-                { Aas.KeyElements.Asset, "Asset" },
-                { Aas.KeyElements.AssetAdministrationShell, "AssetAdministrationShell" },
-                { Aas.KeyElements.BasicEvent, "BasicEvent" },
-                { Aas.KeyElements.Blob, "Blob" },
-                { Aas.KeyElements.Capability, "Capability" },
-                { Aas.KeyElements.ConceptDescription, "ConceptDescription" },
-                { Aas.KeyElements.DataElement, "DataElement" },
-                { Aas.KeyElements.Entity, "Entity" },
-                { Aas.KeyElements.Event, "Event" },
-                { Aas.KeyElements.File, "File" },
-                { Aas.KeyElements.MultiLanguageProperty, "MultiLanguageProperty" },
-                { Aas.KeyElements.Operation, "Operation" },
-                { Aas.KeyElements.Property, "Property" },
-                { Aas.KeyElements.Range, "Range" },
-                { Aas.KeyElements.GlobalReference, "GlobalReference" },
-                { Aas.KeyElements.ReferenceElement, "ReferenceElement" },
-                { Aas.KeyElements.RelationshipElement, "RelationshipElement" },
-                { Aas.KeyElements.Submodel, "Submodel" },
-                { Aas.KeyElements.SubmodelElement, "SubmodelElement" },
-                { Aas.KeyElements.SubmodelElementList, "SubmodelElementList" },
-                { Aas.KeyElements.SubmodelElementStruct, "SubmodelElementStruct" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="ReferableElements" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="ReferableElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.ReferableElements? ReferableElementsFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'B':
+                            if (EqualsAscii(text, "Blob"))
+                            {
+                                return Aas.ReferableElements.Blob;
+                            }
+                            break;
+                        case (byte)'F':
+                            if (EqualsAscii(text, "File"))
+                            {
+                                return Aas.ReferableElements.File;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case (byte)'A':
+                            if (EqualsAscii(text, "Asset"))
+                            {
+                                return Aas.ReferableElements.Asset;
+                            }
+                            break;
+                        case (byte)'E':
+                            if (EqualsAscii(text, "Event"))
+                            {
+                                return Aas.ReferableElements.Event;
+                            }
+                            break;
+                        case (byte)'R':
+                            if (EqualsAscii(text, "Range"))
+                            {
+                                return Aas.ReferableElements.Range;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsAscii(text, "Entity"))
+                    {
+                        return Aas.ReferableElements.Entity;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case (byte)'P':
+                            if (EqualsAscii(text, "Property"))
+                            {
+                                return Aas.ReferableElements.Property;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "Submodel"))
+                            {
+                                return Aas.ReferableElements.Submodel;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    if (EqualsAscii(text, "Operation"))
+                    {
+                        return Aas.ReferableElements.Operation;
+                    }
+                    break;
+                case 10:
+                    switch (text[0])
+                    {
+                        case (byte)'B':
+                            if (EqualsAscii(text, "BasicEvent"))
+                            {
+                                return Aas.ReferableElements.BasicEvent;
+                            }
+                            break;
+                        case (byte)'C':
+                            if (EqualsAscii(text, "Capability"))
+                            {
+                                return Aas.ReferableElements.Capability;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsAscii(text, "DataElement"))
+                    {
+                        return Aas.ReferableElements.DataElement;
+                    }
+                    break;
+                case 15:
+                    if (EqualsAscii(text, "SubmodelElement"))
+                    {
+                        return Aas.ReferableElements.SubmodelElement;
+                    }
+                    break;
+                case 16:
+                    if (EqualsAscii(text, "ReferenceElement"))
+                    {
+                        return Aas.ReferableElements.ReferenceElement;
+                    }
+                    break;
+                case 18:
+                    if (EqualsAscii(text, "ConceptDescription"))
+                    {
+                        return Aas.ReferableElements.ConceptDescription;
+                    }
+                    break;
+                case 19:
+                    switch (text[0])
+                    {
+                        case (byte)'R':
+                            if (EqualsAscii(text, "RelationshipElement"))
+                            {
+                                return Aas.ReferableElements.RelationshipElement;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElementList"))
+                            {
+                                return Aas.ReferableElements.SubmodelElementList;
+                            }
+                            break;
+                    }
+                    break;
+                case 20:
+                    if (EqualsAscii(text, "AccessPermissionRule"))
+                    {
+                        return Aas.ReferableElements.AccessPermissionRule;
+                    }
+                    break;
+                case 21:
+                    switch (text[0])
+                    {
+                        case (byte)'M':
+                            if (EqualsAscii(text, "MultiLanguageProperty"))
+                            {
+                                return Aas.ReferableElements.MultiLanguageProperty;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElementStruct"))
+                            {
+                                return Aas.ReferableElements.SubmodelElementStruct;
+                            }
+                            break;
+                    }
+                    break;
+                case 24:
+                    if (EqualsAscii(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.ReferableElements.AssetAdministrationShell;
+                    }
+                    break;
+                case 28:
+                    if (EqualsAscii(text, "AnnotatedRelationshipElement"))
+                    {
+                        return Aas.ReferableElements.AnnotatedRelationshipElement;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -350,45 +837,36 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.KeyElements that)
         {
-            if (_keyElementsToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.KeyElements.FragmentReference => "FragmentReference",
+                Aas.KeyElements.AccessPermissionRule => "AccessPermissionRule",
+                Aas.KeyElements.AnnotatedRelationshipElement => "AnnotatedRelationshipElement",
+                Aas.KeyElements.Asset => "Asset",
+                Aas.KeyElements.AssetAdministrationShell => "AssetAdministrationShell",
+                Aas.KeyElements.BasicEvent => "BasicEvent",
+                Aas.KeyElements.Blob => "Blob",
+                Aas.KeyElements.Capability => "Capability",
+                Aas.KeyElements.ConceptDescription => "ConceptDescription",
+                Aas.KeyElements.DataElement => "DataElement",
+                Aas.KeyElements.Entity => "Entity",
+                Aas.KeyElements.Event => "Event",
+                Aas.KeyElements.File => "File",
+                Aas.KeyElements.MultiLanguageProperty => "MultiLanguageProperty",
+                Aas.KeyElements.Operation => "Operation",
+                Aas.KeyElements.Property => "Property",
+                Aas.KeyElements.Range => "Range",
+                Aas.KeyElements.GlobalReference => "GlobalReference",
+                Aas.KeyElements.ReferenceElement => "ReferenceElement",
+                Aas.KeyElements.RelationshipElement => "RelationshipElement",
+                Aas.KeyElements.Submodel => "Submodel",
+                Aas.KeyElements.SubmodelElement => "SubmodelElement",
+                Aas.KeyElements.SubmodelElementList => "SubmodelElementList",
+                Aas.KeyElements.SubmodelElementStruct => "SubmodelElementStruct",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.KeyElements> _keyElementsFromString = (
-            new Dictionary<string, Aas.KeyElements>()
-            {
-                { "FragmentReference", Aas.KeyElements.FragmentReference },
-                { "AccessPermissionRule", Aas.KeyElements.AccessPermissionRule },
-                { "AnnotatedRelationshipElement", Aas.KeyElements.AnnotatedRelationshipElement },
-                { "Asset", Aas.KeyElements.Asset },
-                { "AssetAdministrationShell", Aas.KeyElements.AssetAdministrationShell },
-                { "BasicEvent", Aas.KeyElements.BasicEvent },
-                { "Blob", Aas.KeyElements.Blob },
-                { "Capability", Aas.KeyElements.Capability },
-                { "ConceptDescription", Aas.KeyElements.ConceptDescription },
-                { "DataElement", Aas.KeyElements.DataElement },
-                { "Entity", Aas.KeyElements.Entity },
-                { "Event", Aas.KeyElements.Event },
-                { "File", Aas.KeyElements.File },
-                { "MultiLanguageProperty", Aas.KeyElements.MultiLanguageProperty },
-                { "Operation", Aas.KeyElements.Operation },
-                { "Property", Aas.KeyElements.Property },
-                { "Range", Aas.KeyElements.Range },
-                { "GlobalReference", Aas.KeyElements.GlobalReference },
-                { "ReferenceElement", Aas.KeyElements.ReferenceElement },
-                { "RelationshipElement", Aas.KeyElements.RelationshipElement },
-                { "Submodel", Aas.KeyElements.Submodel },
-                { "SubmodelElement", Aas.KeyElements.SubmodelElement },
-                { "SubmodelElementList", Aas.KeyElements.SubmodelElementList },
-                { "SubmodelElementStruct", Aas.KeyElements.SubmodelElementStruct }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="KeyElements" />.
         /// </summary>
@@ -399,41 +877,402 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.KeyElements? KeyElementsFromString(string text)
         {
-            if (_keyElementsFromString.TryGetValue(text, out KeyElements value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return KeyElementsFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="KeyElements" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="KeyElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.KeyElements? KeyElementsFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'B':
+                            if (EqualsOrdinal(text, "Blob"))
+                            {
+                                return Aas.KeyElements.Blob;
+                            }
+                            break;
+                        case 'F':
+                            if (EqualsOrdinal(text, "File"))
+                            {
+                                return Aas.KeyElements.File;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case 'A':
+                            if (EqualsOrdinal(text, "Asset"))
+                            {
+                                return Aas.KeyElements.Asset;
+                            }
+                            break;
+                        case 'E':
+                            if (EqualsOrdinal(text, "Event"))
+                            {
+                                return Aas.KeyElements.Event;
+                            }
+                            break;
+                        case 'R':
+                            if (EqualsOrdinal(text, "Range"))
+                            {
+                                return Aas.KeyElements.Range;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsOrdinal(text, "Entity"))
+                    {
+                        return Aas.KeyElements.Entity;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case 'P':
+                            if (EqualsOrdinal(text, "Property"))
+                            {
+                                return Aas.KeyElements.Property;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "Submodel"))
+                            {
+                                return Aas.KeyElements.Submodel;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    if (EqualsOrdinal(text, "Operation"))
+                    {
+                        return Aas.KeyElements.Operation;
+                    }
+                    break;
+                case 10:
+                    switch (text[0])
+                    {
+                        case 'B':
+                            if (EqualsOrdinal(text, "BasicEvent"))
+                            {
+                                return Aas.KeyElements.BasicEvent;
+                            }
+                            break;
+                        case 'C':
+                            if (EqualsOrdinal(text, "Capability"))
+                            {
+                                return Aas.KeyElements.Capability;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsOrdinal(text, "DataElement"))
+                    {
+                        return Aas.KeyElements.DataElement;
+                    }
+                    break;
+                case 15:
+                    switch (text[0])
+                    {
+                        case 'G':
+                            if (EqualsOrdinal(text, "GlobalReference"))
+                            {
+                                return Aas.KeyElements.GlobalReference;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElement"))
+                            {
+                                return Aas.KeyElements.SubmodelElement;
+                            }
+                            break;
+                    }
+                    break;
+                case 16:
+                    if (EqualsOrdinal(text, "ReferenceElement"))
+                    {
+                        return Aas.KeyElements.ReferenceElement;
+                    }
+                    break;
+                case 17:
+                    if (EqualsOrdinal(text, "FragmentReference"))
+                    {
+                        return Aas.KeyElements.FragmentReference;
+                    }
+                    break;
+                case 18:
+                    if (EqualsOrdinal(text, "ConceptDescription"))
+                    {
+                        return Aas.KeyElements.ConceptDescription;
+                    }
+                    break;
+                case 19:
+                    switch (text[0])
+                    {
+                        case 'R':
+                            if (EqualsOrdinal(text, "RelationshipElement"))
+                            {
+                                return Aas.KeyElements.RelationshipElement;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElementList"))
+                            {
+                                return Aas.KeyElements.SubmodelElementList;
+                            }
+                            break;
+                    }
+                    break;
+                case 20:
+                    if (EqualsOrdinal(text, "AccessPermissionRule"))
+                    {
+                        return Aas.KeyElements.AccessPermissionRule;
+                    }
+                    break;
+                case 21:
+                    switch (text[0])
+                    {
+                        case 'M':
+                            if (EqualsOrdinal(text, "MultiLanguageProperty"))
+                            {
+                                return Aas.KeyElements.MultiLanguageProperty;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElementStruct"))
+                            {
+                                return Aas.KeyElements.SubmodelElementStruct;
+                            }
+                            break;
+                    }
+                    break;
+                case 24:
+                    if (EqualsOrdinal(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.KeyElements.AssetAdministrationShell;
+                    }
+                    break;
+                case 28:
+                    if (EqualsOrdinal(text, "AnnotatedRelationshipElement"))
+                    {
+                        return Aas.KeyElements.AnnotatedRelationshipElement;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.SubmodelElements, string> _submodelElementsToString = (
-            new Dictionary<Aas.SubmodelElements, string>()
-            {
-                { Aas.SubmodelElements.AnnotatedRelationshipElement, "AnnotatedRelationshipElement" },
-                { Aas.SubmodelElements.Asset, "Asset" },
-                { Aas.SubmodelElements.AssetAdministrationShell, "AssetAdministrationShell" },
-                { Aas.SubmodelElements.BasicEvent, "BasicEvent" },
-                { Aas.SubmodelElements.Blob, "Blob" },
-                { Aas.SubmodelElements.Capability, "Capability" },
-                { Aas.SubmodelElements.ConceptDescription, "ConceptDescription" },
-                { Aas.SubmodelElements.DataElement, "DataElement" },
-                { Aas.SubmodelElements.Entity, "Entity" },
-                { Aas.SubmodelElements.Event, "Event" },
-                { Aas.SubmodelElements.File, "File" },
-                { Aas.SubmodelElements.MultiLanguageProperty, "MultiLanguageProperty" },
-                { Aas.SubmodelElements.Operation, "Operation" },
-                { Aas.SubmodelElements.Property, "Property" },
-                { Aas.SubmodelElements.Range, "Range" },
-                { Aas.SubmodelElements.ReferenceElement, "ReferenceElement" },
-                { Aas.SubmodelElements.RelationshipElement, "RelationshipElement" },
-                { Aas.SubmodelElements.Submodel, "Submodel" },
-                { Aas.SubmodelElements.SubmodelElement, "SubmodelElement" },
-                { Aas.SubmodelElements.SubmodelElementList, "SubmodelElementList" },
-                { Aas.SubmodelElements.SubmodelElementStruct, "SubmodelElementStruct" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="KeyElements" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="KeyElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.KeyElements? KeyElementsFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'B':
+                            if (EqualsAscii(text, "Blob"))
+                            {
+                                return Aas.KeyElements.Blob;
+                            }
+                            break;
+                        case (byte)'F':
+                            if (EqualsAscii(text, "File"))
+                            {
+                                return Aas.KeyElements.File;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case (byte)'A':
+                            if (EqualsAscii(text, "Asset"))
+                            {
+                                return Aas.KeyElements.Asset;
+                            }
+                            break;
+                        case (byte)'E':
+                            if (EqualsAscii(text, "Event"))
+                            {
+                                return Aas.KeyElements.Event;
+                            }
+                            break;
+                        case (byte)'R':
+                            if (EqualsAscii(text, "Range"))
+                            {
+                                return Aas.KeyElements.Range;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsAscii(text, "Entity"))
+                    {
+                        return Aas.KeyElements.Entity;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case (byte)'P':
+                            if (EqualsAscii(text, "Property"))
+                            {
+                                return Aas.KeyElements.Property;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "Submodel"))
+                            {
+                                return Aas.KeyElements.Submodel;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    if (EqualsAscii(text, "Operation"))
+                    {
+                        return Aas.KeyElements.Operation;
+                    }
+                    break;
+                case 10:
+                    switch (text[0])
+                    {
+                        case (byte)'B':
+                            if (EqualsAscii(text, "BasicEvent"))
+                            {
+                                return Aas.KeyElements.BasicEvent;
+                            }
+                            break;
+                        case (byte)'C':
+                            if (EqualsAscii(text, "Capability"))
+                            {
+                                return Aas.KeyElements.Capability;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsAscii(text, "DataElement"))
+                    {
+                        return Aas.KeyElements.DataElement;
+                    }
+                    break;
+                case 15:
+                    switch (text[0])
+                    {
+                        case (byte)'G':
+                            if (EqualsAscii(text, "GlobalReference"))
+                            {
+                                return Aas.KeyElements.GlobalReference;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElement"))
+                            {
+                                return Aas.KeyElements.SubmodelElement;
+                            }
+                            break;
+                    }
+                    break;
+                case 16:
+                    if (EqualsAscii(text, "ReferenceElement"))
+                    {
+                        return Aas.KeyElements.ReferenceElement;
+                    }
+                    break;
+                case 17:
+                    if (EqualsAscii(text, "FragmentReference"))
+                    {
+                        return Aas.KeyElements.FragmentReference;
+                    }
+                    break;
+                case 18:
+                    if (EqualsAscii(text, "ConceptDescription"))
+                    {
+                        return Aas.KeyElements.ConceptDescription;
+                    }
+                    break;
+                case 19:
+                    switch (text[0])
+                    {
+                        case (byte)'R':
+                            if (EqualsAscii(text, "RelationshipElement"))
+                            {
+                                return Aas.KeyElements.RelationshipElement;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElementList"))
+                            {
+                                return Aas.KeyElements.SubmodelElementList;
+                            }
+                            break;
+                    }
+                    break;
+                case 20:
+                    if (EqualsAscii(text, "AccessPermissionRule"))
+                    {
+                        return Aas.KeyElements.AccessPermissionRule;
+                    }
+                    break;
+                case 21:
+                    switch (text[0])
+                    {
+                        case (byte)'M':
+                            if (EqualsAscii(text, "MultiLanguageProperty"))
+                            {
+                                return Aas.KeyElements.MultiLanguageProperty;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElementStruct"))
+                            {
+                                return Aas.KeyElements.SubmodelElementStruct;
+                            }
+                            break;
+                    }
+                    break;
+                case 24:
+                    if (EqualsAscii(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.KeyElements.AssetAdministrationShell;
+                    }
+                    break;
+                case 28:
+                    if (EqualsAscii(text, "AnnotatedRelationshipElement"))
+                    {
+                        return Aas.KeyElements.AnnotatedRelationshipElement;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -443,42 +1282,33 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.SubmodelElements that)
         {
-            if (_submodelElementsToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.SubmodelElements.AnnotatedRelationshipElement => "AnnotatedRelationshipElement",
+                Aas.SubmodelElements.Asset => "Asset",
+                Aas.SubmodelElements.AssetAdministrationShell => "AssetAdministrationShell",
+                Aas.SubmodelElements.BasicEvent => "BasicEvent",
+                Aas.SubmodelElements.Blob => "Blob",
+                Aas.SubmodelElements.Capability => "Capability",
+                Aas.SubmodelElements.ConceptDescription => "ConceptDescription",
+                Aas.SubmodelElements.DataElement => "DataElement",
+                Aas.SubmodelElements.Entity => "Entity",
+                Aas.SubmodelElements.Event => "Event",
+                Aas.SubmodelElements.File => "File",
+                Aas.SubmodelElements.MultiLanguageProperty => "MultiLanguageProperty",
+                Aas.SubmodelElements.Operation => "Operation",
+                Aas.SubmodelElements.Property => "Property",
+                Aas.SubmodelElements.Range => "Range",
+                Aas.SubmodelElements.ReferenceElement => "ReferenceElement",
+                Aas.SubmodelElements.RelationshipElement => "RelationshipElement",
+                Aas.SubmodelElements.Submodel => "Submodel",
+                Aas.SubmodelElements.SubmodelElement => "SubmodelElement",
+                Aas.SubmodelElements.SubmodelElementList => "SubmodelElementList",
+                Aas.SubmodelElements.SubmodelElementStruct => "SubmodelElementStruct",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.SubmodelElements> _submodelElementsFromString = (
-            new Dictionary<string, Aas.SubmodelElements>()
-            {
-                { "AnnotatedRelationshipElement", Aas.SubmodelElements.AnnotatedRelationshipElement },
-                { "Asset", Aas.SubmodelElements.Asset },
-                { "AssetAdministrationShell", Aas.SubmodelElements.AssetAdministrationShell },
-                { "BasicEvent", Aas.SubmodelElements.BasicEvent },
-                { "Blob", Aas.SubmodelElements.Blob },
-                { "Capability", Aas.SubmodelElements.Capability },
-                { "ConceptDescription", Aas.SubmodelElements.ConceptDescription },
-                { "DataElement", Aas.SubmodelElements.DataElement },
-                { "Entity", Aas.SubmodelElements.Entity },
-                { "Event", Aas.SubmodelElements.Event },
-                { "File", Aas.SubmodelElements.File },
-                { "MultiLanguageProperty", Aas.SubmodelElements.MultiLanguageProperty },
-                { "Operation", Aas.SubmodelElements.Operation },
-                { "Property", Aas.SubmodelElements.Property },
-                { "Range", Aas.SubmodelElements.Range },
-                { "ReferenceElement", Aas.SubmodelElements.ReferenceElement },
-                { "RelationshipElement", Aas.SubmodelElements.RelationshipElement },
-                { "Submodel", Aas.SubmodelElements.Submodel },
-                { "SubmodelElement", Aas.SubmodelElements.SubmodelElement },
-                { "SubmodelElementList", Aas.SubmodelElements.SubmodelElementList },
-                { "SubmodelElementStruct", Aas.SubmodelElements.SubmodelElementStruct }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="SubmodelElements" />.
         /// </summary>
@@ -489,23 +1319,356 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.SubmodelElements? SubmodelElementsFromString(string text)
         {
-            if (_submodelElementsFromString.TryGetValue(text, out SubmodelElements value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return SubmodelElementsFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="SubmodelElements" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="SubmodelElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.SubmodelElements? SubmodelElementsFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'B':
+                            if (EqualsOrdinal(text, "Blob"))
+                            {
+                                return Aas.SubmodelElements.Blob;
+                            }
+                            break;
+                        case 'F':
+                            if (EqualsOrdinal(text, "File"))
+                            {
+                                return Aas.SubmodelElements.File;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case 'A':
+                            if (EqualsOrdinal(text, "Asset"))
+                            {
+                                return Aas.SubmodelElements.Asset;
+                            }
+                            break;
+                        case 'E':
+                            if (EqualsOrdinal(text, "Event"))
+                            {
+                                return Aas.SubmodelElements.Event;
+                            }
+                            break;
+                        case 'R':
+                            if (EqualsOrdinal(text, "Range"))
+                            {
+                                return Aas.SubmodelElements.Range;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsOrdinal(text, "Entity"))
+                    {
+                        return Aas.SubmodelElements.Entity;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case 'P':
+                            if (EqualsOrdinal(text, "Property"))
+                            {
+                                return Aas.SubmodelElements.Property;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "Submodel"))
+                            {
+                                return Aas.SubmodelElements.Submodel;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    if (EqualsOrdinal(text, "Operation"))
+                    {
+                        return Aas.SubmodelElements.Operation;
+                    }
+                    break;
+                case 10:
+                    switch (text[0])
+                    {
+                        case 'B':
+                            if (EqualsOrdinal(text, "BasicEvent"))
+                            {
+                                return Aas.SubmodelElements.BasicEvent;
+                            }
+                            break;
+                        case 'C':
+                            if (EqualsOrdinal(text, "Capability"))
+                            {
+                                return Aas.SubmodelElements.Capability;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsOrdinal(text, "DataElement"))
+                    {
+                        return Aas.SubmodelElements.DataElement;
+                    }
+                    break;
+                case 15:
+                    if (EqualsOrdinal(text, "SubmodelElement"))
+                    {
+                        return Aas.SubmodelElements.SubmodelElement;
+                    }
+                    break;
+                case 16:
+                    if (EqualsOrdinal(text, "ReferenceElement"))
+                    {
+                        return Aas.SubmodelElements.ReferenceElement;
+                    }
+                    break;
+                case 18:
+                    if (EqualsOrdinal(text, "ConceptDescription"))
+                    {
+                        return Aas.SubmodelElements.ConceptDescription;
+                    }
+                    break;
+                case 19:
+                    switch (text[0])
+                    {
+                        case 'R':
+                            if (EqualsOrdinal(text, "RelationshipElement"))
+                            {
+                                return Aas.SubmodelElements.RelationshipElement;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElementList"))
+                            {
+                                return Aas.SubmodelElements.SubmodelElementList;
+                            }
+                            break;
+                    }
+                    break;
+                case 21:
+                    switch (text[0])
+                    {
+                        case 'M':
+                            if (EqualsOrdinal(text, "MultiLanguageProperty"))
+                            {
+                                return Aas.SubmodelElements.MultiLanguageProperty;
+                            }
+                            break;
+                        case 'S':
+                            if (EqualsOrdinal(text, "SubmodelElementStruct"))
+                            {
+                                return Aas.SubmodelElements.SubmodelElementStruct;
+                            }
+                            break;
+                    }
+                    break;
+                case 24:
+                    if (EqualsOrdinal(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.SubmodelElements.AssetAdministrationShell;
+                    }
+                    break;
+                case 28:
+                    if (EqualsOrdinal(text, "AnnotatedRelationshipElement"))
+                    {
+                        return Aas.SubmodelElements.AnnotatedRelationshipElement;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.BuildInListTypes, string> _buildInListTypesToString = (
-            new Dictionary<Aas.BuildInListTypes, string>()
-            {
-                { Aas.BuildInListTypes.Entities, "ENTITIES" },
-                { Aas.BuildInListTypes.IdRefs, "IDREFS" },
-                { Aas.BuildInListTypes.NMTokens, "NMTOKENS" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="SubmodelElements" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="SubmodelElements" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.SubmodelElements? SubmodelElementsFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'B':
+                            if (EqualsAscii(text, "Blob"))
+                            {
+                                return Aas.SubmodelElements.Blob;
+                            }
+                            break;
+                        case (byte)'F':
+                            if (EqualsAscii(text, "File"))
+                            {
+                                return Aas.SubmodelElements.File;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case (byte)'A':
+                            if (EqualsAscii(text, "Asset"))
+                            {
+                                return Aas.SubmodelElements.Asset;
+                            }
+                            break;
+                        case (byte)'E':
+                            if (EqualsAscii(text, "Event"))
+                            {
+                                return Aas.SubmodelElements.Event;
+                            }
+                            break;
+                        case (byte)'R':
+                            if (EqualsAscii(text, "Range"))
+                            {
+                                return Aas.SubmodelElements.Range;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsAscii(text, "Entity"))
+                    {
+                        return Aas.SubmodelElements.Entity;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case (byte)'P':
+                            if (EqualsAscii(text, "Property"))
+                            {
+                                return Aas.SubmodelElements.Property;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "Submodel"))
+                            {
+                                return Aas.SubmodelElements.Submodel;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    if (EqualsAscii(text, "Operation"))
+                    {
+                        return Aas.SubmodelElements.Operation;
+                    }
+                    break;
+                case 10:
+                    switch (text[0])
+                    {
+                        case (byte)'B':
+                            if (EqualsAscii(text, "BasicEvent"))
+                            {
+                                return Aas.SubmodelElements.BasicEvent;
+                            }
+                            break;
+                        case (byte)'C':
+                            if (EqualsAscii(text, "Capability"))
+                            {
+                                return Aas.SubmodelElements.Capability;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsAscii(text, "DataElement"))
+                    {
+                        return Aas.SubmodelElements.DataElement;
+                    }
+                    break;
+                case 15:
+                    if (EqualsAscii(text, "SubmodelElement"))
+                    {
+                        return Aas.SubmodelElements.SubmodelElement;
+                    }
+                    break;
+                case 16:
+                    if (EqualsAscii(text, "ReferenceElement"))
+                    {
+                        return Aas.SubmodelElements.ReferenceElement;
+                    }
+                    break;
+                case 18:
+                    if (EqualsAscii(text, "ConceptDescription"))
+                    {
+                        return Aas.SubmodelElements.ConceptDescription;
+                    }
+                    break;
+                case 19:
+                    switch (text[0])
+                    {
+                        case (byte)'R':
+                            if (EqualsAscii(text, "RelationshipElement"))
+                            {
+                                return Aas.SubmodelElements.RelationshipElement;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElementList"))
+                            {
+                                return Aas.SubmodelElements.SubmodelElementList;
+                            }
+                            break;
+                    }
+                    break;
+                case 21:
+                    switch (text[0])
+                    {
+                        case (byte)'M':
+                            if (EqualsAscii(text, "MultiLanguageProperty"))
+                            {
+                                return Aas.SubmodelElements.MultiLanguageProperty;
+                            }
+                            break;
+                        case (byte)'S':
+                            if (EqualsAscii(text, "SubmodelElementStruct"))
+                            {
+                                return Aas.SubmodelElements.SubmodelElementStruct;
+                            }
+                            break;
+                    }
+                    break;
+                case 24:
+                    if (EqualsAscii(text, "AssetAdministrationShell"))
+                    {
+                        return Aas.SubmodelElements.AssetAdministrationShell;
+                    }
+                    break;
+                case 28:
+                    if (EqualsAscii(text, "AnnotatedRelationshipElement"))
+                    {
+                        return Aas.SubmodelElements.AnnotatedRelationshipElement;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -515,24 +1678,15 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.BuildInListTypes that)
         {
-            if (_buildInListTypesToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
+            return that switch
             {
-                return null;
-            }
+                Aas.BuildInListTypes.Entities => "ENTITIES",
+                Aas.BuildInListTypes.IdRefs => "IDREFS",
+                Aas.BuildInListTypes.NMTokens => "NMTOKENS",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.BuildInListTypes> _buildInListTypesFromString = (
-            new Dictionary<string, Aas.BuildInListTypes>()
-            {
-                { "ENTITIES", Aas.BuildInListTypes.Entities },
-                { "IDREFS", Aas.BuildInListTypes.IdRefs },
-                { "NMTOKENS", Aas.BuildInListTypes.NMTokens }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="BuildInListTypes" />.
         /// </summary>
@@ -543,34 +1697,90 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.BuildInListTypes? BuildInListTypesFromString(string text)
         {
-            if (_buildInListTypesFromString.TryGetValue(text, out BuildInListTypes value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return BuildInListTypesFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="BuildInListTypes" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="BuildInListTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.BuildInListTypes? BuildInListTypesFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 6:
+                    if (EqualsOrdinal(text, "IDREFS"))
+                    {
+                        return Aas.BuildInListTypes.IdRefs;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case 'E':
+                            if (EqualsOrdinal(text, "ENTITIES"))
+                            {
+                                return Aas.BuildInListTypes.Entities;
+                            }
+                            break;
+                        case 'N':
+                            if (EqualsOrdinal(text, "NMTOKENS"))
+                            {
+                                return Aas.BuildInListTypes.NMTokens;
+                            }
+                            break;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.DecimalBuildInTypes, string> _decimalBuildInTypesToString = (
-            new Dictionary<Aas.DecimalBuildInTypes, string>()
-            {
-                { Aas.DecimalBuildInTypes.Integer, "integer" },
-                { Aas.DecimalBuildInTypes.Long, "long" },
-                { Aas.DecimalBuildInTypes.Int, "int" },
-                { Aas.DecimalBuildInTypes.Short, "short" },
-                { Aas.DecimalBuildInTypes.Byte, "byte" },
-                { Aas.DecimalBuildInTypes.NonNegativeInteger, "NonNegativeInteger" },
-                { Aas.DecimalBuildInTypes.PositiveInteger, "positiveInteger" },
-                { Aas.DecimalBuildInTypes.UnsignedInteger, "unsignedInteger" },
-                { Aas.DecimalBuildInTypes.UnsignedLong, "unsignedLong" },
-                { Aas.DecimalBuildInTypes.UnsignedInt, "unsignedInt" },
-                { Aas.DecimalBuildInTypes.UnsignedShort, "unsignedShort" },
-                { Aas.DecimalBuildInTypes.UnsignedByte, "unsignedByte" },
-                { Aas.DecimalBuildInTypes.NonPositiveInteger, "nonPositiveInteger" },
-                { Aas.DecimalBuildInTypes.NegativeInteger, "negativeInteger" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="BuildInListTypes" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="BuildInListTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.BuildInListTypes? BuildInListTypesFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 6:
+                    if (EqualsAscii(text, "IDREFS"))
+                    {
+                        return Aas.BuildInListTypes.IdRefs;
+                    }
+                    break;
+                case 8:
+                    switch (text[0])
+                    {
+                        case (byte)'E':
+                            if (EqualsAscii(text, "ENTITIES"))
+                            {
+                                return Aas.BuildInListTypes.Entities;
+                            }
+                            break;
+                        case (byte)'N':
+                            if (EqualsAscii(text, "NMTOKENS"))
+                            {
+                                return Aas.BuildInListTypes.NMTokens;
+                            }
+                            break;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -580,35 +1790,26 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.DecimalBuildInTypes that)
         {
-            if (_decimalBuildInTypesToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.DecimalBuildInTypes.Integer => "integer",
+                Aas.DecimalBuildInTypes.Long => "long",
+                Aas.DecimalBuildInTypes.Int => "int",
+                Aas.DecimalBuildInTypes.Short => "short",
+                Aas.DecimalBuildInTypes.Byte => "byte",
+                Aas.DecimalBuildInTypes.NonNegativeInteger => "NonNegativeInteger",
+                Aas.DecimalBuildInTypes.PositiveInteger => "positiveInteger",
+                Aas.DecimalBuildInTypes.UnsignedInteger => "unsignedInteger",
+                Aas.DecimalBuildInTypes.UnsignedLong => "unsignedLong",
+                Aas.DecimalBuildInTypes.UnsignedInt => "unsignedInt",
+                Aas.DecimalBuildInTypes.UnsignedShort => "unsignedShort",
+                Aas.DecimalBuildInTypes.UnsignedByte => "unsignedByte",
+                Aas.DecimalBuildInTypes.NonPositiveInteger => "nonPositiveInteger",
+                Aas.DecimalBuildInTypes.NegativeInteger => "negativeInteger",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.DecimalBuildInTypes> _decimalBuildInTypesFromString = (
-            new Dictionary<string, Aas.DecimalBuildInTypes>()
-            {
-                { "integer", Aas.DecimalBuildInTypes.Integer },
-                { "long", Aas.DecimalBuildInTypes.Long },
-                { "int", Aas.DecimalBuildInTypes.Int },
-                { "short", Aas.DecimalBuildInTypes.Short },
-                { "byte", Aas.DecimalBuildInTypes.Byte },
-                { "NonNegativeInteger", Aas.DecimalBuildInTypes.NonNegativeInteger },
-                { "positiveInteger", Aas.DecimalBuildInTypes.PositiveInteger },
-                { "unsignedInteger", Aas.DecimalBuildInTypes.UnsignedInteger },
-                { "unsignedLong", Aas.DecimalBuildInTypes.UnsignedLong },
-                { "unsignedInt", Aas.DecimalBuildInTypes.UnsignedInt },
-                { "unsignedShort", Aas.DecimalBuildInTypes.UnsignedShort },
-                { "unsignedByte", Aas.DecimalBuildInTypes.UnsignedByte },
-                { "nonPositiveInteger", Aas.DecimalBuildInTypes.NonPositiveInteger },
-                { "negativeInteger", Aas.DecimalBuildInTypes.NegativeInteger }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="DecimalBuildInTypes" />.
         /// </summary>
@@ -619,22 +1820,252 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.DecimalBuildInTypes? DecimalBuildInTypesFromString(string text)
         {
-            if (_decimalBuildInTypesFromString.TryGetValue(text, out DecimalBuildInTypes value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return DecimalBuildInTypesFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="DecimalBuildInTypes" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DecimalBuildInTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DecimalBuildInTypes? DecimalBuildInTypesFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 3:
+                    if (EqualsOrdinal(text, "int"))
+                    {
+                        return Aas.DecimalBuildInTypes.Int;
+                    }
+                    break;
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'l':
+                            if (EqualsOrdinal(text, "long"))
+                            {
+                                return Aas.DecimalBuildInTypes.Long;
+                            }
+                            break;
+                        case 'b':
+                            if (EqualsOrdinal(text, "byte"))
+                            {
+                                return Aas.DecimalBuildInTypes.Byte;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    if (EqualsOrdinal(text, "short"))
+                    {
+                        return Aas.DecimalBuildInTypes.Short;
+                    }
+                    break;
+                case 7:
+                    if (EqualsOrdinal(text, "integer"))
+                    {
+                        return Aas.DecimalBuildInTypes.Integer;
+                    }
+                    break;
+                case 11:
+                    if (EqualsOrdinal(text, "unsignedInt"))
+                    {
+                        return Aas.DecimalBuildInTypes.UnsignedInt;
+                    }
+                    break;
+                case 12:
+                    switch (text[8])
+                    {
+                        case 'L':
+                            if (EqualsOrdinal(text, "unsignedLong"))
+                            {
+                                return Aas.DecimalBuildInTypes.UnsignedLong;
+                            }
+                            break;
+                        case 'B':
+                            if (EqualsOrdinal(text, "unsignedByte"))
+                            {
+                                return Aas.DecimalBuildInTypes.UnsignedByte;
+                            }
+                            break;
+                    }
+                    break;
+                case 13:
+                    if (EqualsOrdinal(text, "unsignedShort"))
+                    {
+                        return Aas.DecimalBuildInTypes.UnsignedShort;
+                    }
+                    break;
+                case 15:
+                    switch (text[0])
+                    {
+                        case 'p':
+                            if (EqualsOrdinal(text, "positiveInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.PositiveInteger;
+                            }
+                            break;
+                        case 'u':
+                            if (EqualsOrdinal(text, "unsignedInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.UnsignedInteger;
+                            }
+                            break;
+                        case 'n':
+                            if (EqualsOrdinal(text, "negativeInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.NegativeInteger;
+                            }
+                            break;
+                    }
+                    break;
+                case 18:
+                    switch (text[0])
+                    {
+                        case 'N':
+                            if (EqualsOrdinal(text, "NonNegativeInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.NonNegativeInteger;
+                            }
+                            break;
+                        case 'n':
+                            if (EqualsOrdinal(text, "nonPositiveInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.NonPositiveInteger;
+                            }
+                            break;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.DurationBuildInTypes, string> _durationBuildInTypesToString = (
-            new Dictionary<Aas.DurationBuildInTypes, string>()
-            {
-                { Aas.DurationBuildInTypes.DayTimeDuration, "dayTimeDuration" },
-                { Aas.DurationBuildInTypes.YearMonthDuration, "yearMonthDuration" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="DecimalBuildInTypes" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DecimalBuildInTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DecimalBuildInTypes? DecimalBuildInTypesFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 3:
+                    if (EqualsAscii(text, "int"))
+                    {
+                        return Aas.DecimalBuildInTypes.Int;
+                    }
+                    break;
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'l':
+                            if (EqualsAscii(text, "long"))
+                            {
+                                return Aas.DecimalBuildInTypes.Long;
+                            }
+                            break;
+                        case (byte)'b':
+                            if (EqualsAscii(text, "byte"))
+                            {
+                                return Aas.DecimalBuildInTypes.Byte;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    if (EqualsAscii(text, "short"))
+                    {
+                        return Aas.DecimalBuildInTypes.Short;
+                    }
+                    break;
+                case 7:
+                    if (EqualsAscii(text, "integer"))
+                    {
+                        return Aas.DecimalBuildInTypes.Integer;
+                    }
+                    break;
+                case 11:
+                    if (EqualsAscii(text, "unsignedInt"))
+                    {
+                        return Aas.DecimalBuildInTypes.UnsignedInt;
+                    }
+                    break;
+                case 12:
+                    switch (text[8])
+                    {
+                        case (byte)'L':
+                            if (EqualsAscii(text, "unsignedLong"))
+                            {
+                                return Aas.DecimalBuildInTypes.UnsignedLong;
+                            }
+                            break;
+                        case (byte)'B':
+                            if (EqualsAscii(text, "unsignedByte"))
+                            {
+                                return Aas.DecimalBuildInTypes.UnsignedByte;
+                            }
+                            break;
+                    }
+                    break;
+                case 13:
+                    if (EqualsAscii(text, "unsignedShort"))
+                    {
+                        return Aas.DecimalBuildInTypes.UnsignedShort;
+                    }
+                    break;
+                case 15:
+                    switch (text[0])
+                    {
+                        case (byte)'p':
+                            if (EqualsAscii(text, "positiveInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.PositiveInteger;
+                            }
+                            break;
+                        case (byte)'u':
+                            if (EqualsAscii(text, "unsignedInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.UnsignedInteger;
+                            }
+                            break;
+                        case (byte)'n':
+                            if (EqualsAscii(text, "negativeInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.NegativeInteger;
+                            }
+                            break;
+                    }
+                    break;
+                case 18:
+                    switch (text[0])
+                    {
+                        case (byte)'N':
+                            if (EqualsAscii(text, "NonNegativeInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.NonNegativeInteger;
+                            }
+                            break;
+                        case (byte)'n':
+                            if (EqualsAscii(text, "nonPositiveInteger"))
+                            {
+                                return Aas.DecimalBuildInTypes.NonPositiveInteger;
+                            }
+                            break;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -644,23 +2075,14 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.DurationBuildInTypes that)
         {
-            if (_durationBuildInTypesToString.TryGetValue(that, out string? value))
+            return that switch
             {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+                Aas.DurationBuildInTypes.DayTimeDuration => "dayTimeDuration",
+                Aas.DurationBuildInTypes.YearMonthDuration => "yearMonthDuration",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.DurationBuildInTypes> _durationBuildInTypesFromString = (
-            new Dictionary<string, Aas.DurationBuildInTypes>()
-            {
-                { "dayTimeDuration", Aas.DurationBuildInTypes.DayTimeDuration },
-                { "yearMonthDuration", Aas.DurationBuildInTypes.YearMonthDuration }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="DurationBuildInTypes" />.
         /// </summary>
@@ -671,37 +2093,68 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.DurationBuildInTypes? DurationBuildInTypesFromString(string text)
         {
-            if (_durationBuildInTypesFromString.TryGetValue(text, out DurationBuildInTypes value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return DurationBuildInTypesFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="DurationBuildInTypes" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DurationBuildInTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DurationBuildInTypes? DurationBuildInTypesFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 15:
+                    if (EqualsOrdinal(text, "dayTimeDuration"))
+                    {
+                        return Aas.DurationBuildInTypes.DayTimeDuration;
+                    }
+                    break;
+                case 17:
+                    if (EqualsOrdinal(text, "yearMonthDuration"))
+                    {
+                        return Aas.DurationBuildInTypes.YearMonthDuration;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.PrimitiveTypes, string> _primitiveTypesToString = (
-            new Dictionary<Aas.PrimitiveTypes, string>()
-            {
-                { Aas.PrimitiveTypes.AnyUri, "anyURI" },
-                { Aas.PrimitiveTypes.Base64Binary, "base64Binary" },
-                { Aas.PrimitiveTypes.Boolean, "boolean" },
-                { Aas.PrimitiveTypes.Date, "date" },
-                { Aas.PrimitiveTypes.DateTime, "dateTime" },
-                { Aas.PrimitiveTypes.Decimal, "decimal" },
-                { Aas.PrimitiveTypes.Double, "double" },
-                { Aas.PrimitiveTypes.Duration, "duration" },
-                { Aas.PrimitiveTypes.Float, "float" },
-                { Aas.PrimitiveTypes.GDay, "gDay" },
-                { Aas.PrimitiveTypes.GMonth, "gMonth" },
-                { Aas.PrimitiveTypes.GMonthDay, "gMonthDay" },
-                { Aas.PrimitiveTypes.HeyBinary, "heyBinary" },
-                { Aas.PrimitiveTypes.Notation, "NOTATION" },
-                { Aas.PrimitiveTypes.QName, "QName" },
-                { Aas.PrimitiveTypes.String, "string" },
-                { Aas.PrimitiveTypes.Time, "time" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="DurationBuildInTypes" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DurationBuildInTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DurationBuildInTypes? DurationBuildInTypesFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 15:
+                    if (EqualsAscii(text, "dayTimeDuration"))
+                    {
+                        return Aas.DurationBuildInTypes.DayTimeDuration;
+                    }
+                    break;
+                case 17:
+                    if (EqualsAscii(text, "yearMonthDuration"))
+                    {
+                        return Aas.DurationBuildInTypes.YearMonthDuration;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -711,38 +2164,29 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.PrimitiveTypes that)
         {
-            if (_primitiveTypesToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.PrimitiveTypes.AnyUri => "anyURI",
+                Aas.PrimitiveTypes.Base64Binary => "base64Binary",
+                Aas.PrimitiveTypes.Boolean => "boolean",
+                Aas.PrimitiveTypes.Date => "date",
+                Aas.PrimitiveTypes.DateTime => "dateTime",
+                Aas.PrimitiveTypes.Decimal => "decimal",
+                Aas.PrimitiveTypes.Double => "double",
+                Aas.PrimitiveTypes.Duration => "duration",
+                Aas.PrimitiveTypes.Float => "float",
+                Aas.PrimitiveTypes.GDay => "gDay",
+                Aas.PrimitiveTypes.GMonth => "gMonth",
+                Aas.PrimitiveTypes.GMonthDay => "gMonthDay",
+                Aas.PrimitiveTypes.HeyBinary => "heyBinary",
+                Aas.PrimitiveTypes.Notation => "NOTATION",
+                Aas.PrimitiveTypes.QName => "QName",
+                Aas.PrimitiveTypes.String => "string",
+                Aas.PrimitiveTypes.Time => "time",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.PrimitiveTypes> _primitiveTypesFromString = (
-            new Dictionary<string, Aas.PrimitiveTypes>()
-            {
-                { "anyURI", Aas.PrimitiveTypes.AnyUri },
-                { "base64Binary", Aas.PrimitiveTypes.Base64Binary },
-                { "boolean", Aas.PrimitiveTypes.Boolean },
-                { "date", Aas.PrimitiveTypes.Date },
-                { "dateTime", Aas.PrimitiveTypes.DateTime },
-                { "decimal", Aas.PrimitiveTypes.Decimal },
-                { "double", Aas.PrimitiveTypes.Double },
-                { "duration", Aas.PrimitiveTypes.Duration },
-                { "float", Aas.PrimitiveTypes.Float },
-                { "gDay", Aas.PrimitiveTypes.GDay },
-                { "gMonth", Aas.PrimitiveTypes.GMonth },
-                { "gMonthDay", Aas.PrimitiveTypes.GMonthDay },
-                { "heyBinary", Aas.PrimitiveTypes.HeyBinary },
-                { "NOTATION", Aas.PrimitiveTypes.Notation },
-                { "QName", Aas.PrimitiveTypes.QName },
-                { "string", Aas.PrimitiveTypes.String },
-                { "time", Aas.PrimitiveTypes.Time }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="PrimitiveTypes" />.
         /// </summary>
@@ -753,27 +2197,308 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.PrimitiveTypes? PrimitiveTypesFromString(string text)
         {
-            if (_primitiveTypesFromString.TryGetValue(text, out PrimitiveTypes value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return PrimitiveTypesFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="PrimitiveTypes" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="PrimitiveTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.PrimitiveTypes? PrimitiveTypesFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'd':
+                            if (EqualsOrdinal(text, "date"))
+                            {
+                                return Aas.PrimitiveTypes.Date;
+                            }
+                            break;
+                        case 'g':
+                            if (EqualsOrdinal(text, "gDay"))
+                            {
+                                return Aas.PrimitiveTypes.GDay;
+                            }
+                            break;
+                        case 't':
+                            if (EqualsOrdinal(text, "time"))
+                            {
+                                return Aas.PrimitiveTypes.Time;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case 'f':
+                            if (EqualsOrdinal(text, "float"))
+                            {
+                                return Aas.PrimitiveTypes.Float;
+                            }
+                            break;
+                        case 'Q':
+                            if (EqualsOrdinal(text, "QName"))
+                            {
+                                return Aas.PrimitiveTypes.QName;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    switch (text[0])
+                    {
+                        case 'a':
+                            if (EqualsOrdinal(text, "anyURI"))
+                            {
+                                return Aas.PrimitiveTypes.AnyUri;
+                            }
+                            break;
+                        case 'd':
+                            if (EqualsOrdinal(text, "double"))
+                            {
+                                return Aas.PrimitiveTypes.Double;
+                            }
+                            break;
+                        case 'g':
+                            if (EqualsOrdinal(text, "gMonth"))
+                            {
+                                return Aas.PrimitiveTypes.GMonth;
+                            }
+                            break;
+                        case 's':
+                            if (EqualsOrdinal(text, "string"))
+                            {
+                                return Aas.PrimitiveTypes.String;
+                            }
+                            break;
+                    }
+                    break;
+                case 7:
+                    switch (text[0])
+                    {
+                        case 'b':
+                            if (EqualsOrdinal(text, "boolean"))
+                            {
+                                return Aas.PrimitiveTypes.Boolean;
+                            }
+                            break;
+                        case 'd':
+                            if (EqualsOrdinal(text, "decimal"))
+                            {
+                                return Aas.PrimitiveTypes.Decimal;
+                            }
+                            break;
+                    }
+                    break;
+                case 8:
+                    switch (text[1])
+                    {
+                        case 'a':
+                            if (EqualsOrdinal(text, "dateTime"))
+                            {
+                                return Aas.PrimitiveTypes.DateTime;
+                            }
+                            break;
+                        case 'u':
+                            if (EqualsOrdinal(text, "duration"))
+                            {
+                                return Aas.PrimitiveTypes.Duration;
+                            }
+                            break;
+                        case 'O':
+                            if (EqualsOrdinal(text, "NOTATION"))
+                            {
+                                return Aas.PrimitiveTypes.Notation;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    switch (text[0])
+                    {
+                        case 'g':
+                            if (EqualsOrdinal(text, "gMonthDay"))
+                            {
+                                return Aas.PrimitiveTypes.GMonthDay;
+                            }
+                            break;
+                        case 'h':
+                            if (EqualsOrdinal(text, "heyBinary"))
+                            {
+                                return Aas.PrimitiveTypes.HeyBinary;
+                            }
+                            break;
+                    }
+                    break;
+                case 12:
+                    if (EqualsOrdinal(text, "base64Binary"))
+                    {
+                        return Aas.PrimitiveTypes.Base64Binary;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.StringBuildInTypes, string> _stringBuildInTypesToString = (
-            new Dictionary<Aas.StringBuildInTypes, string>()
-            {
-                { Aas.StringBuildInTypes.NormalizedString, "normalizedString" },
-                { Aas.StringBuildInTypes.Token, "token" },
-                { Aas.StringBuildInTypes.Language, "Language" },
-                { Aas.StringBuildInTypes.NCName, "NCName" },
-                { Aas.StringBuildInTypes.Entity, "ENTITY" },
-                { Aas.StringBuildInTypes.Id, "ID" },
-                { Aas.StringBuildInTypes.Idref, "IDREF" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="PrimitiveTypes" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="PrimitiveTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.PrimitiveTypes? PrimitiveTypesFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'d':
+                            if (EqualsAscii(text, "date"))
+                            {
+                                return Aas.PrimitiveTypes.Date;
+                            }
+                            break;
+                        case (byte)'g':
+                            if (EqualsAscii(text, "gDay"))
+                            {
+                                return Aas.PrimitiveTypes.GDay;
+                            }
+                            break;
+                        case (byte)'t':
+                            if (EqualsAscii(text, "time"))
+                            {
+                                return Aas.PrimitiveTypes.Time;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case (byte)'f':
+                            if (EqualsAscii(text, "float"))
+                            {
+                                return Aas.PrimitiveTypes.Float;
+                            }
+                            break;
+                        case (byte)'Q':
+                            if (EqualsAscii(text, "QName"))
+                            {
+                                return Aas.PrimitiveTypes.QName;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    switch (text[0])
+                    {
+                        case (byte)'a':
+                            if (EqualsAscii(text, "anyURI"))
+                            {
+                                return Aas.PrimitiveTypes.AnyUri;
+                            }
+                            break;
+                        case (byte)'d':
+                            if (EqualsAscii(text, "double"))
+                            {
+                                return Aas.PrimitiveTypes.Double;
+                            }
+                            break;
+                        case (byte)'g':
+                            if (EqualsAscii(text, "gMonth"))
+                            {
+                                return Aas.PrimitiveTypes.GMonth;
+                            }
+                            break;
+                        case (byte)'s':
+                            if (EqualsAscii(text, "string"))
+                            {
+                                return Aas.PrimitiveTypes.String;
+                            }
+                            break;
+                    }
+                    break;
+                case 7:
+                    switch (text[0])
+                    {
+                        case (byte)'b':
+                            if (EqualsAscii(text, "boolean"))
+                            {
+                                return Aas.PrimitiveTypes.Boolean;
+                            }
+                            break;
+                        case (byte)'d':
+                            if (EqualsAscii(text, "decimal"))
+                            {
+                                return Aas.PrimitiveTypes.Decimal;
+                            }
+                            break;
+                    }
+                    break;
+                case 8:
+                    switch (text[1])
+                    {
+                        case (byte)'a':
+                            if (EqualsAscii(text, "dateTime"))
+                            {
+                                return Aas.PrimitiveTypes.DateTime;
+                            }
+                            break;
+                        case (byte)'u':
+                            if (EqualsAscii(text, "duration"))
+                            {
+                                return Aas.PrimitiveTypes.Duration;
+                            }
+                            break;
+                        case (byte)'O':
+                            if (EqualsAscii(text, "NOTATION"))
+                            {
+                                return Aas.PrimitiveTypes.Notation;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    switch (text[0])
+                    {
+                        case (byte)'g':
+                            if (EqualsAscii(text, "gMonthDay"))
+                            {
+                                return Aas.PrimitiveTypes.GMonthDay;
+                            }
+                            break;
+                        case (byte)'h':
+                            if (EqualsAscii(text, "heyBinary"))
+                            {
+                                return Aas.PrimitiveTypes.HeyBinary;
+                            }
+                            break;
+                    }
+                    break;
+                case 12:
+                    if (EqualsAscii(text, "base64Binary"))
+                    {
+                        return Aas.PrimitiveTypes.Base64Binary;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -783,28 +2508,19 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.StringBuildInTypes that)
         {
-            if (_stringBuildInTypesToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.StringBuildInTypes.NormalizedString => "normalizedString",
+                Aas.StringBuildInTypes.Token => "token",
+                Aas.StringBuildInTypes.Language => "Language",
+                Aas.StringBuildInTypes.NCName => "NCName",
+                Aas.StringBuildInTypes.Entity => "ENTITY",
+                Aas.StringBuildInTypes.Id => "ID",
+                Aas.StringBuildInTypes.Idref => "IDREF",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.StringBuildInTypes> _stringBuildInTypesFromString = (
-            new Dictionary<string, Aas.StringBuildInTypes>()
-            {
-                { "normalizedString", Aas.StringBuildInTypes.NormalizedString },
-                { "token", Aas.StringBuildInTypes.Token },
-                { "Language", Aas.StringBuildInTypes.Language },
-                { "NCName", Aas.StringBuildInTypes.NCName },
-                { "ENTITY", Aas.StringBuildInTypes.Entity },
-                { "ID", Aas.StringBuildInTypes.Id },
-                { "IDREF", Aas.StringBuildInTypes.Idref }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="StringBuildInTypes" />.
         /// </summary>
@@ -815,63 +2531,148 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.StringBuildInTypes? StringBuildInTypesFromString(string text)
         {
-            if (_stringBuildInTypesFromString.TryGetValue(text, out StringBuildInTypes value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return StringBuildInTypesFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="StringBuildInTypes" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="StringBuildInTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.StringBuildInTypes? StringBuildInTypesFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 2:
+                    if (EqualsOrdinal(text, "ID"))
+                    {
+                        return Aas.StringBuildInTypes.Id;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case 't':
+                            if (EqualsOrdinal(text, "token"))
+                            {
+                                return Aas.StringBuildInTypes.Token;
+                            }
+                            break;
+                        case 'I':
+                            if (EqualsOrdinal(text, "IDREF"))
+                            {
+                                return Aas.StringBuildInTypes.Idref;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    switch (text[0])
+                    {
+                        case 'N':
+                            if (EqualsOrdinal(text, "NCName"))
+                            {
+                                return Aas.StringBuildInTypes.NCName;
+                            }
+                            break;
+                        case 'E':
+                            if (EqualsOrdinal(text, "ENTITY"))
+                            {
+                                return Aas.StringBuildInTypes.Entity;
+                            }
+                            break;
+                    }
+                    break;
+                case 8:
+                    if (EqualsOrdinal(text, "Language"))
+                    {
+                        return Aas.StringBuildInTypes.Language;
+                    }
+                    break;
+                case 16:
+                    if (EqualsOrdinal(text, "normalizedString"))
+                    {
+                        return Aas.StringBuildInTypes.NormalizedString;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.DataTypeDef, string> _dataTypeDefToString = (
-            new Dictionary<Aas.DataTypeDef, string>()
-            {
-                { Aas.DataTypeDef.Entities, "ENTITIES" },
-                { Aas.DataTypeDef.IdRefs, "IDREFS" },
-                { Aas.DataTypeDef.NMTokens, "NMTOKENS" },
-                { Aas.DataTypeDef.Integer, "integer" },
-                { Aas.DataTypeDef.Long, "long" },
-                { Aas.DataTypeDef.Int, "int" },
-                { Aas.DataTypeDef.Short, "short" },
-                { Aas.DataTypeDef.Byte, "byte" },
-                { Aas.DataTypeDef.NonNegativeInteger, "NonNegativeInteger" },
-                { Aas.DataTypeDef.PositiveInteger, "positiveInteger" },
-                { Aas.DataTypeDef.UnsignedInteger, "unsignedInteger" },
-                { Aas.DataTypeDef.UnsignedLong, "unsignedLong" },
-                { Aas.DataTypeDef.UnsignedInt, "unsignedInt" },
-                { Aas.DataTypeDef.UnsignedShort, "unsignedShort" },
-                { Aas.DataTypeDef.UnsignedByte, "unsignedByte" },
-                { Aas.DataTypeDef.NonPositiveInteger, "nonPositiveInteger" },
-                { Aas.DataTypeDef.NegativeInteger, "negativeInteger" },
-                { Aas.DataTypeDef.DayTimeDuration, "dayTimeDuration" },
-                { Aas.DataTypeDef.YearMonthDuration, "yearMonthDuration" },
-                { Aas.DataTypeDef.AnyUri, "anyURI" },
-                { Aas.DataTypeDef.Base64Binary, "base64Binary" },
-                { Aas.DataTypeDef.Boolean, "boolean" },
-                { Aas.DataTypeDef.Date, "date" },
-                { Aas.DataTypeDef.DateTime, "dateTime" },
-                { Aas.DataTypeDef.Decimal, "decimal" },
-                { Aas.DataTypeDef.Double, "double" },
-                { Aas.DataTypeDef.Duration, "duration" },
-                { Aas.DataTypeDef.Float, "float" },
-                { Aas.DataTypeDef.GDay, "gDay" },
-                { Aas.DataTypeDef.GMonth, "gMonth" },
-                { Aas.DataTypeDef.GMonthDay, "gMonthDay" },
-                { Aas.DataTypeDef.HeyBinary, "heyBinary" },
-                { Aas.DataTypeDef.Notation, "NOTATION" },
-                { Aas.DataTypeDef.QName, "QName" },
-                { Aas.DataTypeDef.String, "string" },
-                { Aas.DataTypeDef.Time, "time" },
-                { Aas.DataTypeDef.NormalizedString, "normalizedString" },
-                { Aas.DataTypeDef.Token, "token" },
-                { Aas.DataTypeDef.Language, "Language" },
-                { Aas.DataTypeDef.NCName, "NCName" },
-                { Aas.DataTypeDef.Entity, "ENTITY" },
-                { Aas.DataTypeDef.Id, "ID" },
-                { Aas.DataTypeDef.Idref, "IDREF" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="StringBuildInTypes" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="StringBuildInTypes" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.StringBuildInTypes? StringBuildInTypesFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 2:
+                    if (EqualsAscii(text, "ID"))
+                    {
+                        return Aas.StringBuildInTypes.Id;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case (byte)'t':
+                            if (EqualsAscii(text, "token"))
+                            {
+                                return Aas.StringBuildInTypes.Token;
+                            }
+                            break;
+                        case (byte)'I':
+                            if (EqualsAscii(text, "IDREF"))
+                            {
+                                return Aas.StringBuildInTypes.Idref;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    switch (text[0])
+                    {
+                        case (byte)'N':
+                            if (EqualsAscii(text, "NCName"))
+                            {
+                                return Aas.StringBuildInTypes.NCName;
+                            }
+                            break;
+                        case (byte)'E':
+                            if (EqualsAscii(text, "ENTITY"))
+                            {
+                                return Aas.StringBuildInTypes.Entity;
+                            }
+                            break;
+                    }
+                    break;
+                case 8:
+                    if (EqualsAscii(text, "Language"))
+                    {
+                        return Aas.StringBuildInTypes.Language;
+                    }
+                    break;
+                case 16:
+                    if (EqualsAscii(text, "normalizedString"))
+                    {
+                        return Aas.StringBuildInTypes.NormalizedString;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -881,64 +2682,55 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.DataTypeDef that)
         {
-            if (_dataTypeDefToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.DataTypeDef.Entities => "ENTITIES",
+                Aas.DataTypeDef.IdRefs => "IDREFS",
+                Aas.DataTypeDef.NMTokens => "NMTOKENS",
+                Aas.DataTypeDef.Integer => "integer",
+                Aas.DataTypeDef.Long => "long",
+                Aas.DataTypeDef.Int => "int",
+                Aas.DataTypeDef.Short => "short",
+                Aas.DataTypeDef.Byte => "byte",
+                Aas.DataTypeDef.NonNegativeInteger => "NonNegativeInteger",
+                Aas.DataTypeDef.PositiveInteger => "positiveInteger",
+                Aas.DataTypeDef.UnsignedInteger => "unsignedInteger",
+                Aas.DataTypeDef.UnsignedLong => "unsignedLong",
+                Aas.DataTypeDef.UnsignedInt => "unsignedInt",
+                Aas.DataTypeDef.UnsignedShort => "unsignedShort",
+                Aas.DataTypeDef.UnsignedByte => "unsignedByte",
+                Aas.DataTypeDef.NonPositiveInteger => "nonPositiveInteger",
+                Aas.DataTypeDef.NegativeInteger => "negativeInteger",
+                Aas.DataTypeDef.DayTimeDuration => "dayTimeDuration",
+                Aas.DataTypeDef.YearMonthDuration => "yearMonthDuration",
+                Aas.DataTypeDef.AnyUri => "anyURI",
+                Aas.DataTypeDef.Base64Binary => "base64Binary",
+                Aas.DataTypeDef.Boolean => "boolean",
+                Aas.DataTypeDef.Date => "date",
+                Aas.DataTypeDef.DateTime => "dateTime",
+                Aas.DataTypeDef.Decimal => "decimal",
+                Aas.DataTypeDef.Double => "double",
+                Aas.DataTypeDef.Duration => "duration",
+                Aas.DataTypeDef.Float => "float",
+                Aas.DataTypeDef.GDay => "gDay",
+                Aas.DataTypeDef.GMonth => "gMonth",
+                Aas.DataTypeDef.GMonthDay => "gMonthDay",
+                Aas.DataTypeDef.HeyBinary => "heyBinary",
+                Aas.DataTypeDef.Notation => "NOTATION",
+                Aas.DataTypeDef.QName => "QName",
+                Aas.DataTypeDef.String => "string",
+                Aas.DataTypeDef.Time => "time",
+                Aas.DataTypeDef.NormalizedString => "normalizedString",
+                Aas.DataTypeDef.Token => "token",
+                Aas.DataTypeDef.Language => "Language",
+                Aas.DataTypeDef.NCName => "NCName",
+                Aas.DataTypeDef.Entity => "ENTITY",
+                Aas.DataTypeDef.Id => "ID",
+                Aas.DataTypeDef.Idref => "IDREF",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.DataTypeDef> _dataTypeDefFromString = (
-            new Dictionary<string, Aas.DataTypeDef>()
-            {
-                { "ENTITIES", Aas.DataTypeDef.Entities },
-                { "IDREFS", Aas.DataTypeDef.IdRefs },
-                { "NMTOKENS", Aas.DataTypeDef.NMTokens },
-                { "integer", Aas.DataTypeDef.Integer },
-                { "long", Aas.DataTypeDef.Long },
-                { "int", Aas.DataTypeDef.Int },
-                { "short", Aas.DataTypeDef.Short },
-                { "byte", Aas.DataTypeDef.Byte },
-                { "NonNegativeInteger", Aas.DataTypeDef.NonNegativeInteger },
-                { "positiveInteger", Aas.DataTypeDef.PositiveInteger },
-                { "unsignedInteger", Aas.DataTypeDef.UnsignedInteger },
-                { "unsignedLong", Aas.DataTypeDef.UnsignedLong },
-                { "unsignedInt", Aas.DataTypeDef.UnsignedInt },
-                { "unsignedShort", Aas.DataTypeDef.UnsignedShort },
-                { "unsignedByte", Aas.DataTypeDef.UnsignedByte },
-                { "nonPositiveInteger", Aas.DataTypeDef.NonPositiveInteger },
-                { "negativeInteger", Aas.DataTypeDef.NegativeInteger },
-                { "dayTimeDuration", Aas.DataTypeDef.DayTimeDuration },
-                { "yearMonthDuration", Aas.DataTypeDef.YearMonthDuration },
-                { "anyURI", Aas.DataTypeDef.AnyUri },
-                { "base64Binary", Aas.DataTypeDef.Base64Binary },
-                { "boolean", Aas.DataTypeDef.Boolean },
-                { "date", Aas.DataTypeDef.Date },
-                { "dateTime", Aas.DataTypeDef.DateTime },
-                { "decimal", Aas.DataTypeDef.Decimal },
-                { "double", Aas.DataTypeDef.Double },
-                { "duration", Aas.DataTypeDef.Duration },
-                { "float", Aas.DataTypeDef.Float },
-                { "gDay", Aas.DataTypeDef.GDay },
-                { "gMonth", Aas.DataTypeDef.GMonth },
-                { "gMonthDay", Aas.DataTypeDef.GMonthDay },
-                { "heyBinary", Aas.DataTypeDef.HeyBinary },
-                { "NOTATION", Aas.DataTypeDef.Notation },
-                { "QName", Aas.DataTypeDef.QName },
-                { "string", Aas.DataTypeDef.String },
-                { "time", Aas.DataTypeDef.Time },
-                { "normalizedString", Aas.DataTypeDef.NormalizedString },
-                { "token", Aas.DataTypeDef.Token },
-                { "Language", Aas.DataTypeDef.Language },
-                { "NCName", Aas.DataTypeDef.NCName },
-                { "ENTITY", Aas.DataTypeDef.Entity },
-                { "ID", Aas.DataTypeDef.Id },
-                { "IDREF", Aas.DataTypeDef.Idref }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="DataTypeDef" />.
         /// </summary>
@@ -949,39 +2741,650 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.DataTypeDef? DataTypeDefFromString(string text)
         {
-            if (_dataTypeDefFromString.TryGetValue(text, out DataTypeDef value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return DataTypeDefFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="DataTypeDef" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DataTypeDef" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DataTypeDef? DataTypeDefFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 2:
+                    if (EqualsOrdinal(text, "ID"))
+                    {
+                        return Aas.DataTypeDef.Id;
+                    }
+                    break;
+                case 3:
+                    if (EqualsOrdinal(text, "int"))
+                    {
+                        return Aas.DataTypeDef.Int;
+                    }
+                    break;
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'l':
+                            if (EqualsOrdinal(text, "long"))
+                            {
+                                return Aas.DataTypeDef.Long;
+                            }
+                            break;
+                        case 'b':
+                            if (EqualsOrdinal(text, "byte"))
+                            {
+                                return Aas.DataTypeDef.Byte;
+                            }
+                            break;
+                        case 'd':
+                            if (EqualsOrdinal(text, "date"))
+                            {
+                                return Aas.DataTypeDef.Date;
+                            }
+                            break;
+                        case 'g':
+                            if (EqualsOrdinal(text, "gDay"))
+                            {
+                                return Aas.DataTypeDef.GDay;
+                            }
+                            break;
+                        case 't':
+                            if (EqualsOrdinal(text, "time"))
+                            {
+                                return Aas.DataTypeDef.Time;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case 's':
+                            if (EqualsOrdinal(text, "short"))
+                            {
+                                return Aas.DataTypeDef.Short;
+                            }
+                            break;
+                        case 'f':
+                            if (EqualsOrdinal(text, "float"))
+                            {
+                                return Aas.DataTypeDef.Float;
+                            }
+                            break;
+                        case 'Q':
+                            if (EqualsOrdinal(text, "QName"))
+                            {
+                                return Aas.DataTypeDef.QName;
+                            }
+                            break;
+                        case 't':
+                            if (EqualsOrdinal(text, "token"))
+                            {
+                                return Aas.DataTypeDef.Token;
+                            }
+                            break;
+                        case 'I':
+                            if (EqualsOrdinal(text, "IDREF"))
+                            {
+                                return Aas.DataTypeDef.Idref;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    switch (text[0])
+                    {
+                        case 'I':
+                            if (EqualsOrdinal(text, "IDREFS"))
+                            {
+                                return Aas.DataTypeDef.IdRefs;
+                            }
+                            break;
+                        case 'a':
+                            if (EqualsOrdinal(text, "anyURI"))
+                            {
+                                return Aas.DataTypeDef.AnyUri;
+                            }
+                            break;
+                        case 'd':
+                            if (EqualsOrdinal(text, "double"))
+                            {
+                                return Aas.DataTypeDef.Double;
+                            }
+                            break;
+                        case 'g':
+                            if (EqualsOrdinal(text, "gMonth"))
+                            {
+                                return Aas.DataTypeDef.GMonth;
+                            }
+                            break;
+                        case 's':
+                            if (EqualsOrdinal(text, "string"))
+                            {
+                                return Aas.DataTypeDef.String;
+                            }
+                            break;
+                        case 'N':
+                            if (EqualsOrdinal(text, "NCName"))
+                            {
+                                return Aas.DataTypeDef.NCName;
+                            }
+                            break;
+                        case 'E':
+                            if (EqualsOrdinal(text, "ENTITY"))
+                            {
+                                return Aas.DataTypeDef.Entity;
+                            }
+                            break;
+                    }
+                    break;
+                case 7:
+                    switch (text[0])
+                    {
+                        case 'i':
+                            if (EqualsOrdinal(text, "integer"))
+                            {
+                                return Aas.DataTypeDef.Integer;
+                            }
+                            break;
+                        case 'b':
+                            if (EqualsOrdinal(text, "boolean"))
+                            {
+                                return Aas.DataTypeDef.Boolean;
+                            }
+                            break;
+                        case 'd':
+                            if (EqualsOrdinal(text, "decimal"))
+                            {
+                                return Aas.DataTypeDef.Decimal;
+                            }
+                            break;
+                    }
+                    break;
+                case 8:
+                    switch (text[3])
+                    {
+                        case 'I':
+                            if (EqualsOrdinal(text, "ENTITIES"))
+                            {
+                                return Aas.DataTypeDef.Entities;
+                            }
+                            break;
+                        case 'O':
+                            if (EqualsOrdinal(text, "NMTOKENS"))
+                            {
+                                return Aas.DataTypeDef.NMTokens;
+                            }
+                            break;
+                        case 'e':
+                            if (EqualsOrdinal(text, "dateTime"))
+                            {
+                                return Aas.DataTypeDef.DateTime;
+                            }
+                            break;
+                        case 'a':
+                            if (EqualsOrdinal(text, "duration"))
+                            {
+                                return Aas.DataTypeDef.Duration;
+                            }
+                            break;
+                        case 'A':
+                            if (EqualsOrdinal(text, "NOTATION"))
+                            {
+                                return Aas.DataTypeDef.Notation;
+                            }
+                            break;
+                        case 'g':
+                            if (EqualsOrdinal(text, "Language"))
+                            {
+                                return Aas.DataTypeDef.Language;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    switch (text[0])
+                    {
+                        case 'g':
+                            if (EqualsOrdinal(text, "gMonthDay"))
+                            {
+                                return Aas.DataTypeDef.GMonthDay;
+                            }
+                            break;
+                        case 'h':
+                            if (EqualsOrdinal(text, "heyBinary"))
+                            {
+                                return Aas.DataTypeDef.HeyBinary;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsOrdinal(text, "unsignedInt"))
+                    {
+                        return Aas.DataTypeDef.UnsignedInt;
+                    }
+                    break;
+                case 12:
+                    switch (text[8])
+                    {
+                        case 'L':
+                            if (EqualsOrdinal(text, "unsignedLong"))
+                            {
+                                return Aas.DataTypeDef.UnsignedLong;
+                            }
+                            break;
+                        case 'B':
+                            if (EqualsOrdinal(text, "unsignedByte"))
+                            {
+                                return Aas.DataTypeDef.UnsignedByte;
+                            }
+                            break;
+                        case 'n':
+                            if (EqualsOrdinal(text, "base64Binary"))
+                            {
+                                return Aas.DataTypeDef.Base64Binary;
+                            }
+                            break;
+                    }
+                    break;
+                case 13:
+                    if (EqualsOrdinal(text, "unsignedShort"))
+                    {
+                        return Aas.DataTypeDef.UnsignedShort;
+                    }
+                    break;
+                case 15:
+                    switch (text[0])
+                    {
+                        case 'p':
+                            if (EqualsOrdinal(text, "positiveInteger"))
+                            {
+                                return Aas.DataTypeDef.PositiveInteger;
+                            }
+                            break;
+                        case 'u':
+                            if (EqualsOrdinal(text, "unsignedInteger"))
+                            {
+                                return Aas.DataTypeDef.UnsignedInteger;
+                            }
+                            break;
+                        case 'n':
+                            if (EqualsOrdinal(text, "negativeInteger"))
+                            {
+                                return Aas.DataTypeDef.NegativeInteger;
+                            }
+                            break;
+                        case 'd':
+                            if (EqualsOrdinal(text, "dayTimeDuration"))
+                            {
+                                return Aas.DataTypeDef.DayTimeDuration;
+                            }
+                            break;
+                    }
+                    break;
+                case 16:
+                    if (EqualsOrdinal(text, "normalizedString"))
+                    {
+                        return Aas.DataTypeDef.NormalizedString;
+                    }
+                    break;
+                case 17:
+                    if (EqualsOrdinal(text, "yearMonthDuration"))
+                    {
+                        return Aas.DataTypeDef.YearMonthDuration;
+                    }
+                    break;
+                case 18:
+                    switch (text[0])
+                    {
+                        case 'N':
+                            if (EqualsOrdinal(text, "NonNegativeInteger"))
+                            {
+                                return Aas.DataTypeDef.NonNegativeInteger;
+                            }
+                            break;
+                        case 'n':
+                            if (EqualsOrdinal(text, "nonPositiveInteger"))
+                            {
+                                return Aas.DataTypeDef.NonPositiveInteger;
+                            }
+                            break;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.DataTypeIec61360, string> _dataTypeIec61360ToString = (
-            new Dictionary<Aas.DataTypeIec61360, string>()
-            {
-                { Aas.DataTypeIec61360.Date, "DATE" },
-                { Aas.DataTypeIec61360.String, "STRING" },
-                { Aas.DataTypeIec61360.StringTranslatable, "STRING_TRANSLATABLE" },
-                { Aas.DataTypeIec61360.IntegerMeasure, "INTEGER_MEASURE" },
-                { Aas.DataTypeIec61360.IntegerCount, "INTEGER_COUNT" },
-                { Aas.DataTypeIec61360.IntegerCurrency, "INTEGER_CURRENCY" },
-                { Aas.DataTypeIec61360.RealMeasure, "REAL_MEASURE" },
-                { Aas.DataTypeIec61360.RealCount, "REAL_COUNT" },
-                { Aas.DataTypeIec61360.RealCurrency, "REAL_CURRENCY" },
-                { Aas.DataTypeIec61360.Boolean, "BOOLEAN" },
-                { Aas.DataTypeIec61360.Iri, "IRI" },
-                { Aas.DataTypeIec61360.Irdi, "IRDI" },
-                { Aas.DataTypeIec61360.Rational, "RATIONAL" },
-                { Aas.DataTypeIec61360.RationalMeasure, "RATIONAL_MEASURE" },
-                { Aas.DataTypeIec61360.Time, "TIME" },
-                { Aas.DataTypeIec61360.Timestamp, "TIMESTAMP" },
-                { Aas.DataTypeIec61360.File, "FILE" },
-                { Aas.DataTypeIec61360.Html, "HTML" },
-                { Aas.DataTypeIec61360.Blob, "BLOB" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="DataTypeDef" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DataTypeDef" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DataTypeDef? DataTypeDefFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 2:
+                    if (EqualsAscii(text, "ID"))
+                    {
+                        return Aas.DataTypeDef.Id;
+                    }
+                    break;
+                case 3:
+                    if (EqualsAscii(text, "int"))
+                    {
+                        return Aas.DataTypeDef.Int;
+                    }
+                    break;
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'l':
+                            if (EqualsAscii(text, "long"))
+                            {
+                                return Aas.DataTypeDef.Long;
+                            }
+                            break;
+                        case (byte)'b':
+                            if (EqualsAscii(text, "byte"))
+                            {
+                                return Aas.DataTypeDef.Byte;
+                            }
+                            break;
+                        case (byte)'d':
+                            if (EqualsAscii(text, "date"))
+                            {
+                                return Aas.DataTypeDef.Date;
+                            }
+                            break;
+                        case (byte)'g':
+                            if (EqualsAscii(text, "gDay"))
+                            {
+                                return Aas.DataTypeDef.GDay;
+                            }
+                            break;
+                        case (byte)'t':
+                            if (EqualsAscii(text, "time"))
+                            {
+                                return Aas.DataTypeDef.Time;
+                            }
+                            break;
+                    }
+                    break;
+                case 5:
+                    switch (text[0])
+                    {
+                        case (byte)'s':
+                            if (EqualsAscii(text, "short"))
+                            {
+                                return Aas.DataTypeDef.Short;
+                            }
+                            break;
+                        case (byte)'f':
+                            if (EqualsAscii(text, "float"))
+                            {
+                                return Aas.DataTypeDef.Float;
+                            }
+                            break;
+                        case (byte)'Q':
+                            if (EqualsAscii(text, "QName"))
+                            {
+                                return Aas.DataTypeDef.QName;
+                            }
+                            break;
+                        case (byte)'t':
+                            if (EqualsAscii(text, "token"))
+                            {
+                                return Aas.DataTypeDef.Token;
+                            }
+                            break;
+                        case (byte)'I':
+                            if (EqualsAscii(text, "IDREF"))
+                            {
+                                return Aas.DataTypeDef.Idref;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    switch (text[0])
+                    {
+                        case (byte)'I':
+                            if (EqualsAscii(text, "IDREFS"))
+                            {
+                                return Aas.DataTypeDef.IdRefs;
+                            }
+                            break;
+                        case (byte)'a':
+                            if (EqualsAscii(text, "anyURI"))
+                            {
+                                return Aas.DataTypeDef.AnyUri;
+                            }
+                            break;
+                        case (byte)'d':
+                            if (EqualsAscii(text, "double"))
+                            {
+                                return Aas.DataTypeDef.Double;
+                            }
+                            break;
+                        case (byte)'g':
+                            if (EqualsAscii(text, "gMonth"))
+                            {
+                                return Aas.DataTypeDef.GMonth;
+                            }
+                            break;
+                        case (byte)'s':
+                            if (EqualsAscii(text, "string"))
+                            {
+                                return Aas.DataTypeDef.String;
+                            }
+                            break;
+                        case (byte)'N':
+                            if (EqualsAscii(text, "NCName"))
+                            {
+                                return Aas.DataTypeDef.NCName;
+                            }
+                            break;
+                        case (byte)'E':
+                            if (EqualsAscii(text, "ENTITY"))
+                            {
+                                return Aas.DataTypeDef.Entity;
+                            }
+                            break;
+                    }
+                    break;
+                case 7:
+                    switch (text[0])
+                    {
+                        case (byte)'i':
+                            if (EqualsAscii(text, "integer"))
+                            {
+                                return Aas.DataTypeDef.Integer;
+                            }
+                            break;
+                        case (byte)'b':
+                            if (EqualsAscii(text, "boolean"))
+                            {
+                                return Aas.DataTypeDef.Boolean;
+                            }
+                            break;
+                        case (byte)'d':
+                            if (EqualsAscii(text, "decimal"))
+                            {
+                                return Aas.DataTypeDef.Decimal;
+                            }
+                            break;
+                    }
+                    break;
+                case 8:
+                    switch (text[3])
+                    {
+                        case (byte)'I':
+                            if (EqualsAscii(text, "ENTITIES"))
+                            {
+                                return Aas.DataTypeDef.Entities;
+                            }
+                            break;
+                        case (byte)'O':
+                            if (EqualsAscii(text, "NMTOKENS"))
+                            {
+                                return Aas.DataTypeDef.NMTokens;
+                            }
+                            break;
+                        case (byte)'e':
+                            if (EqualsAscii(text, "dateTime"))
+                            {
+                                return Aas.DataTypeDef.DateTime;
+                            }
+                            break;
+                        case (byte)'a':
+                            if (EqualsAscii(text, "duration"))
+                            {
+                                return Aas.DataTypeDef.Duration;
+                            }
+                            break;
+                        case (byte)'A':
+                            if (EqualsAscii(text, "NOTATION"))
+                            {
+                                return Aas.DataTypeDef.Notation;
+                            }
+                            break;
+                        case (byte)'g':
+                            if (EqualsAscii(text, "Language"))
+                            {
+                                return Aas.DataTypeDef.Language;
+                            }
+                            break;
+                    }
+                    break;
+                case 9:
+                    switch (text[0])
+                    {
+                        case (byte)'g':
+                            if (EqualsAscii(text, "gMonthDay"))
+                            {
+                                return Aas.DataTypeDef.GMonthDay;
+                            }
+                            break;
+                        case (byte)'h':
+                            if (EqualsAscii(text, "heyBinary"))
+                            {
+                                return Aas.DataTypeDef.HeyBinary;
+                            }
+                            break;
+                    }
+                    break;
+                case 11:
+                    if (EqualsAscii(text, "unsignedInt"))
+                    {
+                        return Aas.DataTypeDef.UnsignedInt;
+                    }
+                    break;
+                case 12:
+                    switch (text[8])
+                    {
+                        case (byte)'L':
+                            if (EqualsAscii(text, "unsignedLong"))
+                            {
+                                return Aas.DataTypeDef.UnsignedLong;
+                            }
+                            break;
+                        case (byte)'B':
+                            if (EqualsAscii(text, "unsignedByte"))
+                            {
+                                return Aas.DataTypeDef.UnsignedByte;
+                            }
+                            break;
+                        case (byte)'n':
+                            if (EqualsAscii(text, "base64Binary"))
+                            {
+                                return Aas.DataTypeDef.Base64Binary;
+                            }
+                            break;
+                    }
+                    break;
+                case 13:
+                    if (EqualsAscii(text, "unsignedShort"))
+                    {
+                        return Aas.DataTypeDef.UnsignedShort;
+                    }
+                    break;
+                case 15:
+                    switch (text[0])
+                    {
+                        case (byte)'p':
+                            if (EqualsAscii(text, "positiveInteger"))
+                            {
+                                return Aas.DataTypeDef.PositiveInteger;
+                            }
+                            break;
+                        case (byte)'u':
+                            if (EqualsAscii(text, "unsignedInteger"))
+                            {
+                                return Aas.DataTypeDef.UnsignedInteger;
+                            }
+                            break;
+                        case (byte)'n':
+                            if (EqualsAscii(text, "negativeInteger"))
+                            {
+                                return Aas.DataTypeDef.NegativeInteger;
+                            }
+                            break;
+                        case (byte)'d':
+                            if (EqualsAscii(text, "dayTimeDuration"))
+                            {
+                                return Aas.DataTypeDef.DayTimeDuration;
+                            }
+                            break;
+                    }
+                    break;
+                case 16:
+                    if (EqualsAscii(text, "normalizedString"))
+                    {
+                        return Aas.DataTypeDef.NormalizedString;
+                    }
+                    break;
+                case 17:
+                    if (EqualsAscii(text, "yearMonthDuration"))
+                    {
+                        return Aas.DataTypeDef.YearMonthDuration;
+                    }
+                    break;
+                case 18:
+                    switch (text[0])
+                    {
+                        case (byte)'N':
+                            if (EqualsAscii(text, "NonNegativeInteger"))
+                            {
+                                return Aas.DataTypeDef.NonNegativeInteger;
+                            }
+                            break;
+                        case (byte)'n':
+                            if (EqualsAscii(text, "nonPositiveInteger"))
+                            {
+                                return Aas.DataTypeDef.NonPositiveInteger;
+                            }
+                            break;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -991,40 +3394,31 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.DataTypeIec61360 that)
         {
-            if (_dataTypeIec61360ToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.DataTypeIec61360.Date => "DATE",
+                Aas.DataTypeIec61360.String => "STRING",
+                Aas.DataTypeIec61360.StringTranslatable => "STRING_TRANSLATABLE",
+                Aas.DataTypeIec61360.IntegerMeasure => "INTEGER_MEASURE",
+                Aas.DataTypeIec61360.IntegerCount => "INTEGER_COUNT",
+                Aas.DataTypeIec61360.IntegerCurrency => "INTEGER_CURRENCY",
+                Aas.DataTypeIec61360.RealMeasure => "REAL_MEASURE",
+                Aas.DataTypeIec61360.RealCount => "REAL_COUNT",
+                Aas.DataTypeIec61360.RealCurrency => "REAL_CURRENCY",
+                Aas.DataTypeIec61360.Boolean => "BOOLEAN",
+                Aas.DataTypeIec61360.Iri => "IRI",
+                Aas.DataTypeIec61360.Irdi => "IRDI",
+                Aas.DataTypeIec61360.Rational => "RATIONAL",
+                Aas.DataTypeIec61360.RationalMeasure => "RATIONAL_MEASURE",
+                Aas.DataTypeIec61360.Time => "TIME",
+                Aas.DataTypeIec61360.Timestamp => "TIMESTAMP",
+                Aas.DataTypeIec61360.File => "FILE",
+                Aas.DataTypeIec61360.Html => "HTML",
+                Aas.DataTypeIec61360.Blob => "BLOB",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.DataTypeIec61360> _dataTypeIec61360FromString = (
-            new Dictionary<string, Aas.DataTypeIec61360>()
-            {
-                { "DATE", Aas.DataTypeIec61360.Date },
-                { "STRING", Aas.DataTypeIec61360.String },
-                { "STRING_TRANSLATABLE", Aas.DataTypeIec61360.StringTranslatable },
-                { "INTEGER_MEASURE", Aas.DataTypeIec61360.IntegerMeasure },
-                { "INTEGER_COUNT", Aas.DataTypeIec61360.IntegerCount },
-                { "INTEGER_CURRENCY", Aas.DataTypeIec61360.IntegerCurrency },
-                { "REAL_MEASURE", Aas.DataTypeIec61360.RealMeasure },
-                { "REAL_COUNT", Aas.DataTypeIec61360.RealCount },
-                { "REAL_CURRENCY", Aas.DataTypeIec61360.RealCurrency },
-                { "BOOLEAN", Aas.DataTypeIec61360.Boolean },
-                { "IRI", Aas.DataTypeIec61360.Iri },
-                { "IRDI", Aas.DataTypeIec61360.Irdi },
-                { "RATIONAL", Aas.DataTypeIec61360.Rational },
-                { "RATIONAL_MEASURE", Aas.DataTypeIec61360.RationalMeasure },
-                { "TIME", Aas.DataTypeIec61360.Time },
-                { "TIMESTAMP", Aas.DataTypeIec61360.Timestamp },
-                { "FILE", Aas.DataTypeIec61360.File },
-                { "HTML", Aas.DataTypeIec61360.Html },
-                { "BLOB", Aas.DataTypeIec61360.Blob }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="DataTypeIec61360" />.
         /// </summary>
@@ -1035,24 +3429,302 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.DataTypeIec61360? DataTypeIec61360FromString(string text)
         {
-            if (_dataTypeIec61360FromString.TryGetValue(text, out DataTypeIec61360 value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
+            return DataTypeIec61360FromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="DataTypeIec61360" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DataTypeIec61360" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DataTypeIec61360? DataTypeIec61360FromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 3:
+                    if (EqualsOrdinal(text, "IRI"))
+                    {
+                        return Aas.DataTypeIec61360.Iri;
+                    }
+                    break;
+                case 4:
+                    switch (text[0])
+                    {
+                        case 'D':
+                            if (EqualsOrdinal(text, "DATE"))
+                            {
+                                return Aas.DataTypeIec61360.Date;
+                            }
+                            break;
+                        case 'I':
+                            if (EqualsOrdinal(text, "IRDI"))
+                            {
+                                return Aas.DataTypeIec61360.Irdi;
+                            }
+                            break;
+                        case 'T':
+                            if (EqualsOrdinal(text, "TIME"))
+                            {
+                                return Aas.DataTypeIec61360.Time;
+                            }
+                            break;
+                        case 'F':
+                            if (EqualsOrdinal(text, "FILE"))
+                            {
+                                return Aas.DataTypeIec61360.File;
+                            }
+                            break;
+                        case 'H':
+                            if (EqualsOrdinal(text, "HTML"))
+                            {
+                                return Aas.DataTypeIec61360.Html;
+                            }
+                            break;
+                        case 'B':
+                            if (EqualsOrdinal(text, "BLOB"))
+                            {
+                                return Aas.DataTypeIec61360.Blob;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsOrdinal(text, "STRING"))
+                    {
+                        return Aas.DataTypeIec61360.String;
+                    }
+                    break;
+                case 7:
+                    if (EqualsOrdinal(text, "BOOLEAN"))
+                    {
+                        return Aas.DataTypeIec61360.Boolean;
+                    }
+                    break;
+                case 8:
+                    if (EqualsOrdinal(text, "RATIONAL"))
+                    {
+                        return Aas.DataTypeIec61360.Rational;
+                    }
+                    break;
+                case 9:
+                    if (EqualsOrdinal(text, "TIMESTAMP"))
+                    {
+                        return Aas.DataTypeIec61360.Timestamp;
+                    }
+                    break;
+                case 10:
+                    if (EqualsOrdinal(text, "REAL_COUNT"))
+                    {
+                        return Aas.DataTypeIec61360.RealCount;
+                    }
+                    break;
+                case 12:
+                    if (EqualsOrdinal(text, "REAL_MEASURE"))
+                    {
+                        return Aas.DataTypeIec61360.RealMeasure;
+                    }
+                    break;
+                case 13:
+                    switch (text[0])
+                    {
+                        case 'I':
+                            if (EqualsOrdinal(text, "INTEGER_COUNT"))
+                            {
+                                return Aas.DataTypeIec61360.IntegerCount;
+                            }
+                            break;
+                        case 'R':
+                            if (EqualsOrdinal(text, "REAL_CURRENCY"))
+                            {
+                                return Aas.DataTypeIec61360.RealCurrency;
+                            }
+                            break;
+                    }
+                    break;
+                case 15:
+                    if (EqualsOrdinal(text, "INTEGER_MEASURE"))
+                    {
+                        return Aas.DataTypeIec61360.IntegerMeasure;
+                    }
+                    break;
+                case 16:
+                    switch (text[0])
+                    {
+                        case 'I':
+                            if (EqualsOrdinal(text, "INTEGER_CURRENCY"))
+                            {
+                                return Aas.DataTypeIec61360.IntegerCurrency;
+                            }
+                            break;
+                        case 'R':
+                            if (EqualsOrdinal(text, "RATIONAL_MEASURE"))
+                            {
+                                return Aas.DataTypeIec61360.RationalMeasure;
+                            }
+                            break;
+                    }
+                    break;
+                case 19:
+                    if (EqualsOrdinal(text, "STRING_TRANSLATABLE"))
+                    {
+                        return Aas.DataTypeIec61360.StringTranslatable;
+                    }
+                    break;
             }
+
+            return null;
         }
 
-        private static readonly Dictionary<Aas.LevelType, string> _levelTypeToString = (
-            new Dictionary<Aas.LevelType, string>()
-            {
-                { Aas.LevelType.Min, "Min" },
-                { Aas.LevelType.Max, "Max" },
-                { Aas.LevelType.Nom, "Nom" },
-                { Aas.LevelType.Type, "Type" }
-            });
+        /// <summary>
+        /// Parse the string representation of <see cref="DataTypeIec61360" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="DataTypeIec61360" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.DataTypeIec61360? DataTypeIec61360FromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 3:
+                    if (EqualsAscii(text, "IRI"))
+                    {
+                        return Aas.DataTypeIec61360.Iri;
+                    }
+                    break;
+                case 4:
+                    switch (text[0])
+                    {
+                        case (byte)'D':
+                            if (EqualsAscii(text, "DATE"))
+                            {
+                                return Aas.DataTypeIec61360.Date;
+                            }
+                            break;
+                        case (byte)'I':
+                            if (EqualsAscii(text, "IRDI"))
+                            {
+                                return Aas.DataTypeIec61360.Irdi;
+                            }
+                            break;
+                        case (byte)'T':
+                            if (EqualsAscii(text, "TIME"))
+                            {
+                                return Aas.DataTypeIec61360.Time;
+                            }
+                            break;
+                        case (byte)'F':
+                            if (EqualsAscii(text, "FILE"))
+                            {
+                                return Aas.DataTypeIec61360.File;
+                            }
+                            break;
+                        case (byte)'H':
+                            if (EqualsAscii(text, "HTML"))
+                            {
+                                return Aas.DataTypeIec61360.Html;
+                            }
+                            break;
+                        case (byte)'B':
+                            if (EqualsAscii(text, "BLOB"))
+                            {
+                                return Aas.DataTypeIec61360.Blob;
+                            }
+                            break;
+                    }
+                    break;
+                case 6:
+                    if (EqualsAscii(text, "STRING"))
+                    {
+                        return Aas.DataTypeIec61360.String;
+                    }
+                    break;
+                case 7:
+                    if (EqualsAscii(text, "BOOLEAN"))
+                    {
+                        return Aas.DataTypeIec61360.Boolean;
+                    }
+                    break;
+                case 8:
+                    if (EqualsAscii(text, "RATIONAL"))
+                    {
+                        return Aas.DataTypeIec61360.Rational;
+                    }
+                    break;
+                case 9:
+                    if (EqualsAscii(text, "TIMESTAMP"))
+                    {
+                        return Aas.DataTypeIec61360.Timestamp;
+                    }
+                    break;
+                case 10:
+                    if (EqualsAscii(text, "REAL_COUNT"))
+                    {
+                        return Aas.DataTypeIec61360.RealCount;
+                    }
+                    break;
+                case 12:
+                    if (EqualsAscii(text, "REAL_MEASURE"))
+                    {
+                        return Aas.DataTypeIec61360.RealMeasure;
+                    }
+                    break;
+                case 13:
+                    switch (text[0])
+                    {
+                        case (byte)'I':
+                            if (EqualsAscii(text, "INTEGER_COUNT"))
+                            {
+                                return Aas.DataTypeIec61360.IntegerCount;
+                            }
+                            break;
+                        case (byte)'R':
+                            if (EqualsAscii(text, "REAL_CURRENCY"))
+                            {
+                                return Aas.DataTypeIec61360.RealCurrency;
+                            }
+                            break;
+                    }
+                    break;
+                case 15:
+                    if (EqualsAscii(text, "INTEGER_MEASURE"))
+                    {
+                        return Aas.DataTypeIec61360.IntegerMeasure;
+                    }
+                    break;
+                case 16:
+                    switch (text[0])
+                    {
+                        case (byte)'I':
+                            if (EqualsAscii(text, "INTEGER_CURRENCY"))
+                            {
+                                return Aas.DataTypeIec61360.IntegerCurrency;
+                            }
+                            break;
+                        case (byte)'R':
+                            if (EqualsAscii(text, "RATIONAL_MEASURE"))
+                            {
+                                return Aas.DataTypeIec61360.RationalMeasure;
+                            }
+                            break;
+                    }
+                    break;
+                case 19:
+                    if (EqualsAscii(text, "STRING_TRANSLATABLE"))
+                    {
+                        return Aas.DataTypeIec61360.StringTranslatable;
+                    }
+                    break;
+            }
+
+            return null;
+        }
 
         /// <summary>
         /// Retrieve the string representation of <paramref name="that" />.
@@ -1062,25 +3734,16 @@ namespace AasCore.Aas3
         /// </remarks>
         public static string? ToString(Aas.LevelType that)
         {
-            if (_levelTypeToString.TryGetValue(that, out string? value))
-            {
-                return value;
-            }
-            else
-            {
-                return null;
-            }
+            return that switch
+            {
+                Aas.LevelType.Min => "Min",
+                Aas.LevelType.Max => "Max",
+                Aas.LevelType.Nom => "Nom",
+                Aas.LevelType.Type => "Type",
+                _ => null
+            };
         }
 
-        private static readonly Dictionary<string, Aas.LevelType> _levelTypeFromString = (
-            new Dictionary<string, Aas.LevelType>()
-            {
-                { "Min", Aas.LevelType.Min },
-                { "Max", Aas.LevelType.Max },
-                { "Nom", Aas.LevelType.Nom },
-                { "Type", Aas.LevelType.Type }
-            });
-
         /// <summary>
         /// Parse the string representation of <see cref="LevelType" />.
         /// </summary>
@@ -1091,14 +3754,101 @@ namespace AasCore.Aas3
         /// </remarks>
         public static Aas.LevelType? LevelTypeFromString(string text)
         {
-            if (_levelTypeFromString.TryGetValue(text, out LevelType value))
-            {
-                return value;
+            return LevelTypeFromString((System.ReadOnlySpan<char>)text);
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="LevelType" />
+        /// given as characters.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="LevelType" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.LevelType? LevelTypeFromString(System.ReadOnlySpan<char> text)
+        {
+            switch (text.Length)
+            {
+                case 3:
+                    switch (text[1])
+                    {
+                        case 'i':
+                            if (EqualsOrdinal(text, "Min"))
+                            {
+                                return Aas.LevelType.Min;
+                            }
+                            break;
+                        case 'a':
+                            if (EqualsOrdinal(text, "Max"))
+                            {
+                                return Aas.LevelType.Max;
+                            }
+                            break;
+                        case 'o':
+                            if (EqualsOrdinal(text, "Nom"))
+                            {
+                                return Aas.LevelType.Nom;
+                            }
+                            break;
+                    }
+                    break;
+                case 4:
+                    if (EqualsOrdinal(text, "Type"))
+                    {
+                        return Aas.LevelType.Type;
+                    }
+                    break;
             }
-            else
-            {
-                return null;
+
+            return null;
+        }
+
+        /// <summary>
+        /// Parse the string representation of <see cref="LevelType" />
+        /// given as UTF-8 bytes.
+        /// </summary>
+        /// <remarks>
+        /// If <paramref name="text" /> is not a valid string representation
+        /// of a literal of <see cref="LevelType" />,
+        /// return <c>null</c>.
+        /// </remarks>
+        public static Aas.LevelType? LevelTypeFromUtf8(System.ReadOnlySpan<byte> text)
+        {
+            switch (text.Length)
+            {
+                case 3:
+                    switch (text[1])
+                    {
+                        case (byte)'i':
+                            if (EqualsAscii(text, "Min"))
+                            {
+                                return Aas.LevelType.Min;
+                            }
+                            break;
+                        case (byte)'a':
+                            if (EqualsAscii(text, "Max"))
+                            {
+                                return Aas.LevelType.Max;
+                            }
+                            break;
+                        case (byte)'o':
+                            if (EqualsAscii(text, "Nom"))
+                            {
+                                return Aas.LevelType.Nom;
+                            }
+                            break;
+                    }
+                    break;
+                case 4:
+                    if (EqualsAscii(text, "Type"))
+                    {
+                        return Aas.LevelType.Type;
+                    }
+                    break;
             }
+
+            return null;
         }
     }  // public static class Stringification
 }  // namespace AasCore.Aas3
@@ -25,6 +25,40 @@ namespace AasCore.Aas3
         /// </summary>
         public IEnumerable<IClass> Descend();
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// The generated classes implement this method without allocating
+        /// an enumerator. The implementation-specific classes can rely on
+        /// this default implementation.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anInstance in DescendOnce())
+            {
+                action(anInstance);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// The generated classes implement this method without allocating
+        /// an enumerator. The implementation-specific classes can rely on
+        /// this default implementation.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anInstance in Descend())
+            {
+                action(anInstance);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -148,6 +182,53 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            if (RefersTo != null)
+            {
+                action(RefersTo);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            if (RefersTo != null)
+            {
+                action(RefersTo);
+
+                // Recurse
+                RefersTo.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -432,6 +513,40 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -583,6 +698,53 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+
+                // Recurse
+                ValueId.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -682,6 +844,40 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DependsOn)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DependsOn)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -984,6 +1180,125 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (Administration != null)
+            {
+                action(Administration);
+            }
+
+            if (DerivedFrom != null)
+            {
+                action(DerivedFrom);
+            }
+
+            action(AssetInformation);
+
+            foreach (var anItem in Submodels)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (Administration != null)
+            {
+                action(Administration);
+
+                // Recurse
+                Administration.Descend(action);
+            }
+
+            if (DerivedFrom != null)
+            {
+                action(DerivedFrom);
+
+                // Recurse
+                DerivedFrom.Descend(action);
+            }
+
+            action(AssetInformation);
+
+            // Recurse
+            AssetInformation.Descend(action);
+
+            foreach (var anItem in Submodels)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -1160,6 +1475,66 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            if (GlobalAssetId != null)
+            {
+                action(GlobalAssetId);
+            }
+
+            if (SpecificAssetId != null)
+            {
+                action(SpecificAssetId);
+            }
+
+            if (DefaultThumbnail != null)
+            {
+                action(DefaultThumbnail);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            if (GlobalAssetId != null)
+            {
+                action(GlobalAssetId);
+
+                // Recurse
+                GlobalAssetId.Descend(action);
+            }
+
+            if (SpecificAssetId != null)
+            {
+                action(SpecificAssetId);
+
+                // Recurse
+                SpecificAssetId.Descend(action);
+            }
+
+            if (DefaultThumbnail != null)
+            {
+                action(DefaultThumbnail);
+
+                // Recurse
+                DefaultThumbnail.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -1318,8 +1693,55 @@ namespace AasCore.Aas3
         }
 
         /// <summary>
-        /// Accept the <paramref name="visitor" /> to visit this instance
-        /// for double dispatch.
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            if (ExternalSubjectId != null)
+            {
+                action(ExternalSubjectId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            if (ExternalSubjectId != null)
+            {
+                action(ExternalSubjectId);
+
+                // Recurse
+                ExternalSubjectId.Descend(action);
+            }
+        }
+
+        /// <summary>
+        /// Accept the <paramref name="visitor" /> to visit this instance
+        /// for double dispatch.
         /// </summary>
         public void Accept(Visitation.IVisitor visitor)
         {
@@ -1643,6 +2065,131 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (Administration != null)
+            {
+                action(Administration);
+            }
+
+            foreach (var anItem in SubmodelElements)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (Administration != null)
+            {
+                action(Administration);
+
+                // Recurse
+                Administration.Descend(action);
+            }
+
+            foreach (var anItem in SubmodelElements)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -2051,6 +2598,131 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Values)
+            {
+                action(anItem);
+            }
+
+            if (SemanticIdValues != null)
+            {
+                action(SemanticIdValues);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Values)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (SemanticIdValues != null)
+            {
+                action(SemanticIdValues);
+
+                // Recurse
+                SemanticIdValues.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -2369,19 +3041,131 @@ namespace AasCore.Aas3
         }
 
         /// <summary>
-        /// Accept the <paramref name="visitor" /> to visit this instance
-        /// for double dispatch.
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
         /// </summary>
-        public void Accept(Visitation.IVisitor visitor)
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
         {
-            visitor.Visit(this);
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Values)
+            {
+                action(anItem);
+            }
         }
 
         /// <summary>
-        /// Accept the visitor to visit this instance for double dispatch
-        /// with the <paramref name="context" />.
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
         /// </summary>
-        public void Accept<C>(Visitation.IVisitorWithContext<C> visitor, C context)
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Values)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
+        /// <summary>
+        /// Accept the <paramref name="visitor" /> to visit this instance
+        /// for double dispatch.
+        /// </summary>
+        public void Accept(Visitation.IVisitor visitor)
+        {
+            visitor.Visit(this);
+        }
+
+        /// <summary>
+        /// Accept the visitor to visit this instance for double dispatch
+        /// with the <paramref name="context" />.
+        /// </summary>
+        public void Accept<C>(Visitation.IVisitorWithContext<C> visitor, C context)
         {
             visitor.Visit(this, context);
         }
@@ -2728,6 +3512,118 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+
+                // Recurse
+                ValueId.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -3075,6 +3971,131 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            if (Value != null)
+            {
+                action(Value);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (Value != null)
+            {
+                action(Value);
+
+                // Recurse
+                ((IClass)Value).Descend(action);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+
+                // Recurse
+                ValueId.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -3388,26 +4409,125 @@ namespace AasCore.Aas3
         }
 
         /// <summary>
-        /// Accept the <paramref name="visitor" /> to visit this instance
-        /// for double dispatch.
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
         /// </summary>
-        public void Accept(Visitation.IVisitor visitor)
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
         {
-            visitor.Visit(this);
-        }
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
 
-        /// <summary>
-        /// Accept the visitor to visit this instance for double dispatch
-        /// with the <paramref name="context" />.
-        /// </summary>
-        public void Accept<C>(Visitation.IVisitorWithContext<C> visitor, C context)
-        {
-            visitor.Visit(this, context);
-        }
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
 
-        /// <summary>
-        /// Accept the <paramref name="transformer" /> to transform this instance
-        /// for double dispatch.
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
+        /// <summary>
+        /// Accept the <paramref name="visitor" /> to visit this instance
+        /// for double dispatch.
+        /// </summary>
+        public void Accept(Visitation.IVisitor visitor)
+        {
+            visitor.Visit(this);
+        }
+
+        /// <summary>
+        /// Accept the visitor to visit this instance for double dispatch
+        /// with the <paramref name="context" />.
+        /// </summary>
+        public void Accept<C>(Visitation.IVisitorWithContext<C> visitor, C context)
+        {
+            visitor.Visit(this, context);
+        }
+
+        /// <summary>
+        /// Accept the <paramref name="transformer" /> to transform this instance
+        /// for double dispatch.
         /// </summary>
         public T Transform<T>(Visitation.ITransformer<T> transformer)
         {
@@ -3706,6 +4826,118 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            if (Value != null)
+            {
+                action(Value);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (Value != null)
+            {
+                action(Value);
+
+                // Recurse
+                Value.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -4013,6 +5245,105 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -4317,24 +5648,123 @@ namespace AasCore.Aas3
         }
 
         /// <summary>
-        /// Accept the <paramref name="visitor" /> to visit this instance
-        /// for double dispatch.
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
         /// </summary>
-        public void Accept(Visitation.IVisitor visitor)
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
         {
-            visitor.Visit(this);
-        }
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
 
-        /// <summary>
-        /// Accept the visitor to visit this instance for double dispatch
-        /// with the <paramref name="context" />.
-        /// </summary>
-        public void Accept<C>(Visitation.IVisitorWithContext<C> visitor, C context)
-        {
-            visitor.Visit(this, context);
-        }
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
 
-        /// <summary>
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
+        /// <summary>
+        /// Accept the <paramref name="visitor" /> to visit this instance
+        /// for double dispatch.
+        /// </summary>
+        public void Accept(Visitation.IVisitor visitor)
+        {
+            visitor.Visit(this);
+        }
+
+        /// <summary>
+        /// Accept the visitor to visit this instance for double dispatch
+        /// with the <paramref name="context" />.
+        /// </summary>
+        public void Accept<C>(Visitation.IVisitorWithContext<C> visitor, C context)
+        {
+            visitor.Visit(this, context);
+        }
+
+        /// <summary>
         /// Accept the <paramref name="transformer" /> to transform this instance
         /// for double dispatch.
         /// </summary>
@@ -4657,6 +6087,132 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            action(First);
+
+            action(Second);
+
+            foreach (var anItem in Annotation)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            action(First);
+
+            // Recurse
+            First.Descend(action);
+
+            action(Second);
+
+            // Recurse
+            Second.Descend(action);
+
+            foreach (var anItem in Annotation)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -5052,6 +6608,144 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Statements)
+            {
+                action(anItem);
+            }
+
+            if (GlobalAssetId != null)
+            {
+                action(GlobalAssetId);
+            }
+
+            if (SpecificAssetId != null)
+            {
+                action(SpecificAssetId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Statements)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (GlobalAssetId != null)
+            {
+                action(GlobalAssetId);
+
+                // Recurse
+                GlobalAssetId.Descend(action);
+            }
+
+            if (SpecificAssetId != null)
+            {
+                action(SpecificAssetId);
+
+                // Recurse
+                SpecificAssetId.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -5374,6 +7068,112 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            action(Observed);
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            action(Observed);
+
+            // Recurse
+            Observed.Descend(action);
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -5704,24 +7504,162 @@ namespace AasCore.Aas3
 
             foreach (var anItem in OutputVariables)
             {
-                yield return anItem;
+                yield return anItem;
+
+                // Recurse
+                foreach (var anotherItem in anItem.Descend())
+                {
+                    yield return anotherItem;
+                }
+            }
+
+            foreach (var anItem in InoutputVariables)
+            {
+                yield return anItem;
+
+                // Recurse
+                foreach (var anotherItem in anItem.Descend())
+                {
+                    yield return anotherItem;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in InputVariables)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in OutputVariables)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in InoutputVariables)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in InputVariables)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in OutputVariables)
+            {
+                action(anItem);
 
                 // Recurse
-                foreach (var anotherItem in anItem.Descend())
-                {
-                    yield return anotherItem;
-                }
+                anItem.Descend(action);
             }
 
             foreach (var anItem in InoutputVariables)
             {
-                yield return anItem;
+                action(anItem);
 
                 // Recurse
-                foreach (var anotherItem in anItem.Descend())
-                {
-                    yield return anotherItem;
-                }
+                anItem.Descend(action);
             }
         }
 
@@ -5837,6 +7775,34 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            action(Value);
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            action(Value);
+
+            // Recurse
+            Value.Descend(action);
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -6102,6 +8068,105 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+
+                // Recurse
+                SemanticId.Descend(action);
+            }
+
+            foreach (var anItem in Qualifiers)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -6394,6 +8459,105 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (Administration != null)
+            {
+                action(Administration);
+            }
+
+            foreach (var anItem in IsCaseOf)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+
+                // Recurse
+                ((IClass)Description).Descend(action);
+            }
+
+            if (Administration != null)
+            {
+                action(Administration);
+
+                // Recurse
+                Administration.Descend(action);
+            }
+
+            foreach (var anItem in IsCaseOf)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -6644,35 +8808,134 @@ namespace AasCore.Aas3
 
             if (Description != null)
             {
-                yield return Description;
+                yield return Description;
+
+                // Recurse
+                foreach (var anItem in Description.Descend())
+                {
+                    yield return anItem;
+                }
+            }
+
+            if (SemanticId != null)
+            {
+                yield return SemanticId;
+
+                // Recurse
+                foreach (var anItem in SemanticId.Descend())
+                {
+                    yield return anItem;
+                }
+            }
+
+            foreach (var anItem in ContainedElements)
+            {
+                yield return anItem;
+
+                // Recurse
+                foreach (var anotherItem in anItem.Descend())
+                {
+                    yield return anotherItem;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
+            }
+
+            if (SemanticId != null)
+            {
+                action(SemanticId);
+            }
+
+            foreach (var anItem in ContainedElements)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in DataSpecifications)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Extensions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (DisplayName != null)
+            {
+                action(DisplayName);
+
+                // Recurse
+                ((IClass)DisplayName).Descend(action);
+            }
+
+            if (Description != null)
+            {
+                action(Description);
 
                 // Recurse
-                foreach (var anItem in Description.Descend())
-                {
-                    yield return anItem;
-                }
+                ((IClass)Description).Descend(action);
             }
 
             if (SemanticId != null)
             {
-                yield return SemanticId;
+                action(SemanticId);
 
                 // Recurse
-                foreach (var anItem in SemanticId.Descend())
-                {
-                    yield return anItem;
-                }
+                SemanticId.Descend(action);
             }
 
             foreach (var anItem in ContainedElements)
             {
-                yield return anItem;
+                action(anItem);
 
                 // Recurse
-                foreach (var anotherItem in anItem.Descend())
-                {
-                    yield return anotherItem;
-                }
+                anItem.Descend(action);
             }
         }
 
@@ -6781,6 +9044,31 @@ namespace AasCore.Aas3
             yield break;
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            // No descendable properties
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            // No descendable properties
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -6889,6 +9177,53 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in Keys)
+            {
+                action(anItem);
+            }
+
+            if (ReferredSemanticId != null)
+            {
+                action(ReferredSemanticId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in Keys)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            if (ReferredSemanticId != null)
+            {
+                action(ReferredSemanticId);
+
+                // Recurse
+                ReferredSemanticId.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -6963,6 +9298,31 @@ namespace AasCore.Aas3
             yield break;
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            // No descendable properties
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            // No descendable properties
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -7913,6 +10273,34 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            action(ValueId);
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            action(ValueId);
+
+            // Recurse
+            ValueId.Descend(action);
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -7998,6 +10386,40 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in ValueReferencePairs)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in ValueReferencePairs)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -8271,6 +10693,105 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            if (PreferredName != null)
+            {
+                action(PreferredName);
+            }
+
+            if (ShortName != null)
+            {
+                action(ShortName);
+            }
+
+            if (UnitId != null)
+            {
+                action(UnitId);
+            }
+
+            if (Definition != null)
+            {
+                action(Definition);
+            }
+
+            if (ValueList != null)
+            {
+                action(ValueList);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            if (PreferredName != null)
+            {
+                action(PreferredName);
+
+                // Recurse
+                ((IClass)PreferredName).Descend(action);
+            }
+
+            if (ShortName != null)
+            {
+                action(ShortName);
+
+                // Recurse
+                ((IClass)ShortName).Descend(action);
+            }
+
+            if (UnitId != null)
+            {
+                action(UnitId);
+
+                // Recurse
+                UnitId.Descend(action);
+            }
+
+            if (Definition != null)
+            {
+                action(Definition);
+
+                // Recurse
+                ((IClass)Definition).Descend(action);
+            }
+
+            if (ValueList != null)
+            {
+                action(ValueList);
+
+                // Recurse
+                ValueList.Descend(action);
+            }
+
+            if (ValueId != null)
+            {
+                action(ValueId);
+
+                // Recurse
+                ValueId.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -8435,6 +10956,40 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            if (Definition != null)
+            {
+                action(Definition);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            if (Definition != null)
+            {
+                action(Definition);
+
+                // Recurse
+                ((IClass)Definition).Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -8573,6 +11128,66 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Apply the <paramref name="action" /> on all the class instances referenced
+        /// from this instance without further recursion.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="DescendOnce()" />, no enumerator is allocated.
+        /// </remarks>
+        public void DescendOnce(System.Action<IClass> action)
+        {
+            foreach (var anItem in AssetAdministrationShells)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in Submodels)
+            {
+                action(anItem);
+            }
+
+            foreach (var anItem in ConceptDescriptions)
+            {
+                action(anItem);
+            }
+        }
+
+        /// <summary>
+        /// Apply the <paramref name="action" /> recursively on all the class instances
+        /// referenced from this instance.
+        /// </summary>
+        /// <remarks>
+        /// In contrast to <see cref="Descend()" />, no enumerator is allocated
+        /// at any level of the recursion.
+        /// </remarks>
+        public void Descend(System.Action<IClass> action)
+        {
+            foreach (var anItem in AssetAdministrationShells)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in Submodels)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+
+            foreach (var anItem in ConceptDescriptions)
+            {
+                action(anItem);
+
+                // Recurse
+                anItem.Descend(action);
+            }
+        }
+
         /// <summary>
         /// Accept the <paramref name="visitor" /> to visit this instance
         /// for double dispatch.
@@ -4,6 +4,7 @@
  */
 
 using Regex = System.Text.RegularExpressions.Regex;
+using RegexOptions = System.Text.RegularExpressions.RegexOptions;
 using System.Collections.Generic;  // can't alias
 using System.Collections.ObjectModel;  // can't alias
 using System.Linq;  // can't alias"
@@ -72,7 +73,7 @@ namespace AasCore.Aas3
             /// </summary>
             public void Add(Verification.Error error)
             {
-                if(_entries.Count <= Capacity)
+                if (_entries.Count < Capacity)
                 {
                     _entries.Add(error);
                 }
@@ -105,6 +106,99 @@ namespace AasCore.Aas3
             }
         }
 
+        /// <summary>
+        /// Represent a path to an instance as a chain of segments.
+        /// </summary>
+        /// <remarks>
+        /// The verifiers pass the segments down as they descend, and render them
+        /// as a string only when an error is recorded. Hence valid instances are
+        /// verified without formatting any paths.
+        /// </remarks>
+        public sealed class PathSegment
+        {
+            /// <summary>
+            /// Segment which this segment extends, or null if this is the root
+            /// </summary>
+            public readonly PathSegment? Parent;
+
+            /// <summary>
+            /// Name of the property, or null if the segment is an index
+            /// </summary>
+            public readonly string? Name;
+
+            /// <summary>
+            /// Index of the item in a list, if the segment is not a name
+            /// </summary>
+            public readonly int Index;
+
+            /// <summary>
+            /// Initialize the root of a path with the given <paramref name="name" />.
+            /// </summary>
+            public PathSegment(string name)
+            {
+                Name = name;
+            }
+
+            /// <summary>
+            /// Initialize the segment of a property <paramref name="name" />.
+            /// </summary>
+            public PathSegment(PathSegment parent, string name)
+            {
+                Parent = parent;
+                Name = name;
+            }
+
+            /// <summary>
+            /// Initialize the segment of a list item at <paramref name="index" />.
+            /// </summary>
+            public PathSegment(PathSegment parent, int index)
+            {
+                Parent = parent;
+                Index = index;
+            }
+
+            /// <summary>
+            /// Render the path with the segments joined by slashes.
+            /// </summary>
+            public override string ToString()
+            {
+                var segments = new List<PathSegment>();
+                for (PathSegment? segment = this; segment != null; segment = segment.Parent)
+                {
+                    segments.Add(segment);
+                }
+
+                var builder = new System.Text.StringBuilder();
+                for (var i = segments.Count - 1; i >= 0; i--)
+                {
+                    if (i < segments.Count - 1)
+                    {
+                        builder.Append('/');
+                    }
+
+                    if (segments[i].Name != null)
+                    {
+                        builder.Append(segments[i].Name);
+                    }
+                    else
+                    {
+                        builder.Append(segments[i].Index);
+                    }
+                }
+
+                return builder.ToString();
+            }
+
+            /// <summary>
+            /// Render the <paramref name="segment" /> for the implementation-specific
+            /// verification which still localizes the errors with string paths.
+            /// </summary>
+            public static implicit operator string(PathSegment segment)
+            {
+                return segment.ToString();
+            }
+        }  // public sealed class PathSegment
+
         private static Regex _constructIsMimeType()
         {
             var tchar = "[!#$%&'*+\\-.^_`|~0-9a-zA-Z]";
@@ -148,307 +242,256 @@ namespace AasCore.Aas3
         private static class Implementation
         {
             /// <summary>
-            /// Hash allowed enum values for efficient validation of enums.
+            /// Check efficiently whether the values are literals of the enumerations.
             /// </summary>
             private static class EnumValueSet
             {
-                public static HashSet<int> ForModelingKind = new HashSet<int>
-                {
-                    (int)Aas.ModelingKind.Template,
-                    (int)Aas.ModelingKind.Instance
-                };
-
-                public static HashSet<int> ForAssetKind = new HashSet<int>
-                {
-                    (int)Aas.AssetKind.Type,
-                    (int)Aas.AssetKind.Instance
-                };
-
-                public static HashSet<int> ForEntityType = new HashSet<int>
-                {
-                    (int)Aas.EntityType.CoManagedEntity,
-                    (int)Aas.EntityType.SelfManagedEntity
-                };
-
-                public static HashSet<int> ForIdentifiableElements = new HashSet<int>
-                {
-                    (int)Aas.IdentifiableElements.AssetAdministrationShell,
-                    (int)Aas.IdentifiableElements.ConceptDescription,
-                    (int)Aas.IdentifiableElements.Submodel
-                };
-
-                public static HashSet<int> ForReferableElements = new HashSet<int>
-                {
-                    (int)Aas.ReferableElements.AccessPermissionRule,
-                    (int)Aas.ReferableElements.AnnotatedRelationshipElement,
-                    (int)Aas.ReferableElements.Asset,
-                    (int)Aas.ReferableElements.AssetAdministrationShell,
-                    (int)Aas.ReferableElements.BasicEvent,
-                    (int)Aas.ReferableElements.Blob,
-                    (int)Aas.ReferableElements.Capability,
-                    (int)Aas.ReferableElements.ConceptDescription,
-                    (int)Aas.ReferableElements.DataElement,
-                    (int)Aas.ReferableElements.Entity,
-                    (int)Aas.ReferableElements.Event,
-                    (int)Aas.ReferableElements.File,
-                    (int)Aas.ReferableElements.MultiLanguageProperty,
-                    (int)Aas.ReferableElements.Operation,
-                    (int)Aas.ReferableElements.Property,
-                    (int)Aas.ReferableElements.Range,
-                    (int)Aas.ReferableElements.ReferenceElement,
-                    (int)Aas.ReferableElements.RelationshipElement,
-                    (int)Aas.ReferableElements.Submodel,
-                    (int)Aas.ReferableElements.SubmodelElement,
-                    (int)Aas.ReferableElements.SubmodelElementList,
-                    (int)Aas.ReferableElements.SubmodelElementStruct
-                };
-
-                public static HashSet<int> ForKeyElements = new HashSet<int>
-                {
-                    (int)Aas.KeyElements.FragmentReference,
-                    (int)Aas.KeyElements.AccessPermissionRule,
-                    (int)Aas.KeyElements.AnnotatedRelationshipElement,
-                    (int)Aas.KeyElements.Asset,
-                    (int)Aas.KeyElements.AssetAdministrationShell,
-                    (int)Aas.KeyElements.BasicEvent,
-                    (int)Aas.KeyElements.Blob,
-                    (int)Aas.KeyElements.Capability,
-                    (int)Aas.KeyElements.ConceptDescription,
-                    (int)Aas.KeyElements.DataElement,
-                    (int)Aas.KeyElements.Entity,
-                    (int)Aas.KeyElements.Event,
-                    (int)Aas.KeyElements.File,
-                    (int)Aas.KeyElements.MultiLanguageProperty,
-                    (int)Aas.KeyElements.Operation,
-                    (int)Aas.KeyElements.Property,
-                    (int)Aas.KeyElements.Range,
-                    (int)Aas.KeyElements.GlobalReference,
-                    (int)Aas.KeyElements.ReferenceElement,
-                    (int)Aas.KeyElements.RelationshipElement,
-                    (int)Aas.KeyElements.Submodel,
-                    (int)Aas.KeyElements.SubmodelElement,
-                    (int)Aas.KeyElements.SubmodelElementList,
-                    (int)Aas.KeyElements.SubmodelElementStruct
-                };
-
-                public static HashSet<int> ForSubmodelElements = new HashSet<int>
-                {
-                    (int)Aas.SubmodelElements.AnnotatedRelationshipElement,
-                    (int)Aas.SubmodelElements.Asset,
-                    (int)Aas.SubmodelElements.AssetAdministrationShell,
-                    (int)Aas.SubmodelElements.BasicEvent,
-                    (int)Aas.SubmodelElements.Blob,
-                    (int)Aas.SubmodelElements.Capability,
-                    (int)Aas.SubmodelElements.ConceptDescription,
-                    (int)Aas.SubmodelElements.DataElement,
-                    (int)Aas.SubmodelElements.Entity,
-                    (int)Aas.SubmodelElements.Event,
-                    (int)Aas.SubmodelElements.File,
-                    (int)Aas.SubmodelElements.MultiLanguageProperty,
-                    (int)Aas.SubmodelElements.Operation,
-                    (int)Aas.SubmodelElements.Property,
-                    (int)Aas.SubmodelElements.Range,
-                    (int)Aas.SubmodelElements.ReferenceElement,
-                    (int)Aas.SubmodelElements.RelationshipElement,
-                    (int)Aas.SubmodelElements.Submodel,
-                    (int)Aas.SubmodelElements.SubmodelElement,
-                    (int)Aas.SubmodelElements.SubmodelElementList,
-                    (int)Aas.SubmodelElements.SubmodelElementStruct
-                };
-
-                public static HashSet<int> ForBuildInListTypes = new HashSet<int>
-                {
-                    (int)Aas.BuildInListTypes.Entities,
-                    (int)Aas.BuildInListTypes.IdRefs,
-                    (int)Aas.BuildInListTypes.NMTokens
-                };
-
-                public static HashSet<int> ForDecimalBuildInTypes = new HashSet<int>
-                {
-                    (int)Aas.DecimalBuildInTypes.Integer,
-                    (int)Aas.DecimalBuildInTypes.Long,
-                    (int)Aas.DecimalBuildInTypes.Int,
-                    (int)Aas.DecimalBuildInTypes.Short,
-                    (int)Aas.DecimalBuildInTypes.Byte,
-                    (int)Aas.DecimalBuildInTypes.NonNegativeInteger,
-                    (int)Aas.DecimalBuildInTypes.PositiveInteger,
-                    (int)Aas.DecimalBuildInTypes.UnsignedInteger,
-                    (int)Aas.DecimalBuildInTypes.UnsignedLong,
-                    (int)Aas.DecimalBuildInTypes.UnsignedInt,
-                    (int)Aas.DecimalBuildInTypes.UnsignedShort,
-                    (int)Aas.DecimalBuildInTypes.UnsignedByte,
-                    (int)Aas.DecimalBuildInTypes.NonPositiveInteger,
-                    (int)Aas.DecimalBuildInTypes.NegativeInteger
-                };
-
-                public static HashSet<int> ForDurationBuildInTypes = new HashSet<int>
-                {
-                    (int)Aas.DurationBuildInTypes.DayTimeDuration,
-                    (int)Aas.DurationBuildInTypes.YearMonthDuration
-                };
-
-                public static HashSet<int> ForPrimitiveTypes = new HashSet<int>
-                {
-                    (int)Aas.PrimitiveTypes.AnyUri,
-                    (int)Aas.PrimitiveTypes.Base64Binary,
-                    (int)Aas.PrimitiveTypes.Boolean,
-                    (int)Aas.PrimitiveTypes.Date,
-                    (int)Aas.PrimitiveTypes.DateTime,
-                    (int)Aas.PrimitiveTypes.Decimal,
-                    (int)Aas.PrimitiveTypes.Double,
-                    (int)Aas.PrimitiveTypes.Duration,
-                    (int)Aas.PrimitiveTypes.Float,
-                    (int)Aas.PrimitiveTypes.GDay,
-                    (int)Aas.PrimitiveTypes.GMonth,
-                    (int)Aas.PrimitiveTypes.GMonthDay,
-                    (int)Aas.PrimitiveTypes.HeyBinary,
-                    (int)Aas.PrimitiveTypes.Notation,
-                    (int)Aas.PrimitiveTypes.QName,
-                    (int)Aas.PrimitiveTypes.String,
-                    (int)Aas.PrimitiveTypes.Time
-                };
-
-                public static HashSet<int> ForStringBuildInTypes = new HashSet<int>
-                {
-                    (int)Aas.StringBuildInTypes.NormalizedString,
-                    (int)Aas.StringBuildInTypes.Token,
-                    (int)Aas.StringBuildInTypes.Language,
-                    (int)Aas.StringBuildInTypes.NCName,
-                    (int)Aas.StringBuildInTypes.Entity,
-                    (int)Aas.StringBuildInTypes.Id,
-                    (int)Aas.StringBuildInTypes.Idref
-                };
-
-                public static HashSet<int> ForDataTypeDef = new HashSet<int>
-                {
-                    (int)Aas.DataTypeDef.Entities,
-                    (int)Aas.DataTypeDef.IdRefs,
-                    (int)Aas.DataTypeDef.NMTokens,
-                    (int)Aas.DataTypeDef.Integer,
-                    (int)Aas.DataTypeDef.Long,
-                    (int)Aas.DataTypeDef.Int,
-                    (int)Aas.DataTypeDef.Short,
-                    (int)Aas.DataTypeDef.Byte,
-                    (int)Aas.DataTypeDef.NonNegativeInteger,
-                    (int)Aas.DataTypeDef.PositiveInteger,
-                    (int)Aas.DataTypeDef.UnsignedInteger,
-                    (int)Aas.DataTypeDef.UnsignedLong,
-                    (int)Aas.DataTypeDef.UnsignedInt,
-                    (int)Aas.DataTypeDef.UnsignedShort,
-                    (int)Aas.DataTypeDef.UnsignedByte,
-                    (int)Aas.DataTypeDef.NonPositiveInteger,
-                    (int)Aas.DataTypeDef.NegativeInteger,
-                    (int)Aas.DataTypeDef.DayTimeDuration,
-                    (int)Aas.DataTypeDef.YearMonthDuration,
-                    (int)Aas.DataTypeDef.AnyUri,
-                    (int)Aas.DataTypeDef.Base64Binary,
-                    (int)Aas.DataTypeDef.Boolean,
-                    (int)Aas.DataTypeDef.Date,
-                    (int)Aas.DataTypeDef.DateTime,
-                    (int)Aas.DataTypeDef.Decimal,
-                    (int)Aas.DataTypeDef.Double,
-                    (int)Aas.DataTypeDef.Duration,
-                    (int)Aas.DataTypeDef.Float,
-                    (int)Aas.DataTypeDef.GDay,
-                    (int)Aas.DataTypeDef.GMonth,
-                    (int)Aas.DataTypeDef.GMonthDay,
-                    (int)Aas.DataTypeDef.HeyBinary,
-                    (int)Aas.DataTypeDef.Notation,
-                    (int)Aas.DataTypeDef.QName,
-                    (int)Aas.DataTypeDef.String,
-                    (int)Aas.DataTypeDef.Time,
-                    (int)Aas.DataTypeDef.NormalizedString,
-                    (int)Aas.DataTypeDef.Token,
-                    (int)Aas.DataTypeDef.Language,
-                    (int)Aas.DataTypeDef.NCName,
-                    (int)Aas.DataTypeDef.Entity,
-                    (int)Aas.DataTypeDef.Id,
-                    (int)Aas.DataTypeDef.Idref
-                };
-
-                public static HashSet<int> ForDataTypeIec61360 = new HashSet<int>
-                {
-                    (int)Aas.DataTypeIec61360.Date,
-                    (int)Aas.DataTypeIec61360.String,
-                    (int)Aas.DataTypeIec61360.StringTranslatable,
-                    (int)Aas.DataTypeIec61360.IntegerMeasure,
-                    (int)Aas.DataTypeIec61360.IntegerCount,
-                    (int)Aas.DataTypeIec61360.IntegerCurrency,
-                    (int)Aas.DataTypeIec61360.RealMeasure,
-                    (int)Aas.DataTypeIec61360.RealCount,
-                    (int)Aas.DataTypeIec61360.RealCurrency,
-                    (int)Aas.DataTypeIec61360.Boolean,
-                    (int)Aas.DataTypeIec61360.Iri,
-                    (int)Aas.DataTypeIec61360.Irdi,
-                    (int)Aas.DataTypeIec61360.Rational,
-                    (int)Aas.DataTypeIec61360.RationalMeasure,
-                    (int)Aas.DataTypeIec61360.Time,
-                    (int)Aas.DataTypeIec61360.Timestamp,
-                    (int)Aas.DataTypeIec61360.File,
-                    (int)Aas.DataTypeIec61360.Html,
-                    (int)Aas.DataTypeIec61360.Blob
-                };
-
-                public static HashSet<int> ForLevelType = new HashSet<int>
-                {
-                    (int)Aas.LevelType.Min,
-                    (int)Aas.LevelType.Max,
-                    (int)Aas.LevelType.Nom,
-                    (int)Aas.LevelType.Type
-                };
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.ModelingKind" />.
+                /// </summary>
+                public static bool ContainsModelingKind(int value)
+                {
+                    return (uint)value <= (uint)Aas.ModelingKind.Instance;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.AssetKind" />.
+                /// </summary>
+                public static bool ContainsAssetKind(int value)
+                {
+                    return (uint)value <= (uint)Aas.AssetKind.Instance;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.EntityType" />.
+                /// </summary>
+                public static bool ContainsEntityType(int value)
+                {
+                    return (uint)value <= (uint)Aas.EntityType.SelfManagedEntity;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.IdentifiableElements" />.
+                /// </summary>
+                public static bool ContainsIdentifiableElements(int value)
+                {
+                    return (uint)value <= (uint)Aas.IdentifiableElements.Submodel;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.ReferableElements" />.
+                /// </summary>
+                public static bool ContainsReferableElements(int value)
+                {
+                    return (uint)value <= (uint)Aas.ReferableElements.SubmodelElementStruct;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.KeyElements" />.
+                /// </summary>
+                public static bool ContainsKeyElements(int value)
+                {
+                    return (uint)value <= (uint)Aas.KeyElements.SubmodelElementStruct;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.SubmodelElements" />.
+                /// </summary>
+                public static bool ContainsSubmodelElements(int value)
+                {
+                    return (uint)value <= (uint)Aas.SubmodelElements.SubmodelElementStruct;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.BuildInListTypes" />.
+                /// </summary>
+                public static bool ContainsBuildInListTypes(int value)
+                {
+                    return (uint)value <= (uint)Aas.BuildInListTypes.NMTokens;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.DecimalBuildInTypes" />.
+                /// </summary>
+                public static bool ContainsDecimalBuildInTypes(int value)
+                {
+                    return (uint)value <= (uint)Aas.DecimalBuildInTypes.NegativeInteger;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.DurationBuildInTypes" />.
+                /// </summary>
+                public static bool ContainsDurationBuildInTypes(int value)
+                {
+                    return (uint)value <= (uint)Aas.DurationBuildInTypes.YearMonthDuration;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.PrimitiveTypes" />.
+                /// </summary>
+                public static bool ContainsPrimitiveTypes(int value)
+                {
+                    return (uint)value <= (uint)Aas.PrimitiveTypes.Time;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.StringBuildInTypes" />.
+                /// </summary>
+                public static bool ContainsStringBuildInTypes(int value)
+                {
+                    return (uint)value <= (uint)Aas.StringBuildInTypes.Idref;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.DataTypeDef" />.
+                /// </summary>
+                public static bool ContainsDataTypeDef(int value)
+                {
+                    return (uint)value <= (uint)Aas.DataTypeDef.Idref;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.DataTypeIec61360" />.
+                /// </summary>
+                public static bool ContainsDataTypeIec61360(int value)
+                {
+                    return (uint)value <= (uint)Aas.DataTypeIec61360.Blob;
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="value" /> is a literal of
+                /// <see cref="Aas.LevelType" />.
+                /// </summary>
+                public static bool ContainsLevelType(int value)
+                {
+                    return (uint)value <= (uint)Aas.LevelType.Type;
+                }
             }  // private static class EnumValueSet
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Verify the invariants specified for <c>NonEmptyString</c> on
+            /// <paramref name="that" /> and append any errors to <paramref name="errors" />.
             /// </summary>
-            public static void VerifyNonEmptyString (
+            /// <remarks>
+            /// The function is shared by all the descendants which inherit the invariants.
+            /// </remarks>
+            public static void VerifyInvariantsOfNonEmptyString(
                 string that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (!(that.Length >= 1))
                 {
                     errors.Add(
                         new Verification.Error(
-                            path,
+                            path.ToString(),
                             "Invariant violated:\n" +
                             "that.Length >= 1"));
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies the invariants specified for
+            /// <c>NonEmptyString</c> without allocating any errors.
+            /// </summary>
+            public static bool SatisfiesInvariantsOfNonEmptyString(string that)
+            {
+                if (!(that.Length >= 1))
+                {
+                    return false;
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyMimeTyped (
+            public static void VerifyNonEmptyString (
                 string that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
-                if (!(that.Length >= 1))
+                VerifyInvariantsOfNonEmptyString(
+                    that, path, errors);
+            }
+
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidNonEmptyString(string that)
+            {
+                if (!SatisfiesInvariantsOfNonEmptyString(that))
                 {
-                    errors.Add(
-                        new Verification.Error(
-                            path,
-                            "Invariant violated:\n" +
-                            "that.Length >= 1"));
+                    return false;
                 }
 
+                return true;
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// </summary>
+            public static void VerifyMimeTyped (
+                string that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
+            {
+                VerifyInvariantsOfNonEmptyString(
+                    that, path, errors);
+
+                if (errors.Full()) return;
+
                 if (!Verification.IsMimeType(that))
                 {
                     errors.Add(
                         new Verification.Error(
-                            path,
+                            path.ToString(),
                             "Invariant violated:\n" +
                             "Verification.IsMimeType(that)"));
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidMimeTyped(string that)
+            {
+                if (!SatisfiesInvariantsOfNonEmptyString(that))
+                {
+                    return false;
+                }
+
+                if (!Verification.IsMimeType(that))
+                {
+                    return false;
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -457,26 +500,26 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyExtension (
                 Aas.Extension that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
                 Verification.Implementation.VerifyNonEmptyString(
                     that.Name,
-                    $"{path}/Name",
+                    new Verification.PathSegment(path, "Name"),
                     errors);
 
                 if (errors.Full()) return;
 
                 if (that.ValueType != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForDataTypeDef.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
                             (int)that.ValueType))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/ValueType",
+                                new Verification.PathSegment(path, "ValueType").ToString(),
                                 $"Invalid {nameof(Aas.DataTypeDef)}: {that.ValueType}"));
                     }
                 }
@@ -487,11 +530,42 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Value,
-                        $"{path}/Value",
+                        new Verification.PathSegment(path, "Value"),
                         errors);
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidExtension(Aas.Extension that)
+            {
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Name))
+                {
+                    return false;
+                }
+
+                if (that.ValueType != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
+                            (int)that.ValueType))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -500,7 +574,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyAdministrativeInformation (
                 Aas.AdministrativeInformation that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (!(
@@ -509,7 +583,7 @@ namespace AasCore.Aas3
                 {
                     errors.Add(
                         new Verification.Error(
-                            path,
+                            path.ToString(),
                             "Invariant violated:\n" +
                             "Constraint AASd-005\n" +
                             "!(that.Revision != null)\n" +
@@ -522,7 +596,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Version,
-                        $"{path}/Version",
+                        new Verification.PathSegment(path, "Version"),
                         errors);
                 }
 
@@ -532,11 +606,43 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Revision,
-                        $"{path}/Revision",
+                        new Verification.PathSegment(path, "Revision"),
                         errors);
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidAdministrativeInformation(Aas.AdministrativeInformation that)
+            {
+                if (!(
+                    !(that.Revision != null)
+                    || (that.Version != null)))
+                {
+                    return false;
+                }
+
+                if (that.Version != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Version))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Revision != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Revision))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -545,24 +651,24 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyQualifier (
                 Aas.Qualifier that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
                 Verification.Implementation.VerifyNonEmptyString(
                     that.Type,
-                    $"{path}/Type",
+                    new Verification.PathSegment(path, "Type"),
                     errors);
 
                 if (errors.Full()) return;
 
-                if (!Verification.Implementation.EnumValueSet.ForDataTypeDef.Contains(
+                if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
                         (int)that.ValueType))
                 {
                     errors.Add(
                         new Verification.Error(
-                            $"{path}/ValueType",
+                            new Verification.PathSegment(path, "ValueType").ToString(),
                             $"Invalid {nameof(Aas.DataTypeDef)}: {that.ValueType}"));
                 }
 
@@ -572,11 +678,39 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Value,
-                        $"{path}/Value",
+                        new Verification.PathSegment(path, "Value"),
                         errors);
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidQualifier(Aas.Qualifier that)
+            {
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Type))
+                {
+                    return false;
+                }
+
+                if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
+                        (int)that.ValueType))
+                {
+                    return false;
+                }
+
+                if (that.Value != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -585,12 +719,21 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyFormula (
                 Aas.Formula that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 // There is no verification specified.
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidFormula(Aas.Formula that)
+            {
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -599,7 +742,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyAssetAdministrationShell (
                 Aas.AssetAdministrationShell that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -608,7 +751,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -618,7 +761,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -626,10 +769,40 @@ namespace AasCore.Aas3
 
                 Verification.Implementation.VerifyNonEmptyString(
                     that.Id,
-                    $"{path}/Id",
+                    new Verification.PathSegment(path, "Id"),
                     errors);
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidAssetAdministrationShell(Aas.AssetAdministrationShell that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Id))
+                {
+                    return false;
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -638,21 +811,36 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyAssetInformation (
                 Aas.AssetInformation that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
-                if (!Verification.Implementation.EnumValueSet.ForAssetKind.Contains(
+                if (!Verification.Implementation.EnumValueSet.ContainsAssetKind(
                         (int)that.AssetKind))
                 {
                     errors.Add(
                         new Verification.Error(
-                            $"{path}/AssetKind",
+                            new Verification.PathSegment(path, "AssetKind").ToString(),
                             $"Invalid {nameof(Aas.AssetKind)}: {that.AssetKind}"));
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidAssetInformation(Aas.AssetInformation that)
+            {
+                if (!Verification.Implementation.EnumValueSet.ContainsAssetKind(
+                        (int)that.AssetKind))
+                {
+                    return false;
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -661,24 +849,43 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyIdentifierKeyValuePair (
                 Aas.IdentifierKeyValuePair that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
                 Verification.Implementation.VerifyNonEmptyString(
                     that.Key,
-                    $"{path}/Key",
+                    new Verification.PathSegment(path, "Key"),
                     errors);
 
                 if (errors.Full()) return;
 
                 Verification.Implementation.VerifyNonEmptyString(
                     that.Value,
-                    $"{path}/Value",
+                    new Verification.PathSegment(path, "Value"),
                     errors);
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidIdentifierKeyValuePair(Aas.IdentifierKeyValuePair that)
+            {
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Key))
+                {
+                    return false;
+                }
+
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                {
+                    return false;
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -687,19 +894,19 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifySubmodel (
                 Aas.Submodel that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
@@ -710,7 +917,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -720,7 +927,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -728,10 +935,49 @@ namespace AasCore.Aas3
 
                 Verification.Implementation.VerifyNonEmptyString(
                     that.Id,
-                    $"{path}/Id",
+                    new Verification.PathSegment(path, "Id"),
                     errors);
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidSubmodel(Aas.Submodel that)
+            {
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Id))
+                {
+                    return false;
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -740,7 +986,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifySubmodelElementList (
                 Aas.SubmodelElementList that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -749,7 +995,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -759,7 +1005,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -767,24 +1013,24 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
 
                 if (errors.Full()) return;
 
-                if (!Verification.Implementation.EnumValueSet.ForSubmodelElements.Contains(
+                if (!Verification.Implementation.EnumValueSet.ContainsSubmodelElements(
                         (int)that.SubmodelElementTypeValues))
                 {
                     errors.Add(
                         new Verification.Error(
-                            $"{path}/SubmodelElementTypeValues",
+                            new Verification.PathSegment(path, "SubmodelElementTypeValues").ToString(),
                             $"Invalid {nameof(Aas.SubmodelElements)}: {that.SubmodelElementTypeValues}"));
                 }
 
@@ -792,17 +1038,66 @@ namespace AasCore.Aas3
 
                 if (that.ValueTypeValues != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForDataTypeDef.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
                             (int)that.ValueTypeValues))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/ValueTypeValues",
+                                new Verification.PathSegment(path, "ValueTypeValues").ToString(),
                                 $"Invalid {nameof(Aas.DataTypeDef)}: {that.ValueTypeValues}"));
                     }
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidSubmodelElementList(Aas.SubmodelElementList that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.EnumValueSet.ContainsSubmodelElements(
+                        (int)that.SubmodelElementTypeValues))
+                {
+                    return false;
+                }
+
+                if (that.ValueTypeValues != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
+                            (int)that.ValueTypeValues))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -811,7 +1106,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifySubmodelElementStruct (
                 Aas.SubmodelElementStruct that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -820,7 +1115,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -830,7 +1125,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -838,17 +1133,51 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidSubmodelElementStruct(Aas.SubmodelElementStruct that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -857,7 +1186,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyProperty (
                 Aas.Property that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -866,7 +1195,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -876,7 +1205,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -884,24 +1213,24 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
 
                 if (errors.Full()) return;
 
-                if (!Verification.Implementation.EnumValueSet.ForDataTypeDef.Contains(
+                if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
                         (int)that.ValueType))
                 {
                     errors.Add(
                         new Verification.Error(
-                            $"{path}/ValueType",
+                            new Verification.PathSegment(path, "ValueType").ToString(),
                             $"Invalid {nameof(Aas.DataTypeDef)}: {that.ValueType}"));
                 }
 
@@ -911,11 +1240,59 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Value,
-                        $"{path}/Value",
+                        new Verification.PathSegment(path, "Value"),
                         errors);
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidProperty(Aas.Property that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
+                        (int)that.ValueType))
+                {
+                    return false;
+                }
+
+                if (that.Value != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -924,7 +1301,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyMultiLanguageProperty (
                 Aas.MultiLanguageProperty that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -933,7 +1310,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -943,7 +1320,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -951,17 +1328,51 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidMultiLanguageProperty(Aas.MultiLanguageProperty that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -970,7 +1381,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyRange (
                 Aas.Range that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -979,7 +1390,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -989,7 +1400,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -997,24 +1408,24 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
 
                 if (errors.Full()) return;
 
-                if (!Verification.Implementation.EnumValueSet.ForDataTypeDef.Contains(
+                if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
                         (int)that.ValueType))
                 {
                     errors.Add(
                         new Verification.Error(
-                            $"{path}/ValueType",
+                            new Verification.PathSegment(path, "ValueType").ToString(),
                             $"Invalid {nameof(Aas.DataTypeDef)}: {that.ValueType}"));
                 }
 
@@ -1024,7 +1435,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Min,
-                        $"{path}/Min",
+                        new Verification.PathSegment(path, "Min"),
                         errors);
                 }
 
@@ -1034,11 +1445,67 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Max,
-                        $"{path}/Max",
+                        new Verification.PathSegment(path, "Max"),
                         errors);
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidRange(Aas.Range that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.EnumValueSet.ContainsDataTypeDef(
+                        (int)that.ValueType))
+                {
+                    return false;
+                }
+
+                if (that.Min != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Min))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Max != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Max))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
@@ -1047,7 +1514,7 @@ namespace AasCore.Aas3
             /// </summary>
             public static void VerifyReferenceElement (
                 Aas.ReferenceElement that,
-                string path,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -1056,7 +1523,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1066,7 +1533,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -1074,77 +1541,49 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyBlob (
-                Aas.Blob that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidReferenceElement(Aas.ReferenceElement that)
             {
-                if (!Verification.IsMimeType(that.MimeType))
-                {
-                    errors.Add(
-                        new Verification.Error(
-                            path,
-                            "Invariant violated:\n" +
-                            "Verification.IsMimeType(that.MimeType)"));
-                }
-
-                if (errors.Full()) return;
-
                 if (that.IdShort != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.IdShort,
-                        $"{path}/IdShort",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
                 if (that.Category != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.Category,
-                        $"{path}/Category",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
-                        errors.Add(
-                            new Verification.Error(
-                                $"{path}/Kind",
-                                $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
+                        return false;
                     }
                 }
 
-                if (errors.Full()) return;
-
-                Verification.Implementation.VerifyMimeTyped(
-                    that.MimeType,
-                    $"{path}/MimeType",
-                    errors);
+                return true;
             }
 
             /// <summary>
@@ -1153,16 +1592,16 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyFile (
-                Aas.File that,
-                string path,
+            public static void VerifyBlob (
+                Aas.Blob that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (!Verification.IsMimeType(that.MimeType))
                 {
                     errors.Add(
                         new Verification.Error(
-                            path,
+                            path.ToString(),
                             "Invariant violated:\n" +
                             "Verification.IsMimeType(that.MimeType)"));
                 }
@@ -1173,7 +1612,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1183,7 +1622,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -1191,12 +1630,12 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
@@ -1205,64 +1644,52 @@ namespace AasCore.Aas3
 
                 Verification.Implementation.VerifyMimeTyped(
                     that.MimeType,
-                    $"{path}/MimeType",
+                    new Verification.PathSegment(path, "MimeType"),
                     errors);
-
-                if (errors.Full()) return;
-
-                if (that.Value != null)
-                {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.Value,
-                        $"{path}/Value",
-                        errors);
-                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyAnnotatedRelationshipElement (
-                Aas.AnnotatedRelationshipElement that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidBlob(Aas.Blob that)
             {
-                if (errors.Full()) return;
+                if (!Verification.IsMimeType(that.MimeType))
+                {
+                    return false;
+                }
 
                 if (that.IdShort != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.IdShort,
-                        $"{path}/IdShort",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
                 if (that.Category != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.Category,
-                        $"{path}/Category",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
-                        errors.Add(
-                            new Verification.Error(
-                                $"{path}/Kind",
-                                $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
+                        return false;
                     }
                 }
+
+                if (!Verification.Implementation.IsValidMimeTyped(that.MimeType))
+                {
+                    return false;
+                }
+
+                return true;
             }
 
             /// <summary>
@@ -1271,18 +1698,27 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyEntity (
-                Aas.Entity that,
-                string path,
+            public static void VerifyFile (
+                Aas.File that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
+                if (!Verification.IsMimeType(that.MimeType))
+                {
+                    errors.Add(
+                        new Verification.Error(
+                            path.ToString(),
+                            "Invariant violated:\n" +
+                            "Verification.IsMimeType(that.MimeType)"));
+                }
+
                 if (errors.Full()) return;
 
                 if (that.IdShort != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1292,7 +1728,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -1300,26 +1736,84 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
 
                 if (errors.Full()) return;
 
-                if (!Verification.Implementation.EnumValueSet.ForEntityType.Contains(
-                        (int)that.EntityType))
+                Verification.Implementation.VerifyMimeTyped(
+                    that.MimeType,
+                    new Verification.PathSegment(path, "MimeType"),
+                    errors);
+
+                if (errors.Full()) return;
+
+                if (that.Value != null)
                 {
-                    errors.Add(
-                        new Verification.Error(
-                            $"{path}/EntityType",
-                            $"Invalid {nameof(Aas.EntityType)}: {that.EntityType}"));
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.Value,
+                        new Verification.PathSegment(path, "Value"),
+                        errors);
+                }
+            }
+
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidFile(Aas.File that)
+            {
+                if (!Verification.IsMimeType(that.MimeType))
+                {
+                    return false;
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.IsValidMimeTyped(that.MimeType))
+                {
+                    return false;
+                }
+
+                if (that.Value != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
@@ -1328,9 +1822,9 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyBasicEvent (
-                Aas.BasicEvent that,
-                string path,
+            public static void VerifyAnnotatedRelationshipElement (
+                Aas.AnnotatedRelationshipElement that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -1339,7 +1833,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1349,7 +1843,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -1357,26 +1851,60 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
             }
 
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidAnnotatedRelationshipElement(Aas.AnnotatedRelationshipElement that)
+            {
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
             /// <summary>
             /// Verify <paramref name="that" /> and append any errors to
             /// <paramref name="Errors" />.
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyOperation (
-                Aas.Operation that,
-                string path,
+            public static void VerifyEntity (
+                Aas.Entity that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -1385,7 +1913,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1395,7 +1923,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -1403,29 +1931,66 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
+
+                if (errors.Full()) return;
+
+                if (!Verification.Implementation.EnumValueSet.ContainsEntityType(
+                        (int)that.EntityType))
+                {
+                    errors.Add(
+                        new Verification.Error(
+                            new Verification.PathSegment(path, "EntityType").ToString(),
+                            $"Invalid {nameof(Aas.EntityType)}: {that.EntityType}"));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyOperationVariable (
-                Aas.OperationVariable that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidEntity(Aas.Entity that)
             {
-                // There is no verification specified.
+                if (that.IdShort != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
+
+                if (!Verification.Implementation.EnumValueSet.ContainsEntityType(
+                        (int)that.EntityType))
+                {
+                    return false;
+                }
+
+                return true;
             }
 
             /// <summary>
@@ -1434,9 +1999,9 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyCapability (
-                Aas.Capability that,
-                string path,
+            public static void VerifyBasicEvent (
+                Aas.BasicEvent that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -1445,7 +2010,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1455,7 +2020,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
@@ -1463,54 +2028,49 @@ namespace AasCore.Aas3
 
                 if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForModelingKind.Contains(
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
                             (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/Kind",
+                                new Verification.PathSegment(path, "Kind").ToString(),
                                 $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyConceptDescription (
-                Aas.ConceptDescription that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidBasicEvent(Aas.BasicEvent that)
             {
-                if (errors.Full()) return;
-
                 if (that.IdShort != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.IdShort,
-                        $"{path}/IdShort",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
                 if (that.Category != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.Category,
-                        $"{path}/Category",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
+                }
 
-                Verification.Implementation.VerifyNonEmptyString(
-                    that.Id,
-                    $"{path}/Id",
-                    errors);
+                return true;
             }
 
             /// <summary>
@@ -1519,9 +2079,9 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyView (
-                Aas.View that,
-                string path,
+            public static void VerifyOperation (
+                Aas.Operation that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
@@ -1530,7 +2090,7 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.IdShort,
-                        $"{path}/IdShort",
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
@@ -1540,40 +2100,57 @@ namespace AasCore.Aas3
                 {
                     Verification.Implementation.VerifyNonEmptyString(
                         that.Category,
-                        $"{path}/Category",
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
+
+                if (errors.Full()) return;
+
+                if (that.Kind != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        errors.Add(
+                            new Verification.Error(
+                                new Verification.PathSegment(path, "Kind").ToString(),
+                                $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
+                    }
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyGlobalReference (
-                Aas.GlobalReference that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidOperation(Aas.Operation that)
             {
-                if (!(that.Values.Count >= 1))
+                if (that.IdShort != null)
                 {
-                    errors.Add(
-                        new Verification.Error(
-                            path,
-                            "Invariant violated:\n" +
-                            "that.Values.Count >= 1"));
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
+                if (that.Category != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
+                }
 
-                foreach (var anItem in that.Values)
+                if (that.Kind != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        anItem,
-                        $"{path}/Values/{anItem}",
-                        errors);
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
@@ -1582,96 +2159,21 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyModelReference (
-                Aas.ModelReference that,
-                string path,
-                Verification.Errors errors)
-            {
-                if (!(that.Keys.Count >= 1))
-                {
-                    errors.Add(
-                        new Verification.Error(
-                            path,
-                            "Invariant violated:\n" +
-                            "that.Keys.Count >= 1"));
-                }
-            }
-
-            /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
-            /// </summary>
-            public static void VerifyKey (
-                Aas.Key that,
-                string path,
-                Verification.Errors errors)
-            {
-                if (errors.Full()) return;
-
-                if (!Verification.Implementation.EnumValueSet.ForKeyElements.Contains(
-                        (int)that.Type))
-                {
-                    errors.Add(
-                        new Verification.Error(
-                            $"{path}/Type",
-                            $"Invalid {nameof(Aas.KeyElements)}: {that.Type}"));
-                }
-
-                if (errors.Full()) return;
-
-                Verification.Implementation.VerifyNonEmptyString(
-                    that.Value,
-                    $"{path}/Value",
-                    errors);
-            }
-
-            /// <summary>
-            /// Verify the given <paramref name="langStringSet" /> and
-            /// append any errors to <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes the <paramref name="langString" />.
-            /// </summary>
-            public static void VerifyLangStringSet (
-                LangStringSet that,
-                string path,
-                Errors errors)
-            {
-                throw new System.NotImplementedException("TODO");
-            }
-
-            /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
-            /// </summary>
-            public static void VerifyValueReferencePair (
-                Aas.ValueReferencePair that,
-                string path,
+            public static void VerifyOperationVariable (
+                Aas.OperationVariable that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
-                if (errors.Full()) return;
-
-                Verification.Implementation.VerifyNonEmptyString(
-                    that.Value,
-                    $"{path}/Value",
-                    errors);
+                // There is no verification specified.
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyValueList (
-                Aas.ValueList that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidOperationVariable(Aas.OperationVariable that)
             {
-                // There is no verification specified.
+                return true;
             }
 
             /// <summary>
@@ -1680,88 +2182,78 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyDataSpecificationIec61360 (
-                Aas.DataSpecificationIec61360 that,
-                string path,
+            public static void VerifyCapability (
+                Aas.Capability that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
-                if (that.Unit != null)
-                {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.Unit,
-                        $"{path}/Unit",
-                        errors);
-                }
-
-                if (errors.Full()) return;
-
-                if (that.SourceOfDefinition != null)
+                if (that.IdShort != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.SourceOfDefinition,
-                        $"{path}/SourceOfDefinition",
+                        that.IdShort,
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
                 if (errors.Full()) return;
 
-                if (that.Symbol != null)
+                if (that.Category != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.Symbol,
-                        $"{path}/Symbol",
+                        that.Category,
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
                 if (errors.Full()) return;
 
-                if (that.DataType != null)
+                if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForDataTypeIec61360.Contains(
-                            (int)that.DataType))
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
                     {
                         errors.Add(
                             new Verification.Error(
-                                $"{path}/DataType",
-                                $"Invalid {nameof(Aas.DataTypeIec61360)}: {that.DataType}"));
+                                new Verification.PathSegment(path, "Kind").ToString(),
+                                $"Invalid {nameof(Aas.ModelingKind)}: {that.Kind}"));
                     }
                 }
+            }
 
-                if (errors.Full()) return;
-
-                if (that.ValueFormat != null)
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidCapability(Aas.Capability that)
+            {
+                if (that.IdShort != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.ValueFormat,
-                        $"{path}/ValueFormat",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
-                if (that.Value != null)
+                if (that.Category != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.Value,
-                        $"{path}/Value",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
-                if (that.LevelType != null)
+                if (that.Kind != null)
                 {
-                    if (!Verification.Implementation.EnumValueSet.ForLevelType.Contains(
-                            (int)that.LevelType))
+                    if (!Verification.Implementation.EnumValueSet.ContainsModelingKind(
+                            (int)that.Kind))
                     {
-                        errors.Add(
-                            new Verification.Error(
-                                $"{path}/LevelType",
-                                $"Invalid {nameof(Aas.LevelType)}: {that.LevelType}"));
+                        return false;
                     }
                 }
+
+                return true;
             }
 
             /// <summary>
@@ -1770,848 +2262,3226 @@ namespace AasCore.Aas3
             ///
             /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public static void VerifyDataSpecificationPhysicalUnit (
-                Aas.DataSpecificationPhysicalUnit that,
-                string path,
+            public static void VerifyConceptDescription (
+                Aas.ConceptDescription that,
+                Verification.PathSegment path,
                 Verification.Errors errors)
             {
                 if (errors.Full()) return;
 
-                if (that.UnitName != null)
+                if (that.IdShort != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.UnitName,
-                        $"{path}/UnitName",
+                        that.IdShort,
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
                 if (errors.Full()) return;
 
-                if (that.UnitSymbol != null)
+                if (that.Category != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.UnitSymbol,
-                        $"{path}/UnitSymbol",
+                        that.Category,
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
 
                 if (errors.Full()) return;
 
-                if (that.SiNotation != null)
+                Verification.Implementation.VerifyNonEmptyString(
+                    that.Id,
+                    new Verification.PathSegment(path, "Id"),
+                    errors);
+            }
+
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidConceptDescription(Aas.ConceptDescription that)
+            {
+                if (that.IdShort != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.SiNotation,
-                        $"{path}/SiNotation",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
-                if (that.DinNotation != null)
+                if (that.Category != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.DinNotation,
-                        $"{path}/DinNotation",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
-                if (that.EceName != null)
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Id))
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.EceName,
-                        $"{path}/EceName",
-                        errors);
+                    return false;
                 }
 
+                return true;
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// </summary>
+            public static void VerifyView (
+                Aas.View that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
+            {
                 if (errors.Full()) return;
 
-                if (that.EceCode != null)
+                if (that.IdShort != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.EceCode,
-                        $"{path}/EceCode",
+                        that.IdShort,
+                        new Verification.PathSegment(path, "IdShort"),
                         errors);
                 }
 
                 if (errors.Full()) return;
 
-                if (that.NistName != null)
+                if (that.Category != null)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.NistName,
-                        $"{path}/NistName",
+                        that.Category,
+                        new Verification.PathSegment(path, "Category"),
                         errors);
                 }
+            }
 
-                if (errors.Full()) return;
-
-                if (that.SourceOfDefinition != null)
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidView(Aas.View that)
+            {
+                if (that.IdShort != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.SourceOfDefinition,
-                        $"{path}/SourceOfDefinition",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.IdShort))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
-
-                if (that.ConversionFactor != null)
+                if (that.Category != null)
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.ConversionFactor,
-                        $"{path}/ConversionFactor",
-                        errors);
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Category))
+                    {
+                        return false;
+                    }
                 }
 
-                if (errors.Full()) return;
+                return true;
+            }
 
-                if (that.RegistrationAuthorityId != null)
+            /// <summary>
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// </summary>
+            public static void VerifyGlobalReference (
+                Aas.GlobalReference that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
+            {
+                if (!(that.Values.Count >= 1))
                 {
-                    Verification.Implementation.VerifyNonEmptyString(
-                        that.RegistrationAuthorityId,
-                        $"{path}/RegistrationAuthorityId",
-                        errors);
+                    errors.Add(
+                        new Verification.Error(
+                            path.ToString(),
+                            "Invariant violated:\n" +
+                            "that.Values.Count >= 1"));
                 }
 
                 if (errors.Full()) return;
 
-                if (that.Supplier != null)
+                for(var i = 0; i < that.Values.Count; i++)
                 {
                     Verification.Implementation.VerifyNonEmptyString(
-                        that.Supplier,
-                        $"{path}/Supplier",
+                        that.Values[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(path, "Values"),
+                            i),
                         errors);
                 }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> and append any errors to
-            /// <paramref name="Errors" />.
-            ///
-            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public static void VerifyEnvironment (
-                Aas.Environment that,
-                string path,
-                Verification.Errors errors)
+            public static bool IsValidGlobalReference(Aas.GlobalReference that)
             {
-                // There is no verification specified.
-            }
-        }  // private static class Implementation
-
-        /// <summary>
-        /// Verify the instances of the model classes non-recursively.
-        /// </summary>
-        public class NonRecursiveVerifier :
-            Visitation.IVisitorWithContext<string>
-        {
-            public readonly Verification.Errors Errors;
+                if (!(that.Values.Count >= 1))
+                {
+                    return false;
+                }
 
-            /// <summary>
-            /// Initialize the visitor with the given <paramref name="errors" />.
-            ///
-            /// The errors observed during the visitation will be appended to
-            /// the <paramref name="errors" />.
-            /// </summary>
-            NonRecursiveVerifier(Verification.Errors errors)
-            {
-                Errors = errors;
-            }
+                for(var i = 0; i < that.Values.Count; i++)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Values[i]))
+                    {
+                        return false;
+                    }
+                }
 
-            public void Visit(Aas.IClass that, string context)
-            {
-                that.Accept(this, context);
+                return true;
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public void Visit(Aas.Extension that, string context)
+            public static void VerifyModelReference (
+                Aas.ModelReference that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
             {
-                Implementation.VerifyExtension(
-                    that, context, Errors);
+                if (!(that.Keys.Count >= 1))
+                {
+                    errors.Add(
+                        new Verification.Error(
+                            path.ToString(),
+                            "Invariant violated:\n" +
+                            "that.Keys.Count >= 1"));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public void Visit(Aas.AdministrativeInformation that, string context)
+            public static bool IsValidModelReference(Aas.ModelReference that)
             {
-                Implementation.VerifyAdministrativeInformation(
-                    that, context, Errors);
-            }
+                if (!(that.Keys.Count >= 1))
+                {
+                    return false;
+                }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.Qualifier that, string context)
-            {
-                Implementation.VerifyQualifier(
-                    that, context, Errors);
+                return true;
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public void Visit(Aas.Formula that, string context)
+            public static void VerifyKey (
+                Aas.Key that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
             {
-                Implementation.VerifyFormula(
-                    that, context, Errors);
-            }
+                if (errors.Full()) return;
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.AssetAdministrationShell that, string context)
-            {
-                Implementation.VerifyAssetAdministrationShell(
-                    that, context, Errors);
-            }
+                if (!Verification.Implementation.EnumValueSet.ContainsKeyElements(
+                        (int)that.Type))
+                {
+                    errors.Add(
+                        new Verification.Error(
+                            new Verification.PathSegment(path, "Type").ToString(),
+                            $"Invalid {nameof(Aas.KeyElements)}: {that.Type}"));
+                }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.AssetInformation that, string context)
-            {
-                Implementation.VerifyAssetInformation(
-                    that, context, Errors);
-            }
+                if (errors.Full()) return;
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.IdentifierKeyValuePair that, string context)
-            {
-                Implementation.VerifyIdentifierKeyValuePair(
-                    that, context, Errors);
+                Verification.Implementation.VerifyNonEmptyString(
+                    that.Value,
+                    new Verification.PathSegment(path, "Value"),
+                    errors);
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public void Visit(Aas.Submodel that, string context)
+            public static bool IsValidKey(Aas.Key that)
             {
-                Implementation.VerifySubmodel(
-                    that, context, Errors);
-            }
+                if (!Verification.Implementation.EnumValueSet.ContainsKeyElements(
+                        (int)that.Type))
+                {
+                    return false;
+                }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.SubmodelElementList that, string context)
-            {
-                Implementation.VerifySubmodelElementList(
-                    that, context, Errors);
-            }
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                {
+                    return false;
+                }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.SubmodelElementStruct that, string context)
-            {
-                Implementation.VerifySubmodelElementStruct(
-                    that, context, Errors);
+                return true;
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Verify the given <paramref name="langStringSet" /> and
+            /// append any errors to <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes the <paramref name="langString" />.
             /// </summary>
-            public void Visit(Aas.Property that, string context)
+            public static void VerifyLangStringSet (
+                LangStringSet that,
+                string path,
+                Errors errors)
             {
-                Implementation.VerifyProperty(
-                    that, context, Errors);
+                throw new System.NotImplementedException("TODO");
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public void Visit(Aas.MultiLanguageProperty that, string context)
+            public static void VerifyValueReferencePair (
+                Aas.ValueReferencePair that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
             {
-                Implementation.VerifyMultiLanguageProperty(
-                    that, context, Errors);
-            }
+                if (errors.Full()) return;
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.Range that, string context)
-            {
-                Implementation.VerifyRange(
-                    that, context, Errors);
+                Verification.Implementation.VerifyNonEmptyString(
+                    that.Value,
+                    new Verification.PathSegment(path, "Value"),
+                    errors);
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public void Visit(Aas.ReferenceElement that, string context)
+            public static bool IsValidValueReferencePair(Aas.ValueReferencePair that)
             {
-                Implementation.VerifyReferenceElement(
-                    that, context, Errors);
-            }
+                if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                {
+                    return false;
+                }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.Blob that, string context)
-            {
-                Implementation.VerifyBlob(
-                    that, context, Errors);
+                return true;
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public void Visit(Aas.File that, string context)
+            public static void VerifyValueList (
+                Aas.ValueList that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
             {
-                Implementation.VerifyFile(
-                    that, context, Errors);
+                // There is no verification specified.
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
             /// </summary>
-            public void Visit(Aas.AnnotatedRelationshipElement that, string context)
+            public static bool IsValidValueList(Aas.ValueList that)
             {
-                Implementation.VerifyAnnotatedRelationshipElement(
-                    that, context, Errors);
+                return true;
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
             /// </summary>
-            public void Visit(Aas.Entity that, string context)
+            public static void VerifyDataSpecificationIec61360 (
+                Aas.DataSpecificationIec61360 that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
             {
-                Implementation.VerifyEntity(
-                    that, context, Errors);
-            }
+                if (errors.Full()) return;
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.BasicEvent that, string context)
-            {
-                Implementation.VerifyBasicEvent(
-                    that, context, Errors);
-            }
+                if (that.Unit != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.Unit,
+                        new Verification.PathSegment(path, "Unit"),
+                        errors);
+                }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.Operation that, string context)
-            {
-                Implementation.VerifyOperation(
-                    that, context, Errors);
-            }
+                if (errors.Full()) return;
+
+                if (that.SourceOfDefinition != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.SourceOfDefinition,
+                        new Verification.PathSegment(path, "SourceOfDefinition"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.Symbol != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.Symbol,
+                        new Verification.PathSegment(path, "Symbol"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.DataType != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsDataTypeIec61360(
+                            (int)that.DataType))
+                    {
+                        errors.Add(
+                            new Verification.Error(
+                                new Verification.PathSegment(path, "DataType").ToString(),
+                                $"Invalid {nameof(Aas.DataTypeIec61360)}: {that.DataType}"));
+                    }
+                }
+
+                if (errors.Full()) return;
+
+                if (that.ValueFormat != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.ValueFormat,
+                        new Verification.PathSegment(path, "ValueFormat"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.Value != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.Value,
+                        new Verification.PathSegment(path, "Value"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.LevelType != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsLevelType(
+                            (int)that.LevelType))
+                    {
+                        errors.Add(
+                            new Verification.Error(
+                                new Verification.PathSegment(path, "LevelType").ToString(),
+                                $"Invalid {nameof(Aas.LevelType)}: {that.LevelType}"));
+                    }
+                }
+            }
+
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidDataSpecificationIec61360(Aas.DataSpecificationIec61360 that)
+            {
+                if (that.Unit != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Unit))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.SourceOfDefinition != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.SourceOfDefinition))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Symbol != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Symbol))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.DataType != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsDataTypeIec61360(
+                            (int)that.DataType))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.ValueFormat != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.ValueFormat))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Value))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.LevelType != null)
+                {
+                    if (!Verification.Implementation.EnumValueSet.ContainsLevelType(
+                            (int)that.LevelType))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// </summary>
+            public static void VerifyDataSpecificationPhysicalUnit (
+                Aas.DataSpecificationPhysicalUnit that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
+            {
+                if (errors.Full()) return;
+
+                if (that.UnitName != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.UnitName,
+                        new Verification.PathSegment(path, "UnitName"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.UnitSymbol != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.UnitSymbol,
+                        new Verification.PathSegment(path, "UnitSymbol"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.SiNotation != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.SiNotation,
+                        new Verification.PathSegment(path, "SiNotation"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.DinNotation != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.DinNotation,
+                        new Verification.PathSegment(path, "DinNotation"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.EceName != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.EceName,
+                        new Verification.PathSegment(path, "EceName"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.EceCode != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.EceCode,
+                        new Verification.PathSegment(path, "EceCode"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.NistName != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.NistName,
+                        new Verification.PathSegment(path, "NistName"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.SourceOfDefinition != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.SourceOfDefinition,
+                        new Verification.PathSegment(path, "SourceOfDefinition"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.ConversionFactor != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.ConversionFactor,
+                        new Verification.PathSegment(path, "ConversionFactor"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.RegistrationAuthorityId != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.RegistrationAuthorityId,
+                        new Verification.PathSegment(path, "RegistrationAuthorityId"),
+                        errors);
+                }
+
+                if (errors.Full()) return;
+
+                if (that.Supplier != null)
+                {
+                    Verification.Implementation.VerifyNonEmptyString(
+                        that.Supplier,
+                        new Verification.PathSegment(path, "Supplier"),
+                        errors);
+                }
+            }
+
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidDataSpecificationPhysicalUnit(Aas.DataSpecificationPhysicalUnit that)
+            {
+                if (that.UnitName != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.UnitName))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.UnitSymbol != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.UnitSymbol))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.SiNotation != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.SiNotation))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.DinNotation != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.DinNotation))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.EceName != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.EceName))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.EceCode != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.EceCode))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.NistName != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.NistName))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.SourceOfDefinition != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.SourceOfDefinition))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.ConversionFactor != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.ConversionFactor))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.RegistrationAuthorityId != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.RegistrationAuthorityId))
+                    {
+                        return false;
+                    }
+                }
+
+                if (that.Supplier != null)
+                {
+                    if (!Verification.Implementation.IsValidNonEmptyString(that.Supplier))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> and append any errors to
+            /// <paramref name="Errors" />.
+            ///
+            /// The <paramref name="path" /> localizes <paramref name="that" />.
+            /// </summary>
+            public static void VerifyEnvironment (
+                Aas.Environment that,
+                Verification.PathSegment path,
+                Verification.Errors errors)
+            {
+                // There is no verification specified.
+            }
+
+            /// <summary>
+            /// Check whether <paramref name="that" /> satisfies its own constraints
+            /// without allocating any errors.
+            /// </summary>
+            public static bool IsValidEnvironment(Aas.Environment that)
+            {
+                return true;
+            }
+        }  // private static class Implementation
+
+        /// <summary>
+        /// Verify the instances of the model classes non-recursively.
+        /// </summary>
+        public class NonRecursiveVerifier :
+            Visitation.IVisitorWithContext<Verification.PathSegment>
+        {
+            public readonly Verification.Errors Errors;
+
+            /// <summary>
+            /// Initialize the visitor with the given <paramref name="errors" />.
+            ///
+            /// The errors observed during the visitation will be appended to
+            /// the <paramref name="errors" />. The verification stops once
+            /// the capacity of the <paramref name="errors" /> has been reached.
+            /// </summary>
+            public NonRecursiveVerifier(Verification.Errors errors)
+            {
+                Errors = errors;
+            }
+
+            public void Visit(Aas.IClass that, Verification.PathSegment context)
+            {
+                that.Accept(this, context);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Extension that, Verification.PathSegment context)
+            {
+                Implementation.VerifyExtension(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.AdministrativeInformation that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAdministrativeInformation(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Qualifier that, Verification.PathSegment context)
+            {
+                Implementation.VerifyQualifier(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Formula that, Verification.PathSegment context)
+            {
+                Implementation.VerifyFormula(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.AssetAdministrationShell that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAssetAdministrationShell(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.AssetInformation that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAssetInformation(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.IdentifierKeyValuePair that, Verification.PathSegment context)
+            {
+                Implementation.VerifyIdentifierKeyValuePair(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Submodel that, Verification.PathSegment context)
+            {
+                Implementation.VerifySubmodel(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.SubmodelElementList that, Verification.PathSegment context)
+            {
+                Implementation.VerifySubmodelElementList(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.SubmodelElementStruct that, Verification.PathSegment context)
+            {
+                Implementation.VerifySubmodelElementStruct(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Property that, Verification.PathSegment context)
+            {
+                Implementation.VerifyProperty(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.MultiLanguageProperty that, Verification.PathSegment context)
+            {
+                Implementation.VerifyMultiLanguageProperty(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Range that, Verification.PathSegment context)
+            {
+                Implementation.VerifyRange(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.ReferenceElement that, Verification.PathSegment context)
+            {
+                Implementation.VerifyReferenceElement(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Blob that, Verification.PathSegment context)
+            {
+                Implementation.VerifyBlob(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.File that, Verification.PathSegment context)
+            {
+                Implementation.VerifyFile(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.AnnotatedRelationshipElement that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAnnotatedRelationshipElement(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Entity that, Verification.PathSegment context)
+            {
+                Implementation.VerifyEntity(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.BasicEvent that, Verification.PathSegment context)
+            {
+                Implementation.VerifyBasicEvent(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Operation that, Verification.PathSegment context)
+            {
+                Implementation.VerifyOperation(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.OperationVariable that, Verification.PathSegment context)
+            {
+                Implementation.VerifyOperationVariable(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Capability that, Verification.PathSegment context)
+            {
+                Implementation.VerifyCapability(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.ConceptDescription that, Verification.PathSegment context)
+            {
+                Implementation.VerifyConceptDescription(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.View that, Verification.PathSegment context)
+            {
+                Implementation.VerifyView(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.GlobalReference that, Verification.PathSegment context)
+            {
+                Implementation.VerifyGlobalReference(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.ModelReference that, Verification.PathSegment context)
+            {
+                Implementation.VerifyModelReference(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Key that, Verification.PathSegment context)
+            {
+                Implementation.VerifyKey(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.LangStringSet that, Verification.PathSegment context)
+            {
+                Implementation.VerifyLangStringSet(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.ValueReferencePair that, Verification.PathSegment context)
+            {
+                Implementation.VerifyValueReferencePair(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.ValueList that, Verification.PathSegment context)
+            {
+                Implementation.VerifyValueList(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.DataSpecificationIec61360 that, Verification.PathSegment context)
+            {
+                Implementation.VerifyDataSpecificationIec61360(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.DataSpecificationPhysicalUnit that, Verification.PathSegment context)
+            {
+                Implementation.VerifyDataSpecificationPhysicalUnit(
+                    that, context, Errors);
+            }
+
+            /// <summary>
+            /// Verify <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Aas.Environment that, Verification.PathSegment context)
+            {
+                Implementation.VerifyEnvironment(
+                    that, context, Errors);
+            }
+        }  // public class NonRecursiveVerifier
+
+        /// <summary>
+        /// Verify the instances of the model classes recursively.
+        /// </summary>
+        public class RecursiveVerifier :
+            Visitation.IVisitorWithContext<Verification.PathSegment>
+        {
+            public readonly Errors Errors;
+
+            /// <summary>
+            /// Initialize the visitor with the given <paramref name="errors" />.
+            ///
+            /// The errors observed during the visitation will be appended to
+            /// the <paramref name="errors" />. The verification and the descent
+            /// stop once the capacity of the <paramref name="errors" /> has been
+            /// reached.
+            /// </summary>
+            public RecursiveVerifier(Errors errors)
+            {
+                Errors = errors;
+            }
+
+            public void Visit(IClass that, Verification.PathSegment context)
+            {
+                that.Accept(this, context);
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Extension that, Verification.PathSegment context)
+            {
+                Implementation.VerifyExtension(
+                    that, context, Errors);
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                if (that.RefersTo != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.RefersTo,
+                        new Verification.PathSegment(context, "RefersTo"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(AdministrativeInformation that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAdministrativeInformation(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Qualifier that, Verification.PathSegment context)
+            {
+                Implementation.VerifyQualifier(
+                    that, context, Errors);
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                if (that.ValueId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ValueId,
+                        new Verification.PathSegment(context, "ValueId"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Formula that, Verification.PathSegment context)
+            {
+                Implementation.VerifyFormula(
+                    that, context, Errors);
+
+                for(var i = 0; i < that.DependsOn.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DependsOn[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DependsOn"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(AssetAdministrationShell that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAssetAdministrationShell(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.Administration != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Administration,
+                        new Verification.PathSegment(context, "Administration"));
+                }
+
+                if (that.DerivedFrom != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DerivedFrom,
+                        new Verification.PathSegment(context, "DerivedFrom"));
+                }
+
+                if (Errors.Full()) return;
+                Visit(
+                    that.AssetInformation,
+                    new Verification.PathSegment(context, "AssetInformation"));
+
+                for(var i = 0; i < that.Submodels.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Submodels[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Submodels"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(AssetInformation that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAssetInformation(
+                    that, context, Errors);
+
+                if (that.GlobalAssetId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.GlobalAssetId,
+                        new Verification.PathSegment(context, "GlobalAssetId"));
+                }
+
+                if (that.SpecificAssetId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SpecificAssetId,
+                        new Verification.PathSegment(context, "SpecificAssetId"));
+                }
+
+                if (that.DefaultThumbnail != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DefaultThumbnail,
+                        new Verification.PathSegment(context, "DefaultThumbnail"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(IdentifierKeyValuePair that, Verification.PathSegment context)
+            {
+                Implementation.VerifyIdentifierKeyValuePair(
+                    that, context, Errors);
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                if (that.ExternalSubjectId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ExternalSubjectId,
+                        new Verification.PathSegment(context, "ExternalSubjectId"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Submodel that, Verification.PathSegment context)
+            {
+                Implementation.VerifySubmodel(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.Administration != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Administration,
+                        new Verification.PathSegment(context, "Administration"));
+                }
+
+                for(
+                    var i = 0;
+                    i < that.SubmodelElements.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SubmodelElements[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "SubmodelElements"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(SubmodelElementList that, Verification.PathSegment context)
+            {
+                Implementation.VerifySubmodelElementList(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Values.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Values[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Values"),
+                            i));
+                }
+
+                if (that.SemanticIdValues != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticIdValues,
+                        new Verification.PathSegment(context, "SemanticIdValues"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(SubmodelElementStruct that, Verification.PathSegment context)
+            {
+                Implementation.VerifySubmodelElementStruct(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Values.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Values[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Values"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Property that, Verification.PathSegment context)
+            {
+                Implementation.VerifyProperty(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                if (that.ValueId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ValueId,
+                        new Verification.PathSegment(context, "ValueId"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(MultiLanguageProperty that, Verification.PathSegment context)
+            {
+                Implementation.VerifyMultiLanguageProperty(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                if (that.Value != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Value,
+                        new Verification.PathSegment(context, "Value"));
+                }
+
+                if (that.ValueId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ValueId,
+                        new Verification.PathSegment(context, "ValueId"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Range that, Verification.PathSegment context)
+            {
+                Implementation.VerifyRange(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(ReferenceElement that, Verification.PathSegment context)
+            {
+                Implementation.VerifyReferenceElement(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                if (that.Value != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Value,
+                        new Verification.PathSegment(context, "Value"));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Blob that, Verification.PathSegment context)
+            {
+                Implementation.VerifyBlob(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(File that, Verification.PathSegment context)
+            {
+                Implementation.VerifyFile(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(AnnotatedRelationshipElement that, Verification.PathSegment context)
+            {
+                Implementation.VerifyAnnotatedRelationshipElement(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                if (Errors.Full()) return;
+                Visit(
+                    that.First,
+                    new Verification.PathSegment(context, "First"));
+
+                if (Errors.Full()) return;
+                Visit(
+                    that.Second,
+                    new Verification.PathSegment(context, "Second"));
+
+                for(var i = 0; i < that.Annotation.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Annotation[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Annotation"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Entity that, Verification.PathSegment context)
+            {
+                Implementation.VerifyEntity(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Statements.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Statements[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Statements"),
+                            i));
+                }
+
+                if (that.GlobalAssetId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.GlobalAssetId,
+                        new Verification.PathSegment(context, "GlobalAssetId"));
+                }
+
+                if (that.SpecificAssetId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SpecificAssetId,
+                        new Verification.PathSegment(context, "SpecificAssetId"));
+                }
+            }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(BasicEvent that, Verification.PathSegment context)
+            {
+                Implementation.VerifyBasicEvent(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                if (Errors.Full()) return;
+                Visit(
+                    that.Observed,
+                    new Verification.PathSegment(context, "Observed"));
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Operation that, Verification.PathSegment context)
+            {
+                Implementation.VerifyOperation(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
+
+                for(var i = 0; i < that.InputVariables.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.InputVariables[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "InputVariables"),
+                            i));
+                }
+
+                for(
+                    var i = 0;
+                    i < that.OutputVariables.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.OutputVariables[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "OutputVariables"),
+                            i));
+                }
+
+                for(
+                    var i = 0;
+                    i < that.InoutputVariables.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.InoutputVariables[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "InoutputVariables"),
+                            i));
+                }
+            }
+
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.OperationVariable that, string context)
+            public void Visit(OperationVariable that, Verification.PathSegment context)
             {
                 Implementation.VerifyOperationVariable(
                     that, context, Errors);
+
+                if (Errors.Full()) return;
+                Visit(
+                    that.Value,
+                    new Verification.PathSegment(context, "Value"));
             }
 
-            /// <summary>
-            /// Verify <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
-            /// </summary>
-            public void Visit(Aas.Capability that, string context)
-            {
-                Implementation.VerifyCapability(
-                    that, context, Errors);
+            /// <summary>
+            /// Verify recursively <paramref name="that" /> instance and
+            /// append any error to <see cref="Errors" />
+            /// where <paramref name="context" /> is used to localize the error.
+            /// </summary>
+            public void Visit(Capability that, Verification.PathSegment context)
+            {
+                Implementation.VerifyCapability(
+                    that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(var i = 0; i < that.Qualifiers.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Qualifiers[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Qualifiers"),
+                            i));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.ConceptDescription that, string context)
+            public void Visit(ConceptDescription that, Verification.PathSegment context)
             {
                 Implementation.VerifyConceptDescription(
                     that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.Administration != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Administration,
+                        new Verification.PathSegment(context, "Administration"));
+                }
+
+                for(var i = 0; i < that.IsCaseOf.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.IsCaseOf[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "IsCaseOf"),
+                            i));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.View that, string context)
+            public void Visit(View that, Verification.PathSegment context)
             {
                 Implementation.VerifyView(
                     that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.DataSpecifications.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DataSpecifications[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "DataSpecifications"),
+                            i));
+                }
+
+                for(var i = 0; i < that.Extensions.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Extensions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Extensions"),
+                            i));
+                }
+
+                if (that.DisplayName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.DisplayName,
+                        new Verification.PathSegment(context, "DisplayName"));
+                }
+
+                if (that.Description != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Description,
+                        new Verification.PathSegment(context, "Description"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.SemanticId,
+                        new Verification.PathSegment(context, "SemanticId"));
+                }
+
+                for(
+                    var i = 0;
+                    i < that.ContainedElements.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ContainedElements[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "ContainedElements"),
+                            i));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.GlobalReference that, string context)
+            public void Visit(GlobalReference that, Verification.PathSegment context)
             {
                 Implementation.VerifyGlobalReference(
                     that, context, Errors);
+
+                // The recursion ends here.
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.ModelReference that, string context)
+            public void Visit(ModelReference that, Verification.PathSegment context)
             {
                 Implementation.VerifyModelReference(
                     that, context, Errors);
+
+                for(var i = 0; i < that.Keys.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Keys[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Keys"),
+                            i));
+                }
+
+                if (that.ReferredSemanticId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ReferredSemanticId,
+                        new Verification.PathSegment(context, "ReferredSemanticId"));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.Key that, string context)
+            public void Visit(Key that, Verification.PathSegment context)
             {
                 Implementation.VerifyKey(
                     that, context, Errors);
+
+                // The recursion ends here.
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="langStringSet" /> and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.LangStringSet that, string context)
+            public void Visit(LangStringSet that, Verification.PathSegment context)
             {
-                Implementation.VerifyLangStringSet(
-                    that, context, Errors);
+                throw new System.NotImplementedException("TODO");
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.ValueReferencePair that, string context)
+            public void Visit(ValueReferencePair that, Verification.PathSegment context)
             {
                 Implementation.VerifyValueReferencePair(
                     that, context, Errors);
+
+                if (Errors.Full()) return;
+                Visit(
+                    that.ValueId,
+                    new Verification.PathSegment(context, "ValueId"));
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.ValueList that, string context)
+            public void Visit(ValueList that, Verification.PathSegment context)
             {
                 Implementation.VerifyValueList(
                     that, context, Errors);
+
+                for(
+                    var i = 0;
+                    i < that.ValueReferencePairs.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ValueReferencePairs[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "ValueReferencePairs"),
+                            i));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.DataSpecificationIec61360 that, string context)
+            public void Visit(DataSpecificationIec61360 that, Verification.PathSegment context)
             {
                 Implementation.VerifyDataSpecificationIec61360(
                     that, context, Errors);
+
+                if (that.PreferredName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.PreferredName,
+                        new Verification.PathSegment(context, "PreferredName"));
+                }
+
+                if (that.ShortName != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ShortName,
+                        new Verification.PathSegment(context, "ShortName"));
+                }
+
+                if (that.UnitId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.UnitId,
+                        new Verification.PathSegment(context, "UnitId"));
+                }
+
+                if (that.Definition != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Definition,
+                        new Verification.PathSegment(context, "Definition"));
+                }
+
+                if (that.ValueList != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ValueList,
+                        new Verification.PathSegment(context, "ValueList"));
+                }
+
+                if (that.ValueId != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ValueId,
+                        new Verification.PathSegment(context, "ValueId"));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.DataSpecificationPhysicalUnit that, string context)
+            public void Visit(DataSpecificationPhysicalUnit that, Verification.PathSegment context)
             {
                 Implementation.VerifyDataSpecificationPhysicalUnit(
                     that, context, Errors);
+
+                if (that.Definition != null)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Definition,
+                        new Verification.PathSegment(context, "Definition"));
+                }
             }
 
             /// <summary>
-            /// Verify <paramref name="that" /> instance and
+            /// Verify recursively <paramref name="that" /> instance and
             /// append any error to <see cref="Errors" />
             /// where <paramref name="context" /> is used to localize the error.
             /// </summary>
-            public void Visit(Aas.Environment that, string context)
+            public void Visit(Environment that, Verification.PathSegment context)
             {
                 Implementation.VerifyEnvironment(
                     that, context, Errors);
-            }
-        }  // public class NonRecursiveVerifier
 
-        /// <summary>
-        /// Verify the instances of the model classes recursively.
-        /// </summary>
-        public class RecursiveVerifier :
-            Visitation.IVisitorWithContext<string>
-        {
-            public readonly Errors Errors;
+                for(
+                    var i = 0;
+                    i < that.AssetAdministrationShells.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.AssetAdministrationShells[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "AssetAdministrationShells"),
+                            i));
+                }
 
-            /// <summary>
-            /// Initialize the visitor with the given <paramref name="errors" />.
-            ///
-            /// The errors observed during the visitation will be appended to
-            /// the <paramref name="errors" />.
-            /// </summary>
-            RecursiveVerifier(Errors errors)
-            {
-                Errors = errors;
+                for(var i = 0; i < that.Submodels.Count; i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.Submodels[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "Submodels"),
+                            i));
+                }
+
+                for(
+                    var i = 0;
+                    i < that.ConceptDescriptions.Count;
+                    i++)
+                {
+                    if (Errors.Full()) return;
+                    Visit(
+                        that.ConceptDescriptions[i],
+                        new Verification.PathSegment(
+                            new Verification.PathSegment(context, "ConceptDescriptions"),
+                            i));
+                }
             }
+        }  // public class RecursiveVerifier
 
-            public void Visit(IClass that, string context)
+        /// <summary>
+        /// Check the instances of the model classes recursively and stop at
+        /// the first violation.
+        /// </summary>
+        /// <remarks>
+        /// Unlike <see cref="RecursiveVerifier" />, no errors are allocated.
+        /// </remarks>
+        private class RecursiveValidator : Visitation.ITransformer<bool>
+        {
+            public bool Transform(Aas.IClass that)
             {
-                that.Accept(this, context);
+                return that.Transform(this);
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Extension that, string context)
+            public bool Transform(Aas.Extension that)
             {
-                Implementation.VerifyExtension(
-                    that, context, Errors);
+                if (!Implementation.IsValidExtension(that))
+                {
+                    return false;
+                }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.RefersTo != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.RefersTo,
-                        $"{context}/RefersTo");
+                    if (!Transform(that.RefersTo))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(AdministrativeInformation that, string context)
+            public bool Transform(Aas.AdministrativeInformation that)
             {
-                Implementation.VerifyAdministrativeInformation(
-                    that, context, Errors);
+                if (!Implementation.IsValidAdministrativeInformation(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Qualifier that, string context)
+            public bool Transform(Aas.Qualifier that)
             {
-                Implementation.VerifyQualifier(
-                    that, context, Errors);
+                if (!Implementation.IsValidQualifier(that))
+                {
+                    return false;
+                }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ValueId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ValueId,
-                        $"{context}/ValueId");
+                    if (!Transform(that.ValueId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Formula that, string context)
+            public bool Transform(Aas.Formula that)
             {
-                Implementation.VerifyFormula(
-                    that, context, Errors);
+                if (!Implementation.IsValidFormula(that))
+                {
+                    return false;
+                }
 
                 for(var i = 0; i < that.DependsOn.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DependsOn[i],
-                        $"{context}/DependsOn/{i}");
+                    if (!Transform(that.DependsOn[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(AssetAdministrationShell that, string context)
+            public bool Transform(Aas.AssetAdministrationShell that)
             {
-                Implementation.VerifyAssetAdministrationShell(
-                    that, context, Errors);
+                if (!Implementation.IsValidAssetAdministrationShell(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Administration != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Administration,
-                        $"{context}/Administration");
+                    if (!Transform(that.Administration))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DerivedFrom != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DerivedFrom,
-                        $"{context}/DerivedFrom");
+                    if (!Transform(that.DerivedFrom))
+                    {
+                        return false;
+                    }
                 }
 
-                if (Errors.Full()) return;
-                Visit(
-                    that.AssetInformation,
-                    $"{context}/AssetInformation");
+                if (!Transform(that.AssetInformation))
+                {
+                    return false;
+                }
 
                 for(var i = 0; i < that.Submodels.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Submodels[i],
-                        $"{context}/Submodels/{i}");
+                    if (!Transform(that.Submodels[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(AssetInformation that, string context)
+            public bool Transform(Aas.AssetInformation that)
             {
-                Implementation.VerifyAssetInformation(
-                    that, context, Errors);
+                if (!Implementation.IsValidAssetInformation(that))
+                {
+                    return false;
+                }
 
                 if (that.GlobalAssetId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.GlobalAssetId,
-                        $"{context}/GlobalAssetId");
+                    if (!Transform(that.GlobalAssetId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SpecificAssetId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SpecificAssetId,
-                        $"{context}/SpecificAssetId");
+                    if (!Transform(that.SpecificAssetId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DefaultThumbnail != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DefaultThumbnail,
-                        $"{context}/DefaultThumbnail");
+                    if (!Transform(that.DefaultThumbnail))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(IdentifierKeyValuePair that, string context)
+            public bool Transform(Aas.IdentifierKeyValuePair that)
             {
-                Implementation.VerifyIdentifierKeyValuePair(
-                    that, context, Errors);
+                if (!Implementation.IsValidIdentifierKeyValuePair(that))
+                {
+                    return false;
+                }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ExternalSubjectId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ExternalSubjectId,
-                        $"{context}/ExternalSubjectId");
+                    if (!Transform(that.ExternalSubjectId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Submodel that, string context)
+            public bool Transform(Aas.Submodel that)
             {
-                Implementation.VerifySubmodel(
-                    that, context, Errors);
+                if (!Implementation.IsValidSubmodel(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Administration != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Administration,
-                        $"{context}/Administration");
+                    if (!Transform(that.Administration))
+                    {
+                        return false;
+                    }
                 }
 
                 for(
@@ -2619,865 +5489,889 @@ namespace AasCore.Aas3
                     i < that.SubmodelElements.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SubmodelElements[i],
-                        $"{context}/SubmodelElements/{i}");
+                    if (!Transform(that.SubmodelElements[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(SubmodelElementList that, string context)
+            public bool Transform(Aas.SubmodelElementList that)
             {
-                Implementation.VerifySubmodelElementList(
-                    that, context, Errors);
+                if (!Implementation.IsValidSubmodelElementList(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Values.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Values[i],
-                        $"{context}/Values/{i}");
+                    if (!Transform(that.Values[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticIdValues != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticIdValues,
-                        $"{context}/SemanticIdValues");
+                    if (!Transform(that.SemanticIdValues))
+                    {
+                        return false;
+                    }
                 }
-            }
 
-            /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+                return true;
+            }
+
+            /// <summary>
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(SubmodelElementStruct that, string context)
+            public bool Transform(Aas.SubmodelElementStruct that)
             {
-                Implementation.VerifySubmodelElementStruct(
-                    that, context, Errors);
+                if (!Implementation.IsValidSubmodelElementStruct(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Values.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Values[i],
-                        $"{context}/Values/{i}");
+                    if (!Transform(that.Values[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Property that, string context)
+            public bool Transform(Aas.Property that)
             {
-                Implementation.VerifyProperty(
-                    that, context, Errors);
+                if (!Implementation.IsValidProperty(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ValueId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ValueId,
-                        $"{context}/ValueId");
+                    if (!Transform(that.ValueId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(MultiLanguageProperty that, string context)
+            public bool Transform(Aas.MultiLanguageProperty that)
             {
-                Implementation.VerifyMultiLanguageProperty(
-                    that, context, Errors);
+                if (!Implementation.IsValidMultiLanguageProperty(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Value != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Value,
-                        $"{context}/Value");
+                    if (!Transform(that.Value))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ValueId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ValueId,
-                        $"{context}/ValueId");
+                    if (!Transform(that.ValueId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Range that, string context)
+            public bool Transform(Aas.Range that)
             {
-                Implementation.VerifyRange(
-                    that, context, Errors);
+                if (!Implementation.IsValidRange(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(ReferenceElement that, string context)
+            public bool Transform(Aas.ReferenceElement that)
             {
-                Implementation.VerifyReferenceElement(
-                    that, context, Errors);
+                if (!Implementation.IsValidReferenceElement(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Value != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Value,
-                        $"{context}/Value");
+                    if (!Transform(that.Value))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Blob that, string context)
+            public bool Transform(Aas.Blob that)
             {
-                Implementation.VerifyBlob(
-                    that, context, Errors);
+                if (!Implementation.IsValidBlob(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
-            /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// <summary>
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(File that, string context)
+            public bool Transform(Aas.File that)
             {
-                Implementation.VerifyFile(
-                    that, context, Errors);
+                if (!Implementation.IsValidFile(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(AnnotatedRelationshipElement that, string context)
+            public bool Transform(Aas.AnnotatedRelationshipElement that)
             {
-                Implementation.VerifyAnnotatedRelationshipElement(
-                    that, context, Errors);
+                if (!Implementation.IsValidAnnotatedRelationshipElement(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
-                if (Errors.Full()) return;
-                Visit(
-                    that.First,
-                    $"{context}/First");
+                if (!Transform(that.First))
+                {
+                    return false;
+                }
 
-                if (Errors.Full()) return;
-                Visit(
-                    that.Second,
-                    $"{context}/Second");
+                if (!Transform(that.Second))
+                {
+                    return false;
+                }
 
                 for(var i = 0; i < that.Annotation.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Annotation[i],
-                        $"{context}/Annotation/{i}");
+                    if (!Transform(that.Annotation[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Entity that, string context)
+            public bool Transform(Aas.Entity that)
             {
-                Implementation.VerifyEntity(
-                    that, context, Errors);
+                if (!Implementation.IsValidEntity(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Statements.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Statements[i],
-                        $"{context}/Statements/{i}");
+                    if (!Transform(that.Statements[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.GlobalAssetId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.GlobalAssetId,
-                        $"{context}/GlobalAssetId");
+                    if (!Transform(that.GlobalAssetId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SpecificAssetId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SpecificAssetId,
-                        $"{context}/SpecificAssetId");
+                    if (!Transform(that.SpecificAssetId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(BasicEvent that, string context)
+            public bool Transform(Aas.BasicEvent that)
             {
-                Implementation.VerifyBasicEvent(
-                    that, context, Errors);
+                if (!Implementation.IsValidBasicEvent(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
-                if (Errors.Full()) return;
-                Visit(
-                    that.Observed,
-                    $"{context}/Observed");
+                if (!Transform(that.Observed))
+                {
+                    return false;
+                }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Operation that, string context)
+            public bool Transform(Aas.Operation that)
             {
-                Implementation.VerifyOperation(
-                    that, context, Errors);
+                if (!Implementation.IsValidOperation(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.InputVariables.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.InputVariables[i],
-                        $"{context}/InputVariables/{i}");
+                    if (!Transform(that.InputVariables[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(
@@ -3485,10 +6379,10 @@ namespace AasCore.Aas3
                     i < that.OutputVariables.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.OutputVariables[i],
-                        $"{context}/OutputVariables/{i}");
+                    if (!Transform(that.OutputVariables[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(
@@ -3496,204 +6390,212 @@ namespace AasCore.Aas3
                     i < that.InoutputVariables.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.InoutputVariables[i],
-                        $"{context}/InoutputVariables/{i}");
+                    if (!Transform(that.InoutputVariables[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(OperationVariable that, string context)
+            public bool Transform(Aas.OperationVariable that)
             {
-                Implementation.VerifyOperationVariable(
-                    that, context, Errors);
+                if (!Implementation.IsValidOperationVariable(that))
+                {
+                    return false;
+                }
 
-                if (Errors.Full()) return;
-                Visit(
-                    that.Value,
-                    $"{context}/Value");
+                if (!Transform(that.Value))
+                {
+                    return false;
+                }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Capability that, string context)
+            public bool Transform(Aas.Capability that)
             {
-                Implementation.VerifyCapability(
-                    that, context, Errors);
+                if (!Implementation.IsValidCapability(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Qualifiers.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Qualifiers[i],
-                        $"{context}/Qualifiers/{i}");
+                    if (!Transform(that.Qualifiers[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(ConceptDescription that, string context)
+            public bool Transform(Aas.ConceptDescription that)
             {
-                Implementation.VerifyConceptDescription(
-                    that, context, Errors);
+                if (!Implementation.IsValidConceptDescription(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Administration != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Administration,
-                        $"{context}/Administration");
+                    if (!Transform(that.Administration))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.IsCaseOf.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.IsCaseOf[i],
-                        $"{context}/IsCaseOf/{i}");
+                    if (!Transform(that.IsCaseOf[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(View that, string context)
+            public bool Transform(Aas.View that)
             {
-                Implementation.VerifyView(
-                    that, context, Errors);
+                if (!Implementation.IsValidView(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.DataSpecifications.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DataSpecifications[i],
-                        $"{context}/DataSpecifications/{i}");
+                    if (!Transform(that.DataSpecifications[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Extensions.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Extensions[i],
-                        $"{context}/Extensions/{i}");
+                    if (!Transform(that.Extensions[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.DisplayName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.DisplayName,
-                        $"{context}/DisplayName");
+                    if (!Transform(that.DisplayName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Description != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Description,
-                        $"{context}/Description");
+                    if (!Transform(that.Description))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.SemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.SemanticId,
-                        $"{context}/SemanticId");
+                    if (!Transform(that.SemanticId))
+                    {
+                        return false;
+                    }
                 }
 
                 for(
@@ -3701,219 +6603,232 @@ namespace AasCore.Aas3
                     i < that.ContainedElements.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ContainedElements[i],
-                        $"{context}/ContainedElements/{i}");
+                    if (!Transform(that.ContainedElements[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(GlobalReference that, string context)
+            public bool Transform(Aas.GlobalReference that)
             {
-                Implementation.VerifyGlobalReference(
-                    that, context, Errors);
+                if (!Implementation.IsValidGlobalReference(that))
+                {
+                    return false;
+                }
 
-                // The recursion ends here.
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(ModelReference that, string context)
+            public bool Transform(Aas.ModelReference that)
             {
-                Implementation.VerifyModelReference(
-                    that, context, Errors);
+                if (!Implementation.IsValidModelReference(that))
+                {
+                    return false;
+                }
 
                 for(var i = 0; i < that.Keys.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Keys[i],
-                        $"{context}/Keys/{i}");
+                    if (!Transform(that.Keys[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ReferredSemanticId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ReferredSemanticId,
-                        $"{context}/ReferredSemanticId");
+                    if (!Transform(that.ReferredSemanticId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Key that, string context)
+            public bool Transform(Aas.Key that)
             {
-                Implementation.VerifyKey(
-                    that, context, Errors);
+                if (!Implementation.IsValidKey(that))
+                {
+                    return false;
+                }
 
-                // The recursion ends here.
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="langStringSet" /> and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(LangStringSet that, string context)
+            public bool Transform(Aas.LangStringSet that)
             {
-                throw new System.NotImplementedException("TODO");
+                var errors = new Verification.Errors(1);
+                new RecursiveVerifier(errors).Visit(
+                    that, new Verification.PathSegment(""));
+                return errors.Entries().Count == 0;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(ValueReferencePair that, string context)
+            public bool Transform(Aas.ValueReferencePair that)
             {
-                Implementation.VerifyValueReferencePair(
-                    that, context, Errors);
+                if (!Implementation.IsValidValueReferencePair(that))
+                {
+                    return false;
+                }
 
-                if (Errors.Full()) return;
-                Visit(
-                    that.ValueId,
-                    $"{context}/ValueId");
+                if (!Transform(that.ValueId))
+                {
+                    return false;
+                }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(ValueList that, string context)
+            public bool Transform(Aas.ValueList that)
             {
-                Implementation.VerifyValueList(
-                    that, context, Errors);
+                if (!Implementation.IsValidValueList(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.ValueReferencePairs.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ValueReferencePairs[i],
-                        $"{context}/ValueReferencePairs/{i}");
+                    if (!Transform(that.ValueReferencePairs[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(DataSpecificationIec61360 that, string context)
+            public bool Transform(Aas.DataSpecificationIec61360 that)
             {
-                Implementation.VerifyDataSpecificationIec61360(
-                    that, context, Errors);
+                if (!Implementation.IsValidDataSpecificationIec61360(that))
+                {
+                    return false;
+                }
 
                 if (that.PreferredName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.PreferredName,
-                        $"{context}/PreferredName");
+                    if (!Transform(that.PreferredName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ShortName != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ShortName,
-                        $"{context}/ShortName");
+                    if (!Transform(that.ShortName))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.UnitId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.UnitId,
-                        $"{context}/UnitId");
+                    if (!Transform(that.UnitId))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.Definition != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Definition,
-                        $"{context}/Definition");
+                    if (!Transform(that.Definition))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ValueList != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ValueList,
-                        $"{context}/ValueList");
+                    if (!Transform(that.ValueList))
+                    {
+                        return false;
+                    }
                 }
 
                 if (that.ValueId != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ValueId,
-                        $"{context}/ValueId");
+                    if (!Transform(that.ValueId))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(DataSpecificationPhysicalUnit that, string context)
+            public bool Transform(Aas.DataSpecificationPhysicalUnit that)
             {
-                Implementation.VerifyDataSpecificationPhysicalUnit(
-                    that, context, Errors);
+                if (!Implementation.IsValidDataSpecificationPhysicalUnit(that))
+                {
+                    return false;
+                }
 
                 if (that.Definition != null)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Definition,
-                        $"{context}/Definition");
+                    if (!Transform(that.Definition))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
 
             /// <summary>
-            /// Verify recursively <paramref name="that" /> instance and
-            /// append any error to <see cref="Errors" />
-            /// where <paramref name="context" /> is used to localize the error.
+            /// Check recursively whether <paramref name="that" /> instance is valid.
             /// </summary>
-            public void Visit(Environment that, string context)
+            public bool Transform(Aas.Environment that)
             {
-                Implementation.VerifyEnvironment(
-                    that, context, Errors);
+                if (!Implementation.IsValidEnvironment(that))
+                {
+                    return false;
+                }
 
                 for(
                     var i = 0;
                     i < that.AssetAdministrationShells.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.AssetAdministrationShells[i],
-                        $"{context}/AssetAdministrationShells/{i}");
+                    if (!Transform(that.AssetAdministrationShells[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(var i = 0; i < that.Submodels.Count; i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.Submodels[i],
-                        $"{context}/Submodels/{i}");
+                    if (!Transform(that.Submodels[i]))
+                    {
+                        return false;
+                    }
                 }
 
                 for(
@@ -3921,13 +6836,31 @@ namespace AasCore.Aas3
                     i < that.ConceptDescriptions.Count;
                     i++)
                 {
-                    if (Errors.Full()) return;
-                    Visit(
-                        that.ConceptDescriptions[i],
-                        $"{context}/ConceptDescriptions/{i}");
+                    if (!Transform(that.ConceptDescriptions[i]))
+                    {
+                        return false;
+                    }
                 }
+
+                return true;
             }
-        }  // public class RecursiveVerifier
+        }  // private class RecursiveValidator
+
+        private static readonly RecursiveValidator _recursiveValidator = (
+            new RecursiveValidator());
+
+        /// <summary>
+        /// Check whether <paramref name="that" /> instance and all the instances
+        /// beneath it are valid.
+        /// </summary>
+        /// <remarks>
+        /// The check short-circuits on the first violation and allocates no errors.
+        /// Use <see cref="RecursiveVerifier" /> to find out what is invalid.
+        /// </remarks>
+        public static bool IsValid(Aas.IClass that)
+        {
+            return _recursiveValidator.Transform(that);
+        }
     }  // public static class Verification
 }  // namespace AasCore.Aas3
 
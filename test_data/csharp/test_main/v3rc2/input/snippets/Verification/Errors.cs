@@ -33,7 +33,7 @@ public class Errors
     /// </summary>
     public void Add(Verification.Error error)
     {
-        if(_entries.Count <= Capacity)
+        if (_entries.Count < Capacity)
         {
             _entries.Add(error);
         }
@@ -3,7 +3,7 @@
 /// append any error to <see cref="Errors" />
 /// where <paramref name="context" /> is used to localize the error.
 /// </summary>
-public void Visit(LangStringSet that, string context)
+public void Visit(LangStringSet that, Verification.PathSegment context)
 {
     throw new System.NotImplementedException("TODO");
 }
\ No newline at end of file
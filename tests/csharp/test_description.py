@@ -1,11 +1,13 @@
 # pylint: disable=missing-docstring
 
+import ast
 import textwrap
 import unittest.mock
 
 # noinspection PyProtectedMember
 import aas_core_codegen.csharp.description as csharp_description
 import tests.common
+from aas_core_codegen import intermediate
 from aas_core_codegen.common import Stripped, Identifier
 
 
@@ -225,6 +227,80 @@ class TestDescription(unittest.TestCase):
             comment_code,
         )
 
+    def test_inherited_property_rendered_once(self) -> None:
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=textwrap.dedent(
+                '''\
+                class Parent:
+                    something: int
+                    """Do & drink something."""
+
+                    def __init__(self, something: int) -> None:
+                        self.something = something
+
+
+                class Child(Parent):
+                    def __init__(self, something: int) -> None:
+                        Parent.__init__(self, something=something)
+
+
+                __book_url__ = "dummy"
+                __book_version__ = "dummy"
+                '''
+            )
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        parent = symbol_table.must_find(Identifier("Parent"))
+        child = symbol_table.must_find(Identifier("Child"))
+        assert isinstance(parent, intermediate.Class)
+        assert isinstance(child, intermediate.Class)
+
+        parent_description = parent.properties[0].description
+        child_description = child.properties[0].description
+        assert parent_description is not None
+        assert child_description is not None
+
+        parent_result = csharp_description.generate_comment(parent_description)
+        child_result = csharp_description.generate_comment(child_description)
+
+        self.assertEqual(
+            (
+                "/// <summary>\n/// Do &amp; drink something.\n/// </summary>",
+                None,
+            ),
+            parent_result,
+        )
+
+        # The rendering is re-used for the inherited property.
+        self.assertIs(parent_result[0], child_result[0])
+
+        # The errors point to the node of the respective description, even if
+        # the descriptions share the document.
+        other_description = intermediate.Description(
+            document=parent_description.document,
+            node=ast.Constant(value=parent_description.node.value),
+        )
+
+        csharp_description._COMMENT_CACHE.clear()
+        with unittest.mock.patch.object(
+            csharp_description._ElementRenderer,
+            "transform",
+            return_value=(None, "Unexpected element"),
+        ) as transform:
+            _, parent_error = csharp_description.generate_comment(parent_description)
+            _, other_error = csharp_description.generate_comment(other_description)
+
+        self.assertEqual(1, transform.call_count)
+
+        assert parent_error is not None
+        assert other_error is not None
+        self.assertEqual("Unexpected element", parent_error.message)
+        self.assertEqual("Unexpected element", other_error.message)
+        self.assertIs(parent_description.node, parent_error.node)
+        self.assertIs(other_description.node, other_error.node)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,21 @@
 # pylint: disable=missing-docstring
 
 import contextlib
+import functools
 import io
+import json
 import os
 import pathlib
+import re
 import tempfile
+import threading
 import unittest
+import unittest.mock
+from typing import Mapping, Optional, Tuple
 
+import aas_core_codegen.csharp.main
 import aas_core_codegen.main
+from aas_core_codegen import run, specific_implementations
 
 
 class Test_against_recorded(unittest.TestCase):
@@ -129,5 +137,195 @@ class Test_against_recorded(unittest.TestCase):
                         )
 
 
+class Test_sharded_layout(unittest.TestCase):
+    def test_against_single_file(self) -> None:
+        repo_dir = pathlib.Path(os.path.realpath(__file__)).parent.parent.parent
+
+        case_dir = repo_dir / "test_data" / "csharp" / "test_main" / "v3rc2"
+        expected_output_dir = case_dir / "expected_output"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = pathlib.Path(tmp_dir)
+
+            params = aas_core_codegen.main.Parameters(
+                model_path=case_dir / "input/meta_model.py",
+                target=aas_core_codegen.main.Target.CSHARP,
+                snippets_dir=case_dir / "input/snippets",
+                output_dir=output_dir,
+                csharp_layout=aas_core_codegen.csharp.main.Layout.SHARDED,
+            )
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+
+            return_code = aas_core_codegen.main.execute(
+                params=params, stdout=stdout, stderr=stderr
+            )
+
+            self.assertEqual("", stderr.getvalue())
+            self.assertEqual(0, return_code)
+
+            for single_file in ["types.cs", "verification.cs", "jsonization.cs"]:
+                self.assertFalse((output_dir / single_file).exists(), single_file)
+
+            # Every type from the single file is declared in its own shard.
+            types = (expected_output_dir / "types.cs").read_text(encoding="utf-8")
+            type_names = re.findall(
+                r"^    public (?:class|interface|enum) (\w+)", types, re.MULTILINE
+            )
+            self.assertEqual(
+                sorted(f"{name}.cs" for name in type_names),
+                sorted(pth.name for pth in (output_dir / "Types").iterdir()),
+            )
+
+            # Every verified class has its own shard.
+            verification = (expected_output_dir / "verification.cs").read_text(
+                encoding="utf-8"
+            )
+            for name in re.findall(
+                r"^            public static void Verify(\w+) \(",
+                verification,
+                re.MULTILINE,
+            ):
+                shard = (output_dir / "Verification" / f"{name}.cs").read_text(
+                    encoding="utf-8"
+                )
+                self.assertIn(f"public static void Verify{name} (", shard)
+                self.assertIn("public static partial class Verification", shard)
+
+            # Every JSON converter is declared exactly once over all the shards.
+            jsonization = (expected_output_dir / "jsonization.cs").read_text(
+                encoding="utf-8"
+            )
+            sharded_jsonization = "".join(
+                pth.read_text(encoding="utf-8")
+                for pth in sorted((output_dir / "Jsonization").iterdir())
+            )
+            for converter in re.findall(
+                r"public class (\w+JsonConverter)", jsonization
+            ):
+                self.assertEqual(
+                    1,
+                    sharded_jsonization.count(f"public class {converter} :"),
+                    converter,
+                )
+
+            self.assertIn(
+                "CreateJsonConverters()",
+                (output_dir / "Jsonization" / "Jsonization.cs").read_text(
+                    encoding="utf-8"
+                ),
+            )
+
+
+class Test_stale_files(unittest.TestCase):
+    def test_rename_and_layout_switch(self) -> None:
+        repo_dir = pathlib.Path(os.path.realpath(__file__)).parent.parent.parent
+
+        case_dir = repo_dir / "test_data" / "csharp" / "test_main" / "v3rc2"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = pathlib.Path(tmp_dir)
+
+            def execute(layout: aas_core_codegen.csharp.main.Layout) -> None:
+                params = aas_core_codegen.main.Parameters(
+                    model_path=case_dir / "input/meta_model.py",
+                    target=aas_core_codegen.main.Target.CSHARP,
+                    snippets_dir=case_dir / "input/snippets",
+                    output_dir=output_dir,
+                    csharp_layout=layout,
+                )
+
+                stderr = io.StringIO()
+                return_code = aas_core_codegen.main.execute(
+                    params=params, stdout=io.StringIO(), stderr=stderr
+                )
+                self.assertEqual("", stderr.getvalue())
+                self.assertEqual(0, return_code)
+
+            execute(layout=aas_core_codegen.csharp.main.Layout.SHARDED)
+
+            # Pretend that the previous run generated a class which has been renamed
+            # since.
+            (output_dir / "Types" / "Renamed.cs").write_text(
+                "// stale\n", encoding="utf-8"
+            )
+            manifest_pth = output_dir / run.MANIFEST_FILE_NAME
+            manifest = json.loads(manifest_pth.read_text(encoding="utf-8"))
+            manifest["files"]["Types/Renamed.cs"] = "irrelevant"
+            manifest_pth.write_text(json.dumps(manifest), encoding="utf-8")
+
+            execute(layout=aas_core_codegen.csharp.main.Layout.SHARDED)
+
+            self.assertFalse((output_dir / "Types" / "Renamed.cs").exists())
+            self.assertTrue((output_dir / "Types").is_dir())
+
+            execute(layout=aas_core_codegen.csharp.main.Layout.SINGLE_FILE)
+
+            self.assertEqual(
+                sorted(
+                    [
+                        run.MANIFEST_FILE_NAME,
+                        "jsonization.cs",
+                        "stringification.cs",
+                        "types.cs",
+                        "verification.cs",
+                        "visitation.cs",
+                    ]
+                ),
+                sorted(pth.name for pth in output_dir.iterdir()),
+            )
+
+
+class Test_execute_jobs(unittest.TestCase):
+    def test_results_in_order_and_snippets_recorded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            keys = [
+                specific_implementations.ImplementationKey(f"{name}.cs")
+                for name in ["A", "B", "C"]
+            ]
+            for key in keys:
+                (pathlib.Path(tmp_dir) / key).write_text(
+                    f"// {key}\n", encoding="utf-8"
+                )
+
+            spec_impls = specific_implementations.SnippetStore(
+                paths={key: pathlib.Path(tmp_dir) / key for key in keys}
+            )
+
+            def job(
+                key: specific_implementations.ImplementationKey,
+            ) -> Tuple[Optional[Mapping[str, str]], None]:
+                return {key: spec_impls[key]}, None
+
+            # Pretend to have more CPUs so that the jobs are executed in
+            # the worker processes on any machine.
+            with unittest.mock.patch.object(os, "cpu_count", return_value=2):
+                results = aas_core_codegen.csharp.main._execute_jobs(
+                    jobs=[functools.partial(job, key) for key in reversed(keys)],
+                    spec_impls=spec_impls,
+                )
+
+            self.assertEqual(
+                [
+                    ({"C.cs": "// C.cs"}, None),
+                    ({"B.cs": "// B.cs"}, None),
+                    ({"A.cs": "// A.cs"}, None),
+                ],
+                results,
+            )
+            self.assertEqual(keys, sorted(spec_impls.accessed_keys()))
+
+    def test_no_fork_in_threaded_process(self) -> None:
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            self.assertFalse(aas_core_codegen.csharp.main._can_fork())
+        finally:
+            stop.set()
+            thread.join()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+# pylint: disable=missing-docstring
+
+import textwrap
+import unittest
+
+import tests.common
+
+# noinspection PyProtectedMember
+from aas_core_codegen.csharp.stringification import _generate as csharp_stringification
+from aas_core_codegen import intermediate
+from aas_core_codegen.common import Identifier
+
+
+class Test_generate_switch_on_length(unittest.TestCase):
+    @staticmethod
+    def load_enumeration(source: str) -> intermediate.Enumeration:
+        """Translate the ``source`` and retrieve the enumeration ``Some_enum``."""
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        enumeration = symbol_table.must_find(Identifier("Some_enum"))
+        assert isinstance(enumeration, intermediate.Enumeration)
+
+        return enumeration
+
+    def test_characters_with_common_prefix(self) -> None:
+        enumeration = Test_generate_switch_on_length.load_enumeration(
+            textwrap.dedent(
+                """\
+                class Some_enum(Enum):
+                    Ab = "ab"
+                    Ac = "ac"
+                    Bc = "bc"
+                    Abc = "abc"
+
+
+                __book_url__ = "dummy"
+                __book_version__ = "dummy"
+                """
+            )
+        )
+
+        # pylint: disable=protected-access
+        code = csharp_stringification._generate_switch_on_length(
+            enumeration=enumeration,
+            encode=csharp_stringification._utf16_code_units,
+            code_unit_literal=csharp_stringification._char_literal,
+            equality=lambda literal: f'EqualsOrdinal(text, "{literal.value}")',
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                switch (text.Length)
+                {
+                    case 2:
+                        switch (text[0])
+                        {
+                            case 'a':
+                                switch (text[1])
+                                {
+                                    case 'b':
+                                        if (EqualsOrdinal(text, "ab"))
+                                        {
+                                            return Aas.SomeEnum.Ab;
+                                        }
+                                        break;
+                                    case 'c':
+                                        if (EqualsOrdinal(text, "ac"))
+                                        {
+                                            return Aas.SomeEnum.Ac;
+                                        }
+                                        break;
+                                }
+                                break;
+                            case 'b':
+                                if (EqualsOrdinal(text, "bc"))
+                                {
+                                    return Aas.SomeEnum.Bc;
+                                }
+                                break;
+                        }
+                        break;
+                    case 3:
+                        if (EqualsOrdinal(text, "abc"))
+                        {
+                            return Aas.SomeEnum.Abc;
+                        }
+                        break;
+                }
+
+                return null;"""
+            ),
+            code,
+        )
+
+    def test_utf8_with_non_ascii(self) -> None:
+        enumeration = Test_generate_switch_on_length.load_enumeration(
+            textwrap.dedent(
+                """\
+                class Some_enum(Enum):
+                    Accent = "é"
+                    Ez = "ez"
+
+
+                __book_url__ = "dummy"
+                __book_version__ = "dummy"
+                """
+            )
+        )
+
+        # pylint: disable=protected-access
+        code = csharp_stringification._generate_switch_on_length(
+            enumeration=enumeration,
+            encode=csharp_stringification._utf8_code_units,
+            code_unit_literal=csharp_stringification._byte_literal,
+            equality=csharp_stringification._utf8_equality,
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                switch (text.Length)
+                {
+                    case 2:
+                        switch (text[0])
+                        {
+                            case 0xC3:
+                                if (text[0] == 0xC3
+                                    && text[1] == 0xA9)
+                                {
+                                    return Aas.SomeEnum.Accent;
+                                }
+                                break;
+                            case (byte)'e':
+                                if (EqualsAscii(text, "ez"))
+                                {
+                                    return Aas.SomeEnum.Ez;
+                                }
+                                break;
+                        }
+                        break;
+                }
+
+                return null;"""
+            ),
+            code,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# pylint: disable=missing-docstring
+
+import textwrap
+import unittest
+
+import tests.common
+from aas_core_codegen.csharp import structure as csharp_structure
+
+
+class Test_verify(unittest.TestCase):
+    @staticmethod
+    def verify_and_expect_errors(source: str) -> str:
+        """Verify the meta-model given as ``source`` and render the errors."""
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        verified, errors = csharp_structure.verify(symbol_table=symbol_table)
+        assert verified is None
+        assert errors is not None
+
+        return tests.common.most_underlying_messages(errors)
+
+    def test_structure_name_collision(self) -> None:
+        source = textwrap.dedent(
+            """\
+            class URL_thing:
+                pass
+
+
+            class Url_thing:
+                pass
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        self.assertEqual(
+            "The C# name 'UrlThing' of the meta-model class 'Url_thing' "
+            "collides with the C# name of the meta-model class 'URL_thing'",
+            Test_verify.verify_and_expect_errors(source),
+        )
+
+    def test_member_name_collision(self) -> None:
+        source = textwrap.dedent(
+            """\
+            class Something:
+                something_to_URL: int
+
+                def something_to_url(self) -> bool:
+                    return True
+
+                def __init__(self, something_to_URL: int) -> None:
+                    self.something_to_URL = something_to_URL
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        self.assertEqual(
+            "C# method 'SomethingToUrl' corresponding to the meta-model method "
+            "'something_to_url' collides with the C# property 'SomethingToUrl' "
+            "corresponding to the meta-model property 'something_to_URL'",
+            Test_verify.verify_and_expect_errors(source),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,312 @@
+# pylint: disable=missing-docstring
+
+import textwrap
+import unittest
+from typing import Optional
+
+import tests.common
+
+# noinspection PyProtectedMember
+from aas_core_codegen.csharp.verification import _generate as csharp_verification
+from aas_core_codegen.csharp.regex_mode import RegexMode
+from aas_core_codegen import intermediate
+from aas_core_codegen.common import Stripped, Identifier
+
+
+class Test_transpile_pattern_verification(unittest.TestCase):
+    @staticmethod
+    def transpile(regex_mode: RegexMode, regex_timeout_ms: Optional[int]) -> Stripped:
+        """Transpile the pattern verification ``is_something`` of a meta-model."""
+        source = textwrap.dedent(
+            """\
+            @verification
+            def is_something(text: str) -> bool:
+                prefix = "some"
+                pattern = f"^{prefix}thing$"
+                return match(pattern, text) is not None
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        verification = symbol_table.verification_functions[0]
+        assert isinstance(verification, intermediate.PatternVerification)
+
+        # pylint: disable=protected-access
+        code, error = csharp_verification._transpile_pattern_verification(
+            verification=verification,
+            regex_mode=regex_mode,
+            regex_timeout_ms=regex_timeout_ms,
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert code is not None
+
+        return code
+
+    def test_interpreted(self) -> None:
+        code = Test_transpile_pattern_verification.transpile(
+            regex_mode=RegexMode.INTERPRETED, regex_timeout_ms=None
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                private static Regex _constructIsSomething()
+                {
+                    var prefix = "some";
+                    var pattern = $"^{prefix}thing$";
+
+                    return new Regex(pattern);
+                }
+
+                private static readonly Regex _regexIsSomething = _constructIsSomething();
+
+                public static bool IsSomething(string text)
+                {
+                    return _regexIsSomething.IsMatch(text);
+                }"""
+            ),
+            code,
+        )
+
+    def test_compiled_with_timeout(self) -> None:
+        code = Test_transpile_pattern_verification.transpile(
+            regex_mode=RegexMode.COMPILED, regex_timeout_ms=100
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                private static Regex _constructIsSomething()
+                {
+                    var prefix = "some";
+                    var pattern = $"^{prefix}thing$";
+
+                    return new Regex(
+                        pattern,
+                        RegexOptions.Compiled | RegexOptions.CultureInvariant,
+                        System.TimeSpan.FromMilliseconds(100));
+                }
+
+                private static readonly Regex _regexIsSomething = _constructIsSomething();
+
+                /// <remarks>
+                /// If the matching takes longer than 100 milliseconds,
+                /// the <paramref name="text" /> is considered invalid.
+                /// </remarks>
+                public static bool IsSomething(string text)
+                {
+                    try
+                    {
+                        return _regexIsSomething.IsMatch(text);
+                    }
+                    catch (System.Text.RegularExpressions.RegexMatchTimeoutException)
+                    {
+                        return false;
+                    }
+                }"""
+            ),
+            code,
+        )
+
+    def test_generated(self) -> None:
+        code = Test_transpile_pattern_verification.transpile(
+            regex_mode=RegexMode.GENERATED, regex_timeout_ms=None
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                [System.Text.RegularExpressions.GeneratedRegex(
+                    "^something$",
+                    RegexOptions.CultureInvariant)]
+                private static partial Regex _regexIsSomething();
+
+                public static bool IsSomething(string text)
+                {
+                    return _regexIsSomething().IsMatch(text);
+                }"""
+            ),
+            code,
+        )
+
+
+class Test_generate_implementation_is_valid(unittest.TestCase):
+    def test_invariant_returns_false_without_errors(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: len(self.text) > 2)
+            class Something:
+                text: str
+
+                def __init__(self, text: str) -> None:
+                    self.text = text
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        something = symbol_table.must_find(Identifier("Something"))
+        assert isinstance(something, intermediate.ConcreteClass)
+
+        # pylint: disable=protected-access
+        code, error = csharp_verification._generate_implementation_is_valid(
+            something=something, symbol_table=symbol_table
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert code is not None
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                /// <summary>
+                /// Check whether <paramref name="that" /> satisfies its own constraints
+                /// without allocating any errors.
+                /// </summary>
+                public static bool IsValidSomething(Aas.Something that)
+                {
+                    if (!(that.Text.Length > 2))
+                    {
+                        return false;
+                    }
+
+                    return true;
+                }"""
+            ),
+            code,
+        )
+
+
+class Test_generate_implementation_verify_of_symbol(unittest.TestCase):
+    def test_inherited_invariants_are_shared(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: len(self.x) > 0)
+            @abstract
+            class Parent:
+                x: str
+
+                def __init__(self, x: str) -> None:
+                    self.x = x
+
+
+            class Child(Parent):
+                def __init__(self, x: str) -> None:
+                    Parent.__init__(self, x=x)
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        # pylint: disable=protected-access
+        code, error = csharp_verification._generate_implementation_verify_of_symbol(
+            symbol=symbol_table.must_find(Identifier("Child")),
+            symbol_table=symbol_table,
+            spec_impls={},
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert code is not None
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                /// <summary>
+                /// Verify <paramref name="that" /> and append any errors to
+                /// <paramref name="Errors" />.
+                ///
+                /// The <paramref name="path" /> localizes <paramref name="that" />.
+                /// </summary>
+                public static void VerifyChild (
+                    Aas.Child that,
+                    Verification.PathSegment path,
+                    Verification.Errors errors)
+                {
+                    VerifyInvariantsOfParent(
+                        that, path, errors);
+                }
+
+                /// <summary>
+                /// Check whether <paramref name="that" /> satisfies its own constraints
+                /// without allocating any errors.
+                /// </summary>
+                public static bool IsValidChild(Aas.Child that)
+                {
+                    if (!SatisfiesInvariantsOfParent(that))
+                    {
+                        return false;
+                    }
+
+                    return true;
+                }"""
+            ),
+            code,
+        )
+
+    def test_invariants_of_concrete_parent_are_in_line(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: len(self.x) > 0)
+            class Parent:
+                x: str
+
+                def __init__(self, x: str) -> None:
+                    self.x = x
+
+
+            class Child(Parent):
+                def __init__(self, x: str) -> None:
+                    Parent.__init__(self, x=x)
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        for name in ["Parent", "Child"]:
+            # pylint: disable=protected-access
+            code, error = csharp_verification._generate_implementation_verify_of_symbol(
+                symbol=symbol_table.must_find(Identifier(name)),
+                symbol_table=symbol_table,
+                spec_impls={},
+            )
+            assert error is None, tests.common.most_underlying_messages(error)
+            assert code is not None
+
+            self.assertNotIn("InvariantsOfParent", code, name)
+            self.assertIn(f"public static void Verify{name} (", code, name)
+            self.assertIn("that.X.Length > 0", code, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
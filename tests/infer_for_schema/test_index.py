@@ -0,0 +1,152 @@
+# pylint: disable=missing-docstring
+
+import gc
+import textwrap
+import unittest
+import weakref
+
+import tests.common
+from aas_core_codegen import intermediate, infer_for_schema
+from aas_core_codegen.common import Identifier
+
+
+class Test_expected(unittest.TestCase):
+    def test_stacked_constraints_of_constrained_primitive(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @verification
+            def is_something(text: str) -> bool:
+                return match("something-[a-zA-Z]+", text) is not None
+
+
+            @verification
+            def is_acme(text: str) -> bool:
+                return match(".*acme.*", text) is not None
+
+
+            @invariant(lambda self: len(self) > 3)
+            @invariant(lambda self: is_something(self))
+            class Parent(str):
+                pass
+
+
+            @invariant(lambda self: len(self) < 10)
+            @invariant(lambda self: is_acme(self))
+            class Something(Parent):
+                pass
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        something = symbol_table.must_find(Identifier("Something"))
+        assert isinstance(something, intermediate.ConstrainedPrimitive)
+
+        constraint_index, errors = infer_for_schema.build_constraint_index(
+            symbol_table=symbol_table
+        )
+        assert errors is None, tests.common.most_underlying_messages(errors)
+        assert constraint_index is not None
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                LenConstraint(
+                  min_value=None,
+                  max_value=9)"""
+            ),
+            infer_for_schema.dump(constraint_index.len_constraint_of_self(something)),
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                LenConstraint(
+                  min_value=4,
+                  max_value=9)"""
+            ),
+            infer_for_schema.dump(
+                constraint_index.stacked_len_constraint_of_self(something)
+            ),
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                [
+                  PatternConstraint(
+                    pattern='.*acme.*')
+                ]"""
+            ),
+            infer_for_schema.dump_patterns(
+                constraint_index.patterns_on_self(something)
+            ),
+        )
+
+        self.assertEqual(
+            textwrap.dedent(
+                """\
+                [
+                  PatternConstraint(
+                    pattern='something-[a-zA-Z]+'),
+                  PatternConstraint(
+                    pattern='.*acme.*')
+                ]"""
+            ),
+            infer_for_schema.dump_patterns(
+                constraint_index.stacked_patterns_on_self(something)
+            ),
+        )
+
+
+class Test_cache(unittest.TestCase):
+    def test_built_once_per_symbol_table(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: len(self) > 3)
+            class Something(str):
+                pass
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        constraint_index, errors = infer_for_schema.build_constraint_index(
+            symbol_table=symbol_table
+        )
+        assert errors is None, tests.common.most_underlying_messages(errors)
+        assert constraint_index is not None
+
+        another_index, errors = infer_for_schema.build_constraint_index(
+            symbol_table=symbol_table
+        )
+        assert errors is None, tests.common.most_underlying_messages(errors)
+        self.assertIs(constraint_index, another_index)
+
+        # The cached index must not keep the symbol table alive.
+        symbol_table_ref = weakref.ref(symbol_table)
+        del symbol_table
+        del constraint_index
+        del another_index
+        gc.collect()
+        self.assertIsNone(symbol_table_ref())
+
+
+if __name__ == "__main__":
+    unittest.main()
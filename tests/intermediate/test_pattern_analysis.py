@@ -0,0 +1,184 @@
+# pylint: disable=missing-docstring
+
+import re
+import unittest
+
+from aas_core_codegen.intermediate import pattern_analysis
+
+
+def parse_or_fail(pattern: str) -> pattern_analysis.Regex:
+    regex, error = pattern_analysis.parse(pattern)
+    assert error is None, f"{pattern=}, {error=}"
+    assert regex is not None
+    return regex
+
+
+class Test_parse(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        for pattern in [
+            "^[a-zA-Z][a-zA-Z_0-9]*$",
+            "^[0-9]{4}-[A-Za-z0-9:_.]{1,35}(-[A-Za-z0-9:_.]{1,35})?#[0-9]{1,35}$",
+            "(?:ab|cd)+?x{2,}y{,3}",
+            "[^\\]\\-]\\d\\W\\bz",
+            "(?P<name>a)(?=b)(?!c)",
+        ]:
+            regex = parse_or_fail(pattern)
+
+            rendered = pattern_analysis.render(regex)
+            self.assertEqual(rendered, pattern_analysis.render(parse_or_fail(rendered)))
+
+            for text in ["", "a", "ab", "Abc_1", "1234-x#12", "abxxy", "]1!z"]:
+                self.assertEqual(
+                    re.match(pattern, text) is not None,
+                    re.match(rendered, text) is not None,
+                    f"{pattern=}, {rendered=}, {text=}",
+                )
+
+    def test_unsupported_back_reference(self) -> None:
+        regex, error = pattern_analysis.parse("(a)\\1")
+        self.assertIsNone(regex)
+        assert error is not None
+        self.assertIn("back-references", error)
+
+
+class Test_find_catastrophic_backtracking(unittest.TestCase):
+    def test_nested_quantifier(self) -> None:
+        explanations = pattern_analysis.find_catastrophic_backtracking(
+            parse_or_fail("^(a+)+$")
+        )
+
+        self.assertEqual(
+            [
+                "The repetition '(a+)+' is prone to catastrophic backtracking "
+                "since the repeated part contains the nested quantified "
+                "sub-pattern 'a+'"
+            ],
+            explanations,
+        )
+
+    def test_overlapping_alternatives(self) -> None:
+        explanations = pattern_analysis.find_catastrophic_backtracking(
+            parse_or_fail("^(a|ab)*c$")
+        )
+
+        self.assertEqual(
+            [
+                "The repetition '(a|ab)*' is prone to catastrophic backtracking "
+                "since the repeated alternatives 'a' and 'ab' can start with "
+                "the same character"
+            ],
+            explanations,
+        )
+
+    def test_nested_quantifiers_with_overlapping_delimiters(self) -> None:
+        for pattern, repetition, term in [
+            ("^(\\w+\\d+)+$", "(\\w+\\d+)+", "\\w+"),
+            ("^(x+x+)+y$", "(x+x+)+", "x+"),
+        ]:
+            self.assertEqual(
+                [
+                    f"The repetition {repetition!r} is prone to catastrophic "
+                    f"backtracking since the repeated part contains the nested "
+                    f"quantified sub-pattern {term!r}"
+                ],
+                pattern_analysis.find_catastrophic_backtracking(parse_or_fail(pattern)),
+                pattern,
+            )
+
+    def test_overlapping_single_characters(self) -> None:
+        for pattern in [
+            "^(a|a)*$",
+            "^([a-z]|[a-f0-9])*$",
+            "^(([a-z]|[0-9])|%[0-9A-F]{2}|[/?a-c])*$",
+        ]:
+            self.assertEqual(
+                1,
+                len(
+                    pattern_analysis.find_catastrophic_backtracking(
+                        parse_or_fail(pattern)
+                    )
+                ),
+                pattern,
+            )
+
+    def test_no_false_positives(self) -> None:
+        for pattern in [
+            "^[a-zA-Z][a-zA-Z_0-9]*$",
+            # Repetitions delimited by a character
+            "^[a-z]+(-[a-z]+)*$",
+            # Repetitions delimited by a quantified term
+            "^([a-z]+[0-9]+)*$",
+            # Fixed number of repetitions
+            "^([0-9]{2}){3}$",
+            # Possessive quantifier does not backtrack
+            "^(a+)++$",
+            # Negated class with a shorthand, delimited by a space
+            "^[^\\s]+( [^\\s]+)*$",
+            # Repetitions told apart by the third character, as in the BCP 47
+            # language tags
+            "^(-[0-9A-WY-Za-wy-z](-([a-zA-Z0-9]){2,8})+)*$",
+        ]:
+            self.assertEqual(
+                [],
+                pattern_analysis.find_catastrophic_backtracking(parse_or_fail(pattern)),
+                pattern,
+            )
+
+
+class Test_simplify(unittest.TestCase):
+    def test_expected(self) -> None:
+        for pattern, expected in [
+            ("[a-cb-e]|[x]|y", "[a-ex-y]"),
+            ("(?:a|b)+", "[a-b]+"),
+            ("([a-z]|[0-9])*", "[0-9a-z]*"),
+            ("abc|abd|ab", "ab[c-d]?"),
+            ("x(ab|ac)y", "x(a[b-c])y"),
+            ("(a|a)*", "a*"),
+        ]:
+            simplified = pattern_analysis.render(
+                pattern_analysis.simplify(parse_or_fail(pattern))
+            )
+
+            self.assertEqual(expected, simplified, pattern)
+
+    def test_equivalence(self) -> None:
+        texts = [
+            "",
+            "a",
+            "b",
+            "ab",
+            "ac",
+            "abc",
+            "abd",
+            "xaby",
+            "xacy",
+            "xady",
+            "aaaa",
+            "e",
+            "x",
+            "y",
+            "z",
+        ]
+
+        for pattern in [
+            "[a-cb-e]|[x]|y",
+            "abc|abd|ab",
+            "x(ab|ac|a)y",
+            "(?:a|b)+c?",
+            "[^a]|b",
+            "a{2,3}|a{2,3}b",
+        ]:
+            simplified = pattern_analysis.render(
+                pattern_analysis.simplify(parse_or_fail(pattern))
+            )
+
+            for text in texts:
+                self.assertEqual(
+                    re.fullmatch(pattern, text) is not None,
+                    re.fullmatch(simplified, text) is not None,
+                    f"{pattern=}, {simplified=}, {text=}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
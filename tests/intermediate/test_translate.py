@@ -107,6 +107,266 @@ class Test_parsing_docstrings(unittest.TestCase):
         self.assertIsInstance(symbol_references[0].symbol, intermediate.Class)
 
 
+class Test_reverse_index_of_references(unittest.TestCase):
+    def test_case(self) -> None:
+        source = textwrap.dedent(
+            '''\
+            class Some_enum(Enum):
+                """Refer to :class:`.Something`."""
+
+                Some_literal = "some-literal"
+                Another_literal = "another-literal"
+
+
+            class Unused_enum(Enum):
+                Yet_another_literal = "yet-another-literal"
+
+
+            @invariant(lambda self: self.some_enum != Some_enum.Another_literal)
+            @abstract
+            class Something:
+                some_enum: Some_enum
+
+                def __init__(self, some_enum: Some_enum) -> None:
+                    self.some_enum = some_enum
+
+
+            class Concrete(Something):
+                def __init__(self, some_enum: Some_enum) -> None:
+                    Something.__init__(self, some_enum)
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            '''
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+
+        assert symbol_table is not None
+
+        some_enum = symbol_table.must_find(Identifier("Some_enum"))
+        references = symbol_table.references_to(some_enum)
+
+        self.assertEqual(
+            ["Something", "Concrete"], [cls.name for cls in references.classes]
+        )
+
+        self.assertEqual(
+            ["Something", "Something"],
+            [prop.specified_for.name for prop in references.properties],
+        )
+
+        self.assertEqual(2, len(references.arguments))
+
+        self.assertEqual(1, len(references.invariants))
+        self.assertEqual("Something", references.invariants[0].specified_for.name)
+
+        self.assertEqual(0, len(references.descriptions))
+
+        something = symbol_table.must_find(Identifier("Something"))
+        assert some_enum.description is not None
+        self.assertEqual(
+            [some_enum.description],
+            list(symbol_table.references_to(something).descriptions),
+        )
+
+        unused_enum = symbol_table.must_find(Identifier("Unused_enum"))
+        unused_references = symbol_table.references_to(unused_enum)
+        self.assertEqual(0, len(unused_references.properties))
+        self.assertEqual(0, len(unused_references.invariants))
+
+    def test_local_variable_shadowing_symbol(self) -> None:
+        source = textwrap.dedent(
+            """\
+            class self(Enum):
+                something = "something"
+
+
+            @invariant(lambda self: len(self.x) > 0)
+            class Something:
+                x: str
+
+                def __init__(self, x: str) -> None:
+                    self.x = x
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+
+        assert symbol_table is not None
+
+        shadowed = symbol_table.must_find(Identifier("self"))
+        self.assertEqual(0, len(symbol_table.references_to(shadowed).invariants))
+
+
+class Test_stacking_of_invariants(unittest.TestCase):
+    def test_inherited_over_multiple_generations_once(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: len(self.x) > 0)
+            @abstract
+            class Grand_parent:
+                x: str
+
+                def __init__(self, x: str) -> None:
+                    self.x = x
+
+
+            @invariant(lambda self: len(self.x) > 1)
+            @abstract
+            class Parent(Grand_parent):
+                def __init__(self, x: str) -> None:
+                    Grand_parent.__init__(self, x=x)
+
+
+            @invariant(lambda self: len(self.x) > 2)
+            class Child(Parent):
+                def __init__(self, x: str) -> None:
+                    Parent.__init__(self, x=x)
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        child = symbol_table.must_find(Identifier("Child"))
+        assert isinstance(child, intermediate.ConcreteClass)
+
+        self.assertEqual(
+            ["Grand_parent", "Parent", "Child"],
+            [invariant.specified_for.name for invariant in child.invariants],
+        )
+
+    def test_descendants_of_constrained_primitives(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: len(self) >= 1)
+            class Non_empty_string(str, DBC):
+                pass
+
+
+            @invariant(lambda self: len(self) <= 10)
+            class Short_string(Non_empty_string, DBC):
+                pass
+
+
+            @invariant(lambda self: len(self) <= 5)
+            class Shorter_string(Short_string, DBC):
+                pass
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        non_empty_string = symbol_table.must_find(Identifier("Non_empty_string"))
+        assert isinstance(non_empty_string, intermediate.ConstrainedPrimitive)
+
+        self.assertEqual(
+            sorted(
+                id(symbol_table.must_find(Identifier(name)))
+                for name in ["Short_string", "Shorter_string"]
+            ),
+            sorted(non_empty_string.descendant_id_set),
+        )
+
+        shorter_string = symbol_table.must_find(Identifier("Shorter_string"))
+        assert isinstance(shorter_string, intermediate.ConstrainedPrimitive)
+
+        self.assertEqual(0, len(shorter_string.descendant_id_set))
+        self.assertEqual(
+            ["Non_empty_string", "Short_string", "Shorter_string"],
+            [invariant.specified_for.name for invariant in shorter_string.invariants],
+        )
+
+
+class Test_patterns_prone_to_catastrophic_backtracking(unittest.TestCase):
+    @staticmethod
+    def errors_for_pattern(pattern: str) -> List[str]:
+        source = textwrap.dedent(
+            f"""\
+            @verification
+            def is_something(text: str) -> bool:
+                return match({pattern!r}, text) is not None
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+        assert symbol_table is not None
+
+        errors = intermediate.errors_if_patterns_prone_to_catastrophic_backtracking(
+            symbol_table=symbol_table
+        )
+
+        if errors is None:
+            return []
+
+        return [tests.common.most_underlying_messages(error) for error in errors]
+
+    def test_nested_quantifier(self) -> None:
+        self.assertEqual(
+            [
+                "The repetition '(a+)+' is prone to catastrophic backtracking since "
+                "the repeated part contains the nested quantified sub-pattern 'a+'"
+            ],
+            Test_patterns_prone_to_catastrophic_backtracking.errors_for_pattern(
+                "^(a+)+$"
+            ),
+        )
+
+    def test_negated_class_with_shorthand(self) -> None:
+        for pattern in ["^\\S+( \\S+)*$", "^[^\\s]+( [^\\s]+)*$"]:
+            self.assertEqual(
+                [],
+                Test_patterns_prone_to_catastrophic_backtracking.errors_for_pattern(
+                    pattern
+                ),
+                pattern,
+            )
+
+    def test_inline_flags_are_translated_but_not_analyzed(self) -> None:
+        errors = Test_patterns_prone_to_catastrophic_backtracking.errors_for_pattern(
+            "(?i)^abc$"
+        )
+        self.assertEqual(1, len(errors))
+        self.assertTrue(
+            errors[0].startswith("We could not analyze the pattern '(?i)^abc$'"),
+            errors[0],
+        )
+
+
 class Test_against_recorded(unittest.TestCase):
     # Set this variable to True if you want to re-record the test data,
     # without any checks
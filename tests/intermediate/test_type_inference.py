@@ -96,5 +96,114 @@ class Test_with_smoke(unittest.TestCase):
         Test_with_smoke.execute(source=source)
 
 
+class Test_type_maps_of_invariants(unittest.TestCase):
+    def test_stacked_invariant_inferred_once(self) -> None:
+        source = textwrap.dedent(
+            """\
+            @invariant(lambda self: self.something > 0)
+            @abstract
+            class Parent:
+                something: int
+
+                def __init__(self, something: int) -> None:
+                    self.something = something
+
+
+            class Child(Parent):
+                def __init__(self, something: int) -> None:
+                    Parent.__init__(self, something)
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+
+        assert symbol_table is not None
+
+        parent = symbol_table.must_find(Identifier("Parent"))
+        child = symbol_table.must_find(Identifier("Child"))
+        assert isinstance(parent, intermediate.Class)
+        assert isinstance(child, intermediate.Class)
+
+        self.assertIs(parent.invariants[0], child.invariants[0])
+
+        invariant = child.invariants[0]
+        type_map = symbol_table.type_map_of(invariant)
+
+        self.assertEqual("bool", str(type_map[invariant.body]))
+
+    def test_self_shadows_symbol(self) -> None:
+        source = textwrap.dedent(
+            """\
+            class self(Enum):
+                something = "something"
+
+
+            @invariant(lambda self: len(self.x) > 0)
+            class Something:
+                x: str
+
+                def __init__(self, x: str) -> None:
+                    self.x = x
+
+
+            __book_url__ = "dummy"
+            __book_version__ = "dummy"
+            """
+        )
+
+        symbol_table, error = tests.common.translate_source_to_intermediate(
+            source=source
+        )
+        assert error is None, tests.common.most_underlying_messages(error)
+
+        assert symbol_table is not None
+
+        something = symbol_table.must_find(Identifier("Something"))
+        assert isinstance(something, intermediate.Class)
+
+        invariant = something.invariants[0]
+        type_map = symbol_table.type_map_of(invariant)
+
+        self.assertEqual("bool", str(type_map[invariant.body]))
+
+
+class Test_environment(unittest.TestCase):
+    def test_find_through_scopes(self) -> None:
+        bool_type = intermediate_type_inference.PrimitiveTypeAnnotation(
+            intermediate_type_inference.PrimitiveType.BOOL
+        )
+        int_type = intermediate_type_inference.PrimitiveTypeAnnotation(
+            intermediate_type_inference.PrimitiveType.INT
+        )
+
+        base = intermediate_type_inference.ImmutableEnvironment(
+            mapping={Identifier("x"): bool_type}
+        )
+
+        scope = intermediate_type_inference.MutableEnvironment(parent=base)
+        nested_scope = intermediate_type_inference.MutableEnvironment(parent=scope)
+
+        scope.set(Identifier("y"), int_type)
+        nested_scope.set(Identifier("x"), int_type)
+
+        self.assertIs(bool_type, base.find(Identifier("x")))
+        self.assertIs(bool_type, scope.find(Identifier("x")))
+        self.assertIs(int_type, nested_scope.find(Identifier("x")))
+
+        self.assertIs(int_type, scope.find(Identifier("y")))
+
+        # The nested scope sees the parent scope as it was at its creation.
+        self.assertIsNone(nested_scope.find(Identifier("y")))
+
+        self.assertIsNone(base.find(Identifier("z")))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+# pylint: disable=missing-docstring
+
+import textwrap
+import unittest
+
+from aas_core_codegen.common import CodeWriter
+
+
+class Test_CodeWriter(unittest.TestCase):
+    def test_equivalent_to_textwrap_indent(self) -> None:
+        for text in [
+            "",
+            "a",
+            "a\n",
+            "a\nb",
+            "a\n\nb\n",
+            "\n  \n\ta\n",
+            "a\n   b\n\n",
+        ]:
+            writer = CodeWriter()
+            with writer.indent("  "):
+                with writer.indent("\t"):
+                    writer.write(text)
+
+            self.assertEqual(
+                textwrap.indent(textwrap.indent(text, "\t"), "  "),
+                writer.getvalue(),
+                repr(text),
+            )
+
+    def test_line_indented_at_its_start(self) -> None:
+        writer = CodeWriter()
+        writer.write("if (x)\n")
+        with writer.indent("    "):
+            writer.write("return")
+
+        writer.write(" 1;\n")
+        writer.write("return 0;")
+
+        self.assertEqual("if (x)\n    return 1;\nreturn 0;", writer.getvalue())
+
+    def test_written_in_parts(self) -> None:
+        writer = CodeWriter()
+        with writer.indent("    "):
+            for part in ["some", " text\nan", "other\n", "\nlast"]:
+                writer.write(part)
+
+        self.assertEqual(
+            textwrap.indent("some text\nanother\n\nlast", "    "), writer.getvalue()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
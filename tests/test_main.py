@@ -0,0 +1,77 @@
+# pylint: disable=missing-docstring
+
+import json
+import subprocess
+import sys
+import unittest
+from typing import List, Set
+
+import aas_core_codegen.main
+
+
+def modules_after(code: str) -> Set[str]:
+    """Run ``code`` in a fresh interpreter and list the modules imported by then."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(json.loads(process.stdout.splitlines()[-1]))
+
+
+class Test_start_up(unittest.TestCase):
+    # Modules which only the execution of a target needs
+    NOT_NEEDED_AT_START_UP = [
+        "aas_core_codegen.parse",
+        "aas_core_codegen.intermediate",
+        "docutils",
+    ] + list(aas_core_codegen.main.BACKEND_MODULES.values())
+
+    def assert_not_imported(self, prefixes: List[str], modules: Set[str]) -> None:
+        for name in modules:
+            for prefix in prefixes:
+                self.assertFalse(name == prefix or name.startswith(prefix + "."), name)
+
+    def test_import(self) -> None:
+        modules = modules_after("import aas_core_codegen.main")
+
+        self.assertIn("aas_core_codegen.main", modules)
+        self.assert_not_imported(Test_start_up.NOT_NEEDED_AT_START_UP, modules)
+
+    def test_version(self) -> None:
+        modules = modules_after(
+            "import sys\n"
+            "import aas_core_codegen.main\n"
+            "sys.argv = ['aas-core-codegen', '--version']\n"
+            "aas_core_codegen.main.main(prog='aas-core-codegen')"
+        )
+
+        self.assert_not_imported(Test_start_up.NOT_NEEDED_AT_START_UP, modules)
+
+    def test_load_backend(self) -> None:
+        for target, module in aas_core_codegen.main.BACKEND_MODULES.items():
+            modules = modules_after(
+                f"import aas_core_codegen.main\n"
+                f"aas_core_codegen.main.load_backend("
+                f"aas_core_codegen.main.Target.{target.name})"
+            )
+
+            self.assertIn(module, modules, target)
+            self.assert_not_imported(
+                [
+                    other_module
+                    for other_module in aas_core_codegen.main.BACKEND_MODULES.values()
+                    if other_module != module
+                ],
+                modules,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+# pylint: disable=missing-docstring
+
+import hashlib
+import io
+import json
+import os
+import pathlib
+import stat
+import tempfile
+import unittest
+from typing import Iterator, List, Tuple
+
+import aas_core_codegen.main
+from aas_core_codegen import run
+
+
+class Test_write_chunks(unittest.TestCase):
+    def test_new_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pth = pathlib.Path(tmp_dir) / "some.txt"
+
+            digest = run.write_chunks(path=pth, chunks=["some\n", "text\n"])
+
+            self.assertEqual("some\ntext\n", pth.read_text(encoding="utf-8"))
+            self.assertEqual(
+                hashlib.sha256(pth.read_bytes()).hexdigest(),
+                digest,
+            )
+            self.assertEqual(["some.txt"], os.listdir(tmp_dir))
+
+    def test_unchanged_file_is_not_touched(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pth = pathlib.Path(tmp_dir) / "some.txt"
+            pth.write_text("some\ntext\n", encoding="utf-8")
+            os.utime(pth, (1000, 1000))
+
+            run.write_chunks(path=pth, chunks=["some", "\n", "text\n"])
+
+            self.assertEqual(1000, pth.stat().st_mtime)
+
+    def test_changed_file(self) -> None:
+        cases = [
+            ("", ["some"]),
+            ("some text", []),
+            ("some text", ["some"]),
+            ("some", ["some", " text"]),
+            ("some text", ["some", " other"]),
+            ("some text", ["other", " text"]),
+        ]  # type: List[Tuple[str, List[str]]]
+
+        for old, chunks in cases:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                pth = pathlib.Path(tmp_dir) / "some.txt"
+                pth.write_text(old, encoding="utf-8")
+
+                run.write_chunks(path=pth, chunks=chunks)
+
+                self.assertEqual(
+                    "".join(chunks), pth.read_text(encoding="utf-8"), repr(chunks)
+                )
+                self.assertEqual(["some.txt"], os.listdir(tmp_dir))
+
+    def test_mode_is_preserved(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pth = pathlib.Path(tmp_dir) / "some.txt"
+            pth.write_text("some text", encoding="utf-8")
+            os.chmod(pth, 0o640)
+
+            run.write_chunks(path=pth, chunks=["other text"])
+
+            self.assertEqual("other text", pth.read_text(encoding="utf-8"))
+            self.assertEqual(0o640, stat.S_IMODE(pth.stat().st_mode))
+
+    def test_interrupted(self) -> None:
+        def over_chunks() -> Iterator[str]:
+            yield "other"
+            raise RuntimeError("Interrupted")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pth = pathlib.Path(tmp_dir) / "some.txt"
+            pth.write_text("some text", encoding="utf-8")
+
+            with self.assertRaises(RuntimeError):
+                run.write_chunks(path=pth, chunks=over_chunks())
+
+            self.assertEqual("some text", pth.read_text(encoding="utf-8"))
+            self.assertEqual(["some.txt"], os.listdir(tmp_dir))
+
+
+class Test_manifest(unittest.TestCase):
+    def test_rerun_touches_nothing(self) -> None:
+        repo_dir = pathlib.Path(os.path.realpath(__file__)).parent.parent
+        case_dir = repo_dir / "test_data" / "jsonschema" / "test_main" / "v3rc2"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = pathlib.Path(tmp_dir)
+
+            params = aas_core_codegen.main.Parameters(
+                # The model path is relative so that we check that the manifest
+                # does not depend on the working directory.
+                model_path=pathlib.Path(
+                    os.path.relpath(case_dir / "input/meta_model.py")
+                ),
+                target=aas_core_codegen.main.Target.JSONSCHEMA,
+                snippets_dir=case_dir / "input/snippets",
+                output_dir=output_dir,
+            )
+
+            for i in range(2):
+                stderr = io.StringIO()
+                return_code = aas_core_codegen.main.execute(
+                    params=params, stdout=io.StringIO(), stderr=stderr
+                )
+                self.assertEqual("", stderr.getvalue())
+                self.assertEqual(0, return_code)
+
+                if i == 0:
+                    for pth in output_dir.iterdir():
+                        os.utime(pth, (1000, 1000))
+
+            self.assertEqual(
+                [1000, 1000],
+                [pth.stat().st_mtime for pth in sorted(output_dir.iterdir())],
+            )
+
+            manifest = json.loads(
+                (output_dir / run.MANIFEST_FILE_NAME).read_text(encoding="utf-8")
+            )
+
+            self.assertEqual(
+                {
+                    "schema.json": hashlib.sha256(
+                        (output_dir / "schema.json").read_bytes()
+                    ).hexdigest()
+                },
+                manifest["files"],
+            )
+            self.assertEqual(
+                (case_dir / "input/meta_model.py").resolve().as_posix(),
+                manifest["inputs"]["model"]["path"],
+            )
+            self.assertIn("snippets", manifest["inputs"])
+
+    def test_targets_sharing_output_dir(self) -> None:
+        repo_dir = pathlib.Path(os.path.realpath(__file__)).parent.parent
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = pathlib.Path(tmp_dir)
+
+            def execute(target: aas_core_codegen.main.Target) -> None:
+                case_dir = repo_dir / "test_data" / target.value / "test_main" / "v3rc2"
+
+                params = aas_core_codegen.main.Parameters(
+                    model_path=case_dir / "input/meta_model.py",
+                    target=target,
+                    snippets_dir=case_dir / "input/snippets",
+                    output_dir=output_dir,
+                )
+
+                stderr = io.StringIO()
+                return_code = aas_core_codegen.main.execute(
+                    params=params, stdout=io.StringIO(), stderr=stderr
+                )
+                self.assertEqual("", stderr.getvalue())
+                self.assertEqual(0, return_code)
+
+            execute(target=aas_core_codegen.main.Target.CSHARP)
+            csharp_files = sorted(
+                pth.name for pth in output_dir.iterdir() if pth.suffix == ".cs"
+            )
+            self.assertIn("types.cs", csharp_files)
+
+            execute(target=aas_core_codegen.main.Target.JSONSCHEMA)
+            execute(target=aas_core_codegen.main.Target.CSHARP)
+
+            self.assertEqual(
+                sorted(csharp_files + ["schema.json", run.MANIFEST_FILE_NAME]),
+                sorted(pth.name for pth in output_dir.iterdir()),
+            )
+
+            manifest = json.loads(
+                (output_dir / run.MANIFEST_FILE_NAME).read_text(encoding="utf-8")
+            )
+            self.assertEqual("csharp", manifest["generator"]["target"])
+            self.assertEqual(
+                {"layout": "single_file"}, manifest["generator"]["options"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+# pylint: disable=missing-docstring
+
+import unittest
+
+from aas_core_codegen import self_check
+
+
+class Test_run(unittest.TestCase):
+    def test_consistent(self) -> None:
+        self.assertEqual([], self_check.run())
+
+
+if __name__ == "__main__":
+    unittest.main()
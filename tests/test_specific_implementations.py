@@ -0,0 +1,71 @@
+# pylint: disable=missing-docstring
+
+import pathlib
+import tempfile
+import unittest
+
+from aas_core_codegen import specific_implementations
+from aas_core_codegen.specific_implementations import ImplementationKey
+
+
+class Test_read_from_directory(unittest.TestCase):
+    def test_lazy(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snippets_dir = pathlib.Path(tmp_dir)
+            (snippets_dir / "Verification").mkdir()
+            (snippets_dir / "Verification" / "Error.cs").write_text("  error\n")
+            (snippets_dir / "namespace.txt").write_text("Some.Namespace\n")
+            (snippets_dir / "copyright.txt").write_text(
+                "© Some Author\n", encoding="utf-8"
+            )
+
+            store, errors = specific_implementations.read_from_directory(
+                snippets_dir=snippets_dir
+            )
+            assert errors is None, errors
+            assert store is not None
+
+            self.assertEqual(
+                ["Verification/Error.cs", "copyright.txt", "namespace.txt"],
+                sorted(store.keys()),
+            )
+            for key in store.keys():
+                self.assertIsInstance(key, ImplementationKey)
+
+            self.assertEqual([], store.accessed_keys())
+
+            # The snippet is read only on access.
+            (snippets_dir / "namespace.txt").write_text("Another.Namespace\n")
+
+            self.assertEqual(
+                "Another.Namespace", store.get(ImplementationKey("namespace.txt"))
+            )
+            self.assertIsNone(store.get(ImplementationKey("missing.txt")))
+
+            # The presence of a snippet also counts as an access.
+            self.assertIn(ImplementationKey("Verification/Error.cs"), store)
+            self.assertNotIn(ImplementationKey("missing.txt"), store)
+
+            self.assertEqual(
+                ["namespace.txt", "Verification/Error.cs"], store.accessed_keys()
+            )
+            self.assertEqual(["copyright.txt"], store.unused_keys())
+
+            self.assertEqual("© Some Author", store[ImplementationKey("copyright.txt")])
+
+    def test_invalid_key(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snippets_dir = pathlib.Path(tmp_dir)
+            (snippets_dir / "some-snippet.cs").write_text("something")
+
+            store, errors = specific_implementations.read_from_directory(
+                snippets_dir=snippets_dir
+            )
+            self.assertIsNone(store)
+            assert errors is not None
+            self.assertEqual(1, len(errors))
+            self.assertIn("some-snippet.cs", errors[0])
+
+
+if __name__ == "__main__":
+    unittest.main()